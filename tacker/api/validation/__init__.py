@@ -36,11 +36,11 @@ def schema(request_body_schema):
 
     """
 
+    schema_validator = validators.get_schema_validator(request_body_schema)
+
     def add_validator(func):
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            schema_validator = validators._SchemaValidator(
-                request_body_schema)
             try:
                 schema_validator.validate(kwargs['body'])
             except KeyError:
@@ -63,6 +63,8 @@ def query_schema(query_params_schema):
                                 query parameters.
     """
 
+    schema_validator = validators.get_schema_validator(query_params_schema)
+
     def add_validator(func):
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
@@ -81,8 +83,6 @@ def query_schema(query_params_schema):
 
             query_opts = {}
             query_opts.update(req.GET)
-            schema_validator = validators._SchemaValidator(
-                query_params_schema)
             schema_validator.validate(query_opts)
 
             return func(*args, **kwargs)
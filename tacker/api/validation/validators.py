@@ -18,6 +18,8 @@ Internal implementation of request Body validating middleware.
 
 """
 
+import threading
+
 import jsonschema
 from jsonschema import exceptions as jsonschema_exc
 import netaddr
@@ -132,6 +134,23 @@ class FormatChecker(jsonschema.FormatChecker):
             raise jsonschema_exc.FormatError(msg, cause=cause)
 
 
+# NOTE: The validator class extended from validator_org and the format
+# checker are created once and shared by all _SchemaValidators. Format
+# checkers are registered by FormatChecker.cls_checks at import of this
+# module, so they are all included in the shared one.
+_validator_classes = {}
+_format_checker = FormatChecker()
+
+
+def _get_validator_class(validator_org):
+    validator_cls = _validator_classes.get(validator_org)
+    if validator_cls is None:
+        validator_cls = jsonschema.validators.extend(validator_org,
+                                                     validators={})
+        _validator_classes[validator_org] = validator_cls
+    return validator_cls
+
+
 class _SchemaValidator(object):
     """A validator class
 
@@ -145,10 +164,8 @@ class _SchemaValidator(object):
     validator_org = jsonschema.Draft7Validator
 
     def __init__(self, schema):
-        validator_cls = jsonschema.validators.extend(self.validator_org,
-                                                     validators={})
-        format_checker = FormatChecker()
-        self.validator = validator_cls(schema, format_checker=format_checker)
+        validator_cls = _get_validator_class(self.validator_org)
+        self.validator = validator_cls(schema, format_checker=_format_checker)
 
     def validate(self, *args, **kwargs):
         try:
@@ -169,3 +186,36 @@ class _SchemaValidator(object):
             # NOTE: If passing non string value to patternProperties parameter,
             #       TypeError happens. Here is for catching the TypeError.
             raise exception.ValidationError(detail=str(ex))
+
+
+# NOTE: _schema_validators is the registry of validators of the schemas
+# of API requests shared by v1 (tacker.api.validation) and v2
+# (tacker.sol_refactored.api.validator). A validator is created at the
+# first use of a schema, usually at the import of an API controller by
+# the validation decorators, and reused by all requests. A validator is
+# stateless during validation, so it is safe to be shared by concurrent
+# requests.
+#
+# Schemas are identified by their identity (i.e. id()). The registry
+# keeps a reference to the schema so that the id is not reused. It must
+# be used for static schemas (ex. defined at module level) only, not for
+# schemas created on each call.
+_schema_validators = {}
+_schema_validators_lock = threading.Lock()
+
+
+def get_schema_validator(schema, validator_cls=_SchemaValidator):
+    """Return the shared validator of the schema.
+
+    :param dict schema: a static JSON-Schema
+    :param validator_cls: _SchemaValidator or a subclass of it
+    """
+    key = (validator_cls, id(schema))
+    entry = _schema_validators.get(key)
+    if entry is None:
+        with _schema_validators_lock:
+            entry = _schema_validators.get(key)
+            if entry is None:
+                entry = (schema, validator_cls(schema))
+                _schema_validators[key] = entry
+    return entry[1]
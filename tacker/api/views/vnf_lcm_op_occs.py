@@ -90,6 +90,13 @@ class ViewBuilder(base.BaseViewBuilder):
 
     def index(self, request, vnf_lcm_op_occs, all_fields=True,
              exclude_fields=None, fields=None, exclude_default=False):
+        return list(self.iter_index(request, vnf_lcm_op_occs,
+            all_fields=all_fields, exclude_fields=exclude_fields,
+            fields=fields, exclude_default=exclude_default))
+
+    def iter_index(self, request, vnf_lcm_op_occs, all_fields=True,
+                   exclude_fields=None, fields=None, exclude_default=False):
+        """Same as index but returns an iterator of the views."""
 
         # Find out which fields are to be returned in the response.
         if all_fields:
@@ -119,7 +126,7 @@ class ViewBuilder(base.BaseViewBuilder):
             include_fields = set(self.FLATTEN_ATTRIBUTES.keys()) - \
                 exclude_fields
 
-        return [
+        return (
             self._get_vnf_lcm_op_occs_list(
                 vnf_lcm_op_occ, include_fields=include_fields)
-            for vnf_lcm_op_occ in vnf_lcm_op_occs]
+            for vnf_lcm_op_occ in vnf_lcm_op_occs)
@@ -79,6 +79,13 @@ class ViewBuilder(base.BaseViewBuilder):
 
     def index(self, vnf_packages, all_fields=True,
             exclude_fields=None, fields=None, exclude_default=False):
+        return list(self.iter_index(vnf_packages, all_fields=all_fields,
+            exclude_fields=exclude_fields, fields=fields,
+            exclude_default=exclude_default))
+
+    def iter_index(self, vnf_packages, all_fields=True,
+            exclude_fields=None, fields=None, exclude_default=False):
+        """Same as index but returns an iterator of the views."""
 
         # Find out which fields are to be returned in the response.
         if all_fields:
@@ -118,5 +125,5 @@ class ViewBuilder(base.BaseViewBuilder):
 
             include_fields = set(self.FLATTEN_ATTRIBUTES.keys()) - \
                 exclude_fields
-        return [self._get_vnf_package(vnf_package,
-            include_fields=include_fields)for vnf_package in vnf_packages]
+        return (self._get_vnf_package(vnf_package,
+            include_fields=include_fields) for vnf_package in vnf_packages)
@@ -1926,9 +1926,33 @@ class VnfLcmController(wsgi.Controller):
             marker_obj = vnf_lcm_op_occs_obj.VnfLcmOpOcc.get_by_id(
                 request.context, nextpage)
 
+        if allrecords == 'yes':
+            # NOTE: all records are read from DB and serialized while the
+            # response is sent, not to load all of them in memory at once.
+            # The first chunk is made here so that an error of reading DB
+            # is returned as an error response instead of a truncated
+            # 200 response. An error after it aborts the response.
+            result = vnf_lcm_op_list.iter_by_marker_filter(request.context,
+                    marker_obj, filters=filters, read_deleted='no')
+            result = self._view_builder_op_occ.iter_index(request, result,
+                 all_fields=all_fields, exclude_fields=exclude_fields,
+                 fields=fields, exclude_default=exclude_default)
+            try:
+                chunks = utils.prefetch_first(
+                    utils.json_list_chunks(result))
+            except Exception as e:
+                LOG.exception(traceback.format_exc())
+                return self._make_problem_detail(
+                    str(e), 500, title='Internal Server Error')
+
+            res = webob.Response(content_type='application/json')
+            res.status_int = 200
+            res.app_iter = chunks
+
+            return res
+
         try:
             # get records from DB within maximum record size per page
-            # except for getting all records case
             result = vnf_lcm_op_list.get_by_marker_filter(request.context,
                     limit, marker_obj, filters=filters, read_deleted='no')
         except Exception as e:
@@ -1946,7 +1970,7 @@ class VnfLcmController(wsgi.Controller):
         # if the number of records obtained from DB is equal to maximum record
         # size per page, the id of the last record is used as next page marker
         # and set it to Link header of the response
-        if (allrecords != 'yes' and len(result) >= limit):
+        if len(result) >= limit:
             nextpageid = result[(limit - 1)]['id']
             links = ('Link', '<%s?nextpage_opaque_marker=%s>; rel="next"' % (
                 request.path_url, nextpageid))
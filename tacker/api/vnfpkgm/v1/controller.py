@@ -46,6 +46,7 @@ from tacker.objects import fields
 from tacker.objects import vnf_package as vnf_package_obj
 from tacker.objects.vnf_package import VnfPackagesList as vnf_package_list
 from tacker.policies import vnf_package as vnf_package_policies
+from tacker import policy
 from tacker import wsgi
 
 LOG = logging.getLogger(__name__)
@@ -141,6 +142,21 @@ class VnfPkgmController(wsgi.Controller):
         else:
             return {'vendor': '*'}
 
+    def _get_authorized_vendors(self, context, check):
+        # NOTE: the policy target of a package is determined by its vendor
+        # (see _get_policy_target), so the rules are evaluated per distinct
+        # vendor instead of per package and the result is used to narrow
+        # down the packages in DB.
+        vendors = objects.VnfPackagesList.get_vnf_providers(
+            context, read_deleted='no')
+        targets = {vendor: ({'vendor': vendor} if vendor else {})
+                   for vendor in vendors}
+        targets['*'] = {'vendor': '*'}
+        targets[None] = {}
+
+        return [vendor for vendor, target in targets.items()
+                if check(target)]
+
     @wsgi.response(http_client.OK)
     @wsgi.expected_errors((http_client.BAD_REQUEST, http_client.FORBIDDEN))
     @validation.query_schema(vnf_packages.query_params_v1)
@@ -179,10 +195,10 @@ class VnfPkgmController(wsgi.Controller):
         results = []
         limit = None
         marker_obj = None
+        vendors = None
 
         if allrecords != 'yes':
-            if not CONF.oslo_policy.enhanced_tacker_policy:
-                limit = CONF.vnf_package.vnf_package_num
+            limit = CONF.vnf_package.vnf_package_num
 
             # get next page marker object from nextpage id
             if nextpage:
@@ -190,25 +206,50 @@ class VnfPkgmController(wsgi.Controller):
                         nextpage)
 
         try:
+            if CONF.oslo_policy.enhanced_tacker_policy:
+                check = policy.cached_checker(
+                    context, vnf_package_policies.VNFPKGM % 'index')
+                vendors = self._get_authorized_vendors(request.context,
+                                                       check)
+
             # get records from DB within maximum record size per page
             # except for getting all records case
             result = vnf_package_list.get_by_marker_filter(request.context,
-                    limit, marker_obj, filters=filters, read_deleted='no')
+                    limit, marker_obj, filters=filters, read_deleted='no',
+                    vendors=vendors)
         except Exception as e:
             LOG.exception(traceback.format_exc())
             return self._make_problem_detail(
                 str(e), 500, title='Internal Server Error')
 
         if CONF.oslo_policy.enhanced_tacker_policy:
+            # NOTE: the packages are already narrowed down in DB. it is
+            # checked again for safety, which does not evaluate the rules
+            # again thanks to the cache of the checker.
             result = [vnf_package for vnf_package in result
-                      if context.can(
-                          vnf_package_policies.VNFPKGM % 'index',
-                          target=self._get_policy_target(vnf_package),
-                          fatal=False)]
+                      if check(self._get_policy_target(vnf_package))]
             if allrecords != 'yes':
-                limit = CONF.vnf_package.vnf_package_num
                 result = result[:limit]
 
+        if allrecords == 'yes':
+            # NOTE: the views are made and serialized while the response
+            # is sent, not to keep all of them and the whole body in
+            # memory at once.
+            results = self._view_builder.iter_index(result,
+                    all_fields=all_fields,
+                    exclude_fields=exclude_fields,
+                    fields=fields,
+                    exclude_default=exclude_default)
+
+            res = webob.Response(content_type='application/json')
+            res.status_int = 200
+            # NOTE: an error while making the first chunk is raised here
+            # before the response is started.
+            res.app_iter = utils.prefetch_first(
+                utils.json_list_chunks(results, default=str))
+
+            return res
+
         results = self._view_builder.index(result,
                 all_fields=all_fields,
                 exclude_fields=exclude_fields,
@@ -221,8 +262,7 @@ class VnfPkgmController(wsgi.Controller):
         # if the number of records obtained from DB is equal to maximum record
         # size per page, the id of the last record is used as next page marker
         # and set it to Link header of the response
-        if (allrecords != 'yes' and
-                len(results) >= limit):
+        if len(results) >= limit:
             nextpageid = result[(limit - 1)]['id']
             links = ('Link', '<%s?nextpage_opaque_marker=%s>; rel="next"' % (
                 request.path_url, nextpageid))
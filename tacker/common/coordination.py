@@ -48,14 +48,17 @@ class Coordinator(object):
         self.started = False
         self.prefix = prefix
 
+    @property
+    def member_id(self):
+        # NOTE(bluex): Tooz expects member_id as a byte string.
+        return (self.prefix + self.agent_id).encode('ascii')
+
     def start(self):
         if self.started:
             return
 
-        # NOTE(bluex): Tooz expects member_id as a byte string.
-        member_id = (self.prefix + self.agent_id).encode('ascii')
         self.coordinator = coordination.get_coordinator(
-            cfg.CONF.coordination.backend_url, member_id)
+            cfg.CONF.coordination.backend_url, self.member_id)
         self.coordinator.start(start_heart=True)
         self.started = True
 
@@ -14,6 +14,7 @@
 #    under the License.
 import abc
 import os
+import threading
 
 from cryptography import fernet
 from oslo_config import cfg
@@ -22,6 +23,7 @@ from oslo_service import service
 from oslo_utils import uuidutils
 
 from tacker.common import exceptions
+from tacker.common import stats
 from tacker import context as t_context
 from tacker.keymgr import API as KEYMGR_API
 from tacker.sol_refactored import objects
@@ -30,6 +32,28 @@ LOG = logging.getLogger(__name__)
 
 CONF = cfg.CONF
 
+# NOTE: number of encryptions and decryptions done by CryptUtil. It shows
+# how many of them are done (or avoided by the lazy decryption of the
+# persistent objects).
+_stats_lock = threading.Lock()
+_stats = {
+    'encrypt': 0,
+    'decrypt': 0,
+}
+
+
+def _count(op):
+    with _stats_lock:
+        _stats[op] += 1
+
+
+def get_stats():
+    with _stats_lock:
+        return dict(_stats)
+
+
+stats.register('credential_encryption', get_stats)
+
 
 def encrypt(v):
     cu = CryptUtil()
@@ -136,6 +160,10 @@ class CryptUtil(metaclass=service.Singleton):
     '''
 
     crypt_util = None
+    # NOTE: Fernet object made from tacker_key. It is reused as long as
+    # tacker_key is not changed.
+    _fernet = None
+    _fernet_key = None
 
     def __new__(cls):
         if not cls.crypt_util:
@@ -219,14 +247,22 @@ class CryptUtil(metaclass=service.Singleton):
             LOG.error('Duplicate record in CryptKey.')
             raise exceptions.FailedToGetCryptKey()
 
+    def _get_fernet(self):
+        if self._fernet is None or self._fernet_key != self.tacker_key:
+            self._fernet = fernet.Fernet(self.tacker_key)
+            self._fernet_key = self.tacker_key
+        return self._fernet
+
     def encrypt(self, target_str):
-        fernet_obj = fernet.Fernet(self.tacker_key)
+        _count('encrypt')
+        fernet_obj = self._get_fernet()
         encrypted_data = fernet_obj.encrypt(
             target_str.encode('utf-8')).decode('utf-8')
         return encrypted_data
 
     def decrypt(self, target_str):
-        fernet_obj = fernet.Fernet(self.tacker_key)
+        _count('decrypt')
+        fernet_obj = self._get_fernet()
         decrypted_data = fernet_obj.decrypt(
             target_str.encode('utf-8')).decode('utf-8')
         return decrypted_data
@@ -13,11 +13,13 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+from concurrent import futures
 from copy import deepcopy
 import hashlib
 import os
 import re
 import shutil
+import time
 from urllib.parse import urlparse
 from urllib import request as urllib2
 import yaml
@@ -47,6 +49,9 @@ TOSCA_META = 'TOSCA-Metadata/TOSCA.meta'
 ARTIFACT_KEYS = ['Source', 'Algorithm', 'Hash']
 IMAGE_FORMAT_LIST = ['raw', 'vhd', 'vhdx', 'vmdk', 'vdi', 'iso', 'ploop',
                    'qcow2', 'aki', 'ari', 'ami', 'img']
+# NOTE: artifacts are read by this size to compute their hashes so that
+# the memory usage does not depend on the size of the artifacts.
+HASH_CHUNK_SIZE = 1024 * 1024
 
 
 def _check_type(custom_def, node_type, type_list):
@@ -426,6 +431,7 @@ def _get_vnf_artifacts(csar):
 def _convert_artifacts(vnf_artifacts, artifacts_data, csar):
     artifacts_data_split = re.split(b'\n\n+', artifacts_data)
 
+    hash_targets = []
     for data in artifacts_data_split:
         if re.findall(b'.?Name:.?|.?Source:.?|', data):
             # validate key's existence
@@ -457,24 +463,44 @@ def _convert_artifacts(vnf_artifacts, artifacts_data, csar):
                         in IMAGE_FORMAT_LIST:
                     continue
                 else:
-                    algorithm = artifact_data_dict.get('Algorithm')
-                    hash_code = artifact_data_dict.get('Hash')
-                    result = _validate_hash(algorithm, hash_code,
-                                            csar, artifact_path)
-                    if result:
-                        vnf_artifacts.append(artifact_data_dict)
-                    else:
-                        invalid_artifact_err_msg = \
-                            (('The hash "%(hash)s" of artifact file '
-                              '"%(artifact)s" is an invalid value.') %
-                             {'hash': hash_code, 'artifact': artifact_path})
-                        raise exceptions.InvalidCSAR(invalid_artifact_err_msg)
+                    hash_targets.append(artifact_data_dict)
+
+    # NOTE: the hashes of the artifacts are computed concurrently. The
+    # results are checked in the order of the artifacts so that the
+    # error of the first invalid artifact is raised as before.
+    def _validate(artifact_data_dict):
+        return _validate_hash(artifact_data_dict.get('Algorithm'),
+                              artifact_data_dict.get('Hash'),
+                              csar, artifact_data_dict.get('Source'))
+
+    with futures.ThreadPoolExecutor(
+            max_workers=CONF.vnf_package.artifact_hash_workers) as executor:
+        results = executor.map(_validate, hash_targets)
+        for artifact_data_dict, result in zip(hash_targets, results):
+            if result:
+                vnf_artifacts.append(artifact_data_dict)
+            else:
+                invalid_artifact_err_msg = \
+                    (('The hash "%(hash)s" of artifact file '
+                      '"%(artifact)s" is an invalid value.') %
+                     {'hash': artifact_data_dict.get('Hash'),
+                      'artifact': artifact_data_dict.get('Source')})
+                raise exceptions.InvalidCSAR(invalid_artifact_err_msg)
 
     return vnf_artifacts
 
 
+def _update_hash(hash_obj, fp):
+    size = 0
+    while True:
+        chunk = fp.read(HASH_CHUNK_SIZE)
+        if not chunk:
+            return size
+        hash_obj.update(chunk)
+        size += len(chunk)
+
+
 def _validate_hash(algorithm, hash_code, csar, artifact_path):
-    z = zipfile.ZipFile(csar.path)
     algorithm = algorithm.lower()
 
     # validate Algorithm's value
@@ -490,17 +516,29 @@ def _validate_hash(algorithm, hash_code, csar, artifact_path):
     filelist = csar.zfile.namelist()
 
     # validate Source's value
+    # NOTE: the artifact is read from the zip file opened by csar (i.e.
+    # the zip file is not opened for each artifact) and is hashed chunk
+    # by chunk.
+    start = time.monotonic()
     if artifact_path in filelist:
-        hash_obj.update(z.read(artifact_path))
+        with csar.zfile.open(artifact_path) as fp:
+            size = _update_hash(hash_obj, fp)
     elif ((urlparse(artifact_path).scheme == 'file') or
           (bool(urlparse(artifact_path).scheme) and
            bool(urlparse(artifact_path).netloc))):
-        hash_obj.update(urllib2.urlopen(artifact_path).read())
+        with urllib2.urlopen(artifact_path) as fp:
+            size = _update_hash(hash_obj, fp)
     else:
         invalid_artifact_err_msg = (('The path("%(artifact_path)s") of '
                                      'artifact Source is an invalid value.') %
                                     {'artifact_path': artifact_path})
         raise exceptions.InvalidCSAR(invalid_artifact_err_msg)
+    elapsed = time.monotonic() - start
+    LOG.info("Computed %(algorithm)s hash of artifact %(path)s: %(size)d "
+             "bytes in %(time).3f sec (%(rate).1f MB/s).",
+             {'algorithm': algorithm, 'path': artifact_path, 'size': size,
+              'time': elapsed,
+              'rate': size / elapsed / 1e6 if elapsed else 0.0})
 
     # validate Hash's value
     if hash_code == hash_obj.hexdigest():
@@ -0,0 +1,59 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import threading
+
+from oslo_log import log as logging
+
+
+LOG = logging.getLogger(__name__)
+
+
+# NOTE: the in-process caches, pools and queues (ex. the notification
+# dispatcher, the VNFD cache) register a function which returns their
+# statistics as a dict. The statistics of all the sources are reported
+# together by report(), which tacker-conductor calls every
+# 'stats_report_interval' seconds. Sources are registered at import time
+# and the functions must not create the source just to report it.
+
+_sources = {}
+_lock = threading.Lock()
+
+
+def register(name, func):
+    """Register func which returns the statistics of the source name."""
+    with _lock:
+        _sources[name] = func
+
+
+def get_all():
+    """Return the statistics of all the sources keyed by the name."""
+    with _lock:
+        sources = dict(_sources)
+    result = {}
+    for name, func in sorted(sources.items()):
+        try:
+            result[name] = func()
+        except Exception:
+            LOG.exception("Getting the statistics of %s failed.", name)
+    return result
+
+
+def report():
+    for name, stats in get_all().items():
+        if stats is None:
+            continue
+        LOG.info("Statistics of %(name)s: %(stats)s",
+                 {'name': name, 'stats': stats})
@@ -21,6 +21,7 @@
 import functools
 from functools import reduce
 import inspect
+import itertools
 import logging as std_logging
 import math
 import os
@@ -35,6 +36,7 @@ import netaddr
 from oslo_concurrency import lockutils
 from oslo_config import cfg
 from oslo_log import log as logging
+from oslo_serialization import jsonutils
 from oslo_utils import excutils
 from oslo_utils import importutils
 import urllib
@@ -350,6 +352,50 @@ def chunkiter(fp, chunk_size=65536):
             break
 
 
+def json_list_chunks(items, chunk_size=65536, **kwargs):
+    """Serialize items into a JSON array chunk by chunk.
+
+    Return an iterator which serializes the items while it is consumed
+    and yields the bytes of about chunk_size, so that the whole of the
+    items or the serialized bytes are not kept in memory at once.
+
+    :param items: an iterable of the items of the array
+    :param chunk_size: preferred size of chunk
+    :param kwargs: passed to jsonutils.dump_as_bytes
+    """
+    chunk = [b'[']
+    size = 1
+    for i, item in enumerate(items):
+        data = jsonutils.dump_as_bytes(item, **kwargs)
+        if i:
+            # NOTE: the same separator as jsonutils.dump_as_bytes(list).
+            chunk.append(b', ')
+            size += 2
+        chunk.append(data)
+        size += len(data)
+        if size >= chunk_size:
+            yield b''.join(chunk)
+            chunk = []
+            size = 0
+    chunk.append(b']')
+    yield b''.join(chunk)
+
+
+def prefetch_first(iterator):
+    """Get the first item of an iterator in advance.
+
+    Return an iterator which yields all the items of iterator. An error
+    raised while getting the first item (ex. an error of the first DB
+    query of a list read lazily) is raised here, i.e. before the response
+    is started, so that it can be returned as an error response.
+    """
+    try:
+        first = next(iterator)
+    except StopIteration:
+        return iter(())
+    return itertools.chain((first,), iterator)
+
+
 # TODO(esto.aln): Consider to move this function to
 # convert_camelcase_to_snakecase(). We will consider the correct approach
 # to modify the common function so as not to introduce degrade.
@@ -50,8 +50,10 @@ from tacker.common import exceptions
 from tacker.common import log
 from tacker.common import rpc
 from tacker.common import safe_utils
+from tacker.common import stats
 from tacker.common import topics
 from tacker.common import utils
+from tacker.conductor import notification_delivery
 import tacker.conf
 from tacker import context as t_context
 from tacker.db.db_sqlalchemy import models
@@ -327,6 +329,7 @@ class Conductor(manager.Manager, v2_hook.ConductorV2Hook):
         self.vnf_manager = driver_manager.DriverManager(
             'tacker.tacker.vnfm.drivers',
             cfg.CONF.tacker.infra_driver)
+        self.stats_reporter = None
         self._periodic_call()
 
     @async_call
@@ -339,8 +342,17 @@ class Conductor(manager.Manager, v2_hook.ConductorV2Hook):
 
     def start(self):
         coordination.COORDINATOR.start()
+        if CONF.stats_report_interval:
+            self.stats_reporter = loopingcall.FixedIntervalLoopingCall(
+                stats.report)
+            self.stats_reporter.start(
+                interval=CONF.stats_report_interval,
+                initial_delay=CONF.stats_report_interval)
 
     def stop(self):
+        if self.stats_reporter is not None:
+            self.stats_reporter.stop()
+        self.stop_service_hook()
         coordination.COORDINATOR.stop()
 
     def init_host(self):
@@ -1880,6 +1892,9 @@ class Conductor(manager.Manager, v2_hook.ConductorV2Hook):
             notification['id'] = uuidutils.generate_uuid()
 
             # Notification shipping
+            # NOTE: notifications are sent in the background by the
+            # delivery engine. It does not wait for the deliveries (and
+            # their retries) to complete.
             for line in vnf_lcm_subscriptions:
                 notification['subscriptionId'] = line.id
                 if (notification.get('notificationType') ==
@@ -1895,42 +1910,12 @@ class Conductor(manager.Manager, v2_hook.ConductorV2Hook):
                         "/vnflcm/v1/subscriptions/" + line.id
                 notification['timeStamp'] = timeutils.utcnow().isoformat()
                 try:
-                    self.__set_auth_subscription(line)
-
-                    for num in range(CONF.vnf_lcm.retry_num):
-                        try:
-                            LOG.debug("send notify[%s]" %
-                                json.dumps(notification))
-                            auth_client = auth.auth_manager.get_auth_client(
-                                notification['subscriptionId'])
-                            response = auth_client.post(
-                                line.callback_uri,
-                                data=json.dumps(notification),
-                                timeout=CONF.vnf_lcm.retry_timeout,
-                                verify=CONF.vnf_lcm.verify_notification_ssl)
-                            if response.status_code == 204:
-                                LOG.debug(
-                                    "send success notify[%s]",
-                                    json.dumps(notification))
-                                break
-                            else:
-                                LOG.warning("Notification failed id[%s]"
-                                    " status[%s] callback_uri[%s]",
-                                    notification['id'], response.status_code,
-                                    line.callback_uri)
-                                LOG.debug("retry_wait %s",
-                                    CONF.vnf_lcm.retry_wait)
-                                self._retry_check(num)
-
-                                continue
-                        except requests.Timeout as e:
-                            LOG.warning("Notification request timed out."
-                                " id[%(id)s] callback_uri[%(uri)s]"
-                                " reason[%(reason)s]", {
-                                    "id": notification['id'],
-                                    "uri": line.callback_uri,
-                                    "reason": str(e)})
-                            self._retry_check(num)
+                    body = json.dumps(notification)
+                    LOG.debug("send notify[%s]" % body)
+                    notification_delivery.ENGINE.submit(
+                        line.id, line.callback_uri, notification['id'],
+                        body, prepare=functools.partial(
+                            self.__set_auth_subscription, line))
                 except Exception as e:
                     LOG.warning("send error[%s]" % str(e))
                     LOG.warning(traceback.format_exc())
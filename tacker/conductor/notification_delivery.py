@@ -0,0 +1,289 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import collections
+import queue
+import threading
+import time
+
+from oslo_log import log as logging
+import requests
+
+from tacker import auth
+from tacker.common import stats
+import tacker.conf
+
+
+CONF = tacker.conf.CONF
+LOG = logging.getLogger(__name__)
+
+
+class _Delivery(object):
+
+    def __init__(self, notification_id, body, prepare):
+        self.notification_id = notification_id
+        self.body = body
+        self.prepare = prepare
+        self.attempts = 0
+        self.queued_at = time.monotonic()
+
+
+class _Subscriber(object):
+
+    def __init__(self, subscription_id, callback_uri):
+        self.subscription_id = subscription_id
+        self.callback_uri = callback_uri
+        self.deliveries = collections.deque()
+        # NOTE: True while the subscriber is in the ready queue, being
+        # processed by a worker or waiting for a retry.
+        self.scheduled = False
+        self.consecutive_failures = 0
+        self.open_until = None
+        self.stats = {
+            'delivered': 0,
+            'failed': 0,
+            'dropped': 0,
+            'latency_sum': 0.0,
+            'latency_max': 0.0,
+            'latency_last': 0.0,
+        }
+
+
+# NOTE: NotificationDeliveryEngine sends the notifications of v1 LCM
+# APIs in the background instead of in the RPC handler of the conductor.
+#
+# - Each subscription has its own queue. Notifications to a subscription
+#   are sent one by one in order, and notifications to different
+#   subscriptions are sent concurrently by the worker threads.
+# - A failed delivery is retried after retry_wait, doubled by each
+#   failure, up to retry_num attempts. The subscription waits for the
+#   retry without occupying a worker, so a slow or dead callbackUri does
+#   not delay the other subscriptions.
+# - If notification_circuit_failures is set (it is disabled by default)
+#   and the deliveries to a subscription fail that many times in a row,
+#   its circuit is opened and the notifications to it are dropped without
+#   being sent for notification_circuit_open_time seconds. After that, the
+#   next notification is sent as a trial and the circuit is closed if it
+#   succeeds.
+# - The sessions of auth.auth_manager are used for the deliveries, so the
+#   connections to the same callbackUri are reused.
+# - Delivery latency is recorded per subscription and available via
+#   get_stats(), which is reported periodically by tacker.common.stats.
+
+class NotificationDeliveryEngine(object):
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.idle = threading.Condition(self.lock)
+        self.ready = queue.Queue()
+        self.subscribers = {}
+        self.workers = []
+
+    def _start_workers(self):
+        # NOTE: called with the lock held.
+        if self.workers:
+            return
+        for _ in range(CONF.vnf_lcm.notification_workers):
+            th = threading.Thread(target=self._worker, daemon=True)
+            th.start()
+            self.workers.append(th)
+
+    def submit(self, subscription_id, callback_uri, notification_id, body,
+               prepare=None):
+        """Queue a notification to a subscription.
+
+        body is the serialized notification. prepare is called by the
+        worker before the first attempt (ex. set up the auth client of
+        the subscription).
+        """
+        with self.lock:
+            self._start_workers()
+            subscriber = self.subscribers.get(subscription_id)
+            if subscriber is None:
+                subscriber = _Subscriber(subscription_id, callback_uri)
+                self.subscribers[subscription_id] = subscriber
+            subscriber.callback_uri = callback_uri
+            if (len(subscriber.deliveries) >=
+                    CONF.vnf_lcm.notification_queue_size):
+                subscriber.stats['dropped'] += 1
+                LOG.warning("Notification queue of subscription %s is "
+                            "full. Notification id[%s] is dropped.",
+                            subscription_id, notification_id)
+                return
+            subscriber.deliveries.append(
+                _Delivery(notification_id, body, prepare))
+            if not subscriber.scheduled:
+                subscriber.scheduled = True
+                self.ready.put(subscriber)
+
+    def _worker(self):
+        while True:
+            subscriber = self.ready.get()
+            try:
+                self._process(subscriber)
+            except Exception:
+                # NOTE: it is a last resort not to stop the worker.
+                LOG.exception("Notification delivery to subscription %s "
+                              "failed.", subscriber.subscription_id)
+                self._done(subscriber, failed=True)
+
+    def _circuit_open(self, subscriber):
+        if subscriber.open_until is None:
+            return False
+        if time.monotonic() < subscriber.open_until:
+            return True
+        # NOTE: half-open. the next delivery is sent as a trial.
+        return False
+
+    def _process(self, subscriber):
+        with self.lock:
+            delivery = subscriber.deliveries[0]
+            circuit_open = self._circuit_open(subscriber)
+        if circuit_open:
+            LOG.warning("Circuit of subscription %s is open. Notification "
+                        "id[%s] is dropped.", subscriber.subscription_id,
+                        delivery.notification_id)
+            self._done(subscriber, dropped=True)
+            return
+
+        if delivery.attempts == 0 and delivery.prepare is not None:
+            delivery.prepare()
+        delivery.attempts += 1
+        start = time.monotonic()
+        result = self._send(subscriber, delivery)
+        latency = time.monotonic() - start
+
+        if result:
+            self._done(subscriber, latency=latency)
+        elif (result is None and
+                delivery.attempts < CONF.vnf_lcm.retry_num):
+            wait = CONF.vnf_lcm.retry_wait * 2 ** (delivery.attempts - 1)
+            LOG.debug("retry_wait %s", wait)
+            timer = threading.Timer(wait, self.ready.put, (subscriber,))
+            timer.daemon = True
+            timer.start()
+        else:
+            if delivery.attempts >= CONF.vnf_lcm.retry_num:
+                LOG.warning("Number of retries exceeded retry count [%s]",
+                            CONF.vnf_lcm.retry_num)
+            self._done(subscriber, failed=True)
+
+    def _send(self, subscriber, delivery):
+        """Send a notification.
+
+        Returns True if it succeeds, None if it should be retried and
+        False if it fails.
+        """
+        try:
+            auth_client = auth.auth_manager.get_auth_client(
+                subscriber.subscription_id)
+            response = auth_client.post(
+                subscriber.callback_uri,
+                data=delivery.body,
+                timeout=CONF.vnf_lcm.retry_timeout,
+                verify=CONF.vnf_lcm.verify_notification_ssl)
+        except requests.Timeout as e:
+            LOG.warning("Notification request timed out."
+                        " id[%(id)s] callback_uri[%(uri)s]"
+                        " reason[%(reason)s]", {
+                            "id": delivery.notification_id,
+                            "uri": subscriber.callback_uri,
+                            "reason": str(e)})
+            return None
+        except Exception as e:
+            LOG.warning("send error[%s]", str(e))
+            return False
+
+        if response.status_code == 204:
+            LOG.debug("send success notify[%s]", delivery.body)
+            return True
+        LOG.warning("Notification failed id[%s] status[%s] "
+                    "callback_uri[%s]", delivery.notification_id,
+                    response.status_code, subscriber.callback_uri)
+        return None
+
+    def _done(self, subscriber, latency=None, failed=False, dropped=False):
+        with self.lock:
+            delivery = subscriber.deliveries.popleft()
+            sub_stats = subscriber.stats
+            if dropped:
+                sub_stats['dropped'] += 1
+            elif failed:
+                sub_stats['failed'] += 1
+                subscriber.consecutive_failures += 1
+                threshold = CONF.vnf_lcm.notification_circuit_failures
+                if threshold and subscriber.consecutive_failures >= threshold:
+                    subscriber.open_until = (
+                        time.monotonic() +
+                        CONF.vnf_lcm.notification_circuit_open_time)
+                    LOG.warning("Notifications to subscription %s failed %d "
+                                "times in a row. Circuit is opened for %d "
+                                "sec.", subscriber.subscription_id,
+                                subscriber.consecutive_failures,
+                                CONF.vnf_lcm.notification_circuit_open_time)
+            else:
+                sub_stats['delivered'] += 1
+                sub_stats['latency_sum'] += latency
+                sub_stats['latency_max'] = max(sub_stats['latency_max'],
+                                               latency)
+                sub_stats['latency_last'] = latency
+                subscriber.consecutive_failures = 0
+                subscriber.open_until = None
+            if subscriber.deliveries:
+                self.ready.put(subscriber)
+            else:
+                subscriber.scheduled = False
+                self.idle.notify_all()
+
+        if latency is not None:
+            LOG.info("Notification id[%s] to subscription %s delivered in "
+                     "%.3f sec (%.3f sec including queueing).",
+                     delivery.notification_id, subscriber.subscription_id,
+                     latency, time.monotonic() - delivery.queued_at)
+
+    def join(self, timeout=None):
+        """Wait until all queued notifications are processed.
+
+        Returns False if timed out.
+        """
+        with self.lock:
+            return self.idle.wait_for(
+                lambda: not any(s.scheduled
+                                for s in self.subscribers.values()),
+                timeout=timeout)
+
+    def get_stats(self):
+        """Return the delivery statistics per subscription.
+
+        Returns None if no notification has been submitted.
+        """
+        now = time.monotonic()
+        result = {}
+        with self.lock:
+            for subscription_id, subscriber in self.subscribers.items():
+                sub_stats = dict(subscriber.stats)
+                count = sub_stats['delivered']
+                sub_stats['latency_avg'] = (
+                    sub_stats['latency_sum'] / count if count else 0.0)
+                sub_stats['queued'] = len(subscriber.deliveries)
+                sub_stats['circuit_open'] = (
+                    subscriber.open_until is not None and
+                    now < subscriber.open_until)
+                result[subscription_id] = sub_stats
+        return result or None
+
+
+ENGINE = NotificationDeliveryEngine()
+stats.register('v1_notification_delivery', ENGINE.get_stats)
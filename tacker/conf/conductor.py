@@ -29,12 +29,42 @@ interval_opts = [
                default=300,
                help=_('Interval time in sec for DB sync between '
                       'Tacker and Kubernetes VIMs')),
+    cfg.IntOpt('stats_report_interval',
+               default=300,
+               min=0,  # 0 means not reported
+               help=_('Interval time in sec to log the statistics of the '
+                      'in-process caches, pools and queues of the '
+                      'conductor (ex. notification dispatcher, VNFD '
+                      'cache).')),
+]
+
+db_sync_opts = [
+    cfg.IntOpt('db_synchronization_workers',
+               default=10,
+               min=1,
+               help=_('Number of threads which synchronize VNF instances '
+                      'with VIMs concurrently in a DB synchronization '
+                      'pass.')),
+    cfg.IntOpt('db_synchronization_workers_per_vim',
+               default=2,
+               min=1,
+               help=_('Maximum number of threads which access the same VIM '
+                      'concurrently in a DB synchronization pass.')),
+    cfg.BoolOpt('db_synchronization_sharding',
+                default=False,
+                help=_('Share VNF instances to be synchronized among '
+                       'conductors. Each conductor joins a group of the '
+                       'coordination backend and synchronizes only the VNF '
+                       'instances assigned to it by consistent hashing. '
+                       'The coordination backend must support groups and '
+                       'expire members of stopped conductors.')),
 ]
 
 
 def register_opts(conf):
     conf.register_opts(interval_opts)
+    conf.register_opts(db_sync_opts)
 
 
 def list_opts():
-    return {'DEFAULT': interval_opts}
+    return {'DEFAULT': interval_opts + db_sync_opts}
@@ -36,6 +36,34 @@ OPTS = [
         'retry_timeout',
         default=10,
         help="Retry timeout (sec)"),
+    cfg.IntOpt(
+        'notification_workers',
+        default=10,
+        min=1,
+        help="Number of worker threads which send notifications. "
+             "Notifications to different subscriptions are sent "
+             "concurrently by these threads."),
+    cfg.IntOpt(
+        'notification_queue_size',
+        default=1000,
+        min=1,
+        help="Maximum number of notifications waiting to be sent per "
+             "subscription. Notifications exceeding it are dropped."),
+    cfg.IntOpt(
+        'notification_circuit_failures',
+        default=0,
+        min=0,
+        help="Number of consecutive failed notifications (after retries) "
+             "to a subscription after which notifications to it are "
+             "dropped for notification_circuit_open_time seconds. "
+             "0 (default) means notifications are never dropped."),
+    cfg.IntOpt(
+        'notification_circuit_open_time',
+        default=300,
+        min=0,
+        help="Time (sec) during which notifications to a subscription "
+             "are dropped after notification_circuit_failures "
+             "consecutive failures."),
     cfg.BoolOpt(
         'test_callback_uri',
         default=True,
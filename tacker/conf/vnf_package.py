@@ -55,6 +55,20 @@ Secure hashing algorithm used for computing the 'hash' property.
 Possible values:
     * sha256, sha512
 
+Related options:
+    * None
+""")),
+
+    cfg.IntOpt('artifact_hash_workers',
+               default=4,
+               min=1,
+               help=_("""
+Number of threads which compute the hashes of the artifacts of a CSAR
+concurrently to verify them at onboarding.
+
+Possible values:
+    * Any positive integer
+
 Related options:
     * None
 """)),
@@ -274,6 +274,9 @@ class VnfLcmFilters(model_base.BASE):
     """Contains all info about vnf LCM filters."""
 
     __tablename__ = 'vnf_lcm_filters'
+    __table_args__ = (
+        sa.Index('vnf_lcm_filters_subsc_idx', 'subscription_uuid'),
+    )
     __maxsize__ = 65536
     id = sa.Column(sa.Integer, nullable=True, primary_key=True)
     subscription_uuid = sa.Column(sa.String(36),
@@ -306,11 +309,42 @@ class VnfLcmFilters(model_base.BASE):
     operation_states_len = sa.Column(sa.Integer, nullable=True)
 
 
+class VnfLcmFilterValues(model_base.BASE):
+    """Contains the elements of the list attributes of vnf LCM filters.
+
+    One row per element of notificationTypes, operationTypes,
+    operationStates and vnfInstanceSubscriptionFilter.vnfdIds of a
+    subscription, so that the subscriptions are looked up by an index.
+    A row whose value is NULL means that the attribute is empty, i.e.
+    the subscription is not restricted by it.
+    """
+
+    __tablename__ = 'vnf_lcm_filter_values'
+    __table_args__ = (
+        sa.Index('vnf_lcm_filter_values_attr_idx',
+                 'attribute', 'value', 'subscription_uuid'),
+        sa.Index('vnf_lcm_filter_values_subsc_idx',
+                 'subscription_uuid', 'attribute'),
+    )
+
+    id = sa.Column(sa.Integer, nullable=False, primary_key=True,
+                   autoincrement=True)
+    subscription_uuid = sa.Column(sa.String(36),
+                                  sa.ForeignKey('vnf_lcm_subscriptions.id'),
+                                  nullable=False)
+    attribute = sa.Column(sa.String(64), nullable=False)
+    value = sa.Column(sa.String(255), nullable=True)
+
+
 class VnfLcmSubscriptions(model_base.BASE, models.SoftDeleteMixin,
                 models.TimestampMixin):
     """Contains all info about vnf LCM Subscriptions."""
 
     __tablename__ = 'vnf_lcm_subscriptions'
+    __table_args__ = (
+        sa.Index('vnf_lcm_subscriptions_callback_idx',
+                 'callback_uri', 'deleted'),
+    )
     id = sa.Column(sa.String(36), nullable=False, primary_key=True)
     callback_uri = sa.Column(sa.String(255), nullable=False)
     authentication = sa.Column(sa.JSON, nullable=True)
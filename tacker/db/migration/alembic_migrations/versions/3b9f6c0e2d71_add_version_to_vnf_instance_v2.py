@@ -0,0 +1,37 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+#
+
+"""add version to VnfInstanceV2 and VnfLcmOpOccV2
+
+Revision ID: 3b9f6c0e2d71
+Revises: 8998b7cf7ebf
+Create Date: 2026-10-18 11:04:52.801947
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '3b9f6c0e2d71'
+down_revision = '8998b7cf7ebf'
+
+
+def upgrade(active_plugins=None, options=None):
+    for table in ('VnfInstanceV2', 'VnfLcmOpOccV2'):
+        op.add_column(table,
+                      sa.Column('version', sa.Integer(), nullable=False,
+                                server_default='0'))
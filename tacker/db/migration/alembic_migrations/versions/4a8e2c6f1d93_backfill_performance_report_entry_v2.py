@@ -0,0 +1,136 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+#
+
+"""backfill PerformanceReportEntryV2 table
+
+Revision ID: 4a8e2c6f1d93
+Revises: 9c4d1e7b2a56
+Create Date: 2026-10-18 19:05:44.107236
+
+"""
+
+from alembic import op
+from oslo_serialization import jsonutils
+from oslo_utils import timeutils
+from oslo_utils import uuidutils
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '4a8e2c6f1d93'
+down_revision = '9c4d1e7b2a56'
+
+
+def _load(value):
+    if isinstance(value, str):
+        value = jsonutils.loads(value)
+    return value or []
+
+
+def _time(value):
+    return timeutils.normalize_time(timeutils.parse_isotime(value))
+
+
+def _report_id(href):
+    # NOTE: href is '{endpoint}/vnfpm/v2/pm_jobs/{jobId}/reports/{id}'.
+    return href.rstrip('/').rsplit('/', 1)[-1]
+
+
+def _entry_rows(report_id, job_id, entries, ready_time):
+    # NOTE: the same as make_report_entries() of
+    # tacker.sol_refactored.common.pm_job_utils at this revision.
+    rows = []
+    for entry in entries:
+        for value in entry.get('performanceValues') or []:
+            rows.append({
+                'id': uuidutils.generate_uuid(),
+                'reportId': report_id,
+                'jobId': job_id,
+                'objectInstanceId': entry['objectInstanceId'],
+                'subObjectInstanceId': entry.get('subObjectInstanceId'),
+                'performanceMetric': entry['performanceMetric'],
+                'timeStamp': _time(value['timeStamp']),
+                'readyTime': ready_time})
+    return rows
+
+
+def upgrade(active_plugins=None, options=None):
+    # NOTE: the reports stored before PerformanceReportEntryV2 was
+    # introduced are linked by PmJobV2.reports. make their entries so that
+    # the latest report lookup and the retention see them, and remove
+    # their links from PmJobV2.reports since the links are made from
+    # PerformanceReportEntryV2 when PM jobs are shown.
+    pm_jobs = sa.table(
+        'PmJobV2',
+        sa.column('id', sa.String(255)),
+        sa.column('reports', sa.JSON))
+    reports = sa.table(
+        'PerformanceReportV2',
+        sa.column('id', sa.String(255)),
+        sa.column('jobId', sa.String(255)),
+        sa.column('entries', sa.JSON))
+    report_entries = sa.table(
+        'PerformanceReportEntryV2',
+        sa.column('id', sa.String(36)),
+        sa.column('reportId', sa.String(255)),
+        sa.column('jobId', sa.String(36)),
+        sa.column('objectInstanceId', sa.String(36)),
+        sa.column('subObjectInstanceId', sa.String(255)),
+        sa.column('performanceMetric', sa.String(255)),
+        sa.column('timeStamp', sa.DateTime),
+        sa.column('readyTime', sa.DateTime))
+    bind = op.get_bind()
+
+    ready_times = {}
+    job_links = {}
+    for job_id, job_reports in bind.execute(
+            sa.select(pm_jobs.c.id, pm_jobs.c.reports)):
+        links = _load(job_reports)
+        if not links:
+            continue
+        job_links[job_id] = links
+        for link in links:
+            if link.get('href') and link.get('readyTime'):
+                ready_times[_report_id(link['href'])] = _time(
+                    link['readyTime'])
+
+    done_ids = {report_id for (report_id,) in bind.execute(
+        sa.select(report_entries.c.reportId).distinct())}
+    backfilled_ids = set()
+    for report_id, job_id, entries in bind.execute(
+            sa.select(reports.c.id, reports.c.jobId, reports.c.entries)):
+        if report_id in done_ids:
+            continue
+        entries = _load(entries)
+        ready_time = ready_times.get(report_id)
+        if ready_time is None:
+            # NOTE: the same as VnfPmDriverV2._store_report(), readyTime
+            # is the timeStamp of the first performance value.
+            try:
+                ready_time = _time(
+                    entries[0]['performanceValues'][0]['timeStamp'])
+            except (IndexError, KeyError):
+                continue
+        rows = _entry_rows(report_id, job_id, entries, ready_time)
+        if rows:
+            op.bulk_insert(report_entries, rows)
+            backfilled_ids.add(report_id)
+
+    for job_id, links in job_links.items():
+        remains = [link for link in links
+                   if _report_id(link.get('href', '')) not in backfilled_ids]
+        if len(remains) != len(links):
+            bind.execute(pm_jobs.update().where(
+                pm_jobs.c.id == job_id).values(reports=remains))
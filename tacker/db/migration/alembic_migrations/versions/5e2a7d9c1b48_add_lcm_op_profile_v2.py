@@ -0,0 +1,49 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+#
+
+"""add LcmOpProfileV2 table
+
+Revision ID: 5e2a7d9c1b48
+Revises: 3b9f6c0e2d71
+Create Date: 2026-10-18 14:21:07.316482
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '5e2a7d9c1b48'
+down_revision = '3b9f6c0e2d71'
+
+
+def upgrade(active_plugins=None, options=None):
+    op.create_table(
+        'LcmOpProfileV2',
+        sa.Column('id', sa.String(length=36), nullable=False),
+        sa.Column('lcmOpOccId', sa.String(length=36), nullable=False),
+        sa.Column('vnfInstanceId', sa.String(length=36), nullable=False),
+        sa.Column('operation', sa.String(length=255), nullable=False),
+        sa.Column('action', sa.String(length=255), nullable=False),
+        sa.Column('operationState', sa.String(length=255), nullable=False),
+        sa.Column('startTime', sa.DateTime(), nullable=False),
+        sa.Column('duration', sa.Float(), nullable=False),
+        sa.Column('phases', sa.JSON(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.Index('LcmOpProfileV2_lcmocc_idx', 'lcmOpOccId'),
+        sa.Index('LcmOpProfileV2_start_idx', 'startTime'),
+        mysql_engine='InnoDB'
+    )
@@ -0,0 +1,43 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+#
+
+"""add LcmOpMetricV2 table
+
+Revision ID: 6d2f8b4a1c37
+Revises: 4a8e2c6f1d93
+Create Date: 2026-10-18 21:37:12.504819
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '6d2f8b4a1c37'
+down_revision = '4a8e2c6f1d93'
+
+
+def upgrade(active_plugins=None, options=None):
+    op.create_table(
+        'LcmOpMetricV2',
+        sa.Column('operation', sa.String(length=255), nullable=False),
+        sa.Column('phase', sa.String(length=255), nullable=False),
+        sa.Column('le', sa.String(length=16), nullable=False),
+        sa.Column('count', sa.BigInteger(), nullable=False),
+        sa.Column('sum', sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint('operation', 'phase', 'le'),
+        mysql_engine='InnoDB'
+    )
@@ -0,0 +1,53 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+#
+
+"""add PerformanceReportEntryV2 table
+
+Revision ID: 8998b7cf7ebf
+Revises: ca2ad037c320
+Create Date: 2026-10-18 09:12:31.524317
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '8998b7cf7ebf'
+down_revision = 'ca2ad037c320'
+
+
+def upgrade(active_plugins=None, options=None):
+    op.create_table(
+        'PerformanceReportEntryV2',
+        sa.Column('id', sa.String(length=36), nullable=False),
+        sa.Column('reportId', sa.String(length=255), nullable=False),
+        sa.Column('jobId', sa.String(length=36), nullable=False),
+        sa.Column('objectInstanceId', sa.String(length=36), nullable=False),
+        sa.Column('subObjectInstanceId', sa.String(length=255),
+                  nullable=True),
+        sa.Column('performanceMetric', sa.String(length=255),
+                  nullable=False),
+        sa.Column('timeStamp', sa.DateTime(), nullable=False),
+        sa.Column('readyTime', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.Index('PerformanceReportEntryV2_latest_idx',
+                 'jobId', 'objectInstanceId', 'subObjectInstanceId',
+                 'performanceMetric', 'timeStamp'),
+        sa.Index('PerformanceReportEntryV2_job_idx', 'jobId', 'readyTime'),
+        sa.Index('PerformanceReportEntryV2_report_idx', 'reportId'),
+        mysql_engine='InnoDB'
+    )
@@ -0,0 +1,94 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+#
+
+"""add vnf_lcm_filter_values table
+
+Revision ID: 9c4d1e7b2a56
+Revises: 5e2a7d9c1b48
+Create Date: 2026-10-18 16:42:13.528190
+
+"""
+
+from alembic import op
+from oslo_serialization import jsonutils
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '9c4d1e7b2a56'
+down_revision = '5e2a7d9c1b48'
+
+
+def _filter_values(subscription_uuid, filter):
+    # NOTE: the same as _make_filter_values() of
+    # tacker.objects.vnf_lcm_subscriptions at this revision.
+    if isinstance(filter, str):
+        filter = jsonutils.loads(filter)
+    filter = filter or {}
+    vnf_instance_filter = filter.get('vnfInstanceSubscriptionFilter') or {}
+    attributes = {
+        'notificationTypes': filter.get('notificationTypes'),
+        'operationTypes': filter.get('operationTypes'),
+        'operationStates': filter.get('operationStates'),
+        'vnfdIds': vnf_instance_filter.get('vnfdIds'),
+    }
+
+    rows = []
+    for attribute, values in attributes.items():
+        for value in sorted(set(values or [])) or [None]:
+            rows.append({'subscription_uuid': subscription_uuid,
+                         'attribute': attribute,
+                         'value': value})
+    return rows
+
+
+def upgrade(active_plugins=None, options=None):
+    filter_values = op.create_table(
+        'vnf_lcm_filter_values',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('subscription_uuid', sa.String(length=36),
+                  nullable=False),
+        sa.Column('attribute', sa.String(length=64), nullable=False),
+        sa.Column('value', sa.String(length=255), nullable=True),
+        sa.ForeignKeyConstraint(['subscription_uuid'],
+                                ['vnf_lcm_subscriptions.id'], ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.Index('vnf_lcm_filter_values_attr_idx',
+                 'attribute', 'value', 'subscription_uuid'),
+        sa.Index('vnf_lcm_filter_values_subsc_idx',
+                 'subscription_uuid', 'attribute'),
+        mysql_engine='InnoDB'
+    )
+
+    # NOTE: the subscriptions are looked up from vnf_lcm_filter_values
+    # and by callback_uri, then joined with their filter.
+    op.create_index('vnf_lcm_filters_subsc_idx', 'vnf_lcm_filters',
+                    ['subscription_uuid'])
+    op.create_index('vnf_lcm_subscriptions_callback_idx',
+                    'vnf_lcm_subscriptions', ['callback_uri', 'deleted'])
+
+    # NOTE: normalize the filters of the existing subscriptions.
+    vnf_lcm_filters = sa.table(
+        'vnf_lcm_filters',
+        sa.column('subscription_uuid', sa.String(36)),
+        sa.column('filter', sa.JSON))
+    bind = op.get_bind()
+    rows = []
+    for subscription_uuid, filter in bind.execute(
+            sa.select(vnf_lcm_filters.c.subscription_uuid,
+                      vnf_lcm_filters.c.filter)):
+        rows.extend(_filter_values(subscription_uuid, filter))
+    if rows:
+        op.bulk_insert(filter_values, rows)
@@ -180,6 +180,8 @@ class NfvoPlugin(nfvo_db_plugin.NfvoPluginDb):
 
             vim_obj = super(NfvoPlugin, self).update_vim(
                 context, vim_id, vim_obj)
+            # NOTE: the credentials may be encrypted with a new key.
+            vim_client.clear_vim_auth_cache(vim_id)
             if old_auth_need_delete:
                 try:
                     self._vim_drivers.invoke(vim_type,
@@ -208,3 +210,4 @@ class NfvoPlugin(nfvo_db_plugin.NfvoPluginDb):
                                  'deregister_vim',
                                  vim_obj=vim_obj)
         super(NfvoPlugin, self).delete_vim(context, vim_id)
+        vim_client.clear_vim_auth_cache(vim_id)
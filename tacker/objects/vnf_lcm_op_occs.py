@@ -88,19 +88,24 @@ def _vnf_lcm_op_occ_update(context, values):
         update(update, synchronize_session=False)
 
 
+# NOTE: the number of rows fetched from DB at once by
+# VnfLcmOpOccList.iter_by_marker_filter.
+_STREAM_BATCH_SIZE = 100
+
+
+def _make_vnf_lcm_op_occ(context, db_op_occ):
+    if (db_op_occ['changed_info'] and
+            isinstance(db_op_occ['changed_info'], str)):
+        db_op_occ['changed_info'] = jsonutils.loads(
+            db_op_occ['changed_info'])
+    return VnfLcmOpOcc._from_db_object(
+        context, VnfLcmOpOcc(context), db_op_occ)
+
+
 def _make_vnf_lcm_op_occs_list(context, op_occ_list,
                                db_op_occ_list):
-    lcm_op_occ_class = VnfLcmOpOcc
-
-    op_occ_list.objects = []
-    for db_op_occ in db_op_occ_list:
-        if (db_op_occ['changed_info'] and
-                isinstance(db_op_occ['changed_info'], str)):
-            db_op_occ['changed_info'] = jsonutils.loads(
-                db_op_occ['changed_info'])
-        vnf_lcm_op_occ_obj = lcm_op_occ_class._from_db_object(
-            context, lcm_op_occ_class(context), db_op_occ)
-        op_occ_list.objects.append(vnf_lcm_op_occ_obj)
+    op_occ_list.objects = [_make_vnf_lcm_op_occ(context, db_op_occ)
+                           for db_op_occ in db_op_occ_list]
 
     op_occ_list.obj_reset_changes()
     return op_occ_list
@@ -509,6 +514,27 @@ class VnfLcmOpOccList(ovoo_base.ObjectListBase, base.TackerObject):
         db_vnf_lcm_op_occs = query.all()
         return _make_vnf_lcm_op_occs_list(context, cls(), db_vnf_lcm_op_occs)
 
+    @classmethod
+    def iter_by_marker_filter(cls, context, marker_obj, filters=None,
+                              read_deleted=None):
+        """Iterate all VnfLcmOpOcc after marker_obj in the order of id.
+
+        The rows are fetched from DB by batches while the iterator is
+        consumed, so that all of them are not loaded in memory at once.
+        The read transaction is kept until the iterator is exhausted or
+        closed.
+        """
+        with db_api.context_manager.reader.using(context):
+            query = _vnf_lcm_op_occs_get_by_filters_query(
+                context, read_deleted=read_deleted, filters=filters)
+            query = sqlalchemyutils.paginate_query(query,
+                model=models.VnfLcmOpOccs,
+                limit=None,
+                sorts=[['id', 'asc']],
+                marker_obj=marker_obj)
+            for db_op_occ in query.yield_per(_STREAM_BATCH_SIZE):
+                yield _make_vnf_lcm_op_occ(context, db_op_occ)
+
 
 @base.TackerObjectRegistry.register
 class ResourceChanges(base.TackerObject,
@@ -14,12 +14,12 @@ from oslo_log import log as logging
 from oslo_serialization import jsonutils as json
 from oslo_utils import timeutils
 from oslo_versionedobjects import base as ovoo_base
+import sqlalchemy as sa
 from sqlalchemy.orm import joinedload
 from sqlalchemy.sql import text
 
 from tacker.common import exceptions
 from tacker.common import utils
-from tacker.common.utils import convert_string_to_snakecase
 import tacker.conf
 from tacker.db import api as db_api
 from tacker.db.db_sqlalchemy import api
@@ -85,20 +85,64 @@ def _get_vnf_subscription_filter_values(vnf_subscription_filter):
     return vnf_subscription_array
 
 
-def _make_list(value):
-    if isinstance(value, list):
-        res = ""
-        for i in range(len(value)):
-            t = "\"{}\"".format(value[i])
-            if i == 0:
-                res = str(t)
-            else:
-                res = "{0},{1}".format(res, t)
+def _make_filter_values(subscription_id, filter):
+    vnf_instance_filter = filter.get('vnfInstanceSubscriptionFilter') or {}
+    attributes = {
+        'notificationTypes': filter.get('notificationTypes'),
+        'operationTypes': filter.get('operationTypes'),
+        'operationStates': filter.get('operationStates'),
+        'vnfdIds': vnf_instance_filter.get('vnfdIds'),
+    }
+
+    # NOTE: an empty attribute is stored as a row whose value is NULL
+    # so that the subscriptions not restricted by it are looked up by
+    # the index too.
+    new_entries = []
+    for attribute, values in attributes.items():
+        for value in sorted(set(values or [])) or [None]:
+            new_entries.append({"subscription_uuid": subscription_id,
+                                "attribute": attribute,
+                                "value": value})
+    return new_entries
 
-        res = "[{}]".format(res)
-    else:
-        res = "[\"{}\"]".format(str(value))
-    return res
+
+def _subscriptions_match(attribute, value):
+    """Subscriptions whose attribute is empty or contains the value"""
+    filter_values = models.VnfLcmFilterValues
+    cond = filter_values.value.is_(None)
+    if value is not None:
+        cond = sa.or_(filter_values.value == value, cond)
+    return sa.select(filter_values.subscription_uuid).where(
+        filter_values.attribute == attribute, cond)
+
+
+def _subscriptions_contain(attribute, values):
+    """Subscriptions whose attribute contains all of the values
+
+    The attribute must be empty if no value is given.
+    """
+    filter_values = models.VnfLcmFilterValues
+    stmt = sa.select(filter_values.subscription_uuid).where(
+        filter_values.attribute == attribute)
+    if not values:
+        return stmt.where(filter_values.value.is_(None))
+
+    values = set(values) if isinstance(values, list) else {values}
+    return stmt.where(filter_values.value.in_(values)).group_by(
+        filter_values.subscription_uuid).having(
+        sa.func.count(sa.distinct(filter_values.value)) == len(values))
+
+
+def _select_subscriptions(*columns):
+    # NOTE: the JSON columns are returned as the raw strings stored in
+    # the DB, which the callers load by themselves.
+    subscriptions = models.VnfLcmSubscriptions
+    filters = models.VnfLcmFilters
+    return sa.select(
+        subscriptions.id, *columns,
+        sa.type_coerce(filters.filter, sa.Text).label('filter')).join(
+        filters, filters.subscription_uuid == subscriptions.id).where(
+        subscriptions.deleted == 0)
 
 
 @db_api.context_manager.reader
@@ -106,54 +150,22 @@ def _vnf_lcm_subscriptions_get(context,
                                notification_type,
                                operation_type=None
                                ):
+    subscriptions = models.VnfLcmSubscriptions
+    stmt = _select_subscriptions(
+        subscriptions.callback_uri,
+        sa.type_coerce(subscriptions.authentication,
+                       sa.Text).label('authentication'),
+        subscriptions.tenant_id).where(
+        subscriptions.id.in_(
+            _subscriptions_match('notificationTypes', notification_type)))
 
     if notification_type == 'VnfLcmOperationOccurrenceNotification':
-        stmt = (
-            "select"
-            " t1.id,t1.callback_uri,t1.authentication,"
-            " t1.tenant_id, t2.filter "
-            " from "
-            " vnf_lcm_subscriptions t1, "
-            " (select distinct subscription_uuid,filter from vnf_lcm_filters "
-            " where "
-            " (notification_types_len = 0 \
-                or JSON_CONTAINS(notification_types, '" +
-            _make_list(notification_type) +
-            "')) "
-            " and "
-            " (operation_types_len = 0 or JSON_CONTAINS(operation_types, '" +
-            _make_list(operation_type) +
-            "')) "
-            " order by "
-            "         notification_types_len desc,"
-            "         operation_types_len desc"
-            ") t2 "
-            " where "
-            " t1.id=t2.subscription_uuid "
-            " and t1.deleted=0")
-    else:
-        stmt = (
-            "select"
-            " t1.id,t1.callback_uri,t1.authentication,"
-            " t1.tenant_id, t2.filter "
-            " from "
-            " vnf_lcm_subscriptions t1, "
-            " (select distinct subscription_uuid,filter from vnf_lcm_filters "
-            " where "
-            " (notification_types_len = 0 or \
-                JSON_CONTAINS(notification_types, '" +
-            _make_list(notification_type) +
-            "')) "
-            " order by "
-            "         notification_types_len desc,"
-            "         operation_types_len desc"
-            ") t2 "
-            " where "
-            " t1.id=t2.subscription_uuid "
-            " and t1.deleted=0")
+        stmt = stmt.where(subscriptions.id.in_(
+            _subscriptions_match('operationTypes', operation_type)))
 
     result_list = []
-    result = context.session.execute(text(stmt))
+    result = context.session.execute(
+        stmt.order_by(subscriptions.created_at))
     for line in result:
         result_list.append(line)
     return result_list
@@ -235,6 +247,38 @@ def _get_by_subscriptionid(context, subscriptionsId):
     return result_line
 
 
+def _vnf_instance_filter_contained(subscription_filter,
+                                   vnf_instance_subscription_filter):
+    """Check vnfInstanceSubscriptionFilter of an existing subscription
+
+    The list attributes must contain all of the requested values, or be
+    empty if no value is requested. The others must be equal. vnfdIds
+    is excluded since it is checked by vnf_lcm_filter_values.
+    """
+    if isinstance(subscription_filter, str):
+        subscription_filter = json.loads(subscription_filter)
+    existing = {}
+    for column in _get_vnf_subscription_filter_values(
+            subscription_filter.get('vnfInstanceSubscriptionFilter') or {}):
+        existing.update(column)
+
+    for column in _get_vnf_subscription_filter_values(
+            vnf_instance_subscription_filter):
+        for key, value in column.items():
+            if key == 'vnfdIds':
+                continue
+            existing_value = existing[key]
+            if key in VNF_INSTANCE_SUBSCRIPTION_FILTER_LISTS:
+                if value:
+                    if not set(value) <= set(existing_value):
+                        return False
+                elif existing_value:
+                    return False
+            elif existing_value != value:
+                return False
+    return True
+
+
 @db_api.context_manager.reader
 def _vnf_lcm_subscriptions_id_get(context,
                                   callbackUri,
@@ -243,80 +287,29 @@ def _vnf_lcm_subscriptions_id_get(context,
                                   operation_state=None,
                                   vnf_instance_subscription_filter=None
                                   ):
-
-    stmt = ("select "
-          "t1.id "
-           "from "
-           "vnf_lcm_subscriptions t1, "
-           "(select subscription_uuid from vnf_lcm_filters "
-           "where ")
+    subscriptions = models.VnfLcmSubscriptions
+    stmt = _select_subscriptions().where(
+        subscriptions.callback_uri == callbackUri,
+        subscriptions.id.in_(_subscriptions_contain(
+            'notificationTypes', notification_type)),
+        subscriptions.id.in_(_subscriptions_contain(
+            'operationStates', operation_state)),
+        subscriptions.id.in_(_subscriptions_contain(
+            'operationTypes', operation_type)))
 
     if vnf_instance_subscription_filter:
-        included_in_filter = []
-        column_list = _get_vnf_subscription_filter_values(
-            vnf_instance_subscription_filter)
-
-        stmt_lst = [stmt]
-        for column in column_list:
-            for key in column:
-                if key in VNF_INSTANCE_SUBSCRIPTION_FILTER:
-                    value = column[key]
-                    if key in VNF_INSTANCE_SUBSCRIPTION_FILTER_LISTS:
-                        if value:
-                            value = _make_list(value)
-                            stmt_lst.append(
-                                " JSON_CONTAINS({}, '{}') and ".format(
-                                    convert_string_to_snakecase(key), value))
-                        else:
-                            stmt_lst.append(" {}_len=0 and ".format(
-                                convert_string_to_snakecase(key)))
-                    else:
-                        stmt_lst.append(" {}='{}' and ".format(
-                            convert_string_to_snakecase(key), value))
-
-                    included_in_filter.append(key)
-        stmt = ''.join(stmt_lst)
-
-        not_included_in_filter = list(
-            set(VNF_INSTANCE_SUBSCRIPTION_FILTER_LISTS) -
-            set(included_in_filter))
-
-        # items not being searched for is excluded by adding
-        # <name>_len=0 to the sql query
-        for key in not_included_in_filter:
-            stmt = stmt + " {}_len=0 and ".format(
-                convert_string_to_snakecase(key))
-
-    if notification_type:
-        stmt = (stmt + " JSON_CONTAINS(notification_types, '" +
-               _make_list(notification_type) + "') ")
-    else:
-        stmt = stmt + " notification_types_len=0 "
-    stmt = stmt + "and "
-
-    if operation_state:
-        stmt = (stmt + " JSON_CONTAINS(operation_states, '" +
-               _make_list(operation_state) + "') ")
-    else:
-        stmt = stmt + " operation_states_len=0 "
-    stmt = stmt + "and "
-
-    if operation_type:
-        stmt = stmt + " JSON_CONTAINS(operation_types, '" + \
-            _make_list(operation_type) + "') "
-    else:
-        stmt = stmt + " operation_types_len=0 "
-    stmt = (
-        stmt +
-        ") t2 where t1.id=t2.subscription_uuid and t1.callback_uri= '" +
-        callbackUri +
-        "' and t1.deleted=0 ")
-    LOG.debug("Composed SQL stmt for vnflcm subscriptions id: %s" % stmt)
+        stmt = stmt.where(subscriptions.id.in_(_subscriptions_contain(
+            'vnfdIds', vnf_instance_subscription_filter.get('vnfdIds'))))
 
     try:
-        result = context.session.execute(text(stmt))
+        result = context.session.execute(stmt)
         for line in result:
-            return line
+            # NOTE: the rest of vnfInstanceSubscriptionFilter is checked
+            # against the few subscriptions found by the index.
+            if (not vnf_instance_subscription_filter or
+                    _vnf_instance_filter_contained(
+                        line.filter, vnf_instance_subscription_filter)):
+                return line
     except exceptions.NotFound:
         return ''
     except Exception as exc:
@@ -344,6 +337,10 @@ def _add_filter_data(context, subscription_id, filter):
             models.VnfLcmFilters.__table__.insert(),
             new_entries)
 
+        context.session.execute(
+            models.VnfLcmFilterValues.__table__.insert(),
+            _make_filter_values(subscription_id, filter))
+
 
 @db_api.context_manager.reader
 def _vnf_lcm_subscription_list_by_filters(context,
@@ -20,6 +20,8 @@ from oslo_utils import timeutils
 from oslo_utils import uuidutils
 from oslo_utils import versionutils
 from oslo_versionedobjects import base as ovoo_base
+import sqlalchemy as sa
+from sqlalchemy import orm
 from sqlalchemy.orm import joinedload
 from sqlalchemy.sql import func
 
@@ -153,6 +155,49 @@ def _vnf_packages_get_by_filters_query(context, read_deleted=None,
     return query
 
 
+def _apply_vendors_filter(query, vendors):
+    """Narrow down the query to the packages of the vendors.
+
+    vendors is a list of 'vendor' of the policy targets of packages.
+    '*' matches the packages not onboarded and None matches the onboarded
+    packages without vnf_provider.
+    """
+    vnfd = orm.aliased(models.VnfPackageVnfd)
+    query = query.outerjoin(vnfd, sa.and_(
+        vnfd.package_uuid == models.VnfPackage.id, vnfd.deleted == '0'))
+    onboarded = (models.VnfPackage.onboarding_state ==
+                 fields.PackageOnboardingStateType.ONBOARDED)
+
+    conditions = []
+    if '*' in vendors:
+        conditions.append(sa.not_(onboarded))
+    if None in vendors:
+        conditions.append(sa.and_(onboarded, sa.or_(
+            vnfd.vnf_provider.is_(None), vnfd.vnf_provider == '')))
+    providers = [vendor for vendor in vendors if vendor not in ('*', None)]
+    if providers:
+        conditions.append(sa.and_(onboarded,
+                                  vnfd.vnf_provider.in_(providers)))
+
+    if not conditions:
+        return query.filter(sa.false())
+    return query.filter(sa.or_(*conditions))
+
+
+@db_api.context_manager.reader
+def _vnf_package_vnf_providers(context, read_deleted=None):
+    query = api.model_query(context, models.VnfPackage,
+                            read_deleted=read_deleted,
+                            project_only=True)
+    query = query.join(models.VnfPackageVnfd).filter(
+        models.VnfPackage.onboarding_state ==
+        fields.PackageOnboardingStateType.ONBOARDED,
+        models.VnfPackageVnfd.deleted == '0')
+    query = query.with_entities(models.VnfPackageVnfd.vnf_provider).distinct()
+
+    return [row[0] for row in query.all()]
+
+
 @db_api.context_manager.reader
 def _vnf_package_get_by_id(context, package_uuid, columns_to_join=None):
 
@@ -735,10 +780,12 @@ class VnfPackagesList(ovoo_base.ObjectListBase, base.TackerObject):
     @base.remotable_classmethod
     def get_by_marker_filter(cls, context,
             limit, marker_obj,
-            filters=None, read_deleted=None):
+            filters=None, read_deleted=None, vendors=None):
         query = _vnf_packages_get_by_filters_query(context,
                                                read_deleted=read_deleted,
                                                filters=filters)
+        if vendors is not None:
+            query = _apply_vendors_filter(query, vendors)
         query = sqlalchemyutils.paginate_query(query,
             model=models.VnfPackage,
             limit=limit,
@@ -748,6 +795,11 @@ class VnfPackagesList(ovoo_base.ObjectListBase, base.TackerObject):
 
         return _make_vnf_packages_list(context, cls(), db_vnf_packages)
 
+    @base.remotable_classmethod
+    def get_vnf_providers(cls, context, read_deleted=None):
+        """Return the distinct vnf_provider of the onboarded packages."""
+        return _vnf_package_vnf_providers(context, read_deleted=read_deleted)
+
     @base.remotable_classmethod
     def get_by_filters(cls, context, read_deleted=None, filters=None):
         db_vnf_packages = _vnf_package_list_by_filters(context,
@@ -285,6 +285,25 @@ def authorize(context, action, target, do_raise=True, exc=None):
     return result
 
 
+def cached_checker(context, action):
+    """Return a function which checks the action against a target.
+
+    The result is cached per distinct target, so the rules are evaluated
+    only once for the resources which share the same target (ex. the same
+    vendor, area and tenant) when a lot of resources are listed.
+    """
+    results = {}
+
+    def _check(target):
+        key = tuple(sorted(target.items()))
+        if key not in results:
+            results[key] = bool(context.can(action, target=target,
+                                            fatal=False))
+        return results[key]
+
+    return _check
+
+
 def refresh(policy_file=None):
     """Reset policy and init a new instance of Enforcer."""
     reset()
@@ -25,6 +25,7 @@ SERVER_NOTIFICATION_POLICY_NAME = \
     'tacker_server_notification_api:server_notification:{}'
 
 RULE_ANY = '@'
+RULE_ADMIN_API = 'rule:admin_only'
 
 V2_PATH = '/vnflcm/v2'
 API_VERSIONS_PATH = V2_PATH + '/api_versions'
@@ -254,6 +255,26 @@ rules = [
              'path': VNF_LCM_OP_OCCS_ID_PATH}
         ]
     ),
+    # NOTE: 'profile' and 'lcm_op_profile_metrics' are not defined in the
+    # specification. They are proprietary implementations of Tacker.
+    policy.DocumentedRuleDefault(
+        name=POLICY_NAME.format('lcm_op_occ_profile'),
+        check_str=RULE_ADMIN_API,
+        description="Show the profile of VnfLcmOpOcc.",
+        operations=[
+            {'method': 'GET',
+             'path': VNF_LCM_OP_OCCS_ID_PATH + '/profile'}
+        ]
+    ),
+    policy.DocumentedRuleDefault(
+        name=POLICY_NAME.format('lcm_op_profile_metrics'),
+        check_str=RULE_ADMIN_API,
+        description="Get the metrics of the profiles of LCM operations.",
+        operations=[
+            {'method': 'GET',
+             'path': V2_PATH + '/lcm_op_profile_metrics'}
+        ]
+    ),
 ]
 
 sn_rules = [
@@ -61,7 +61,12 @@ class VnflcmAPIRouterV2(sol_wsgi.SolAPIRouter):
         # It is available when config parameter
         # v2_vnfm.test_enable_lcm_op_occ_delete set to True.
         ("/vnf_lcm_op_occs/{id}", {"GET": "lcm_op_occ_show",
-                                   "DELETE": "lcm_op_occ_delete"})
+                                   "DELETE": "lcm_op_occ_delete"}),
+        # NOTE: 'profile' and 'lcm_op_profile_metrics' are not defined in
+        # the specification. They are proprietary implementations of Tacker
+        # to show the duration of each phase of LCM operations.
+        ("/vnf_lcm_op_occs/{id}/profile", {"GET": "lcm_op_occ_profile"}),
+        ("/lcm_op_profile_metrics", {"GET": "lcm_op_profile_metrics"})
     ]
 
 
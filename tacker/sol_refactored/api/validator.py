@@ -31,7 +31,14 @@ class SolSchemaValidator(validators._SchemaValidator):
             raise sol_ex.SolValidationError(detail=str(ex))
 
 
+def get_validator(request_body_schema):
+    """Return the shared SolSchemaValidator of a static schema."""
+    return validators.get_schema_validator(request_body_schema,
+                                           SolSchemaValidator)
+
+
 def schema(request_body_schema, min_version, max_version=None):
+    schema_validator = get_validator(request_body_schema)
 
     def add_validator(func):
         @functools.wraps(func)
@@ -42,7 +49,6 @@ def schema(request_body_schema, min_version, max_version=None):
             if ver.matches(min_ver, max_ver):
                 if 'body' not in kwargs:
                     raise sol_ex.SolValidationError(detail="body is missing")
-                schema_validator = SolSchemaValidator(request_body_schema)
                 schema_validator.validate(kwargs['body'])
 
             return func(*args, **kwargs)
@@ -52,13 +58,13 @@ def schema(request_body_schema, min_version, max_version=None):
 
 
 def schema_nover(request_body_schema):
+    schema_validator = get_validator(request_body_schema)
 
     def add_validator(func):
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             if 'body' not in kwargs:
                 raise sol_ex.SolValidationError(detail="body is missing")
-            schema_validator = SolSchemaValidator(request_body_schema)
             schema_validator.validate(kwargs['body'])
 
             return func(*args, **kwargs)
@@ -13,6 +13,8 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import collections.abc
+
 import routes
 import webob
 
@@ -21,6 +23,7 @@ from oslo_log import log as logging
 from oslo_serialization import jsonutils
 
 from tacker.common import exceptions as common_ex
+from tacker.common import utils
 from tacker import context
 
 from tacker.sol_refactored.api import api_version
@@ -79,17 +82,48 @@ class SolResponse(object):
             body = self.body
         elif content_type == 'application/zip':
             body = self.body
+        elif isinstance(self.body, collections.abc.Iterator):
+            # 'application/json' list read from DB lazily
+            body = self._serialize_iter()
         else:  # 'application/json'
             body = jsonutils.dump_as_bytes(self.body)
-            if len(body) > config.CONF.v2_vnfm.max_content_length:
-                raise sol_ex.ResponseTooBig(
-                    size=config.CONF.v2_vnfm.max_content_length)
-        response = webob.Response(body=body)
+            max_length = config.CONF.v2_vnfm.max_content_length
+            if max_length and len(body) > max_length:
+                raise sol_ex.ResponseTooBig(size=max_length)
+        if isinstance(body, collections.abc.Iterator):
+            response = webob.Response(app_iter=body)
+        else:
+            response = webob.Response(body=body)
         response.status_int = self.status
         for hdr, val in self.headers.items():
             response.headers[hdr.replace('_', '-')] = val
         return response
 
+    def _serialize_iter(self):
+        # NOTE: the items are serialized into chunks while they are read.
+        # If max_content_length is set, the chunks are buffered up to it
+        # to check the length before the response is started. Otherwise
+        # the chunks are sent while they are made, i.e. the memory used
+        # is bounded by the chunk size rather than the number of items.
+        chunks = utils.json_list_chunks(
+            self.body, config.CONF.v2_vnfm.response_chunk_size)
+        max_length = config.CONF.v2_vnfm.max_content_length
+        if not max_length:
+            # NOTE: the first chunk is made here so that an error of
+            # reading DB is returned as an error response instead of a
+            # truncated 200 response.
+            return utils.prefetch_first(chunks)
+
+        body = []
+        size = 0
+        for chunk in chunks:
+            size += len(chunk)
+            if size > max_length:
+                chunks.close()
+                raise sol_ex.ResponseTooBig(size=max_length)
+            body.append(chunk)
+        return b''.join(body)
+
 
 class SolErrorResponse(SolResponse):
 
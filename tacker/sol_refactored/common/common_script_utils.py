@@ -298,7 +298,7 @@ def apply_ext_managed_vls_from_inst(hot_dict, inst):
 
 def check_subsc_auth(auth_req, validation=True):
     if validation:
-        auth_validator = validator.SolSchemaValidator(
+        auth_validator = validator.get_validator(
             common_types.SubscriptionAuthentication)
         auth_validator.validate(auth_req)
 
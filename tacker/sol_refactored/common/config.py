@@ -31,13 +31,74 @@ VNFM_OPTS = [
                       'termination.')),
     cfg.IntOpt('max_content_length',
                default=1000000,
-               help=_('Max content length for list APIs.')),
+               help=_('Max content length for list APIs. 0 means no '
+                      'limit, which lets the list APIs without paging '
+                      'send the response without buffering all of it.')),
+    cfg.IntOpt('response_chunk_size',
+               default=65536,
+               min=1,
+               help=_('Preferred size (in bytes) of the chunks by which '
+                      'the response of the list APIs without paging is '
+                      'serialized and sent.')),
     cfg.IntOpt('openstack_vim_stack_create_timeout',
                default=20,
                help=_('Timeout (in minutes) of heat stack creation.')),
+    cfg.IntOpt('heat_resource_cache_size',
+               default=64,
+               min=0,
+               help=_('Maximum number of heat stacks whose resource list '
+                      '(nested_depth=2) is kept in memory. A cached list '
+                      'is used as long as no stack event has occurred '
+                      'since it was made, and is updated from the stack '
+                      'events otherwise. If 0, the resource list is got '
+                      'from heat every time.')),
+    cfg.IntOpt('heat_resource_cache_max_events',
+               default=100,
+               min=0,
+               help=_('Maximum number of stack events applied to a cached '
+                      'resource list of a heat stack. If more events have '
+                      'occurred, the whole resource list is got from heat '
+                      'again.')),
+    cfg.IntOpt('vnfd_cache_size',
+               default=64,
+               min=0,
+               help=_('Maximum number of parsed VNFDs kept in memory. A '
+                      'VNFD is parsed again only if its files are '
+                      'modified. If 0, VNFD is parsed every time it is '
+                      'used.')),
+    cfg.IntOpt('userdata_worker_pool_size',
+               default=4,
+               min=0,
+               help=_('Maximum number of idle worker processes kept for '
+                      'executing lcm-operation-user-data classes. A worker '
+                      'keeps the userdata class of a package imported and '
+                      'is reused by the following operations of the '
+                      'package. If 0, a new process is started with a copy '
+                      'of the package for each execution.')),
+    cfg.IntOpt('userdata_worker_idle_timeout',
+               default=600,
+               min=1,
+               help=_('Time (in seconds) after which an idle userdata '
+                      'worker process is stopped.')),
     cfg.IntOpt('kubernetes_vim_rsc_wait_timeout',
                default=500,
                help=_('Timeout (second) of k8s res creation.')),
+    cfg.BoolOpt('kubernetes_vim_rsc_watch',
+                default=True,
+                help=_('If True, the waits for k8s resources to be ready, '
+                       'deleted or updated are woken up by the changes of '
+                       'pods notified by the watch API. The watch verb of '
+                       'pods is necessary for it. If False or the watch '
+                       'is not available, the resources are checked by '
+                       'polling.')),
+    cfg.IntOpt('kubernetes_api_client_idle_timeout',
+               default=300,
+               min=0,
+               help=_('Time (in seconds) after which an idle Kubernetes API '
+                      'client, i.e. its connection pool and CA certificate '
+                      'file, is removed. API clients are reused by the '
+                      'operations of the same VIM connection until then. '
+                      'If 0, an API client is created for each operation.')),
     cfg.IntOpt('vnf_instance_page_size',
                default=0,  # 0 means no paging
                help=_('Paged response size of the query result '
@@ -64,6 +125,55 @@ VNFM_OPTS = [
                       'connection error when sending a notification. '
                       'Period between retries is exponential starting '
                       '0.5 seconds up to a maximum of 60 seconds.')),
+    cfg.IntOpt('subscription_index_resync_interval',
+               default=60,
+               min=0,  # 0 means no periodic resync
+               help=_('Interval in sec to synchronize the in-memory index '
+                      'of subscriptions with DB. The index is updated when '
+                      'a subscription is created or deleted, and this '
+                      'resync only picks up the changes whose update was '
+                      'lost.')),
+    cfg.IntOpt('notification_workers',
+               default=10,
+               help=_('Number of worker threads which send notifications. '
+                      'Notifications are sent concurrently by these '
+                      'threads.')),
+    cfg.IntOpt('notification_queue_size',
+               default=1000,
+               help=_('Maximum number of notifications waiting to be sent. '
+                      'If the queue is full, the sender of a notification '
+                      'waits until there is room in the queue.')),
+    cfg.IntOpt('notification_client_cache_size',
+               default=100,
+               help=_('Maximum number of HTTP clients cached for sending '
+                      'notifications. A client is cached per callbackUri '
+                      'and authentication so that its connection is reused '
+                      'by the following notifications.')),
+    cfg.FloatOpt('timer_wheel_tick',
+                 default=0.1,
+                 min=0.01,
+                 help=_('Resolution (in seconds) of the timers of the '
+                        'conductor, such as the timers packing auto heal '
+                        'requests of prometheus plugin and server '
+                        'notification. All timers are driven by one '
+                        'scheduler thread.')),
+    cfg.IntOpt('timer_wheel_workers',
+               default=10,
+               min=1,
+               help=_('Number of worker threads which execute the expired '
+                      'timers of the conductor.')),
+    cfg.BoolOpt('lcm_op_profile',
+                default=True,
+                help=_('If True, the duration of each phase of LCM '
+                       'operations (ex. grant, infra driver, mgmt driver, '
+                       'notification) is recorded and available by the '
+                       'LCM operation profile API and metrics.')),
+    cfg.IntOpt('lcm_op_profile_retention_period',
+               default=604800,
+               min=0,  # 0 means profiles are kept forever
+               help=_('Retention period in sec of LCM operation profiles. '
+                      'Profiles which started before this are deleted when '
+                      'a new profile is stored.')),
     cfg.IntOpt('vnffm_alarm_page_size',
                default=0,  # 0 means no paging
                help=_('Paged response size of the query result '
@@ -76,6 +186,17 @@ VNFM_OPTS = [
                default=0,  # 0 means no paging
                help=_('Paged response size of the query result for '
                       'VNF PM job.')),
+    cfg.BoolOpt('db_optimistic_locking',
+                default=False,
+                help=_('If True, updating VnfInstance or VnfLcmOpOcc fails '
+                       'when the row in DB has been updated by another '
+                       'request since it was read.')),
+    cfg.IntOpt('vnfpm_report_retention_period',
+               default=0,  # 0 means reports are kept until PM job deleted
+               min=0,
+               help=_('Retention period in sec of VNF PM reports. Reports '
+                      'whose readyTime is older than this are deleted when '
+                      'a new report of the same PM job is stored.')),
     cfg.BoolOpt('placement_fallback_best_effort',
                default=False,
                help=_('If True, fallbackBestEffort setting is enabled '
@@ -305,6 +426,31 @@ PROMETHEUS_PLUGIN_OPTS = [
                       'that requires `collection_period`, '
                       'it is read from the configuration file. '
                       'The unit shall be seconds.')),
+    cfg.IntOpt('ssh_pool_size',
+               default=4,
+               min=0,
+               help=_('Maximum number of idle SSH connections kept per '
+                      'Prometheus server to upload and delete rule files. '
+                      '0 means connections are not reused.')),
+    cfg.IntOpt('ssh_idle_timeout',
+               default=60,
+               min=1,
+               help=_('Time (in seconds) an idle SSH connection to a '
+                      'Prometheus server is kept.')),
+    cfg.IntOpt('rule_upload_workers',
+               default=10,
+               min=1,
+               help=_('Number of threads which upload or delete rule files '
+                      'to the Prometheus servers in parallel.')),
+    cfg.FloatOpt('reload_coalesce_window',
+                 default=0,
+                 min=0,
+                 help=_('Time (in seconds) to wait before reloading a '
+                        'Prometheus server so that the rule changes in '
+                        'the period are reloaded at once. Note that the '
+                        'API request which changes the rules waits for '
+                        'it. 0 (default) means each change is reloaded '
+                        'separately without waiting.')),
 ]
 
 CONF.register_opts(PROMETHEUS_PLUGIN_OPTS, 'prometheus_plugin')
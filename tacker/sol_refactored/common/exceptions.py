@@ -200,6 +200,11 @@ class OtherOperationInProgress(SolHttpError409):
                 "is in progress.")
 
 
+class DbUpdateConflict(SolHttpError409):
+    message = _("%(obj_name)s %(obj_id)s has been updated by another "
+                "request.")
+
+
 class UserDataClassNotImplemented(SolHttpError400):
     message = _("Userdata class not implemented.")
 
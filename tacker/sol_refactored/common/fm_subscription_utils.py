@@ -18,6 +18,7 @@ from oslo_log import log as logging
 
 from tacker.sol_refactored.common import config
 from tacker.sol_refactored.common import exceptions as sol_ex
+from tacker.sol_refactored.common import subscription_index
 from tacker.sol_refactored.common import subscription_utils as subsc_utils
 from tacker.sol_refactored import objects
 
@@ -26,6 +27,20 @@ LOG = logging.getLogger(__name__)
 
 CONF = config.CONF
 
+_subsc_index = subscription_index.SubscriptionIndex(
+    'FmSubscriptionV1',
+    subscription_index.INST_FILTER_KEYS + [
+        ('notificationType', subscription_index.filter_key(
+            'notificationTypes')),
+        ('faultyResourceType', subscription_index.filter_key(
+            'faultyResourceTypes')),
+        ('perceivedSeverity', subscription_index.filter_key(
+            'perceivedSeverities')),
+        ('eventType', subscription_index.filter_key('eventTypes')),
+        ('probableCause', subscription_index.filter_key('probableCauses')),
+    ]
+)
+
 
 def get_subsc(context, subsc_id):
     subsc = objects.FmSubscriptionV1.get_by_id(context, subsc_id)
@@ -42,61 +57,88 @@ def subsc_href(subsc_id, endpoint):
     return f"{endpoint}/vnffm/v1/subscriptions/{subsc_id}"
 
 
+def add_subsc_index(subsc):
+    _subsc_index.add(subsc)
+
+
+def remove_subsc_index(subsc_id):
+    _subsc_index.remove(subsc_id)
+
+
+def reload_subsc_index(context, subsc_id):
+    _subsc_index.reload(context, subsc_id)
+
+
+def match_subsc(subsc, inst, notif_type, alarm):
+    # subsc: FmSubscription
+
+    if not subsc.obj_attr_is_set('filter'):
+        # no filter. get it.
+        return True
+
+    # subsc.filter: FmNotificationsFilter
+    # - vnfInstanceSubscriptionFilter 0..1
+    # - notificationTypes 0..N
+    # - faultyResourceTypes 0..N
+    # - perceivedSeverities 0..N
+    # - eventTypes 0..N
+    # - probableCauses 0..N
+    if alarm.obj_attr_is_set('rootCauseFaultyResource'):
+        alarm_faulty_res_type = (
+            alarm.rootCauseFaultyResource.faultyResourceType)
+    else:
+        alarm_faulty_res_type = None
+
+    if subsc.filter.obj_attr_is_set('vnfInstanceSubscriptionFilter'):
+        inst_filter = subsc.filter.vnfInstanceSubscriptionFilter
+        if not subsc_utils.match_inst_subsc_filter(inst_filter, inst):
+            return False
+
+    if subsc.filter.obj_attr_is_set('notificationTypes'):
+        if notif_type not in subsc.filter.notificationTypes:
+            return False
+
+    if (alarm_faulty_res_type is not None and
+            subsc.filter.obj_attr_is_set('faultyResourceTypes')):
+        if alarm_faulty_res_type not in subsc.filter.faultyResourceTypes:
+            return False
+
+    if (alarm.perceivedSeverity is not None and
+            subsc.filter.obj_attr_is_set('perceivedSeverities')):
+        if alarm.perceivedSeverity not in subsc.filter.perceivedSeverities:
+            return False
+
+    if (alarm.eventType is not None and
+            subsc.filter.obj_attr_is_set('eventTypes')):
+        if alarm.eventType not in subsc.filter.eventTypes:
+            return False
+
+    if (alarm.probableCause is not None and
+            subsc.filter.obj_attr_is_set('probableCauses')):
+        if alarm.probableCause not in subsc.filter.probableCauses:
+            return False
+
+    # OK, matched
+    return True
+
+
 def get_matched_subscs(context, inst, notif_type, alarm):
-    subscs = []
-    for subsc in get_subsc_all(context):
-        # subsc: FmSubscription
-
-        if not subsc.obj_attr_is_set('filter'):
-            # no filter. get it.
-            subscs.append(subsc)
-            continue
-
-        # subsc.filter: FmNotificationsFilter
-        # - vnfInstanceSubscriptionFilter 0..1
-        # - notificationTypes 0..N
-        # - faultyResourceTypes 0..N
-        # - perceivedSeverities 0..N
-        # - eventTypes 0..N
-        # - probableCauses 0..N
-        if alarm.obj_attr_is_set('rootCauseFaultyResource'):
-            alarm_faulty_res_type = (
-                alarm.rootCauseFaultyResource.faultyResourceType)
-        else:
-            alarm_faulty_res_type = None
-
-        if subsc.filter.obj_attr_is_set('vnfInstanceSubscriptionFilter'):
-            inst_filter = subsc.filter.vnfInstanceSubscriptionFilter
-            if not subsc_utils.match_inst_subsc_filter(inst_filter, inst):
-                continue
-
-        if subsc.filter.obj_attr_is_set('notificationTypes'):
-            if notif_type not in subsc.filter.notificationTypes:
-                continue
-
-        if (alarm_faulty_res_type is not None and
-                subsc.filter.obj_attr_is_set('faultyResourceTypes')):
-            if alarm_faulty_res_type not in subsc.filter.faultyResourceTypes:
-                continue
-
-        if (alarm.perceivedSeverity is not None and
-                subsc.filter.obj_attr_is_set('perceivedSeverities')):
-            if alarm.perceivedSeverity not in subsc.filter.perceivedSeverities:
-                continue
-
-        if (alarm.eventType is not None and
-                subsc.filter.obj_attr_is_set('eventTypes')):
-            if alarm.eventType not in subsc.filter.eventTypes:
-                continue
-
-        if (alarm.probableCause is not None and
-                subsc.filter.obj_attr_is_set('probableCauses')):
-            if alarm.probableCause not in subsc.filter.probableCauses:
-                continue
-        # OK, matched
-        subscs.append(subsc)
-
-    return subscs
+    conditions = subscription_index.inst_conditions(inst)
+    conditions['notificationType'] = [notif_type]
+    if alarm.obj_attr_is_set('rootCauseFaultyResource'):
+        conditions['faultyResourceType'] = [
+            alarm.rootCauseFaultyResource.faultyResourceType]
+    if alarm.perceivedSeverity is not None:
+        conditions['perceivedSeverity'] = [alarm.perceivedSeverity]
+    if alarm.eventType is not None:
+        conditions['eventType'] = [alarm.eventType]
+    if alarm.probableCause is not None:
+        conditions['probableCause'] = [alarm.probableCause]
+
+    # NOTE: the candidates got from the index satisfy the indexed keys
+    # only. check whole filter of the candidates.
+    return [subsc for subsc in _subsc_index.match(context, conditions)
+            if match_subsc(subsc, inst, notif_type, alarm)]
 
 
 def get_alarm_subscs(context, alarm, inst):
@@ -15,6 +15,9 @@
 
 
 import abc
+import hashlib
+import threading
+import time
 import urllib
 
 from keystoneauth1 import adapter
@@ -32,12 +35,16 @@ from tacker.sol_refactored.objects import base
 
 LOG = logging.getLogger(__name__)
 
+# NOTE: an access token is refreshed this seconds before it expires
+# not to be rejected because of the expiration during a request.
+OAUTH2_TOKEN_REFRESH_MARGIN = 10
+
 
 class HttpClient(object):
 
     def __init__(self, auth_handle, version=None,
             service_type='nfv-orchestration', connect_retries=None,
-            timeout=None, base_url=None):
+            timeout=None, base_url=None, reuse_session=False):
         self.auth_handle = auth_handle
         self.version = version
         self.service_type = service_type
@@ -46,6 +53,21 @@ class HttpClient(object):
         self.connect_retries = connect_retries
         self.timeout = timeout
         self.base_url = base_url
+        # NOTE: if reuse_session is True, the session is created at
+        # the first request and used for the following requests so
+        # that the connection is kept alive. It must not be used with
+        # auth_handle which authentication depends on the context.
+        self.reuse_session = reuse_session
+        self._session = None
+
+    def _get_session(self, context):
+        if not self.reuse_session:
+            return self.auth_handle.get_session(
+                self.auth_handle.get_auth(context), self.service_type)
+        if self._session is None:
+            self._session = self.auth_handle.get_session(
+                self.auth_handle.get_auth(context), self.service_type)
+        return self._session
 
     def do_request(self, url, method, context=None, expected_status=[],
                    **kwargs):
@@ -74,8 +96,7 @@ class HttpClient(object):
         if self.base_url is not None:
             kwargs.setdefault('endpoint_override', self.base_url)
 
-        session = self.auth_handle.get_session(
-            self.auth_handle.get_auth(context), self.service_type)
+        session = self._get_session(context)
         resp = session.request(url, method, raise_exc=False, **kwargs)
 
         resp_body = self._decode_body(resp)
@@ -198,6 +219,60 @@ class NoAuthHandle(AuthHandle):
         return session.Session(auth=auth, verify=self.verify)
 
 
+class OAuth2TokenCache(object):
+    """Process-wide cache of OAuth2.0 access tokens.
+
+    A token is cached until 'expires_in' of the token response minus
+    OAUTH2_TOKEN_REFRESH_MARGIN. A token without 'expires_in' is not
+    cached. Only one thread gets a token for the same key at the same
+    time and the other threads wait and use the result of it.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.tokens = {}
+        self.key_locks = {}
+
+    def _get_valid(self, key):
+        entry = self.tokens.get(key)
+        if entry is not None and entry[1] > time.monotonic():
+            return entry[0]
+
+    def get(self, key, fetch_token):
+        token = self._get_valid(key)
+        if token is not None:
+            return token
+
+        with self.lock:
+            key_lock = self.key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            # NOTE: it may be got by another thread while waiting.
+            token = self._get_valid(key)
+            if token is not None:
+                return token
+
+            resp_body = fetch_token()
+            if resp_body is None:
+                return
+            token = resp_body['access_token']
+            expires_in = resp_body.get('expires_in')
+            if expires_in is not None:
+                expires_at = (time.monotonic() + int(expires_in) -
+                              OAUTH2_TOKEN_REFRESH_MARGIN)
+                self.tokens[key] = (token, expires_at)
+            return token
+
+    def invalidate(self, key):
+        self.tokens.pop(key, None)
+
+    def clear(self):
+        self.tokens.clear()
+
+
+OAUTH2_TOKEN_CACHE = OAuth2TokenCache()
+
+
 class OAuth2AuthPlugin(plugin.FixedEndpointPlugin):
 
     def __init__(self, endpoint, token_endpoint, client_id, client_password,
@@ -208,7 +283,12 @@ class OAuth2AuthPlugin(plugin.FixedEndpointPlugin):
         self.client_password = client_password
         self.verify = verify
 
-    def get_token(self, session, **kwargs):
+    def _cache_key(self):
+        password_hash = hashlib.sha256(
+            (self.client_password or '').encode()).hexdigest()
+        return (self.token_endpoint, self.client_id, password_hash)
+
+    def _fetch_token(self):
         auth = BasicAuthHandle(self.client_id,
                                self.client_password,
                                self.verify)
@@ -224,7 +304,10 @@ class OAuth2AuthPlugin(plugin.FixedEndpointPlugin):
             LOG.error("get OAuth2 token failed: %d" % resp.status_code)
             return
 
-        return resp_body['access_token']
+        return resp_body
+
+    def get_token(self, session, **kwargs):
+        return OAUTH2_TOKEN_CACHE.get(self._cache_key(), self._fetch_token)
 
     def get_headers(self, session, **kwargs):
         token = self.get_token(session)
@@ -233,6 +316,12 @@ class OAuth2AuthPlugin(plugin.FixedEndpointPlugin):
         auth = 'Bearer %s' % token
         return {'Authorization': auth}
 
+    def invalidate(self):
+        # NOTE: it is called when 401 is returned. keystoneauth1 session
+        # retries the request with a new token if True is returned.
+        OAUTH2_TOKEN_CACHE.invalidate(self._cache_key())
+        return True
+
 
 class OAuth2AuthHandle(AuthHandle):
 
@@ -279,7 +368,10 @@ class OAuth2MtlsAuthPlugin(plugin.FixedEndpointPlugin):
         self.verify_cert = verify_cert
         self.client_cert = client_cert
 
-    def get_token(self, session, **kwargs):
+    def _cache_key(self):
+        return (self.token_endpoint, self.client_id, self.client_cert)
+
+    def _fetch_token(self):
         auth = CertAuthMtlsHandle(self.endpoint, self.verify_cert,
             self.client_cert)
         client = HttpClient(auth)
@@ -298,7 +390,10 @@ class OAuth2MtlsAuthPlugin(plugin.FixedEndpointPlugin):
             LOG.error("get OAuth2 mTLS token failed: %d" % resp.status_code)
             return
 
-        return resp_body['access_token']
+        return resp_body
+
+    def get_token(self, session, **kwargs):
+        return OAUTH2_TOKEN_CACHE.get(self._cache_key(), self._fetch_token)
 
     def get_headers(self, session, **kwargs):
         token = self.get_token(session)
@@ -307,6 +402,11 @@ class OAuth2MtlsAuthPlugin(plugin.FixedEndpointPlugin):
         auth = 'Bearer %s' % token
         return {'Authorization': auth}
 
+    def invalidate(self):
+        # NOTE: see OAuth2AuthPlugin.invalidate
+        OAUTH2_TOKEN_CACHE.invalidate(self._cache_key())
+        return True
+
 
 class OAuth2MtlsAuthHandle(AuthHandle):
 
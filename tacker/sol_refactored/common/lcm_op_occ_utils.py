@@ -600,7 +600,7 @@ def check_lcmocc_in_progress(context, inst_id):
     # check here is existence of lcmocc for the vnf instance with
     # FAILED_TEMP operationState.
     lcmoccs = objects.VnfLcmOpOccV2.get_by_filter(
-        context, vnfInstanceId=inst_id,
+        context, attrs=['id'], vnfInstanceId=inst_id,
         operationState=fields.LcmOperationStateType.FAILED_TEMP)
     if lcmoccs:
         raise sol_ex.OtherOperationInProgress(inst_id=inst_id)
@@ -0,0 +1,252 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import contextlib
+import datetime
+import functools
+import threading
+import time
+
+from oslo_log import log as logging
+from oslo_utils import timeutils
+from oslo_utils import uuidutils
+
+from tacker.sol_refactored.common import config
+from tacker.sol_refactored import objects
+
+
+LOG = logging.getLogger(__name__)
+
+CONF = config.CONF
+
+# upper bounds (in seconds) of the buckets of the histograms.
+METRICS_BUCKETS = (0.1, 0.5, 1, 5, 10, 30, 60, 120, 300, 600, 1800, 3600)
+
+# NOTE: lcm_profiler records the duration of each phase of an execution
+# (start, retry or rollback) of a v2 LCM operation.
+#
+# - profile_lcm_op() activates a profile for the thread (i.e. green thread
+#   in the conductor) executing the LCM operation and stores it as a
+#   LcmOpProfileV2 at the end.
+# - The phases (ex. grant, infra driver, mgmt driver, notification) are
+#   recorded by phase() and measure(). A phase inside another phase is
+#   named by joining the names by '.', ex. 'process.heat_wait'.
+# - phase() and measure() do nothing if there is no active profile, so
+#   they can be put on the code shared with other than LCM operations.
+# - The durations are also added to the buckets of the histograms in
+#   LcmOpMetricV2 when a profile is stored. get_metrics() reads only
+#   them, so it does not depend on the number of the stored profiles and
+#   the histograms are not decreased when the profiles expire.
+
+_local = threading.local()
+
+
+class _Profile(object):
+
+    def __init__(self):
+        self.origin = time.monotonic()
+        self.names = []
+        self.phases = []
+
+
+@contextlib.contextmanager
+def phase(name):
+    """Record the duration of the block as a phase."""
+    prof = getattr(_local, 'profile', None)
+    if prof is None:
+        yield
+        return
+
+    prof.names.append(name)
+    full_name = '.'.join(prof.names)
+    start = time.monotonic()
+    try:
+        yield
+    finally:
+        end = time.monotonic()
+        prof.names.pop()
+        prof.phases.append(objects.LcmOpProfileV2_Phases(
+            name=full_name,
+            start=start - prof.origin,
+            duration=end - start
+        ))
+
+
+def measure(name):
+    """Decorator to record the duration of the function as a phase."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with phase(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def profile_lcm_op(action):
+    """Decorator to profile an execution of a LCM operation.
+
+    The decorated function must take context and lcmocc as the first
+    arguments following self. action is one of 'START', 'RETRY' and
+    'ROLLBACK'.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, context, lcmocc, *args, **kwargs):
+            if (not CONF.v2_vnfm.lcm_op_profile or
+                    getattr(_local, 'profile', None) is not None):
+                return func(self, context, lcmocc, *args, **kwargs)
+
+            start_time = timeutils.utcnow()
+            prof = _Profile()
+            _local.profile = prof
+            try:
+                return func(self, context, lcmocc, *args, **kwargs)
+            finally:
+                _local.profile = None
+                duration = time.monotonic() - prof.origin
+                _store_profile(context, lcmocc, action, start_time,
+                               duration, prof.phases)
+        return wrapper
+    return decorator
+
+
+def _store_profile(context, lcmocc, action, start_time, duration, phases):
+    # NOTE: storing the profile must not affect the LCM operation.
+    try:
+        profile = objects.LcmOpProfileV2(
+            id=uuidutils.generate_uuid(),
+            lcmOpOccId=lcmocc.id,
+            vnfInstanceId=lcmocc.vnfInstanceId,
+            operation=lcmocc.operation,
+            action=action,
+            operationState=lcmocc.operationState,
+            startTime=start_time,
+            duration=duration,
+            phases=sorted(phases, key=lambda p: p.start)
+        )
+        profile.create(context)
+        _store_metrics(context, lcmocc.operation, duration, phases)
+        LOG.info("%s %s of VnfLcmOpOcc %s took %.3f sec.", action,
+                 lcmocc.operation, lcmocc.id, duration)
+
+        retention_period = CONF.v2_vnfm.lcm_op_profile_retention_period
+        if retention_period:
+            num = objects.LcmOpProfileV2.delete_profiles(
+                context, start_time - datetime.timedelta(
+                    seconds=retention_period))
+            if num:
+                LOG.debug("%d expired LCM operation profiles deleted.",
+                          num)
+    except Exception:
+        LOG.exception("Storing the profile of VnfLcmOpOcc %s failed.",
+                      lcmocc.id)
+
+
+def get_profiles(context, lcmocc_id):
+    profiles = objects.LcmOpProfileV2.get_by_filter(context,
+                                                    lcmOpOccId=lcmocc_id)
+    return sorted(profiles, key=lambda p: p.startTime)
+
+
+def _bucket(value):
+    for bound in METRICS_BUCKETS:
+        if value <= bound:
+            return str(bound)
+    return '+Inf'
+
+
+def _store_metrics(context, operation, duration, phases):
+    observations = {}
+
+    def _observe(phase_name, value):
+        key = (operation, phase_name, _bucket(value))
+        count, total = observations.get(key, (0, 0.0))
+        observations[key] = (count + 1, total + value)
+
+    # NOTE: phase '' is the whole execution.
+    _observe('', duration)
+    for item in phases:
+        _observe(item.name, item.duration)
+    objects.LcmOpMetricV2.add_observations(context, observations)
+
+
+class _Histogram(object):
+
+    def __init__(self):
+        self.buckets = [0] * len(METRICS_BUCKETS)
+        self.count = 0
+        self.sum = 0.0
+
+    def add(self, le, count, total):
+        """Add the count and the sum of a bucket.
+
+        le is the upper bound of the bucket and the counts of all the
+        buckets whose bound is not less than le are increased.
+        """
+        for i, bound in enumerate(METRICS_BUCKETS):
+            if le <= bound:
+                self.buckets[i] += count
+        self.count += count
+        self.sum += total
+
+
+def _label_value(value):
+    return (value.replace('\\', '\\\\').replace('"', '\\"')
+            .replace('\n', '\\n'))
+
+
+def _format_histogram(name, description, histograms):
+    lines = [f'# HELP {name} {description}',
+             f'# TYPE {name} histogram']
+    for labels, hist in sorted(histograms.items()):
+        label_str = ','.join(f'{key}="{_label_value(value)}"'
+                             for key, value in labels)
+        for bound, count in zip(METRICS_BUCKETS, hist.buckets):
+            lines.append(f'{name}_bucket{{{label_str},le="{bound}"}} '
+                         f'{count}')
+        lines.append(f'{name}_bucket{{{label_str},le="+Inf"}} {hist.count}')
+        lines.append(f'{name}_sum{{{label_str}}} {hist.sum}')
+        lines.append(f'{name}_count{{{label_str}}} {hist.count}')
+    return lines
+
+
+def get_metrics(context):
+    """Return the histograms of the durations of LCM operations.
+
+    The return value is a text in Prometheus exposition format.
+    """
+    metrics = objects.LcmOpMetricV2.get_dict_all(
+        context, ['operation', 'phase', 'le', 'count', 'sum'], None, None)
+
+    op_hists = {}
+    phase_hists = {}
+    # NOTE: the buckets are added in order so that the sums are stable.
+    for metric in sorted(metrics, key=lambda m: float(m['le'])):
+        labels = (('operation', metric['operation']),)
+        hists = op_hists
+        if metric['phase']:
+            labels += (('phase', metric['phase']),)
+            hists = phase_hists
+        hists.setdefault(labels, _Histogram()).add(
+            float(metric['le']), metric['count'], metric['sum'])
+
+    lines = _format_histogram(
+        'tacker_lcm_op_duration_seconds',
+        'Duration of the executions of LCM operations.', op_hists)
+    lines += _format_histogram(
+        'tacker_lcm_op_phase_duration_seconds',
+        'Duration of the phases of LCM operations.', phase_hists)
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,101 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import queue
+import threading
+import time
+
+from oslo_log import log as logging
+
+
+LOG = logging.getLogger(__name__)
+
+
+# NOTE: NotificationDispatcher runs notification deliveries by a fixed
+# number of worker threads instead of starting a thread per notification.
+# Deliveries are queued and the caller of 'submit' is blocked while the
+# queue is full (i.e. backpressure). Worker threads are started at the
+# first 'submit' so that the process which does not send notifications
+# does not have them.
+
+class NotificationDispatcher(object):
+
+    def __init__(self, num_workers, max_queue_size):
+        self.num_workers = num_workers
+        self.queue = queue.Queue(maxsize=max_queue_size)
+        self.lock = threading.Lock()
+        self.workers = []
+        self.stats = {
+            'delivered': 0,
+            'failed': 0,
+            'latency_sum': 0.0,
+            'latency_max': 0.0,
+        }
+
+    def _start_workers(self):
+        with self.lock:
+            if self.workers:
+                return
+            for _ in range(self.num_workers):
+                th = threading.Thread(target=self._worker, daemon=True)
+                th.start()
+                self.workers.append(th)
+
+    def _worker(self):
+        while True:
+            func, args, kwargs, queued_at = self.queue.get()
+            start = time.monotonic()
+            try:
+                func(*args, **kwargs)
+                success = True
+            except Exception:
+                # NOTE: func is expected to handle errors by itself.
+                # it is a last resort not to stop the worker.
+                LOG.exception("notification delivery failed.")
+                success = False
+            finally:
+                end = time.monotonic()
+                self._record(success, end - start, end - queued_at)
+                self.queue.task_done()
+
+    def _record(self, success, latency, total_latency):
+        with self.lock:
+            if success:
+                self.stats['delivered'] += 1
+            else:
+                self.stats['failed'] += 1
+            self.stats['latency_sum'] += latency
+            self.stats['latency_max'] = max(self.stats['latency_max'],
+                                            latency)
+        LOG.debug("notification delivered in %.3f sec (%.3f sec including "
+                  "queueing).", latency, total_latency)
+
+    def submit(self, func, *args, **kwargs):
+        self._start_workers()
+        # NOTE: blocks while the queue is full.
+        self.queue.put((func, args, kwargs, time.monotonic()))
+
+    def join(self):
+        """Wait until all queued deliveries are done."""
+        self.queue.join()
+
+    def get_stats(self):
+        with self.lock:
+            stats = dict(self.stats)
+        count = stats['delivered'] + stats['failed']
+        stats['latency_avg'] = stats['latency_sum'] / count if count else 0.0
+        stats['queue_depth'] = self.queue.qsize()
+        stats['workers'] = len(self.workers)
+        return stats
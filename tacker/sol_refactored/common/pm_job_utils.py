@@ -14,7 +14,10 @@
 #    under the License.
 
 
+import datetime
+
 from oslo_log import log as logging
+from oslo_utils import timeutils
 from oslo_utils import uuidutils
 
 from tacker.sol_refactored.common import config
@@ -26,24 +29,79 @@ LOG = logging.getLogger(__name__)
 CONF = config.CONF
 
 
-def update_report(context, job_id, report, timestamp, endpoint):
-    # update reports in the pmJob
-    pm_job = get_pm_job(context, job_id)
-
-    job_report = _gen_job_report(job_id, report, timestamp, endpoint)
-
-    if pm_job.obj_attr_is_set('reports'):
-        pm_job.reports.append(job_report)
-    else:
-        pm_job.reports = [job_report]
-
-    return pm_job
-
-
-def _gen_job_report(job_id, report, timestamp, endpoint):
+def make_report_entries(report, ready_time):
+    # NOTE: a PerformanceReportEntryV2 is made for each performanceValue
+    # of the report. timeStamp and readyTime are normalized to UTC since
+    # DateTime column does not keep timezone.
+    ready_time = timeutils.normalize_time(ready_time)
+    entries = []
+    for entry in report.entries:
+        for value in entry.performanceValues:
+            entries.append(objects.PerformanceReportEntryV2(
+                id=uuidutils.generate_uuid(),
+                reportId=report.id,
+                jobId=report.jobId,
+                objectInstanceId=entry.objectInstanceId,
+                subObjectInstanceId=entry.get('subObjectInstanceId'),
+                performanceMetric=entry.performanceMetric,
+                timeStamp=timeutils.normalize_time(value.timeStamp),
+                readyTime=ready_time
+            ))
+    return entries
+
+
+def get_latest_report_times(context, job_ids, object_instance_ids):
+    # NOTE: the latest report times of all metrics of the PM jobs are
+    # gotten at once. use find_latest_report_time to look up the result.
+    return objects.PerformanceReportEntryV2.get_latest_time_stamps(
+        context, list(job_ids), list(object_instance_ids))
+
+
+def find_latest_report_time(latest_report_times, job_id, object_instance_id,
+                            sub_object_instance_id, metric):
+    # NOTE: look up the result of get_latest_report_times. an entry
+    # without subObjectInstanceId matches any sub_object_instance_id.
+    times = [latest_report_times.get(
+        (job_id, object_instance_id, sub_id, metric))
+        for sub_id in {None, sub_object_instance_id}]
+    times = [report_time for report_time in times
+             if report_time is not None]
+    return max(times) if times else None
+
+
+def set_pm_job_reports(context, pm_jobs, endpoint):
+    # NOTE: reports are not saved in PmJobV2 but made from
+    # PerformanceReportEntryV2 when PM jobs are shown. the links saved in
+    # PmJobV2 by the former version are moved to PerformanceReportEntryV2
+    # by the DB migration, except the ones whose report does not exist.
+    # they are shown as they are.
+    job_reports = objects.PerformanceReportEntryV2.get_reports(
+        context, [pm_job.id for pm_job in pm_jobs])
+    for pm_job in pm_jobs:
+        reports = (list(pm_job.reports)
+                   if pm_job.obj_attr_is_set('reports') else [])
+        reports += [_gen_job_report(pm_job.id, report_id, ready_time,
+                                    endpoint)
+                    for report_id, ready_time in job_reports[pm_job.id]]
+        pm_job.reports = reports
+
+
+def delete_expired_reports(context, job_id):
+    retention_period = CONF.v2_vnfm.vnfpm_report_retention_period
+    if not retention_period:
+        return
+    ready_before = timeutils.utcnow() - datetime.timedelta(
+        seconds=retention_period)
+    num = objects.PerformanceReportEntryV2.delete_reports(
+        context, job_id, ready_before=ready_before)
+    if num:
+        LOG.debug("%d expired reports of PM job %s deleted.", num, job_id)
+
+
+def _gen_job_report(job_id, report_id, ready_time, endpoint):
     return objects.VnfPmJobV2_Reports(
-        href=f'{endpoint}/vnfpm/v2/pm_jobs/{job_id}/reports/{report.id}',
-        readyTime=timestamp
+        href=f'{endpoint}/vnfpm/v2/pm_jobs/{job_id}/reports/{report_id}',
+        readyTime=ready_time
     )
 
 
@@ -60,6 +118,13 @@ def get_pm_job(context, pm_job_id):
     return pm_job
 
 
+def get_pm_jobs(context, pm_job_ids):
+    # get the PM jobs from DB at once. the return value is a dict whose
+    # key is a PM job id. PM jobs which do not exist are not included.
+    pm_jobs = objects.PmJobV2.get_by_ids(context, list(pm_job_ids))
+    return {pm_job.id: pm_job for pm_job in pm_jobs}
+
+
 def get_pm_report(context, pm_job_id, report_id=None):
     if report_id:
         pm_report = objects.PerformanceReportV2.get_by_filter(
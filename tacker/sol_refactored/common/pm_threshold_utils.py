@@ -35,6 +35,14 @@ def get_pm_threshold(context, pm_threshold_id):
     return objects.ThresholdV2.get_by_id(context, pm_threshold_id)
 
 
+def get_pm_thresholds(context, pm_threshold_ids):
+    # the return value is a dict whose key is a threshold id. thresholds
+    # which do not exist are not included.
+    pm_thresholds = objects.ThresholdV2.get_by_ids(context,
+                                                   list(pm_threshold_ids))
+    return {pm_threshold.id: pm_threshold for pm_threshold in pm_thresholds}
+
+
 def get_pm_threshold_state(pm_threshold, sub_object_instance_id):
     if (not pm_threshold.obj_attr_is_set('metadata') or
             not pm_threshold.metadata.get('thresholdState')):
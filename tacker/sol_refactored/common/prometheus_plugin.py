@@ -13,13 +13,15 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+from concurrent import futures
+import contextlib
 import datetime
-import itertools
+import io
 import json
-import os
 import paramiko
 import re
-import tempfile
+import threading
+import time
 import yaml
 
 from keystoneauth1 import exceptions as ks_exc
@@ -57,11 +59,184 @@ class PrometheusPlugin():
         return t if t.tzinfo else t.astimezone()
 
 
+class SshConnectionPool():
+    """Pool of SSH connections to the Prometheus servers.
+
+    Rule files are uploaded, verified and deleted via a
+    paramiko.Transport taken from the pool, so that an SSH handshake
+    is not necessary for each rule file. At most ssh_pool_size idle
+    connections are kept per server for ssh_idle_timeout seconds. The
+    expired connections are closed by a timer, which runs only while
+    there are idle connections.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        # key: (host, port, user, password), value: list of tuples of
+        # idle transport and the time it is released.
+        self.idle = {}
+        self.reaper = None
+
+    @contextlib.contextmanager
+    def connection(self, host, port, user, password):
+        key = (host, port, user, password)
+        transport = self._acquire(key)
+        try:
+            yield transport
+        except Exception:
+            # NOTE: the connection may be broken. it is not reused.
+            transport.close()
+            raise
+        self._release(key, transport)
+
+    def _acquire(self, key):
+        now = time.monotonic()
+        transport = None
+        expired = []
+        with self.lock:
+            conns = self.idle.get(key, [])
+            while conns:
+                conn, released_at = conns.pop()
+                if (now - released_at <
+                        CONF.prometheus_plugin.ssh_idle_timeout and
+                        conn.is_active()):
+                    transport = conn
+                    break
+                expired.append(conn)
+        for conn in expired:
+            conn.close()
+        if transport is not None:
+            return transport
+
+        host, port, user, password = key
+        transport = paramiko.Transport(sock=(host, port))
+        try:
+            transport.connect(username=user, password=password)
+        except Exception:
+            transport.close()
+            raise
+        return transport
+
+    def _release(self, key, transport):
+        with self.lock:
+            conns = self.idle.setdefault(key, [])
+            if (len(conns) < CONF.prometheus_plugin.ssh_pool_size and
+                    transport.is_active()):
+                conns.append((transport, time.monotonic()))
+                if self.reaper is None:
+                    self._start_reaper(
+                        CONF.prometheus_plugin.ssh_idle_timeout)
+                return
+        transport.close()
+
+    def _start_reaper(self, delay):
+        # NOTE: called with the lock held.
+        self.reaper = threading.Timer(delay, self._reap)
+        self.reaper.daemon = True
+        self.reaper.start()
+
+    def _reap(self):
+        """Close the connections idle for ssh_idle_timeout seconds."""
+        timeout = CONF.prometheus_plugin.ssh_idle_timeout
+        now = time.monotonic()
+        expired = []
+        with self.lock:
+            self.reaper = None
+            next_expiry = None
+            for key in list(self.idle):
+                conns = []
+                for conn, released_at in self.idle[key]:
+                    if now - released_at < timeout and conn.is_active():
+                        conns.append((conn, released_at))
+                        expiry = released_at + timeout
+                        if next_expiry is None or expiry < next_expiry:
+                            next_expiry = expiry
+                    else:
+                        expired.append(conn)
+                if conns:
+                    self.idle[key] = conns
+                else:
+                    del self.idle[key]
+            if next_expiry is not None:
+                self._start_reaper(next_expiry - now)
+        for conn in expired:
+            conn.close()
+
+    def close(self):
+        """Close all the idle connections."""
+        with self.lock:
+            if self.reaper is not None:
+                self.reaper.cancel()
+                self.reaper = None
+            conns = [conn for key_conns in self.idle.values()
+                     for conn, _ in key_conns]
+            self.idle = {}
+        for conn in conns:
+            conn.close()
+
+
+class _ReloadRequest():
+    def __init__(self):
+        self.done = threading.Event()
+        self.error = None
+
+
+class ReloadCoalescer():
+    """Coalesce reloading requests to a Prometheus server.
+
+    If reload_coalesce_window is set (it is disabled by default since
+    the wait delays the API response), the first request to a server
+    waits for reload_coalesce_window seconds and then reloads the
+    server. The requests which come during the wait do not reload the
+    server by themselves but wait for the reload of the first request,
+    which is sent after their rule files are uploaded.
+    """
+
+    def __init__(self, reload_func):
+        self.reload_func = reload_func
+        self.lock = threading.Lock()
+        self.pending = {}
+
+    def reload(self, context, uri):
+        window = CONF.prometheus_plugin.reload_coalesce_window
+        if not window:
+            self.reload_func(context, uri)
+            return
+
+        with self.lock:
+            req = self.pending.get(uri)
+            first = req is None
+            if first:
+                req = _ReloadRequest()
+                self.pending[uri] = req
+
+        if first:
+            time.sleep(window)
+            with self.lock:
+                # NOTE: the requests after this send another reload
+                # since their rule files may not be uploaded before this
+                # reload.
+                del self.pending[uri]
+            try:
+                self.reload_func(context, uri)
+            except Exception as ex:
+                req.error = ex
+            finally:
+                req.done.set()
+        else:
+            req.done.wait()
+
+        if req.error is not None:
+            raise req.error
+
+
 class PrometheusPluginPmBase(PrometheusPlugin):
     def __init__(self):
         super(PrometheusPluginPmBase, self).__init__()
         auth_handle = http_client.NoAuthHandle()
         self.client = http_client.HttpClient(auth_handle)
+        self.ssh_pool = SshConnectionPool()
+        self.reloader = ReloadCoalescer(self.reload_prom_server)
 
     def set_callback(self, notification_callback):
         self.notification_callback = notification_callback
@@ -266,10 +441,12 @@ class PrometheusPluginPmBase(PrometheusPlugin):
         return resources[0].computeResource
 
     def _delete_rule(self, host, port, user, password, path, id):
-        with paramiko.Transport(sock=(host, port)) as client:
-            client.connect(username=user, password=password)
+        with self.ssh_pool.connection(host, port, user, password) as client:
             sftp = paramiko.SFTPClient.from_transport(client)
-            sftp.remove(f'{path}/{id}.json')
+            try:
+                sftp.remove(f'{path}/{id}.json')
+            finally:
+                sftp.close()
 
     def reload_prom_server(self, context, reload_uri):
         resp, _ = self.client.do_request(
@@ -280,29 +457,33 @@ class PrometheusPluginPmBase(PrometheusPlugin):
                 f"{resp.status_code}.")
 
     def _upload_rule(self, rule_group, host, port, user, password, path, id):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            with open(os.path.join(tmpdir, 'rule.json'),
-                      'w+', encoding="utf-8") as fp:
-                json.dump(rule_group, fp, indent=4, ensure_ascii=False)
-                filename = fp.name
-            with paramiko.Transport(sock=(host, port)) as client:
-                LOG.info("Upload rule files to prometheus server: %s.", host)
-                client.connect(username=user, password=password)
-                sftp = paramiko.SFTPClient.from_transport(client)
-                sftp.put(filename, f'{path}/{id}.json')
+        # NOTE: the rule file is written from memory without a temporary
+        # file.
+        data = json.dumps(rule_group, indent=4,
+                          ensure_ascii=False).encode('utf-8')
+        with self.ssh_pool.connection(host, port, user, password) as client:
+            LOG.info("Upload rule files to prometheus server: %s.", host)
+            sftp = paramiko.SFTPClient.from_transport(client)
+            try:
+                sftp.putfo(io.BytesIO(data), f'{path}/{id}.json')
+            finally:
+                sftp.close()
         self.verify_rule(host, port, user, password, path, id)
 
     def verify_rule(self, host, port, user, password, path, id):
         if not CONF.prometheus_plugin.test_rule_with_promtool:
             return
-        with paramiko.SSHClient() as client:
-            client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-            client.connect(host, port=port, username=user, password=password)
+        with self.ssh_pool.connection(host, port, user, password) as client:
             command = f"promtool check rules {path}/{id}.json"
             LOG.info("Rule file validation command: %s", command)
-            _, stdout, stderr = client.exec_command(command)
-            if stdout.channel.recv_exit_status() != 0:
-                error_byte = stderr.read()
+            channel = client.open_session()
+            try:
+                channel.exec_command(command)
+                exit_status = channel.recv_exit_status()
+                error_byte = channel.makefile_stderr().read()
+            finally:
+                channel.close()
+            if exit_status != 0:
                 error_str = error_byte.decode('utf-8')
                 LOG.error(
                     "Rule file validation with promtool failed: %s",
@@ -310,25 +491,56 @@ class PrometheusPluginPmBase(PrometheusPlugin):
                 raise sol_ex.PrometheusPluginError(
                     "Rule file validation with promtool failed.")
 
+    def _run_parallel(self, func, items):
+        """Call func for each item in parallel.
+
+        Return the exceptions raised by func (None if not raised) in the
+        order of items.
+        """
+        if len(items) <= 1:
+            errors = []
+            for item in items:
+                try:
+                    func(item)
+                    errors.append(None)
+                except Exception as ex:
+                    errors.append(ex)
+            return errors
+
+        max_workers = min(len(items),
+                          CONF.prometheus_plugin.rule_upload_workers)
+        with futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            fs = [executor.submit(func, item) for item in items]
+        return [f.exception() for f in fs]
+
+    def _reload_prom_servers(self, context, reload_list):
+        errors = self._run_parallel(
+            lambda uri: self.reloader.reload(context, uri), reload_list)
+        for error in errors:
+            if error is not None:
+                raise error
+
     def delete_rules(self, context, pm_job_or_threshold):
         target_list, reload_list = self.get_access_info(pm_job_or_threshold)
-        for target in target_list:
-            try:
-                self._delete_rule(
-                    target['host'], target['port'], target['user'],
-                    target['password'], target['path'], pm_job_or_threshold.id)
-            except (sol_ex.PrometheusPluginError, ks_exc.ClientException,
-                    paramiko.SSHException):
-                # NOTE(shimizu-koji): This exception is ignored.
-                # DELETE /pm_jobs/{id} will be success even if _delete_rule()
-                # is failed. Because the rule file was already deleted.
-                pass
-        for uri in reload_list:
-            try:
-                self.reload_prom_server(context, uri)
-            except (sol_ex.PrometheusPluginError, ks_exc.ClientException,
-                    paramiko.SSHException):
-                pass
+
+        def _delete(target):
+            self._delete_rule(
+                target['host'], target['port'], target['user'],
+                target['password'], target['path'], pm_job_or_threshold.id)
+
+        for error in self._run_parallel(_delete, target_list):
+            if error is not None and not isinstance(
+                    error, (sol_ex.PrometheusPluginError,
+                            ks_exc.ClientException, paramiko.SSHException)):
+                raise error
+            # NOTE(shimizu-koji): This exception is ignored.
+            # DELETE /pm_jobs/{id} will be success even if _delete_rule()
+            # is failed. Because the rule file was already deleted.
+        try:
+            self._reload_prom_servers(context, reload_list)
+        except (sol_ex.PrometheusPluginError, ks_exc.ClientException,
+                paramiko.SSHException):
+            pass
 
     def get_access_info(self, pm_job_or_threshold):
         target_list = []
@@ -364,23 +576,26 @@ class PrometheusPluginPmBase(PrometheusPlugin):
 
     def upload_rules(self, context, target_list, reload_list, rule_group, id):
         def _cleanup_error(target_list):
-            for target in target_list:
-                try:
-                    self._delete_rule(target['host'], target['port'],
-                        target['user'], target['password'], target['path'],
-                        id)
-                except (sol_ex.PrometheusPluginError, ks_exc.ClientException,
-                        paramiko.SSHException):
-                    pass
-
-        try:
-            for target in target_list:
-                self._upload_rule(
-                    rule_group, target['host'], target['port'],
+            def _delete(target):
+                self._delete_rule(target['host'], target['port'],
                     target['user'], target['password'], target['path'],
                     id)
-            for uri in reload_list:
-                self.reload_prom_server(context, uri)
+            # NOTE: errors are ignored.
+            self._run_parallel(_delete, target_list)
+
+        def _upload(target):
+            self._upload_rule(
+                rule_group, target['host'], target['port'],
+                target['user'], target['password'], target['path'],
+                id)
+
+        try:
+            # NOTE: rule files are uploaded to all targets in parallel.
+            # the first error in the order of target_list is raised.
+            for error in self._run_parallel(_upload, target_list):
+                if error is not None:
+                    raise error
+            self._reload_prom_servers(context, reload_list)
         except (sol_ex.PrometheusPluginError, ks_exc.ClientException,
                 paramiko.SSHException) as e:
             LOG.error("failed to upload rule files: %s", e.args[0])
@@ -437,31 +652,14 @@ class PrometheusPluginPm(PrometheusPluginPmBase, mon_base.MonitoringPlugin):
         self.rpc.store_job_info(context, entries)
 
     def get_datetime_of_latest_report(
-            self, context, pm_job, object_instance_id,
+            self, latest_report_times, pm_job_id, object_instance_id,
             sub_object_instance_id, metric):
-        report = pm_job_utils.get_pm_report(context, pm_job.id)
-        if not report:
-            return None
-
-        report = list(map(lambda x: x.entries, report))
-        report = list(itertools.chain.from_iterable(report))
-        entries_of_same_object = list(
-            filter(
-                lambda x: (
-                    x.objectInstanceId == object_instance_id and
-                    (not x.obj_attr_is_set('subObjectInstanceId') or
-                     x.subObjectInstanceId == sub_object_instance_id) and
-                    x.performanceMetric == metric),
-                report))
-        if len(entries_of_same_object) == 0:
-            return None
-        values = sum(list(map(
-            lambda x: x.performanceValues, entries_of_same_object)), [])
-        return max(values, key=lambda value:
-                   self.parse_datetime(value.timeStamp)).timeStamp
+        return pm_job_utils.find_latest_report_time(
+            latest_report_times, pm_job_id, object_instance_id,
+            sub_object_instance_id, metric)
 
     def filter_alert_by_time(
-            self, context, pm_job, datetime_now,
+            self, latest_report_times, pm_job_id, pm_job, datetime_now,
             object_instance_id, sub_object_instance_id, metric):
         # Ignore expired alert
         reporting_boundary = pm_job.criteria.reportingBoundary\
@@ -473,8 +671,8 @@ class PrometheusPluginPm(PrometheusPluginPmBase, mon_base.MonitoringPlugin):
 
         # Ignore short period alert
         report_date = self.get_datetime_of_latest_report(
-            context, pm_job, object_instance_id, sub_object_instance_id,
-            metric)
+            latest_report_times, pm_job_id, object_instance_id,
+            sub_object_instance_id, metric)
 
         # reporting_period_margin is some margin for timing inconsistency
         # between prometheus and tacker.
@@ -510,9 +708,20 @@ class PrometheusPluginPm(PrometheusPluginPmBase, mon_base.MonitoringPlugin):
         result = {}
         context = request.context
         datetime_now = datetime.datetime.now(datetime.timezone.utc)
-        for alert in body['alerts']:
-            if alert['labels']['function_type'] != 'vnfpm':
-                continue
+        alerts = [alert for alert in body['alerts']
+                  if alert['labels']['function_type'] == 'vnfpm']
+
+        # NOTE: PM jobs and the latest report times of them are gotten
+        # from DB at once for all alerts instead of for each alert since
+        # alertmanager may send a lot of alerts at once. the following
+        # checks are done in memory.
+        pm_job_ids = {alert['labels']['job_id'] for alert in alerts}
+        pm_jobs = pm_job_utils.get_pm_jobs(context, pm_job_ids)
+        latest_report_times = pm_job_utils.get_latest_report_times(
+            context, pm_jobs.keys(),
+            {alert['labels']['object_instance_id'] for alert in alerts})
+
+        for alert in alerts:
             try:
                 pm_job_id = alert['labels']['job_id']
                 object_instance_id = alert['labels']['object_instance_id']
@@ -521,8 +730,11 @@ class PrometheusPluginPm(PrometheusPluginPmBase, mon_base.MonitoringPlugin):
                     'sub_object_instance_id')
                 value = alert['annotations']['value']
 
-                pm_job = pm_job_utils.get_pm_job(context, pm_job_id)
-                self.filter_alert_by_time(context, pm_job, datetime_now,
+                pm_job = pm_jobs.get(pm_job_id)
+                if pm_job is None:
+                    raise sol_ex.PMJobNotExist()
+                self.filter_alert_by_time(latest_report_times, pm_job_id,
+                                          pm_job, datetime_now,
                                           object_instance_id,
                                           sub_object_instance_id, metric)
                 self.valid_alert(
@@ -771,10 +983,14 @@ class PrometheusPluginThreshold(PrometheusPluginPmBase,
     def _alert(self, request, body):
         result = []
         context = request.context
-        alerts = (alert for alert in body['alerts'] if
+        alerts = [alert for alert in body['alerts'] if
                   alert['status'] == 'firing' and
                   alert['labels']['receiver_type'] == 'tacker' and
-                  alert['labels']['function_type'] == 'vnfpm_threshold')
+                  alert['labels']['function_type'] == 'vnfpm_threshold']
+
+        # NOTE: thresholds are gotten from DB at once for all alerts.
+        pm_thresholds = pm_threshold_utils.get_pm_thresholds(
+            context, {alert['labels']['threshold_id'] for alert in alerts})
 
         for alert in alerts:
             try:
@@ -785,8 +1001,7 @@ class PrometheusPluginThreshold(PrometheusPluginPmBase,
                     'sub_object_instance_id')
                 value = alert['annotations']['value']
 
-                pm_threshold = pm_threshold_utils.get_pm_threshold(
-                    context, pm_threshold_id)
+                pm_threshold = pm_thresholds.get(pm_threshold_id)
                 if not pm_threshold:
                     raise sol_ex.PMThresholdNotExist(
                         threshold_id=pm_threshold_id)
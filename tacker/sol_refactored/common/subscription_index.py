@@ -0,0 +1,254 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import itertools
+import threading
+import time
+
+from oslo_log import log as logging
+
+from tacker.sol_refactored.common import config
+from tacker.sol_refactored import objects
+
+
+LOG = logging.getLogger(__name__)
+
+CONF = config.CONF
+
+
+# NOTE: SubscriptionIndex keeps subscriptions in memory and indexes them
+# by the attributes of their filters so that the candidates of a
+# notification are obtained by set intersection instead of evaluating
+# the filter of every subscription.
+#
+# Each index key is defined by a name and a function which returns the
+# values of the key a subscription filters on, or None if the
+# subscription does not filter on the key (i.e. wildcard).
+#
+# The index is per process. It is loaded from DB at the first lookup and
+# kept up to date by 'add' and 'remove' in the process which creates or
+# deletes a subscription (tacker-server). Other processes are told by
+# RPC so that 'reload' is called for the subscription (see
+# VnfLcmRpcApiV2.reload_subsc_index). To recover from a lost RPC or a
+# change by another tacker-server, the index is also synchronized with
+# DB at most once per 'subscription_index_resync_interval' by comparing
+# the subscription ids (only 'id' column is read, and only new
+# subscriptions are loaded). Note that subscriptions are not modified
+# after creation, so comparing ids is enough.
+#
+# The candidates returned by 'match' satisfy the indexed keys only.
+# The caller must check the rest of the filter (ex. vnfInstanceNames,
+# versions of products) for the candidates.
+
+class SubscriptionIndex(object):
+
+    def __init__(self, obj_name, keys):
+        self.obj_name = obj_name
+        self.keys = keys
+        self.lock = threading.Lock()
+        self.clear()
+
+    def clear(self):
+        with self.lock:
+            self.loaded = False
+            self.synced_at = None
+            self.seq = itertools.count()
+            self.subscs = {}
+            self.orders = {}
+            self.subsc_values = {}
+            self.index = {name: {} for name, _ in self.keys}
+            self.wildcards = {name: set() for name, _ in self.keys}
+
+    def _get_obj_cls(self):
+        return getattr(objects, self.obj_name)
+
+    def _add(self, subsc):
+        if subsc.id in self.subscs:
+            self._remove(subsc.id)
+        self.subscs[subsc.id] = subsc
+        self.orders[subsc.id] = next(self.seq)
+        self.subsc_values[subsc.id] = {}
+        for name, get_values in self.keys:
+            values = get_values(subsc)
+            self.subsc_values[subsc.id][name] = values
+            if values is None:
+                self.wildcards[name].add(subsc.id)
+                continue
+            for value in values:
+                self.index[name].setdefault(value, set()).add(subsc.id)
+
+    def _remove(self, subsc_id):
+        if self.subscs.pop(subsc_id, None) is None:
+            return
+        self.orders.pop(subsc_id)
+        for name, values in self.subsc_values.pop(subsc_id).items():
+            if values is None:
+                self.wildcards[name].discard(subsc_id)
+                continue
+            index = self.index[name]
+            for value in values:
+                ids = index.get(value)
+                if ids is None:
+                    continue
+                ids.discard(subsc_id)
+                if not ids:
+                    del index[value]
+
+    def add(self, subsc):
+        with self.lock:
+            if self.loaded:
+                self._add(subsc)
+
+    def remove(self, subsc_id):
+        with self.lock:
+            self._remove(subsc_id)
+
+    def reload(self, context, subsc_id):
+        subsc = self._get_obj_cls().get_by_id(context, subsc_id)
+        with self.lock:
+            if not self.loaded:
+                # it is loaded with the subscription at the first lookup.
+                return
+            if subsc is None:
+                self._remove(subsc_id)
+            else:
+                self._add(subsc)
+
+    def _need_sync(self):
+        if not self.loaded:
+            return True
+        interval = CONF.v2_vnfm.subscription_index_resync_interval
+        return (interval > 0 and
+                time.monotonic() - self.synced_at >= interval)
+
+    def sync(self, context):
+        # NOTE: DB is accessed without holding the lock so that lookups
+        # in other threads are not blocked by DB I/O. Only the update
+        # of the index is done under the lock.
+        obj_cls = self._get_obj_cls()
+        if not self.loaded:
+            subscs = obj_cls.get_all(context)
+            with self.lock:
+                if not self.loaded:
+                    for subsc in subscs:
+                        self._add(subsc)
+                    self.loaded = True
+                    self.synced_at = time.monotonic()
+            return
+
+        with self.lock:
+            known_ids = set(self.subscs)
+            # NOTE: set before the DB query so that concurrent lookups
+            # do not start another synchronization.
+            self.synced_at = time.monotonic()
+        db_ids = {item['id']
+                  for item in obj_cls.get_dict_all(context, ['id'],
+                                                   None, None)}
+        new_subscs = [obj_cls.get_by_id(context, subsc_id)
+                      for subsc_id in db_ids - known_ids]
+
+        with self.lock:
+            # NOTE: only ids known before the DB query are checked for
+            # removal not to drop the subscriptions added by 'add' in
+            # the meantime.
+            for subsc_id in known_ids - db_ids:
+                self._remove(subsc_id)
+            for subsc in new_subscs:
+                if subsc is not None and subsc.id not in self.subscs:
+                    self._add(subsc)
+
+    def match(self, context, conditions):
+        """Return candidate subscriptions matched with conditions.
+
+        conditions is a dict whose key is the name of an index key and
+        value is a list of values of the notification. A subscription
+        matches a key if it is a wildcard for the key or it filters on
+        any one of the values. Keys not included in conditions are not
+        checked.
+        """
+        if self._need_sync():
+            self.sync(context)
+        with self.lock:
+            candidates = None
+            for name, values in conditions.items():
+                matched = set(self.wildcards[name])
+                for value in values:
+                    matched |= self.index[name].get(value, set())
+                if candidates is None:
+                    candidates = matched
+                else:
+                    candidates &= matched
+                if not candidates:
+                    return []
+            if candidates is None:
+                candidates = set(self.subscs)
+            return [self.subscs[subsc_id]
+                    for subsc_id in sorted(candidates, key=self.orders.get)]
+
+
+def _filter_values(subsc, *attrs):
+    obj = subsc
+    for attr in attrs:
+        if not obj.obj_attr_is_set(attr) or getattr(obj, attr) is None:
+            return None
+        obj = getattr(obj, attr)
+    return obj
+
+
+def filter_key(*attrs):
+    """Make an index key function for a list attribute of the filter."""
+    def get_values(subsc):
+        return _filter_values(subsc, 'filter', *attrs)
+    return get_values
+
+
+def products_key(subsc):
+    """Index key function for vnfProductsFromProviders.
+
+    The values are tuples of vnfProvider and vnfProductName. vnfProductName
+    is None if the subscription does not filter on vnfProducts of the
+    provider.
+    """
+    products_providers = _filter_values(
+        subsc, 'filter', 'vnfInstanceSubscriptionFilter',
+        'vnfProductsFromProviders')
+    if products_providers is None:
+        return None
+    values = []
+    for products in products_providers:
+        if not products.obj_attr_is_set('vnfProducts'):
+            values.append((products.vnfProvider, None))
+            continue
+        for product in products.vnfProducts:
+            values.append((products.vnfProvider, product.vnfProductName))
+    return values
+
+
+INST_FILTER_KEYS = [
+    ('vnfdId', filter_key('vnfInstanceSubscriptionFilter', 'vnfdIds')),
+    ('vnfInstanceId',
+     filter_key('vnfInstanceSubscriptionFilter', 'vnfInstanceIds')),
+    ('vnfProduct', products_key),
+]
+
+
+def inst_conditions(inst):
+    provider = inst.get('vnfProvider')
+    return {
+        'vnfdId': [inst.get('vnfdId')],
+        'vnfInstanceId': [inst.id],
+        'vnfProduct': [(provider, inst.get('vnfProductName')),
+                       (provider, None)],
+    }
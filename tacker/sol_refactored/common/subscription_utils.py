@@ -13,17 +13,22 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import collections
+import hashlib
 import threading
 
 from oslo_log import log as logging
 from oslo_utils import timeutils
 from oslo_utils import uuidutils
 
+from tacker.common import stats
 from tacker.sol_refactored.api import api_version
 from tacker.sol_refactored.common import common_script_utils
 from tacker.sol_refactored.common import config
 from tacker.sol_refactored.common import exceptions as sol_ex
 from tacker.sol_refactored.common import http_client
+from tacker.sol_refactored.common import notification_dispatcher
+from tacker.sol_refactored.common import subscription_index
 from tacker.sol_refactored.common import vnf_instance_utils as inst_utils
 from tacker.sol_refactored import objects
 
@@ -36,6 +41,16 @@ TEST_NOTIFICATION_TIMEOUT = 20  # seconds
 NOTIFY_TYPE_PM = 'PM'
 NOTIFY_TYPE_FM = 'FM'
 
+_subsc_index = subscription_index.SubscriptionIndex(
+    'LccnSubscriptionV2',
+    subscription_index.INST_FILTER_KEYS + [
+        ('notificationType', subscription_index.filter_key(
+            'notificationTypes')),
+        ('operationType', subscription_index.filter_key('operationTypes')),
+        ('operationState', subscription_index.filter_key('operationStates')),
+    ]
+)
+
 # NOTE: The methods of first half are for LCM subscription only
 # since this file was for LCM subscription originally.
 # The methods of later half are common for LCM, PM and FM
@@ -57,6 +72,18 @@ def subsc_href(subsc_id, endpoint):
     return "{}/vnflcm/v2/subscriptions/{}".format(endpoint, subsc_id)
 
 
+def add_subsc_index(subsc):
+    _subsc_index.add(subsc)
+
+
+def remove_subsc_index(subsc_id):
+    _subsc_index.remove(subsc_id)
+
+
+def reload_subsc_index(context, subsc_id):
+    _subsc_index.reload(context, subsc_id)
+
+
 def match_version(version, inst):
     # - vnfSoftwareVersion 1
     # - vnfdVersions 0..N
@@ -145,44 +172,53 @@ def get_lcmocc_subscs(context, lcmocc, inst):
             lcmocc.operation, lcmocc.operationState)
 
 
-def get_matched_subscs(context, inst, notif_type, op_type, op_state):
-    subscs = []
-    for subsc in get_subsc_all(context):
-        # subsc: LccnSubscription
+def match_subsc(subsc, inst, notif_type, op_type, op_state):
+    # subsc: LccnSubscription
+
+    if not subsc.obj_attr_is_set('filter'):
+        # no filter. get it.
+        return True
+
+    # subsc.filter: LifecycleChangeNotificationsFilter
+    # - vnfInstanceSubscriptionFilter 0..1
+    # - notificationTypes 0..N
+    # - operationTypes 0..N
+    # - operationStates 0..N
+    if subsc.filter.obj_attr_is_set('vnfInstanceSubscriptionFilter'):
+        inst_filter = subsc.filter.vnfInstanceSubscriptionFilter
+        if not match_inst_subsc_filter(inst_filter, inst):
+            return False
 
-        if not subsc.obj_attr_is_set('filter'):
-            # no filter. get it.
-            subscs.append(subsc)
-            continue
+    if subsc.filter.obj_attr_is_set('notificationTypes'):
+        if notif_type not in subsc.filter.notificationTypes:
+            return False
 
-        # subsc.filter: LifecycleChangeNotificationsFilter
-        # - vnfInstanceSubscriptionFilter 0..1
-        # - notificationTypes 0..N
-        # - operationTypes 0..N
-        # - operationStates 0..N
-        if subsc.filter.obj_attr_is_set('vnfInstanceSubscriptionFilter'):
-            inst_filter = subsc.filter.vnfInstanceSubscriptionFilter
-            if not match_inst_subsc_filter(inst_filter, inst):
-                continue
+    if (op_type is not None and
+            subsc.filter.obj_attr_is_set('operationTypes')):
+        if op_type not in subsc.filter.operationTypes:
+            return False
 
-        if subsc.filter.obj_attr_is_set('notificationTypes'):
-            if notif_type not in subsc.filter.notificationTypes:
-                continue
+    if (op_state is not None and
+            subsc.filter.obj_attr_is_set('operationStates')):
+        if op_state not in subsc.filter.operationStates:
+            return False
 
-        if (op_type is not None and
-                subsc.filter.obj_attr_is_set('operationTypes')):
-            if op_type not in subsc.filter.operationTypes:
-                continue
+    # OK, matched
+    return True
 
-        if (op_state is not None and
-                subsc.filter.obj_attr_is_set('operationStates')):
-            if op_state not in subsc.filter.operationStates:
-                continue
 
-        # OK, matched
-        subscs.append(subsc)
+def get_matched_subscs(context, inst, notif_type, op_type, op_state):
+    conditions = subscription_index.inst_conditions(inst)
+    conditions['notificationType'] = [notif_type]
+    if op_type is not None:
+        conditions['operationType'] = [op_type]
+    if op_state is not None:
+        conditions['operationState'] = [op_state]
 
-    return subscs
+    # NOTE: the candidates got from the index satisfy the indexed keys
+    # only. check whole filter of the candidates.
+    return [subsc for subsc in _subsc_index.match(context, conditions)
+            if match_subsc(subsc, inst, notif_type, op_type, op_state)]
 
 
 def make_create_inst_notif_data(subsc, inst, endpoint):
@@ -266,21 +302,44 @@ def get_subsc_auth(auth_req):
     return auth
 
 
-def async_call(func):
-    def inner(*args, **kwargs):
-        th = threading.Thread(target=func, args=args,
-                              kwargs=kwargs, daemon=True)
-        th.start()
-    return inner
+# NOTE: the dispatcher is created at the first use, not at import time,
+# so that the configuration is read after it is loaded.
+_dispatcher = None
+_dispatcher_lock = threading.Lock()
 
 
-@async_call
-def send_notification(obj_data, notif_data, notify_type=None):
-    version = api_version.CURRENT_VERSION
-    if notify_type == NOTIFY_TYPE_PM:
-        version = api_version.CURRENT_PM_VERSION
-    elif notify_type == NOTIFY_TYPE_FM:
-        version = api_version.CURRENT_FM_VERSION
+def _get_dispatcher():
+    global _dispatcher
+    with _dispatcher_lock:
+        if _dispatcher is None:
+            _dispatcher = notification_dispatcher.NotificationDispatcher(
+                CONF.v2_vnfm.notification_workers,
+                CONF.v2_vnfm.notification_queue_size)
+        return _dispatcher
+
+
+# NOTE: HttpClient is cached per callbackUri, authentication and version
+# so that the session (i.e. connection) is reused for the notifications
+# to the same destination. The least recently used one is dropped if
+# the number of clients exceeds notification_client_cache_size.
+_notif_clients = collections.OrderedDict()
+_notif_clients_lock = threading.Lock()
+
+
+def _notif_client_key(obj_data, version):
+    auth = obj_data.get('authentication')
+    auth_json = auth.to_json() if auth is not None else ''
+    auth_hash = hashlib.sha256(auth_json.encode()).hexdigest()
+    return (obj_data.callbackUri, auth_hash, version)
+
+
+def _get_notif_client(obj_data, version):
+    key = _notif_client_key(obj_data, version)
+    with _notif_clients_lock:
+        client = _notif_clients.get(key)
+        if client is not None:
+            _notif_clients.move_to_end(key)
+            return client
 
     auth_handle = common_script_utils.get_http_auth_handle(
         obj_data.get('authentication'))
@@ -288,7 +347,34 @@ def send_notification(obj_data, notif_data, notify_type=None):
                        if CONF.v2_vnfm.notify_connect_retries else None)
     client = http_client.HttpClient(auth_handle,
                                     version=version,
-                                    connect_retries=connect_retries)
+                                    connect_retries=connect_retries,
+                                    reuse_session=True)
+    max_clients = CONF.v2_vnfm.notification_client_cache_size
+    with _notif_clients_lock:
+        _notif_clients[key] = client
+        while len(_notif_clients) > max_clients:
+            _notif_clients.popitem(last=False)
+    return client
+
+
+def get_notification_stats():
+    # NOTE: None if no notification has been sent by the process.
+    if _dispatcher is None:
+        return None
+    return _dispatcher.get_stats()
+
+
+stats.register('v2_notification_dispatcher', get_notification_stats)
+
+
+def _send_notification(obj_data, notif_data, notify_type=None):
+    version = api_version.CURRENT_VERSION
+    if notify_type == NOTIFY_TYPE_PM:
+        version = api_version.CURRENT_PM_VERSION
+    elif notify_type == NOTIFY_TYPE_FM:
+        version = api_version.CURRENT_FM_VERSION
+
+    client = _get_notif_client(obj_data, version)
     url = obj_data.callbackUri
     try:
         resp, _ = client.do_request(
@@ -298,6 +384,13 @@ def send_notification(obj_data, notif_data, notify_type=None):
         LOG.exception(f"send_notification failed: {ex}")
 
 
+def send_notification(obj_data, notif_data, notify_type=None):
+    # NOTE: notification is sent asynchronously by the worker of
+    # the dispatcher.
+    _get_dispatcher().submit(_send_notification, obj_data, notif_data,
+                             notify_type)
+
+
 def test_notification(obj_data, notify_type=None):
     version = api_version.CURRENT_VERSION
     if notify_type == NOTIFY_TYPE_PM:
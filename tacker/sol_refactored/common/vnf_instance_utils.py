@@ -83,23 +83,24 @@ def select_vim_info(vim_connection_info, return_key=False):
         return value
 
 
+_vdu_vnfc_mapping = {
+    'type': 'object',
+    'patternProperties': {
+        '^.*$': {
+            'type': 'array',
+            'items': common_types.IdentifierInVnf
+        }
+    }
+}
+
+
 def check_metadata_format(metadata):
     """Check VnfInstance.metadata format"""
     # NOTE: This method checks keys which Tacker supports originally.
     # The key supporting is only 'VDU_VNFc_mapping' for the moment.
 
-    _vdu_vnfc_mapping = {
-        'type': 'object',
-        'patternProperties': {
-            '^.*$': {
-                'type': 'array',
-                'items': common_types.IdentifierInVnf
-            }
-        }
-    }
-
     if 'VDU_VNFc_mapping' in metadata:
-        schema_validator = validator.SolSchemaValidator(_vdu_vnfc_mapping)
+        schema_validator = validator.get_validator(_vdu_vnfc_mapping)
         schema_validator.validate(metadata['VDU_VNFc_mapping'])
 
         all_vnfc_info_ids = list()
@@ -14,21 +14,111 @@
 #    under the License.
 
 
+import collections
 import io
 import os
+import pickle
 import re
 import shutil
 import tempfile
+import threading
+import time
 import zipfile
 
 from oslo_log import log as logging
 import yaml
 
+from tacker.common import stats
+from tacker.sol_refactored.common import config
 from tacker.sol_refactored.common import exceptions as sol_ex
 
 
 LOG = logging.getLogger(__name__)
 
+CONF = config.CONF
+
+TOSCA_META_PATH = os.path.join('TOSCA-Metadata', 'TOSCA.meta')
+
+
+# NOTE: VnfdCache keeps the parsed contents of VNFDs (i.e. TOSCA.meta and
+# Definitions) in memory so that yaml files are not parsed by every
+# get_vnfd. An entry is identified by vnfdId and the csar directory and
+# is valid as long as the fingerprint (name, mtime and size of the yaml
+# files) is not changed. The least recently used entry is dropped if the
+# number of entries exceeds vnfd_cache_size.
+#
+# The contents are kept pickled and each get returns a new copy of them,
+# so that a Vnfd object can modify its contents (or the dicts returned by
+# its methods) without affecting other Vnfd objects. Unpickling is much
+# faster than parsing the yaml files.
+
+class VnfdCache(object):
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries = collections.OrderedDict()
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'evictions': 0,
+        }
+
+    def get(self, key, fingerprint):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None or entry[0] != fingerprint:
+                self.stats['misses'] += 1
+                return None
+            self.entries.move_to_end(key)
+            self.stats['hits'] += 1
+        return pickle.loads(entry[1])
+
+    def put(self, key, fingerprint, contents):
+        max_entries = CONF.v2_vnfm.vnfd_cache_size
+        data = pickle.dumps(contents, protocol=pickle.HIGHEST_PROTOCOL)
+        with self.lock:
+            self.entries[key] = (fingerprint, data)
+            self.entries.move_to_end(key)
+            while len(self.entries) > max_entries:
+                self.entries.popitem(last=False)
+                self.stats['evictions'] += 1
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def get_stats(self):
+        with self.lock:
+            stats = dict(self.stats)
+            stats['entries'] = len(self.entries)
+        return stats
+
+
+_vnfd_cache = VnfdCache()
+
+
+def get_vnfd_cache_stats():
+    return _vnfd_cache.get_stats()
+
+
+stats.register('v2_vnfd_cache', get_vnfd_cache_stats)
+
+
+def _get_fingerprint(csar_dir):
+    path = os.path.join(csar_dir, TOSCA_META_PATH)
+    if not os.path.isfile(path):
+        raise sol_ex.InvalidVnfdFormat()
+    files = [TOSCA_META_PATH]
+    files += sorted(os.path.join('Definitions', entry)
+                    for entry in os.listdir(os.path.join(csar_dir,
+                                                         'Definitions'))
+                    if entry.endswith(('.yaml', '.yml')))
+    fingerprint = []
+    for name in files:
+        st = os.stat(os.path.join(csar_dir, name))
+        fingerprint.append((name, st.st_mtime_ns, st.st_size))
+    return tuple(fingerprint)
+
 
 class Vnfd(object):
 
@@ -37,11 +127,41 @@ class Vnfd(object):
         self.tosca_meta = {}
         self.definitions = {}
         self.vnfd_flavours = {}
+        # NOTE: per flavour indexes. {flavour_id: {node_type: nodes}} and
+        # {flavour_id: {vdu_name: [cp_name, ...]}}
+        self._nodes_by_type = {}
+        self._vdu_cps = {}
         self.csar_dir = None
 
     def init_from_csar_dir(self, csar_dir):
         self.csar_dir = csar_dir
-        self._init_vnfd(csar_dir)
+        if CONF.v2_vnfm.vnfd_cache_size == 0:
+            self._init_vnfd(csar_dir)
+            return
+
+        key = (self.vnfd_id, csar_dir)
+        fingerprint = _get_fingerprint(csar_dir)
+        contents = _vnfd_cache.get(key, fingerprint)
+        if contents is None:
+            start = time.monotonic()
+            self._init_vnfd(csar_dir)
+            LOG.debug("VNFD %s parsed in %.3f sec.", self.vnfd_id,
+                      time.monotonic() - start)
+            contents = {
+                'tosca_meta': self.tosca_meta,
+                'definitions': self.definitions,
+                'vnfd_flavours': self.vnfd_flavours,
+                'nodes_by_type': self._nodes_by_type,
+                'vdu_cps': self._vdu_cps,
+            }
+            _vnfd_cache.put(key, fingerprint, contents)
+            return
+
+        self.tosca_meta = contents['tosca_meta']
+        self.definitions = contents['definitions']
+        self.vnfd_flavours = contents['vnfd_flavours']
+        self._nodes_by_type = contents['nodes_by_type']
+        self._vdu_cps = contents['vdu_cps']
 
     def init_from_zip_data(self, zip_data):
         # NOTE: This is used when external NFVO is used and only VNFD in
@@ -126,7 +246,7 @@ class Vnfd(object):
         for name, data in nodes.items():
             if (data['type'] in types and
                     data.get('properties', {}).get('sw_image_data')):
-                sw_image[name] = data['properties']['sw_image_data']
+                sw_image[name] = dict(data['properties']['sw_image_data'])
                 sw_file = (data
                            .get('artifacts', {})
                            .get('sw_image', {})
@@ -152,16 +272,22 @@ class Vnfd(object):
         }
         return prop
 
-    def get_nodes(self, flavour_id, node_type):
-        vnfd = self.get_vnfd_flavour(flavour_id)
-        nodes = (vnfd
-                 .get('topology_template', {})
-                 .get('node_templates', {}))
-
-        res = {name: data
-            for name, data in nodes.items() if data['type'] == node_type}
+    def _get_nodes_by_type(self, flavour_id):
+        nodes_by_type = self._nodes_by_type.get(flavour_id)
+        if nodes_by_type is None:
+            vnfd = self.get_vnfd_flavour(flavour_id)
+            nodes = (vnfd
+                     .get('topology_template', {})
+                     .get('node_templates', {}))
+            nodes_by_type = {}
+            for name, data in nodes.items():
+                nodes_by_type.setdefault(data['type'], {})[name] = data
+            self._nodes_by_type[flavour_id] = nodes_by_type
+        return nodes_by_type
 
-        return res
+    def get_nodes(self, flavour_id, node_type):
+        # NOTE: return a new dict since the index is shared.
+        return dict(self._get_nodes_by_type(flavour_id).get(node_type, {}))
 
     def get_vdu_nodes(self, flavour_id):
         return self.get_nodes(flavour_id, 'tosca.nodes.nfv.Vdu.Compute')
@@ -178,15 +304,21 @@ class Vnfd(object):
         return self.get_nodes(flavour_id, 'tosca.nodes.nfv.VduCp')
 
     def get_vdu_cps(self, flavour_id, vdu_name):
-        cp_nodes = self.get_vducp_nodes(flavour_id)
-        cps = []
-        for cp_name, cp_data in cp_nodes.items():
-            reqs = cp_data.get('requirements', [])
-            for req in reqs:
-                if req.get('virtual_binding') == vdu_name:
-                    cps.append(cp_name)
-                    break
-        return cps
+        vdu_cps = self._vdu_cps.get(flavour_id)
+        if vdu_cps is None:
+            cp_nodes = self.get_vducp_nodes(flavour_id)
+            vdu_cps = {}
+            for cp_name, cp_data in cp_nodes.items():
+                reqs = cp_data.get('requirements', [])
+                for req in reqs:
+                    vdu = req.get('virtual_binding')
+                    if vdu is None:
+                        continue
+                    cps = vdu_cps.setdefault(vdu, [])
+                    if cp_name not in cps:
+                        cps.append(cp_name)
+            self._vdu_cps[flavour_id] = vdu_cps
+        return list(vdu_cps.get(vdu_name, []))
 
     def get_vdu_storages(self, vdu_node):
         storages = [req['virtual_storage']
@@ -51,6 +51,16 @@ class VnfLcmRpcApiV2(object):
     def modify_vnfinfo(self, context, lcmocc_id):
         self._cast_lcm_op(context, lcmocc_id, 'modify_vnfinfo')
 
+    def reload_subsc_index(self, context, obj_name, subsc_id):
+        # NOTE: cast to all conductors since each of them has its own
+        # index of subscriptions.
+        serializer = objects_base.TackerObjectSerializer()
+        client = rpc.get_client(
+            self.target, version_cap=None, serializer=serializer)
+        cctxt = client.prepare(fanout=True)
+        cctxt.cast(context, 'reload_subsc_index',
+                   obj_name=obj_name, subsc_id=subsc_id)
+
     def server_notification_cast(self, context, method, **kwargs):
         serializer = objects_base.TackerObjectSerializer()
         client = rpc.get_client(
@@ -13,19 +13,28 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+from concurrent import futures
 import copy
 import threading
 
 from oslo_log import log as logging
 from oslo_service import loopingcall
 from oslo_utils import encodeutils
+from oslo_utils import timeutils
+from tooz import coordination as tooz_coordination
+from tooz import hashring
 
+from tacker.common import coordination
 from tacker.common import log
 from tacker import context as tacker_context
 from tacker.sol_refactored.common import config
 from tacker.sol_refactored.common import coordinate
 from tacker.sol_refactored.common import exceptions as sol_ex
+from tacker.sol_refactored.common import fm_subscription_utils \
+    as fm_subsc_utils
 from tacker.sol_refactored.common import lcm_op_occ_utils as lcmocc_utils
+from tacker.sol_refactored.common import lcm_profiler
+from tacker.sol_refactored.common import subscription_utils as subsc_utils
 from tacker.sol_refactored.common import vnf_instance_utils as inst_utils
 from tacker.sol_refactored.conductor import prometheus_plugin_driver as pp_drv
 from tacker.sol_refactored.conductor import server_notification_driver as sdrv
@@ -44,6 +53,7 @@ CONF = config.CONF
 # is being executed, it should take a while to start the actual DB
 # synchronization periodical process.
 DB_SYNC_INITIAL_DELAY = 60
+DB_SYNC_GROUP = b'tacker-conductor-db-sync'
 
 
 def async_call(func):
@@ -122,6 +132,7 @@ class ConductorV2(object):
         self.start_lcm_op_internal(context, lcmocc)
 
     @coordinate.lock_vnf_instance('{lcmocc.vnfInstanceId}', delay=True)
+    @lcm_profiler.profile_lcm_op('START')
     def start_lcm_op_internal(self, context, lcmocc):
         # just consistency check
         if lcmocc.operationState != fields.LcmOperationStateType.STARTING:
@@ -161,7 +172,8 @@ class ConductorV2(object):
             lcmocc_utils.update_lcmocc_status(
                 lcmocc, fields.LcmOperationStateType.PROCESSING)
             lcmocc.grantId = grant.id
-            with context.session.begin(nested=True):
+            with lcm_profiler.phase('db_commit'), \
+                    context.session.begin(nested=True):
                 # save grant_req and grant to be used when retry
                 # NOTE: grant_req is saved because it is necessary to interpret
                 # the contents of grant. Though grant can be gotten from NFVO,
@@ -194,7 +206,8 @@ class ConductorV2(object):
             lcmocc_utils.update_lcmocc_status(
                 lcmocc, fields.LcmOperationStateType.COMPLETED)
             # update inst and lcmocc at the same time
-            with context.session.begin(nested=True):
+            with lcm_profiler.phase('db_commit'), \
+                    context.session.begin(nested=True):
                 inst.update(context)
                 lcmocc.update(context)
                 # grant_req and grant are not necessary any more.
@@ -218,6 +231,7 @@ class ConductorV2(object):
         self._retry_lcm_op(context, lcmocc)
 
     @coordinate.lock_vnf_instance('{lcmocc.vnfInstanceId}', delay=True)
+    @lcm_profiler.profile_lcm_op('RETRY')
     def _retry_lcm_op(self, context, lcmocc):
         # just consistency check
         if lcmocc.operationState != fields.LcmOperationStateType.FAILED_TEMP:
@@ -259,7 +273,8 @@ class ConductorV2(object):
                 lcmocc, fields.LcmOperationStateType.COMPLETED)
             lcmocc.error = None  # clear error
             # update inst and lcmocc at the same time
-            with context.session.begin(nested=True):
+            with lcm_profiler.phase('db_commit'), \
+                    context.session.begin(nested=True):
                 inst.update(context)
                 lcmocc.update(context)
                 # grant_req and grant are not necessary any more.
@@ -286,6 +301,7 @@ class ConductorV2(object):
         self._rollback_lcm_op(context, lcmocc)
 
     @coordinate.lock_vnf_instance('{lcmocc.vnfInstanceId}', delay=True)
+    @lcm_profiler.profile_lcm_op('ROLLBACK')
     def _rollback_lcm_op(self, context, lcmocc):
         # just consistency check
         if lcmocc.operationState != fields.LcmOperationStateType.FAILED_TEMP:
@@ -324,7 +340,8 @@ class ConductorV2(object):
             if (lcmocc.obj_attr_is_set('error') and
                     lcmocc.error.obj_attr_is_set('userScriptErrHandlingData')):
                 del lcmocc.error.userScriptErrHandlingData
-            with context.session.begin(nested=True):
+            with lcm_profiler.phase('db_commit'), \
+                    context.session.begin(nested=True):
                 lcmocc.update(context)
                 # NOTE: Basically inst is not changed. But there is a case
                 # that VIM resources may be changed while rollback. Only
@@ -395,26 +412,107 @@ class ConductorV2(object):
     def _sync_db(self):
         """Periodic database update invocation method(v2 api)"""
         LOG.debug("Starting _sync_db")
+        start_time = timeutils.now()
         context = tacker_context.get_admin_context()
 
         vnf_instances = objects.VnfInstanceV2.get_by_filter(
             context, instantiationState='INSTANTIATED')
+        if CONF.db_synchronization_sharding:
+            # NOTE: start coordination before running threads since
+            # Coordinator.start is not thread safe. it is noop if already
+            # started.
+            coordination.COORDINATOR.start()
+            vnf_instances = self._get_own_instances(vnf_instances)
+
+        # NOTE: instances are synchronized concurrently by a bounded
+        # number of threads. to avoid overloading a VIM, instances are
+        # grouped by VIM and the instances of a VIM are processed by at
+        # most 'db_synchronization_workers_per_vim' threads.
+        with futures.ThreadPoolExecutor(
+                max_workers=CONF.db_synchronization_workers) as executor:
+            results = list(executor.map(
+                self._sync_db_insts, self._group_insts_by_vim(vnf_instances)))
+
+        durations = [duration for result in results for duration in result]
+        LOG.info("DB synchronization pass finished: %(num)d vnf instances "
+                 "in %(total).3f sec (max %(max).3f sec per instance).",
+                 {'num': len(durations),
+                  'total': timeutils.now() - start_time,
+                  'max': max(durations, default=0.0)})
+        LOG.debug("Ended _sync_db")
+
+    def _get_own_instances(self, vnf_instances):
+        # NOTE: VnfInstances are shared among conductors by consistent
+        # hashing over the members of DB_SYNC_GROUP. if the coordination
+        # backend does not support groups, all instances are processed
+        # as before. note that _sync_inst is protected by the lock of
+        # the instance anyway.
+        coord = coordination.COORDINATOR
+        try:
+            try:
+                coord.coordinator.create_group(DB_SYNC_GROUP).get()
+            except tooz_coordination.GroupAlreadyExist:
+                pass
+            try:
+                coord.coordinator.join_group(DB_SYNC_GROUP).get()
+            except tooz_coordination.MemberAlreadyExist:
+                pass
+            members = coord.coordinator.get_members(DB_SYNC_GROUP).get()
+        except (tooz_coordination.ToozError, NotImplementedError) as ex:
+            LOG.warning("Sharding of DB synchronization is not available, "
+                        "so synchronize all vnf instances. Error: %s", ex)
+            return vnf_instances
+
+        ring = hashring.HashRing(members)
+        return [inst for inst in vnf_instances
+                if coord.member_id in ring.get_nodes(inst.id.encode())]
+
+    def _group_insts_by_vim(self, vnf_instances):
+        vim_insts = {}
         for inst in vnf_instances:
             try:
                 vim_info = inst_utils.select_vim_info(inst.vimConnectionInfo)
-                self.vnflcm_driver.diff_check_inst(inst, vim_info)
-                self._sync_inst(context, inst, vim_info)
-            except sol_ex.DbSyncNoDiff:
-                continue
-            except sol_ex.DbSyncFailed as e:
-                LOG.error("%s: %s", e.__class__.__name__, e.args[0])
-            except sol_ex.OtherOperationInProgress:
-                LOG.info("There is an LCM operation in progress, so "
-                         f"skip this DB synchronization. vnf: {inst.id}.")
-            except Exception as e:
-                LOG.error(f"Failed to synchronize database vnf: {inst.id} "
-                          f"Error: {encodeutils.exception_to_unicode(e)}")
-        LOG.debug("Ended _sync_db")
+                vim_key = (vim_info.get('vimId') or
+                           vim_info.get('interfaceInfo', {}).get('endpoint'))
+            except Exception:
+                # NOTE: the error is handled in _sync_db_inst.
+                vim_key = None
+            vim_insts.setdefault(vim_key, []).append(inst)
+
+        groups = []
+        for insts in vim_insts.values():
+            num = min(CONF.db_synchronization_workers_per_vim, len(insts))
+            groups.extend(insts[i::num] for i in range(num))
+        return groups
+
+    def _sync_db_insts(self, vnf_instances):
+        # NOTE: a context (i.e. DB session) is not shared among threads.
+        context = tacker_context.get_admin_context()
+        durations = []
+        for inst in vnf_instances:
+            start_time = timeutils.now()
+            self._sync_db_inst(context, inst)
+            duration = timeutils.now() - start_time
+            LOG.debug("DB synchronization of vnf %s took %.3f sec.",
+                      inst.id, duration)
+            durations.append(duration)
+        return durations
+
+    def _sync_db_inst(self, context, inst):
+        try:
+            vim_info = inst_utils.select_vim_info(inst.vimConnectionInfo)
+            self.vnflcm_driver.diff_check_inst(inst, vim_info)
+            self._sync_inst(context, inst, vim_info)
+        except sol_ex.DbSyncNoDiff:
+            pass
+        except sol_ex.DbSyncFailed as e:
+            LOG.error("%s: %s", e.__class__.__name__, e.args[0])
+        except sol_ex.OtherOperationInProgress:
+            LOG.info("There is an LCM operation in progress, so "
+                     f"skip this DB synchronization. vnf: {inst.id}.")
+        except Exception as e:
+            LOG.error(f"Failed to synchronize database vnf: {inst.id} "
+                      f"Error: {encodeutils.exception_to_unicode(e)}")
 
     @coordinate.lock_vnf_instance('{inst.id}')
     def _sync_inst(self, context, inst, vim_info):
@@ -455,6 +553,13 @@ class ConductorV2(object):
     def dequeue_auto_heal_instance(self, context, vnf_instance_id):
         self.prom_driver.dequeue_heal(vnf_instance_id)
 
+    @log.log
+    def reload_subsc_index(self, context, obj_name, subsc_id):
+        if obj_name == 'FmSubscriptionV1':
+            fm_subsc_utils.reload_subsc_index(context, subsc_id)
+        else:
+            subsc_utils.reload_subsc_index(context, subsc_id)
+
     @log.log
     def server_notification_notify(
             self, context, vnf_instance_id, vnfc_instance_ids):
@@ -17,6 +17,7 @@ import threading
 
 from oslo_log import log as logging
 from tacker.sol_refactored.common import config as cfg
+from tacker.sol_refactored.conductor import timer_wheel
 from tacker.sol_refactored.conductor import vnflcm_auto
 from tacker.sol_refactored import objects
 
@@ -34,8 +35,8 @@ class VnfmAutoHealTimer():
         self.context = context
         self.vnf_instance_id = vnf_instance_id
         self.expiration_handler = expiration_handler
-        self.timer = threading.Timer(expiration_time, self.expire)
-        self.timer.start()
+        self.timer = timer_wheel.get_timer_wheel().schedule(
+            expiration_time, self.expire)
 
     def expire(self):
         _expired = False
@@ -20,6 +20,7 @@ from oslo_utils import encodeutils
 
 from tacker import context as tacker_context
 from tacker.sol_refactored.common import config as cfg
+from tacker.sol_refactored.conductor import timer_wheel
 from tacker.sol_refactored.conductor import vnflcm_auto
 from tacker.sol_refactored import objects
 
@@ -34,8 +35,8 @@ class ServerNotificationTimer():
         self.queue = []
         self.vnf_instance_id = vnf_instance_id
         self.expiration_handler = expiration_handler
-        self.timer = threading.Timer(expiration_time, self.expire)
-        self.timer.start()
+        self.timer = timer_wheel.get_timer_wheel().schedule(
+            expiration_time, self.expire)
 
     def expire(self):
         _expired = False
@@ -0,0 +1,240 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from concurrent import futures
+import threading
+import time
+
+from oslo_log import log as logging
+
+from tacker.common import stats
+from tacker.sol_refactored.common import config
+
+
+LOG = logging.getLogger(__name__)
+
+CONF = config.CONF
+
+# number of slots of a wheel and number of wheels. with the default tick
+# (0.1 sec), the wheels cover 6.4 sec, 6.8 min, 7.3 hours and 19.4 days.
+# a timer beyond them is kept in the last slot of the outermost wheel and
+# placed again when the slot is cascaded.
+WHEEL_SLOTS = 64
+WHEEL_LEVELS = 4
+
+
+class TimerHandle(object):
+
+    def __init__(self, wheel, deadline, expire_tick, callback, args):
+        self.wheel = wheel
+        self.deadline = deadline
+        self.expire_tick = expire_tick
+        self.callback = callback
+        self.args = args
+        # NOTE: the slot (set) which holds the handle. None after expired
+        # or cancelled.
+        self.bucket = None
+
+    def cancel(self):
+        if self.bucket is not None:
+            self.wheel._cancel(self)
+
+
+# NOTE: TimerWheel is a hierarchical timing wheel driven by one scheduler
+# thread. It is used instead of threading.Timer, which starts a thread per
+# timer, by the timers of the conductor (ex. the timers packing auto heal
+# requests per VNF instance), so the number of threads does not grow with
+# the number of timers even if a lot of VNF instances fail at once.
+#
+# - Time is divided into ticks of timer_wheel_tick seconds. The timers
+#   whose deadline is within WHEEL_SLOTS ticks are held in the slots of
+#   the innermost wheel, and the others in the outer wheels, each slot of
+#   which covers WHEEL_SLOTS times the ticks of a slot of the inner wheel.
+#   When the innermost wheel goes around, the next slot of the outer wheel
+#   is cascaded into the inner wheels.
+# - Scheduling and cancelling a timer is O(1).
+# - Expired timers are dispatched to a bounded thread pool so that a slow
+#   callback does not delay the other timers.
+# - The number of pending timers and the expiry lag, i.e. the delay of the
+#   dispatch from the deadline, are available via get_stats().
+
+class TimerWheel(object):
+
+    def __init__(self, tick=None, max_workers=None):
+        self.tick = tick or CONF.v2_vnfm.timer_wheel_tick
+        self.max_workers = max_workers or CONF.v2_vnfm.timer_wheel_workers
+        self.lock = threading.Lock()
+        self.cond = threading.Condition(self.lock)
+        self.wheels = [[set() for _ in range(WHEEL_SLOTS)]
+                       for _ in range(WHEEL_LEVELS)]
+        self.origin = time.monotonic()
+        self.current_tick = 0
+        self.pending = 0
+        self.thread = None
+        self.executor = None
+        self.stats = {
+            'expired': 0,
+            'expiry_lag_last': 0.0,
+            'expiry_lag_max': 0.0,
+        }
+
+    def _now_tick(self, now):
+        return int((now - self.origin) / self.tick)
+
+    def _start(self):
+        # NOTE: called with the lock held.
+        if self.thread is None:
+            self.executor = futures.ThreadPoolExecutor(
+                max_workers=self.max_workers)
+            self.thread = threading.Thread(target=self._run, daemon=True)
+            self.thread.start()
+
+    def schedule(self, delay, callback, *args):
+        """Call callback(*args) after delay seconds.
+
+        It returns a TimerHandle, which can be used to cancel the timer.
+        """
+        deadline = time.monotonic() + delay
+        # NOTE: +1 so that the timer does not expire earlier than the
+        # deadline since current_tick is the tick which has begun.
+        expire_tick = self._now_tick(deadline) + 1
+        handle = TimerHandle(self, deadline, expire_tick, callback, args)
+        with self.lock:
+            self._start()
+            if self.pending == 0:
+                # NOTE: the scheduler thread does not advance the ticks
+                # while there is no timer. catch up here since it is safe
+                # for the empty wheels.
+                self.current_tick = max(self.current_tick,
+                                        self._now_tick(time.monotonic()))
+            self._place(handle)
+            self.pending += 1
+            self.cond.notify()
+        return handle
+
+    def _place(self, handle):
+        # NOTE: called with the lock held.
+        delta = handle.expire_tick - self.current_tick
+        span = WHEEL_SLOTS
+        for level in range(WHEEL_LEVELS):
+            if delta < span or level == WHEEL_LEVELS - 1:
+                break
+            span *= WHEEL_SLOTS
+        slot_ticks = span // WHEEL_SLOTS
+        if delta >= span:
+            # beyond the wheels. placed again when cascaded.
+            index = (self.current_tick // slot_ticks - 1) % WHEEL_SLOTS
+        else:
+            index = (handle.expire_tick // slot_ticks) % WHEEL_SLOTS
+        handle.bucket = self.wheels[level][index]
+        handle.bucket.add(handle)
+
+    def _cancel(self, handle):
+        with self.lock:
+            if handle.bucket is not None:
+                handle.bucket.discard(handle)
+                handle.bucket = None
+                self.pending -= 1
+
+    def _advance(self):
+        # NOTE: called with the lock held. process the next tick and return
+        # the expired timers.
+        self.current_tick += 1
+        tick = self.current_tick
+        slot_ticks = 1
+        for level in range(1, WHEEL_LEVELS):
+            slot_ticks *= WHEEL_SLOTS
+            if tick % slot_ticks != 0:
+                break
+            bucket = self.wheels[level][(tick // slot_ticks) % WHEEL_SLOTS]
+            handles = list(bucket)
+            bucket.clear()
+            for handle in handles:
+                self._place(handle)
+
+        bucket = self.wheels[0][tick % WHEEL_SLOTS]
+        expired = [handle for handle in bucket
+                   if handle.expire_tick <= tick]
+        for handle in expired:
+            bucket.discard(handle)
+            handle.bucket = None
+        self.pending -= len(expired)
+        return expired
+
+    def _run(self):
+        while True:
+            expired = []
+            with self.lock:
+                now_tick = self._now_tick(time.monotonic())
+                if self.pending == 0:
+                    # NOTE: nothing to do for the ticks without timers.
+                    self.current_tick = max(self.current_tick, now_tick)
+                    self.cond.wait()
+                    continue
+                while self.current_tick < now_tick:
+                    expired.extend(self._advance())
+                if not expired:
+                    self.cond.wait(self.origin +
+                                   (self.current_tick + 1) * self.tick -
+                                   time.monotonic())
+                    continue
+            self._dispatch(expired)
+
+    def _dispatch(self, expired):
+        now = time.monotonic()
+        for handle in expired:
+            lag = max(now - handle.deadline, 0.0)
+            with self.lock:
+                self.stats['expired'] += 1
+                self.stats['expiry_lag_last'] = lag
+                self.stats['expiry_lag_max'] = max(
+                    self.stats['expiry_lag_max'], lag)
+            self.executor.submit(self._call, handle)
+
+    def _call(self, handle):
+        try:
+            handle.callback(*handle.args)
+        except Exception:
+            LOG.exception("Timer callback %s failed.", handle.callback)
+
+    def get_stats(self):
+        """Return the number of pending timers and the expiry lag."""
+        with self.lock:
+            result = dict(self.stats)
+            result['pending'] = self.pending
+        return result
+
+
+_timer_wheel = None
+_timer_wheel_lock = threading.Lock()
+
+
+def get_timer_wheel():
+    global _timer_wheel
+    with _timer_wheel_lock:
+        if _timer_wheel is None:
+            _timer_wheel = TimerWheel()
+        return _timer_wheel
+
+
+def get_timer_wheel_stats():
+    # NOTE: None if no timer has been scheduled by the process. the timer
+    # wheel is not created just to report it.
+    if _timer_wheel is None:
+        return None
+    return _timer_wheel.get_stats()
+
+
+stats.register('v2_timer_wheel', get_timer_wheel_stats)
@@ -16,6 +16,7 @@
 
 from tacker.sol_refactored.conductor import conductor_rpc_v2
 from tacker.sol_refactored.conductor import conductor_v2
+from tacker.sol_refactored.infra_drivers.openstack import userdata_pool
 from tacker.sol_refactored.objects import base as objects_base
 
 
@@ -30,3 +31,8 @@ class ConductorV2Hook(object):
         service.conn.create_consumer(
             conductor_rpc_v2.TOPIC_PROMETHEUS_PLUGIN, endpoints,
             serializer=serializer)
+
+    def stop_service_hook(self):
+        # NOTE: stop the worker processes of userdata classes not to
+        # leave them after the conductor exits.
+        userdata_pool.POOL.stop()
@@ -24,6 +24,7 @@ from oslo_utils import uuidutils
 from tacker.sol_refactored.common import config
 from tacker.sol_refactored.common import exceptions as sol_ex
 from tacker.sol_refactored.common import lcm_op_occ_utils as lcmocc_utils
+from tacker.sol_refactored.common import lcm_profiler
 from tacker.sol_refactored.common import vim_utils
 from tacker.sol_refactored.common import vnf_instance_utils as inst_utils
 from tacker.sol_refactored.infra_drivers.kubernetes import helm
@@ -60,6 +61,7 @@ class VnfLcmDriverV2(object):
         self.endpoint = CONF.v2_vnfm.endpoint
         self.nfvo_client = nfvo_client.NfvoClient()
 
+    @lcm_profiler.measure('grant')
     def grant(self, context, lcmocc, inst, vnfd):
         # grant exchange
         # NOTE: the api_version of NFVO supposes 1.4.0 at the moment.
@@ -88,6 +90,7 @@ class VnfLcmDriverV2(object):
 
         return grant_req, grant
 
+    @lcm_profiler.measure('post_grant')
     def post_grant(self, context, lcmocc, inst, grant_req, grant, vnfd):
         method = getattr(self,
                          "%s_%s" % (lcmocc.operation.lower(), 'post_grant'),
@@ -95,6 +98,7 @@ class VnfLcmDriverV2(object):
         if method:
             method(context, lcmocc, inst, grant_req, grant, vnfd)
 
+    @lcm_profiler.measure('mgmt_driver')
     def _exec_mgmt_driver_script(self, operation, flavour_id, req, inst,
                                  grant_req, grant, vnfd,
                                  user_script_err_handling_data, new_vnfd=None):
@@ -226,6 +230,7 @@ class VnfLcmDriverV2(object):
         else:
             return operation.lower()
 
+    @lcm_profiler.measure('process')
     def process(self, context, lcmocc, inst, grant_req, grant, vnfd,
                 user_script_err_handling_data):
         # save inst to use updating lcmocc after process done
@@ -265,6 +270,7 @@ class VnfLcmDriverV2(object):
         self._make_inst_info_common(lcmocc, inst_saved, inst, vnfd)
         lcmocc_utils.update_lcmocc(lcmocc, inst_saved, inst)
 
+    @lcm_profiler.measure('rollback')
     def rollback(self, context, lcmocc, inst, grant_req, grant, vnfd,
                  user_script_err_handling_data):
         method = getattr(self,
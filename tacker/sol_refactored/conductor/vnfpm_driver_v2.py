@@ -38,11 +38,12 @@ class VnfPmDriverV2():
             # store report into db
             report = self._store_report(context, report)
 
-            # update job reports
             job_id = report.jobId
             timestamp = report.entries[0].performanceValues[0].timeStamp
-            pm_job = self._update_job_reports(
-                context, job_id, report, timestamp, self.endpoint)
+            pm_job = pm_job_utils.get_pm_job(context, job_id)
+
+            # delete reports older than the retention period
+            pm_job_utils.delete_expired_reports(context, job_id)
 
             # Send a notify pm job request to the NFVO client.
             # POST /{pmjob.callbackUri}
@@ -76,14 +77,13 @@ class VnfPmDriverV2():
 
     def _store_report(self, context, report):
         report = objects.PerformanceReportV2.from_dict(report)
-        report.create(context)
-        return report
-
-    def _update_job_reports(
-            self, context, job_id, report, timestamp, endpoint):
-        # update reports in the pmJob
-        update_job = pm_job_utils.update_report(
-            context, job_id, report, timestamp, endpoint)
+        # NOTE: reports are not appended to PmJobV2 but looked up by
+        # PerformanceReportEntryV2. readyTime of the report is the
+        # timeStamp of its first performance value.
+        ready_time = report.entries[0].performanceValues[0].timeStamp
+        entries = pm_job_utils.make_report_entries(report, ready_time)
         with context.session.begin():
-            update_job.update(context)
-        return update_job
+            report.create(context)
+            for entry in entries:
+                entry.create(context)
+        return report
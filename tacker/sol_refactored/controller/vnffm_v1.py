@@ -29,6 +29,7 @@ from tacker.sol_refactored.common import fm_alarm_utils
 from tacker.sol_refactored.common import fm_subscription_utils\
     as fm_subsc_utils
 from tacker.sol_refactored.common import subscription_utils as subsc_utils
+from tacker.sol_refactored.conductor import conductor_rpc_v2
 from tacker.sol_refactored.controller import vnffm_view
 from tacker.sol_refactored.nfvo import nfvo_client
 from tacker.sol_refactored import objects
@@ -43,6 +44,7 @@ class VnfFmControllerV1(sol_wsgi.SolAPIController):
 
     def __init__(self):
         self.nfvo_client = nfvo_client.NfvoClient()
+        self.conductor_rpc = conductor_rpc_v2.VnfLcmRpcApiV2()
         self.endpoint = CONF.v2_vnfm.endpoint
         self._fm_view = vnffm_view.AlarmViewBuilder(self.endpoint,
             CONF.v2_vnfm.vnffm_alarm_page_size)
@@ -127,6 +129,9 @@ class VnfFmControllerV1(sol_wsgi.SolAPIController):
                 subsc, subsc_utils.NOTIFY_TYPE_FM)
 
         subsc.create(context)
+        fm_subsc_utils.add_subsc_index(subsc)
+        self.conductor_rpc.reload_subsc_index(
+            context, 'FmSubscriptionV1', subsc.id)
 
         resp_body = self._subsc_view.detail(subsc)
         self_href = fm_subsc_utils.subsc_href(subsc.id, self.endpoint)
@@ -159,6 +164,9 @@ class VnfFmControllerV1(sol_wsgi.SolAPIController):
         subsc = fm_subsc_utils.get_subsc(request.context, id)
 
         subsc.delete(context)
+        fm_subsc_utils.remove_subsc_index(subsc.id)
+        self.conductor_rpc.reload_subsc_index(
+            context, 'FmSubscriptionV1', subsc.id)
 
         return sol_wsgi.SolResponse(204, None,
                                     version=api_version.CURRENT_FM_VERSION)
@@ -17,6 +17,7 @@
 from oslo_log import log as logging
 from oslo_utils import uuidutils
 
+from tacker import policy
 from tacker.sol_refactored.api import api_version
 from tacker.sol_refactored.api.policies.vnflcm_v2 import POLICY_NAME
 from tacker.sol_refactored.api.schemas import vnflcm_v2 as schema
@@ -26,6 +27,7 @@ from tacker.sol_refactored.common import config
 from tacker.sol_refactored.common import coordinate
 from tacker.sol_refactored.common import exceptions as sol_ex
 from tacker.sol_refactored.common import lcm_op_occ_utils as lcmocc_utils
+from tacker.sol_refactored.common import lcm_profiler
 from tacker.sol_refactored.common import subscription_utils as subsc_utils
 from tacker.sol_refactored.common import vim_utils
 from tacker.sol_refactored.common import vnf_instance_utils as inst_utils
@@ -119,13 +121,15 @@ class VnfLcmControllerV2(sol_wsgi.SolAPIController):
         filters, selector, pager = self._inst_view.parse_query_params(request)
 
         # NOTE: insts is dict
-        insts = self._inst_view.get_dict_all(request.context, filters,
-                                             selector, pager)
         if config.CONF.oslo_policy.enhanced_tacker_policy:
-            insts = [inst for inst in insts if request.context.can(
-                POLICY_NAME.format('index'),
-                target=self._get_policy_target_dict(inst),
-                fatal=False)]
+            check = policy.cached_checker(request.context,
+                                          POLICY_NAME.format('index'))
+            insts = self._inst_view.get_dict_page(
+                request.context, filters, selector, pager,
+                lambda inst: check(self._get_policy_target_dict(inst)))
+        else:
+            insts = self._inst_view.get_dict_all(request.context, filters,
+                                                 selector, pager)
 
         resp_body = self._inst_view.detail_dict_list(insts, filters,
                                                      selector, pager)
@@ -495,6 +499,9 @@ class VnfLcmControllerV2(sol_wsgi.SolAPIController):
             subsc_utils.test_notification(subsc)
 
         subsc.create(context)
+        subsc_utils.add_subsc_index(subsc)
+        self.conductor_rpc.reload_subsc_index(
+            context, 'LccnSubscriptionV2', subsc.id)
 
         resp_body = self._subsc_view.detail(subsc)
         self_href = subsc_utils.subsc_href(subsc.id, self.endpoint)
@@ -523,6 +530,9 @@ class VnfLcmControllerV2(sol_wsgi.SolAPIController):
         subsc = subsc_utils.get_subsc(request.context, id)
 
         subsc.delete(context)
+        subsc_utils.remove_subsc_index(subsc.id)
+        self.conductor_rpc.reload_subsc_index(
+            context, 'LccnSubscriptionV2', subsc.id)
 
         return sol_wsgi.SolResponse(204, None)
 
@@ -648,9 +658,32 @@ class VnfLcmControllerV2(sol_wsgi.SolAPIController):
 
         return sol_wsgi.SolResponse(204, None)
 
+    def lcm_op_occ_profile(self, request, id):
+        # NOTE: This is a proprietary implementation of Tacker. Return the
+        # duration of each phase of the executions (start, retry and
+        # rollback) of the LCM operation.
+        context = request.context
+        lcmocc_utils.get_lcmocc(context, id)
+
+        profiles = lcm_profiler.get_profiles(context, id)
+        resp_body = [profile.to_dict() for profile in profiles]
+
+        return sol_wsgi.SolResponse(200, resp_body)
+
+    def lcm_op_profile_metrics(self, request):
+        # NOTE: This is a proprietary implementation of Tacker. Return the
+        # histograms of the duration of LCM operations and their phases
+        # in Prometheus exposition format.
+        metrics = lcm_profiler.get_metrics(request.context)
+
+        return sol_wsgi.SolResponse(200, metrics.encode(),
+                                    content_type='text/plain')
+
     def supported_api_versions(self, action):
-        if action == 'api_versions':
+        if action in ('api_versions', 'lcm_op_profile_metrics'):
             # support all versions and it is OK there is no Version header.
+            # NOTE: lcm_op_profile_metrics is scraped by Prometheus, which
+            # does not send Version header.
             return None
         else:
             return api_version.v2_versions
@@ -437,7 +437,7 @@ class EnhanceViewBuilder(BaseViewBuilder):
         return EnhanceAttributeSelector(self._ALL, self._MANDATORY,
                                         self._EXCLUDE_DEFAULT, **params)
 
-    def get_dict_all(self, context, filters, selector, pager):
+    def _get_db_filters(self, filters, selector):
         # calc db fields
         extra_attrs = set()
         db_filters = []
@@ -445,7 +445,7 @@ class EnhanceViewBuilder(BaseViewBuilder):
         for item in filters:
             if item.attr[0] not in selector.all_attrs:
                 # never match
-                return []
+                return None
             extra_attrs.add(item.attr[0])
             # NOTE: cont and ncont are not supported at the moment.
             if len(item.attr) == 1 and item.op not in ['cont', 'ncont']:
@@ -459,6 +459,12 @@ class EnhanceViewBuilder(BaseViewBuilder):
         for item in rm_filters:
             filters.remove(item)
         selector.add_extra_attrs(extra_attrs)
+        return db_filters
+
+    def get_dict_all(self, context, filters, selector, pager):
+        db_filters = self._get_db_filters(filters, selector)
+        if db_filters is None:
+            return []
         attrs = selector.return_attrs | selector.extra_attrs
         limit = None
         if (pager.page_size > 0 and len(filters) == 0 and
@@ -469,9 +475,62 @@ class EnhanceViewBuilder(BaseViewBuilder):
         if pager.marker:
             db_filters.append(('gt', 'id', pager.marker))
 
-        return self.obj_cls.get_dict_all(context, attrs, db_filters, limit)
+        # NOTE: all values are returned without paging if page_size is 0.
+        # read them lazily not to load all of them in memory at once.
+        return self.obj_cls.get_dict_all(context, attrs, db_filters, limit,
+                                         stream=(pager.page_size == 0))
+
+    def get_dict_page(self, context, filters, selector, pager, check):
+        """Get the values of a page which pass the check.
+
+        The values are fetched in the order of id by batches of page_size
+        + 1 and the filters which can not be handled by DB and the check
+        (ex. policy check) are applied to them, until page_size + 1 values
+        pass (i.e. the page is filled and it is found there are more data)
+        or all values are fetched. The filters are emptied since they are
+        applied already. If page_size is 0, an iterator of all values which
+        pass the check is returned.
+        """
+        db_filters = self._get_db_filters(filters, selector)
+        if db_filters is None:
+            return []
+        attrs = selector.return_attrs | selector.extra_attrs
+        rest_filters = list(filters)
+        filters.clear()
+
+        def _match(value):
+            return self.match_filters(value, rest_filters) and check(value)
+
+        if pager.page_size == 0:
+            values = self.obj_cls.get_dict_all(context, attrs, db_filters,
+                                               None, stream=True)
+            return (value for value in values if _match(value))
+
+        limit = pager.page_size + 1
+        marker = pager.marker
+        result = []
+        while True:
+            batch_filters = list(db_filters)
+            if marker:
+                batch_filters.append(('gt', 'id', marker))
+            values = self.obj_cls.get_dict_all(context, attrs,
+                                               batch_filters, limit)
+            for value in values:
+                if _match(value):
+                    result.append(value)
+                    if len(result) == limit:
+                        return result
+            if len(values) < limit:
+                return result
+            marker = values[-1]['id']
 
     def detail_dict_list(self, values, filters, selector, pager):
+        if pager.page_size == 0:
+            # NOTE: return an iterator so that the response is serialized
+            # while the values are read. see SolResponse.
+            pager.next_marker = None
+            return (self.detail_dict(v, selector) for v in values
+                    if self.match_filters(v, filters))
         if filters:
             resp_body = [self.detail_dict(v, selector) for v in values
                          if self.match_filters(v, filters)]
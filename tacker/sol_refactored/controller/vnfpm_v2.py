@@ -206,6 +206,8 @@ class VnfPmControllerV2(sol_wsgi.SolAPIController):
             request)
         pm_job = pm_job_utils.get_pm_job_all(request.context,
                                              marker=pager.marker)
+        pm_job_utils.set_pm_job_reports(request.context, pm_job,
+                                        self.endpoint)
         resp_body = self._pm_job_view.detail_list(pm_job, filters,
                                                   selector, pager)
 
@@ -215,6 +217,8 @@ class VnfPmControllerV2(sol_wsgi.SolAPIController):
 
     def show(self, request, id):
         pm_job = pm_job_utils.get_pm_job(request.context, id)
+        pm_job_utils.set_pm_job_reports(request.context, [pm_job],
+                                        self.endpoint)
         pm_job_resp = self._pm_job_view.detail(pm_job)
         return sol_wsgi.SolResponse(200, pm_job_resp,
                                     version=api_version.CURRENT_PM_VERSION)
@@ -253,10 +257,7 @@ class VnfPmControllerV2(sol_wsgi.SolAPIController):
 
         self.plugin.delete_job(context=context, pm_job=pm_job)
 
-        reports = objects.PerformanceReportV2.get_by_filter(context,
-                                                            jobId=pm_job.id)
-        for report in reports:
-            report.delete(context)
+        objects.PerformanceReportEntryV2.delete_reports(context, pm_job.id)
         pm_job.delete(context)
 
         return sol_wsgi.SolResponse(204, None,
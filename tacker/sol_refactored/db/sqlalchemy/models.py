@@ -61,6 +61,10 @@ class VnfInstanceV2(model_base.BASE):
     instantiatedVnfInfo = sa.Column(sa.JSON(), nullable=True)
     metadata__ = sa.Column("metadata", sa.JSON(), nullable=True)
     extensions = sa.Column(sa.JSON(), nullable=True)
+    # NOTE: 'version' is not included in the original 'VnfInstance' data
+    # type definition. It is used for optimistic concurrency control.
+    version = sa.Column(sa.Integer, nullable=False, default=0,
+                        server_default='0')
 
 
 class VnfLcmOpOccV2(model_base.BASE):
@@ -98,6 +102,10 @@ class VnfLcmOpOccV2(model_base.BASE):
     changedExtConnectivity = sa.Column(sa.JSON(), nullable=True)
     modificationsTriggeredByVnfPkgChange = sa.Column(sa.JSON(), nullable=True)
     vnfSnapshotInfoId = sa.Column(sa.String(255), nullable=True)
+    # NOTE: 'version' is not included in the original 'VnfLcmOpOcc' data
+    # type definition. It is used for optimistic concurrency control.
+    version = sa.Column(sa.Integer, nullable=False, default=0,
+                        server_default='0')
 
 
 class GrantV1(model_base.BASE):
@@ -261,6 +269,33 @@ class PerformanceReportV2(model_base.BASE):
     entries = sa.Column(sa.JSON(), nullable=False)
 
 
+class PerformanceReportEntryV2(model_base.BASE):
+    """Type: PerformanceReportEntry
+
+    This is a proprietary implementation of Tacker.
+    Contain a performance value of PerformanceReportV2 to look up
+    the latest report of a metric and the reports of a PM job without
+    loading the entries of every report.
+    """
+
+    __tablename__ = 'PerformanceReportEntryV2'
+    __table_args__ = (
+        sa.Index('PerformanceReportEntryV2_latest_idx',
+                 'jobId', 'objectInstanceId', 'subObjectInstanceId',
+                 'performanceMetric', 'timeStamp'),
+        sa.Index('PerformanceReportEntryV2_job_idx', 'jobId', 'readyTime'),
+        sa.Index('PerformanceReportEntryV2_report_idx', 'reportId'),
+    )
+    id = sa.Column(sa.String(36), nullable=False, primary_key=True)
+    reportId = sa.Column(sa.String(255), nullable=False)
+    jobId = sa.Column(sa.String(36), nullable=False)
+    objectInstanceId = sa.Column(sa.String(36), nullable=False)
+    subObjectInstanceId = sa.Column(sa.String(255), nullable=True)
+    performanceMetric = sa.Column(sa.String(255), nullable=False)
+    timeStamp = sa.Column(sa.DateTime(), nullable=False)
+    readyTime = sa.Column(sa.DateTime(), nullable=False)
+
+
 class CryptKey(model_base.BASE):
     """Type: CryptKey
 
@@ -274,3 +309,43 @@ class CryptKey(model_base.BASE):
     encryptedKey = sa.Column(sa.String(255), nullable=False)
     keyType = sa.Column(sa.String(36), nullable=False)
     inUse = sa.Column(sa.Boolean, nullable=False)
+
+
+class LcmOpProfileV2(model_base.BASE):
+    """Type: LcmOpProfile
+
+    This is a proprietary implementation of Tacker.
+    Contain the duration of each phase of an execution (start, retry or
+    rollback) of a VnfLcmOpOccV2.
+    """
+
+    __tablename__ = 'LcmOpProfileV2'
+    __table_args__ = (
+        sa.Index('LcmOpProfileV2_lcmocc_idx', 'lcmOpOccId'),
+        sa.Index('LcmOpProfileV2_start_idx', 'startTime'),
+    )
+    id = sa.Column(sa.String(36), nullable=False, primary_key=True)
+    lcmOpOccId = sa.Column(sa.String(36), nullable=False)
+    vnfInstanceId = sa.Column(sa.String(36), nullable=False)
+    operation = sa.Column(sa.String(255), nullable=False)
+    action = sa.Column(sa.String(255), nullable=False)
+    operationState = sa.Column(sa.String(255), nullable=False)
+    startTime = sa.Column(sa.DateTime(), nullable=False)
+    duration = sa.Column(sa.Float(), nullable=False)
+    phases = sa.Column(sa.JSON(), nullable=False)
+
+
+class LcmOpMetricV2(model_base.BASE):
+    """Type: LcmOpMetric
+
+    This is a proprietary implementation of Tacker.
+    Contain the number and the sum of the durations of LCM operations (or
+    their phases) which fall in a bucket of the histogram.
+    """
+
+    __tablename__ = 'LcmOpMetricV2'
+    operation = sa.Column(sa.String(255), nullable=False, primary_key=True)
+    phase = sa.Column(sa.String(255), nullable=False, primary_key=True)
+    le = sa.Column(sa.String(16), nullable=False, primary_key=True)
+    count = sa.Column(sa.BigInteger(), nullable=False)
+    sum = sa.Column(sa.Float(), nullable=False)
@@ -19,6 +19,7 @@ import yaml
 from oslo_log import log as logging
 
 from tacker.sol_refactored.common import exceptions as sol_ex
+from tacker.sol_refactored.common import lcm_profiler
 
 LOG = logging.getLogger(__name__)
 
@@ -31,6 +32,7 @@ class HelmClient():
     def __init__(self, helm_auth_params):
         self.helm_auth_params = helm_auth_params
 
+    @lcm_profiler.measure('helm_command')
     def _execute_command(self, helm_command, raise_ex=True):
         helm_command.extend(self.helm_auth_params)
         result = subprocess.run(helm_command,
@@ -16,15 +16,17 @@
 import copy
 import operator
 import re
+import time
 
 from oslo_log import log as logging
-from oslo_service import loopingcall
 
 from tacker.sol_refactored.common import config
 from tacker.sol_refactored.common import exceptions as sol_ex
+from tacker.sol_refactored.common import lcm_profiler
 from tacker.sol_refactored.common import vnf_instance_utils as inst_utils
 from tacker.sol_refactored.infra_drivers.kubernetes import kubernetes_resource
 from tacker.sol_refactored.infra_drivers.kubernetes import kubernetes_utils
+from tacker.sol_refactored.infra_drivers.kubernetes import kubernetes_watch
 from tacker.sol_refactored.nfvo import nfvo_client
 from tacker.sol_refactored import objects
 
@@ -33,6 +35,7 @@ LOG = logging.getLogger(__name__)
 
 CONF = config.CONF
 CHECK_INTERVAL = 10
+POLL_INTERVAL_MIN = 1
 
 
 class KubernetesCommon(object):
@@ -158,35 +161,64 @@ class KubernetesCommon(object):
             for vnfc_res_info in vnfc_resources
         ]
 
-    def _check_status(self, check_func, *args):
-        timer = loopingcall.FixedIntervalWithTimeoutLoopingCall(
-            check_func, *args)
-        try:
-            timer.start(interval=CHECK_INTERVAL,
-                timeout=CONF.v2_vnfm.kubernetes_vim_rsc_wait_timeout).wait()
-        except loopingcall.LoopingCallTimeOut:
-            raise sol_ex.K8sOperaitionTimeout()
-
+    def _get_watch_targets(self, k8s_reses):
+        if not CONF.v2_vnfm.kubernetes_vim_rsc_watch:
+            return set()
+        return {(res.k8s_api_client, res.namespace) for res in k8s_reses
+                if isinstance(res, kubernetes_resource.NamespacedResource)}
+
+    def _check_status(self, check_func, k8s_reses, *args):
+        # NOTE: check_func is called when pods in the namespaces of
+        # k8s_reses are changed if the watch of them is available.
+        # It is also called every CHECK_INTERVAL seconds since not all
+        # changes are followed by changes of pods. Otherwise check_func is
+        # called by polling with backoff from POLL_INTERVAL_MIN seconds to
+        # CHECK_INTERVAL seconds.
+        deadline = (time.monotonic() +
+                    CONF.v2_vnfm.kubernetes_vim_rsc_wait_timeout)
+        poll_interval = POLL_INTERVAL_MIN
+        targets = self._get_watch_targets(k8s_reses)
+        with kubernetes_watch.watch_pods(targets) as (event, is_active):
+            while True:
+                event.clear()
+                last_check = time.monotonic()
+                if check_func(*args):
+                    return
+                now = time.monotonic()
+                if now >= deadline:
+                    raise sol_ex.K8sOperaitionTimeout()
+                if is_active():
+                    event.wait(min(CHECK_INTERVAL, deadline - now))
+                    # NOTE: limit the rate of checks since changes of
+                    # pods occur in bursts.
+                    wait = last_check + POLL_INTERVAL_MIN - time.monotonic()
+                    if wait > 0:
+                        time.sleep(wait)
+                else:
+                    event.wait(min(poll_interval, deadline - now))
+                    poll_interval = min(poll_interval * 2, CHECK_INTERVAL)
+
+    @lcm_profiler.measure('k8s_wait_ready')
     def _wait_k8s_reses_ready(self, k8s_reses):
         def _check_ready(check_reses):
             ok_reses = {res for res in check_reses if res.is_ready()}
             check_reses -= ok_reses
-            if not check_reses:
-                raise loopingcall.LoopingCallDone()
+            return not check_reses
 
         check_reses = set(k8s_reses)
-        self._check_status(_check_ready, check_reses)
+        self._check_status(_check_ready, k8s_reses, check_reses)
 
+    @lcm_profiler.measure('k8s_wait_deleted')
     def _wait_k8s_reses_deleted(self, k8s_reses):
         def _check_deleted(check_reses):
             ok_reses = {res for res in check_reses if not res.is_exists()}
             check_reses -= ok_reses
-            if not check_reses:
-                raise loopingcall.LoopingCallDone()
+            return not check_reses
 
         check_reses = set(k8s_reses)
-        self._check_status(_check_deleted, check_reses)
+        self._check_status(_check_deleted, k8s_reses, check_reses)
 
+    @lcm_profiler.measure('k8s_wait_updated')
     def _wait_k8s_reses_updated(self, k8s_reses, k8s_api_client, namespace,
             old_pods_names):
         def _check_updated(check_reses, k8s_api_client, namespace,
@@ -201,12 +233,11 @@ class KubernetesCommon(object):
                 if res.is_update(pods_info, old_pods_names):
                     ok_reses.add(res)
             check_reses -= ok_reses
-            if not check_reses:
-                raise loopingcall.LoopingCallDone()
+            return not check_reses
 
         check_reses = set(k8s_reses)
-        self._check_status(_check_updated, check_reses, k8s_api_client,
-                           namespace, old_pods_names)
+        self._check_status(_check_updated, k8s_reses, check_reses,
+                           k8s_api_client, namespace, old_pods_names)
 
     def diff_check_inst(self, inst, vim_info):
         inst_tmp = copy.deepcopy(inst)
@@ -13,9 +13,13 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import hashlib
+import json
 import os
 import re
 import tempfile
+import threading
+import time
 from urllib.parse import urlparse
 import urllib.request as urllib2
 
@@ -23,6 +27,7 @@ from kubernetes import client
 from oslo_log import log as logging
 import yaml
 
+from tacker.sol_refactored.common import config
 from tacker.sol_refactored.common import exceptions as sol_ex
 from tacker.sol_refactored.common import oidc_utils
 from tacker.sol_refactored.infra_drivers.kubernetes import helm_utils
@@ -31,6 +36,8 @@ from tacker.sol_refactored.infra_drivers.kubernetes import kubernetes_resource
 
 LOG = logging.getLogger(__name__)
 
+CONF = config.CONF
+
 SUPPORTED_NAMESPACE_KIND = {
     "Binding",
     "ConfigMap",
@@ -121,67 +128,216 @@ def list_namespaced_pods(k8s_api_client, namespace):
     return k8s_client.list_namespaced_pod(namespace=namespace).items
 
 
+def _make_ca_cert_file(ca_cert_str):
+    file_descriptor, ca_cert_file = tempfile.mkstemp()
+    ca_cert = re.sub(r'\s', '\n', ca_cert_str)
+    ca_cert = re.sub(r'BEGIN\nCERT', r'BEGIN CERT', ca_cert)
+    ca_cert = re.sub(r'END\nCERT', r'END CERT', ca_cert)
+    # write ca cert file
+    os.write(file_descriptor, ca_cert.encode())
+    os.close(file_descriptor)
+    return ca_cert_file
+
+
+def _make_k8s_config(vim_info, ca_cert_file):
+    k8s_config = client.Configuration()
+    k8s_config.host = vim_info.interfaceInfo['endpoint']
+
+    if 'oidc_token_url' not in vim_info.accessInfo:
+        if ('username' in vim_info.accessInfo and
+                vim_info.accessInfo.get('password') is not None):
+            k8s_config.username = vim_info.accessInfo['username']
+            k8s_config.password = vim_info.accessInfo['password']
+            basic_token = k8s_config.get_basic_auth_token()
+            k8s_config.api_key['authorization'] = basic_token
+
+        if 'bearer_token' in vim_info.accessInfo:
+            k8s_config.api_key_prefix['authorization'] = 'Bearer'
+            k8s_config.api_key['authorization'] = vim_info.accessInfo[
+                'bearer_token']
+
+    if ca_cert_file:
+        k8s_config.ssl_ca_cert = ca_cert_file
+        k8s_config.verify_ssl = True
+    else:
+        k8s_config.verify_ssl = False
+
+    return k8s_config
+
+
+def _set_oidc_token(k8s_config, vim_info, ca_cert_file):
+    # Obtain a openid token from openid provider
+    id_token = oidc_utils.get_id_token_with_password_grant(
+        vim_info.accessInfo.get('oidc_token_url'),
+        vim_info.accessInfo.get('username'),
+        vim_info.accessInfo.get('password'),
+        vim_info.accessInfo.get('client_id'),
+        client_secret=vim_info.accessInfo.get('client_secret'),
+        ssl_ca_cert=ca_cert_file
+    )
+    k8s_config.api_key_prefix['authorization'] = 'Bearer'
+    k8s_config.api_key['authorization'] = id_token
+
+
+class _K8sApiClientEntry(object):
+
+    def __init__(self, vim_info):
+        self.ca_cert_file = None
+        if 'ssl_ca_cert' in vim_info.interfaceInfo:
+            self.ca_cert_file = _make_ca_cert_file(
+                vim_info.interfaceInfo['ssl_ca_cert'])
+        self.api_client = client.api_client.ApiClient(
+            configuration=_make_k8s_config(vim_info, self.ca_cert_file))
+        self.users = 0
+        self.last_used = time.monotonic()
+        self.stale = False
+
+    def close(self):
+        try:
+            self.api_client.close()
+        except Exception:
+            pass
+        if self.ca_cert_file:
+            os.remove(self.ca_cert_file)
+
+
+# NOTE: K8sApiClientCache keeps Kubernetes API clients, i.e. their ca
+# cert files and connection pools, across AuthContextManagers of the same
+# VIM connection instead of creating them for each LCM operation, DB
+# synchronization and so on.
+#
+# - An entry is identified by the endpoint and the fingerprint of the
+#   interfaceInfo and accessInfo of vimConnectionInfo.
+# - If vimConnectionInfo of a VIM (identified by vimId, or the endpoint if
+#   vimId is not set) is changed, the entries of its old
+#   vimConnectionInfo are invalidated.
+# - Entries not used for kubernetes_api_client_idle_timeout seconds are
+#   removed. Entries in use are never removed (an invalidated entry is
+#   removed when it is released).
+# - An OpenID token is obtained for each AuthContextManager as before
+#   since it may expire.
+
+class K8sApiClientCache(object):
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries = {}
+        self.vim_keys = {}
+
+    @staticmethod
+    def _get_key(vim_info):
+        conn = {'interfaceInfo': dict(vim_info.interfaceInfo),
+                'accessInfo': dict(vim_info.accessInfo)}
+        fingerprint = hashlib.sha256(
+            json.dumps(conn, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        return (vim_info.interfaceInfo['endpoint'], fingerprint)
+
+    @staticmethod
+    def _get_vim_key(vim_info):
+        if vim_info.obj_attr_is_set('vimId') and vim_info.vimId:
+            return vim_info.vimId
+        return vim_info.interfaceInfo['endpoint']
+
+    def _pop_removable(self):
+        # NOTE: called with the lock held.
+        removed = []
+        limit = (time.monotonic() -
+                 CONF.v2_vnfm.kubernetes_api_client_idle_timeout)
+        for key, entry in list(self.entries.items()):
+            if entry.users == 0 and (entry.stale or
+                                     entry.last_used < limit):
+                removed.append(self.entries.pop(key))
+        for vim_key, key in list(self.vim_keys.items()):
+            if key not in self.entries:
+                del self.vim_keys[vim_key]
+        return removed
+
+    def acquire(self, vim_info):
+        key = self._get_key(vim_info)
+        vim_key = self._get_vim_key(vim_info)
+        with self.lock:
+            old_key = self.vim_keys.get(vim_key)
+            if old_key is not None and old_key != key:
+                old_entry = self.entries.get(old_key)
+                if old_entry is not None:
+                    old_entry.stale = True
+            removed = self._pop_removable()
+            entry = self.entries.get(key)
+            if entry is None:
+                # NOTE: creating an entry (i.e. ApiClient) does not
+                # access the VIM.
+                entry = _K8sApiClientEntry(vim_info)
+                self.entries[key] = entry
+            self.vim_keys[vim_key] = key
+            entry.users += 1
+            entry.last_used = time.monotonic()
+        for old in removed:
+            old.close()
+        return entry
+
+    def release(self, entry):
+        with self.lock:
+            entry.users -= 1
+            entry.last_used = time.monotonic()
+            removed = self._pop_removable()
+        for old in removed:
+            old.close()
+
+    def clear(self):
+        with self.lock:
+            entries = list(self.entries.values())
+            self.entries = {}
+            self.vim_keys = {}
+        for entry in entries:
+            entry.close()
+
+
+_api_client_cache = K8sApiClientCache()
+
+
 class AuthContextManager:
     def __init__(self, vim_info):
         self.vim_info = vim_info
         self.ca_cert_file = None
+        self.cache_entry = None
 
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_value, exc_traceback):
-        if self.ca_cert_file:
+        if self.cache_entry:
+            # NOTE: ca_cert_file is owned by the cache entry.
+            _api_client_cache.release(self.cache_entry)
+            self.cache_entry = None
+        elif self.ca_cert_file:
             os.remove(self.ca_cert_file)
+        self.ca_cert_file = None
 
     def _create_ca_cert_file(self, ca_cert_str):
         if self.ca_cert_file:
             return
-        file_descriptor, self.ca_cert_file = tempfile.mkstemp()
-        ca_cert = re.sub(r'\s', '\n', ca_cert_str)
-        ca_cert = re.sub(r'BEGIN\nCERT', r'BEGIN CERT', ca_cert)
-        ca_cert = re.sub(r'END\nCERT', r'END CERT', ca_cert)
-        # write ca cert file
-        os.write(file_descriptor, ca_cert.encode())
-        os.close(file_descriptor)
+        self.ca_cert_file = _make_ca_cert_file(ca_cert_str)
 
     def init_k8s_api_client(self):
-        k8s_config = client.Configuration()
-        k8s_config.host = self.vim_info.interfaceInfo['endpoint']
+        if CONF.v2_vnfm.kubernetes_api_client_idle_timeout > 0:
+            if self.cache_entry is None and self.ca_cert_file is None:
+                self.cache_entry = _api_client_cache.acquire(self.vim_info)
+                self.ca_cert_file = self.cache_entry.ca_cert_file
+            if self.cache_entry is not None:
+                api_client = self.cache_entry.api_client
+                if 'oidc_token_url' in self.vim_info.accessInfo:
+                    _set_oidc_token(api_client.configuration,
+                                    self.vim_info, self.ca_cert_file)
+                return api_client
 
         if 'ssl_ca_cert' in self.vim_info.interfaceInfo:
             self._create_ca_cert_file(
                 self.vim_info.interfaceInfo['ssl_ca_cert'])
 
+        k8s_config = _make_k8s_config(self.vim_info, self.ca_cert_file)
         if 'oidc_token_url' in self.vim_info.accessInfo:
-            # Obtain a openid token from openid provider
-            id_token = oidc_utils.get_id_token_with_password_grant(
-                self.vim_info.accessInfo.get('oidc_token_url'),
-                self.vim_info.accessInfo.get('username'),
-                self.vim_info.accessInfo.get('password'),
-                self.vim_info.accessInfo.get('client_id'),
-                client_secret=self.vim_info.accessInfo.get('client_secret'),
-                ssl_ca_cert=self.ca_cert_file
-            )
-            k8s_config.api_key_prefix['authorization'] = 'Bearer'
-            k8s_config.api_key['authorization'] = id_token
-        else:
-            if ('username' in self.vim_info.accessInfo and
-                    self.vim_info.accessInfo.get('password') is not None):
-                k8s_config.username = self.vim_info.accessInfo['username']
-                k8s_config.password = self.vim_info.accessInfo['password']
-                basic_token = k8s_config.get_basic_auth_token()
-                k8s_config.api_key['authorization'] = basic_token
-
-            if 'bearer_token' in self.vim_info.accessInfo:
-                k8s_config.api_key_prefix['authorization'] = 'Bearer'
-                k8s_config.api_key['authorization'] = self.vim_info.accessInfo[
-                    'bearer_token']
-
-        if self.ca_cert_file:
-            k8s_config.ssl_ca_cert = self.ca_cert_file
-            k8s_config.verify_ssl = True
-        else:
-            k8s_config.verify_ssl = False
+            _set_oidc_token(k8s_config, self.vim_info, self.ca_cert_file)
 
         return client.api_client.ApiClient(configuration=k8s_config)
 
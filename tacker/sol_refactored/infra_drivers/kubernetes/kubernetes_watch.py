@@ -0,0 +1,173 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import contextlib
+import threading
+import time
+
+from kubernetes import client
+from kubernetes import watch
+from oslo_log import log as logging
+
+
+LOG = logging.getLogger(__name__)
+
+# timeout (seconds) of a watch request. the watch is restarted from the
+# last resourceVersion after the timeout.
+WATCH_TIMEOUT = 60
+# interval (seconds) of the retry of a failed watch. doubled by each
+# failure up to WATCH_RETRY_INTERVAL_MAX.
+WATCH_RETRY_INTERVAL_MIN = 1
+WATCH_RETRY_INTERVAL_MAX = 30
+
+
+# NOTE: PodWatcher watches pods of a namespace with the Kubernetes watch
+# API and wakes up the subscribers by every change of the pods. Since the
+# readiness (and deletion and update) of the workload resources handled by
+# tacker is followed by changes of their pods, the subscribers, i.e. the
+# waits of LCM operations, check their resources when they are woken up
+# instead of polling them at a fixed interval.
+#
+# A PodWatcher is shared by the subscribers of the same API client and
+# namespace, and it is stopped when the last subscriber leaves.
+# 'active' is False while the watch is not established (ex. the watch
+# verb is not permitted or the connection is lost). The subscribers must
+# fall back to polling in that case.
+
+class PodWatcher(object):
+
+    def __init__(self, k8s_api_client, namespace):
+        self.k8s_api_client = k8s_api_client
+        self.namespace = namespace
+        self.lock = threading.Lock()
+        self.subscribers = set()
+        self.active = False
+        self.stopped = False
+        self.thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self.thread.start()
+
+    def stop(self):
+        # NOTE: the thread exits at the next event or the timeout of the
+        # watch request.
+        self.stopped = True
+
+    def subscribe(self, event):
+        with self.lock:
+            self.subscribers.add(event)
+
+    def unsubscribe(self, event):
+        with self.lock:
+            self.subscribers.discard(event)
+            return len(self.subscribers)
+
+    def _notify(self):
+        with self.lock:
+            subscribers = list(self.subscribers)
+        for event in subscribers:
+            event.set()
+
+    def _set_active(self, active):
+        self.active = active
+        # NOTE: subscribers re-check their resources since changes may be
+        # missed while the watch is not established.
+        self._notify()
+
+    def _watch(self, v1, resource_version):
+        w = watch.Watch()
+        for event in w.stream(v1.list_namespaced_pod, self.namespace,
+                              resource_version=resource_version,
+                              timeout_seconds=WATCH_TIMEOUT,
+                              _request_timeout=WATCH_TIMEOUT + 10):
+            if self.stopped:
+                w.stop()
+                break
+            resource_version = event['object'].metadata.resource_version
+            self._notify()
+        return resource_version
+
+    def _run(self):
+        v1 = client.CoreV1Api(api_client=self.k8s_api_client)
+        resource_version = None
+        retry_interval = WATCH_RETRY_INTERVAL_MIN
+        while not self.stopped:
+            try:
+                if resource_version is None:
+                    pods = v1.list_namespaced_pod(namespace=self.namespace)
+                    resource_version = pods.metadata.resource_version
+                    self._set_active(True)
+                resource_version = self._watch(v1, resource_version)
+                retry_interval = WATCH_RETRY_INTERVAL_MIN
+            except Exception as ex:
+                # NOTE: including 410 Gone (i.e. resource_version is too
+                # old). restart from listing pods.
+                LOG.debug("watch of pods in namespace %s failed: %s",
+                          self.namespace, ex)
+                resource_version = None
+                self._set_active(False)
+                time.sleep(retry_interval)
+                retry_interval = min(retry_interval * 2,
+                                     WATCH_RETRY_INTERVAL_MAX)
+        self.active = False
+
+
+_watchers = {}
+_watchers_lock = threading.Lock()
+
+
+def _subscribe(k8s_api_client, namespace, event):
+    key = (id(k8s_api_client), namespace)
+    with _watchers_lock:
+        watcher = _watchers.get(key)
+        if watcher is None:
+            watcher = PodWatcher(k8s_api_client, namespace)
+            _watchers[key] = watcher
+            watcher.subscribe(event)
+            watcher.start()
+        else:
+            watcher.subscribe(event)
+    return watcher
+
+
+def _unsubscribe(watcher, event):
+    key = (id(watcher.k8s_api_client), watcher.namespace)
+    with _watchers_lock:
+        if watcher.unsubscribe(event) == 0:
+            watcher.stop()
+            if _watchers.get(key) is watcher:
+                del _watchers[key]
+
+
+@contextlib.contextmanager
+def watch_pods(targets):
+    """Watch pods of the namespaces while in the context.
+
+    targets is a set of tuples of an API client and a namespace. It
+    returns an event set by every change of the pods and a function which
+    returns whether all watches are established.
+    """
+    event = threading.Event()
+    watchers = [_subscribe(k8s_api_client, namespace, event)
+                for k8s_api_client, namespace in targets]
+
+    def _is_active():
+        return bool(watchers) and all(w.active for w in watchers)
+
+    try:
+        yield event, _is_active
+    finally:
+        for watcher in watchers:
+            _unsubscribe(watcher, event)
@@ -13,12 +13,17 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import collections
+import threading
+
 from oslo_log import log as logging
 from oslo_service import loopingcall
 
+from tacker.common import stats
 from tacker.sol_refactored.common import config
 from tacker.sol_refactored.common import exceptions as sol_ex
 from tacker.sol_refactored.common import http_client
+from tacker.sol_refactored.common import lcm_profiler
 
 
 LOG = logging.getLogger(__name__)
@@ -59,6 +64,7 @@ class HeatClient(object):
                                              service_type='orchestration',
                                              base_url=base_url)
 
+    @lcm_profiler.measure('heat_create_stack')
     def create_stack(self, fields, wait=True):
         if CONF.v2_vnfm.enable_rollback_stack:
             fields['disable_rollback'] = False
@@ -72,6 +78,7 @@ class HeatClient(object):
 
         return body['stack']['id']
 
+    @lcm_profiler.measure('heat_update_stack')
     def update_stack(self, stack_name, fields, wait=True):
         if CONF.v2_vnfm.enable_rollback_stack:
             fields['disable_rollback'] = False
@@ -88,6 +95,7 @@ class HeatClient(object):
         if wait:
             self.wait_stack_update(stack_name)
 
+    @lcm_profiler.measure('heat_delete_stack')
     def delete_stack(self, stack_name, wait=True):
         path = f"stacks/{stack_name}"
         resp, body = self.client.do_request(path, "DELETE",
@@ -117,7 +125,13 @@ class HeatClient(object):
 
         return body["stack"]["id"]
 
+    @lcm_profiler.measure('heat_get_resources')
     def get_resources(self, stack_name):
+        if CONF.v2_vnfm.heat_resource_cache_size == 0:
+            return HeatResourceInventory(self.list_resources(stack_name))
+        return _heat_resource_cache.get_resources(self, stack_name)
+
+    def list_resources(self, stack_name):
         # NOTE: Because it is necessary to get nested stack info, it is
         # necessary to specify 'nested_depth=2'.
         path = f"stacks/{stack_name}/resources?nested_depth=2"
@@ -126,6 +140,32 @@ class HeatClient(object):
 
         return body['resources']
 
+    def get_latest_event_id(self, stack_name):
+        # NOTE: nested_depth is the same as list_resources so that the
+        # events of all resources listed are included.
+        path = (f"stacks/{stack_name}/events?nested_depth=2"
+                "&sort_dir=desc&limit=1")
+        resp, body = self.client.do_request(path, "GET",
+                expected_status=[200, 404])
+
+        if resp.status_code == 404 or not body['events']:
+            return None
+
+        return body['events'][0]['id']
+
+    def get_events_after(self, stack_name, marker, limit):
+        path = (f"stacks/{stack_name}/events?nested_depth=2"
+                f"&sort_dir=asc&marker={marker}&limit={limit}")
+        resp, body = self.client.do_request(path, "GET",
+                expected_status=[200, 400, 404])
+
+        # NOTE: 400 or 404 is returned if the marker event is purged.
+        if resp.status_code != 200:
+            return None
+
+        return body['events']
+
+    @lcm_profiler.measure('heat_wait')
     def _wait_completion(self, stack_name, operation, complete_status,
             progress_status, failed_status):
         # NOTE: timeout is specified for each stack operation. so it is
@@ -242,7 +282,182 @@ class HeatClient(object):
         return body["events"][0]["resource_status_reason"]
 
 
+class HeatResourceInventory(list):
+    """List of heat resources indexed by type, name and parent."""
+
+    def __init__(self, heat_reses):
+        super(HeatResourceInventory, self).__init__(heat_reses)
+        self.by_type = collections.defaultdict(list)
+        self.by_name = {}
+        self.by_parent = collections.defaultdict(list)
+        for res in self:
+            self.by_type[res['resource_type']].append(res)
+            self.by_name.setdefault(res['resource_name'], res)
+            self.by_parent[res.get('parent_resource')].append(res)
+
+    def get_by_types(self, types):
+        if len(types) == 1:
+            return list(self.by_type.get(types[0], []))
+        return [res for res in self if res['resource_type'] in types]
+
+    def get_children(self, parent_name):
+        """Return the resources whose parent_resource is parent_name.
+
+        None means the resources of the top level stack.
+        """
+        return list(self.by_parent.get(parent_name, []))
+
+
+def make_inventory(heat_reses):
+    if isinstance(heat_reses, HeatResourceInventory):
+        return heat_reses
+    return HeatResourceInventory(heat_reses)
+
+
+# NOTE: HeatResourceCache keeps the resource list (nested_depth=2) of heat
+# stacks in memory, since the list is large for a VNF with a lot of VDUs
+# and ports and is got several times in an LCM operation.
+#
+# - An entry is identified by the stack name (i.e. vnf-{inst id}/{stack
+#   id}) and holds the id of the latest stack event when the list is made.
+#   It is valid as long as the latest event is not changed.
+# - If events have occurred (ex. by a stack update), the resources which
+#   the events are about are got from heat one by one and replaced in the
+#   list, as long as the number of events is not more than
+#   heat_resource_cache_max_events. Otherwise the whole list is got again.
+# - The least recently used entry is dropped if the number of entries
+#   exceeds heat_resource_cache_size.
+#
+# The cached resources are shared by the callers. They must be treated as
+# read-only.
+
+class _CacheEntry(object):
+
+    def __init__(self, event_id, resources):
+        self.event_id = event_id
+        self.resources = resources
+
+
+class HeatResourceCache(object):
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries = collections.OrderedDict()
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'incremental_updates': 0,
+            'evictions': 0,
+        }
+
+    def get_resources(self, heat_client, stack_name):
+        # NOTE: the latest event id is got before the resources so that
+        # the events during getting the resources are applied next time.
+        event_id = heat_client.get_latest_event_id(stack_name)
+        with self.lock:
+            entry = self.entries.get(stack_name)
+            if entry is not None:
+                self.entries.move_to_end(stack_name)
+        if event_id is None:
+            # no event (should not occur) or the stack is not found.
+            # not cached.
+            self._pop(stack_name)
+            return HeatResourceInventory(heat_client.list_resources(
+                stack_name))
+
+        resources = None
+        stat = 'misses'
+        if entry is not None and entry.event_id == event_id:
+            resources = entry.resources
+            stat = 'hits'
+        elif entry is not None:
+            resources = self._apply_events(heat_client, stack_name, entry)
+            stat = 'incremental_updates'
+        if resources is None:
+            resources = heat_client.list_resources(stack_name)
+            stat = 'misses'
+
+        self._put(stack_name, _CacheEntry(event_id, resources), stat)
+        return HeatResourceInventory(resources)
+
+    def _apply_events(self, heat_client, stack_name, entry):
+        max_events = CONF.v2_vnfm.heat_resource_cache_max_events
+        events = heat_client.get_events_after(stack_name, entry.event_id,
+                                              max_events + 1)
+        if events is None or len(events) > max_events:
+            return None
+
+        # (stack name/stack id, resource name) of the changed resources
+        changed = []
+        for event in events:
+            stack_id = get_resource_stack_id(event)
+            if (stack_id is None or
+                    stack_id.split('/')[0] == event['resource_name']):
+                # event of the stack itself
+                continue
+            key = (stack_id, event['resource_name'])
+            if key not in changed:
+                changed.append(key)
+
+        resources = list(entry.resources)
+        index = {(get_resource_stack_id(res), res['resource_name']): i
+                 for i, res in enumerate(resources)}
+        removed = set()
+        for key in changed:
+            res = heat_client.get_resource_info(*key)
+            idx = index.get(key)
+            if res is None:
+                if idx is not None:
+                    removed.add(idx)
+            elif idx is not None:
+                resources[idx] = res
+            else:
+                index[key] = len(resources)
+                resources.append(res)
+
+        LOG.debug("%d resources of %s are updated from the stack events.",
+                  len(changed), stack_name)
+        return [res for i, res in enumerate(resources) if i not in removed]
+
+    def _put(self, stack_name, entry, stat):
+        max_entries = CONF.v2_vnfm.heat_resource_cache_size
+        with self.lock:
+            self.stats[stat] += 1
+            self.entries[stack_name] = entry
+            self.entries.move_to_end(stack_name)
+            while len(self.entries) > max_entries:
+                self.entries.popitem(last=False)
+                self.stats['evictions'] += 1
+
+    def _pop(self, stack_name):
+        with self.lock:
+            self.stats['misses'] += 1
+            self.entries.pop(stack_name, None)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def get_stats(self):
+        with self.lock:
+            result = dict(self.stats)
+            result['entries'] = len(self.entries)
+        return result
+
+
+_heat_resource_cache = HeatResourceCache()
+
+
+def get_heat_resource_cache_stats():
+    return _heat_resource_cache.get_stats()
+
+
+stats.register('v2_heat_resource_cache', get_heat_resource_cache_stats)
+
+
 def get_reses_by_types(heat_reses, types):
+    if isinstance(heat_reses, HeatResourceInventory):
+        return heat_reses.get_by_types(types)
     return [res for res in heat_reses if res['resource_type'] in types]
 
 
@@ -299,6 +514,8 @@ def get_resource_stack_id(heat_res):
 
 def get_parent_resource(heat_res, heat_reses):
     parent = heat_res.get('parent_resource')
+    if parent and isinstance(heat_reses, HeatResourceInventory):
+        return heat_reses.by_name.get(parent)
     if parent:
         for res in heat_reses:
             if res['resource_name'] == parent:
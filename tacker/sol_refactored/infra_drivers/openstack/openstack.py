@@ -14,6 +14,7 @@
 #    under the License.
 
 
+import collections
 import copy
 import json
 import os
@@ -32,10 +33,12 @@ from tacker.sol_refactored.common import common_script_utils
 from tacker.sol_refactored.common import config
 from tacker.sol_refactored.common import exceptions as sol_ex
 from tacker.sol_refactored.common import lcm_op_occ_utils as lcmocc_utils
+from tacker.sol_refactored.common import lcm_profiler
 from tacker.sol_refactored.common import vnf_instance_utils as inst_utils
 from tacker.sol_refactored.infra_drivers.openstack import heat_utils
 from tacker.sol_refactored.infra_drivers.openstack import nova_utils
 from tacker.sol_refactored.infra_drivers.openstack import userdata_default
+from tacker.sol_refactored.infra_drivers.openstack import userdata_pool
 from tacker.sol_refactored import objects
 from tacker.sol_refactored.objects.v2 import fields as v2fields
 
@@ -242,7 +245,8 @@ class Openstack(object):
         vim_info = inst_utils.select_vim_info(inst.vimConnectionInfo)
         heat_client = heat_utils.HeatClient(vim_info)
         stack_name = heat_utils.get_stack_name(inst)
-        heat_reses = heat_client.get_resources(stack_name)
+        heat_reses = heat_utils.make_inventory(
+            heat_client.get_resources(stack_name))
 
         # mark unhealthy to added servers while scale out
         vnfc_ids = [vnfc.id
@@ -880,31 +884,15 @@ class Openstack(object):
             LOG.debug("Processing %s %s %s", userdata, userdata_class,
                 grant_req.operation)
 
-            tmp_csar_dir = vnfd.make_tmp_csar_dir()
             script_dict = {
                 'request': req.to_dict(),
                 'vnf_instance': inst.to_dict(),
                 'grant_request': grant_req.to_dict(),
                 'grant_response': grant.to_dict(),
-                'tmp_csar_dir': tmp_csar_dir,
                 'is_rollback': is_rollback
             }
-            script_path = os.path.join(
-                os.path.dirname(__file__), "userdata_main.py")
-
-            out = subprocess.run([sys.executable, script_path],
-                input=pickle.dumps(script_dict),
-                stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-
-            vnfd.remove_tmp_csar_dir(tmp_csar_dir)
-
-            if out.returncode != 0:
-                LOG.debug("execute userdata class instantiate failed: %s",
-                    out.stderr)
-                raise sol_ex.UserdataExecutionFailed(
-                    sol_detail=str(out.stderr))
-
-            fields = pickle.loads(out.stdout)
+            with lcm_profiler.phase('userdata'):
+                fields = userdata_pool.POOL.execute(vnfd, script_dict)
 
         fields['timeout_mins'] = (
             CONF.v2_vnfm.openstack_vim_stack_create_timeout)
@@ -1254,27 +1242,35 @@ class Openstack(object):
 
             ext_cp_infos.append(ext_cp_info)
 
-    def _find_vnfc_cp_info(self, port_res, vnfc_res_infos, server_reses):
-        for vnfc_res_info in vnfc_res_infos:
-            if not vnfc_res_info.obj_attr_is_set('vnfcCpInfo'):
-                continue
-            vnfc_res = server_reses[vnfc_res_info.id]
-            vdu_name = vnfc_res_info.vduId
-            cp_name = port_res['resource_name']
-            if (vdu_name in port_res.get('required_by', []) and
-                    port_res.get('parent_resource') ==
-                    vnfc_res.get('parent_resource')):
-                for vnfc_cp in vnfc_res_info.vnfcCpInfo:
-                    if vnfc_cp.cpdId == cp_name:
-                        return vnfc_cp
+    def _find_vnfc_cp_info(self, port_res, vnfc_index):
+        # NOTE: vnfc_index is {(vduId, parent_resource): [(index of
+        # vnfc_res_infos, vnfc_res_info), ...]}. the first matched one in
+        # the order of vnfc_res_infos is returned.
+        parent = port_res.get('parent_resource')
+        candidates = []
+        for vdu_name in set(port_res.get('required_by', [])):
+            candidates.extend(vnfc_index.get((vdu_name, parent), []))
+        cp_name = port_res['resource_name']
+        for _, vnfc_res_info in sorted(candidates, key=lambda x: x[0]):
+            for vnfc_cp in vnfc_res_info.vnfcCpInfo:
+                if vnfc_cp.cpdId == cp_name:
+                    return vnfc_cp
 
     def _link_vnfc_cp_info(self, vnfc_res_infos, ext_port_infos,
             vnf_port_infos, ext_cp_infos, server_reses, port_reses):
 
+        vnfc_index = collections.defaultdict(list)
+        for idx, vnfc_res_info in enumerate(vnfc_res_infos):
+            if not vnfc_res_info.obj_attr_is_set('vnfcCpInfo'):
+                continue
+            vnfc_res = server_reses[vnfc_res_info.id]
+            vnfc_index[(vnfc_res_info.vduId,
+                        vnfc_res.get('parent_resource'))].append(
+                (idx, vnfc_res_info))
+
         for ext_port_info in ext_port_infos:
             port_res = port_reses[ext_port_info.id]
-            vnfc_cp = self._find_vnfc_cp_info(port_res, vnfc_res_infos,
-                server_reses)
+            vnfc_cp = self._find_vnfc_cp_info(port_res, vnfc_index)
             if vnfc_cp:
                 # should be found
                 vnfc_cp.vnfExtCpId = ext_port_info.cpInstanceId
@@ -1285,8 +1281,7 @@ class Openstack(object):
 
         for vnf_port_info in vnf_port_infos:
             port_res = port_reses[vnf_port_info.id]
-            vnfc_cp = self._find_vnfc_cp_info(port_res, vnfc_res_infos,
-                server_reses)
+            vnfc_cp = self._find_vnfc_cp_info(port_res, vnfc_index)
             if vnfc_cp:
                 # should be found
                 vnf_port_info.cpInstanceType = 'VNFC_CP'
@@ -1377,7 +1372,8 @@ class Openstack(object):
         stack_id = stack_id if stack_id else inst.instantiatedVnfInfo.metadata[
             'stack_id']
         stack_name = heat_utils.get_stack_name(inst, stack_id)
-        heat_reses = heat_client.get_resources(stack_name)
+        heat_reses = heat_utils.make_inventory(
+            heat_client.get_resources(stack_name))
         # NOTE: Using json.loads because parameters['nfv'] is string
         nfv_dict = json.loads(heat_client.get_parameters(stack_name)['nfv'])
 
@@ -1429,14 +1425,18 @@ class Openstack(object):
             for res_id, res in server_reses.items()
         ]
 
+        # NOTE: {parent_resource: [storage id, ...]} in the order of
+        # storage_reses.
+        storage_ids_by_parent = collections.defaultdict(list)
+        for storage_id, storage_res in storage_reses.items():
+            storage_ids_by_parent[storage_res.get('parent_resource')].append(
+                storage_id)
+
         for vnfc_res_info in vnfc_res_infos:
             vdu_name = vnfc_res_info.vduId
             server_res = server_reses[vnfc_res_info.id]
-            storage_ids = [storage_id
-                for storage_id, storage_res in storage_reses.items()
-                if (server_res.get('parent_resource') ==
-                    storage_res.get('parent_resource'))
-            ]
+            storage_ids = list(storage_ids_by_parent.get(
+                server_res.get('parent_resource'), []))
             if storage_ids:
                 vnfc_res_info.storageResourceIds = storage_ids
 
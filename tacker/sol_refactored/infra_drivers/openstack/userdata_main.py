@@ -14,15 +14,25 @@
 #    under the License.
 
 import importlib
+import io
 import os
 import pickle
 import sys
 import traceback
 
 
-def main():
-    script_dict = pickle.load(sys.stdin.buffer)
+# NOTE: modules imported in advance by a worker process so that they are
+# ready when a userdata class is executed. They are not necessarily
+# importable (ex. tacker is not installed in the environment) since the
+# userdata class may not use them.
+WARM_MODULES = [
+    'tacker.sol_refactored.common.common_script_utils',
+    'tacker.sol_refactored.common.vnf_instance_utils',
+    'tacker.sol_refactored.infra_drivers.openstack.userdata_utils',
+]
 
+
+def _exec_userdata(script_dict):
     req = script_dict['request']
     inst = script_dict['vnf_instance']
     grant_req = script_dict['grant_request']
@@ -33,7 +43,8 @@ def main():
     userdata_path = additional_params['lcm-operation-user-data']
     userdata_class = additional_params['lcm-operation-user-data-class']
 
-    sys.path.append(tmp_csar_dir)
+    if tmp_csar_dir not in sys.path:
+        sys.path.append(tmp_csar_dir)
     class_module = os.path.splitext(
         userdata_path.lstrip('./'))[0].replace('/', '.')
     module = importlib.import_module(class_module)
@@ -43,15 +54,67 @@ def main():
     if script_dict['is_rollback']:
         operation = operation + '_rollback'
     method = getattr(klass, operation)
-    stack_dict = method(req, inst, grant_req, grant, tmp_csar_dir)
+    return method(req, inst, grant_req, grant, tmp_csar_dir)
+
+
+def _take_stdout():
+    # NOTE: stdout is kept for the output of this script only not to be
+    # broken by outputs of userdata classes. They are written to stderr
+    # instead.
+    out = os.fdopen(os.dup(sys.stdout.fileno()), 'wb')
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    return out
+
+
+def main():
+    out = _take_stdout()
+    script_dict = pickle.load(sys.stdin.buffer)
+
+    stack_dict = _exec_userdata(script_dict)
+
+    pickle.dump(stack_dict, out)
+    out.flush()
+
+
+def worker_main():
+    # NOTE: a worker process executes userdata classes repeatedly. Each
+    # request is a pickled script_dict read from stdin and each response
+    # is a pickled dict which has 'result' or 'error' written to stdout.
+    # Imported modules (i.e. userdata classes) are kept between requests.
+    out = _take_stdout()
+
+    for name in WARM_MODULES:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            pass
+
+    while True:
+        try:
+            script_dict = pickle.load(sys.stdin.buffer)
+        except EOFError:
+            return
+
+        stdout, stderr = sys.stdout, sys.stderr
+        sys.stdout = sys.stderr = io.StringIO()
+        try:
+            resp = pickle.dumps({'result': _exec_userdata(script_dict)})
+        except Exception:
+            resp = pickle.dumps(
+                {'error': sys.stderr.getvalue() + traceback.format_exc()})
+        finally:
+            sys.stdout, sys.stderr = stdout, stderr
 
-    pickle.dump(stack_dict, sys.stdout.buffer)
-    sys.stdout.flush()
+        out.write(resp)
+        out.flush()
 
 
 if __name__ == "__main__":
     try:
-        main()
+        if sys.argv[1:] == ['--worker']:
+            worker_main()
+        else:
+            main()
         os._exit(0)
     except Exception:
         sys.stderr.write(traceback.format_exc())
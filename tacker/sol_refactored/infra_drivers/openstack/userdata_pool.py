@@ -0,0 +1,327 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import os
+import pickle
+import shutil
+import stat
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from oslo_log import log as logging
+
+from tacker.common import stats
+from tacker.sol_refactored.common import config
+from tacker.sol_refactored.common import exceptions as sol_ex
+
+
+LOG = logging.getLogger(__name__)
+
+CONF = config.CONF
+
+USERDATA_MAIN = os.path.join(os.path.dirname(__file__), "userdata_main.py")
+
+
+# NOTE: UserDataWorkerPool executes userdata classes (i.e.
+# 'lcm-operation-user-data-class') by worker processes which are kept
+# alive between operations instead of starting a new python process per
+# operation.
+#
+# - A worker is bound to a package (csar directory, userdata file and its
+#   mtime) at its first use so that the imported userdata module is
+#   reused by the following operations of the package and modules of
+#   different packages do not conflict.
+# - A spare worker, which is not bound to any package yet, is started in
+#   advance so that the interpreter startup and imports of tacker modules
+#   are not included in the operation even if there is no idle worker of
+#   the package.
+# - A worker makes its own copy of the csar directory when it is bound
+#   and the copy is made read-only, so that userdata classes can neither
+#   modify the package of tacker nor leave changes to the following
+#   operations. The copy is made once per worker, not per operation.
+# - A worker process is started without holding the lock of the pool.
+# - Each worker runs in its own working directory and stderr of it is
+#   discarded. The outputs of a userdata class are included in the error
+#   detail if the class fails.
+# - A worker is discarded if the execution fails. Idle workers are
+#   stopped after userdata_worker_idle_timeout and the oldest one is
+#   stopped if the number of idle workers exceeds
+#   userdata_worker_pool_size.
+#
+# If userdata_worker_pool_size is 0, a new process is started for each
+# execution with a copy of the csar directory as before.
+
+class UserDataWorker(object):
+
+    def __init__(self):
+        self.work_dir = tempfile.mkdtemp()
+        self.csar_dir = None
+        self.proc = subprocess.Popen(
+            [sys.executable, USERDATA_MAIN, '--worker'],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL, cwd=self.work_dir, close_fds=True)
+        self.last_used = time.monotonic()
+
+    def bind(self, vnfd):
+        if self.csar_dir is None:
+            self.csar_dir = vnfd.make_tmp_csar_dir()
+            _set_writable(self.csar_dir, False)
+
+    def alive(self):
+        return self.proc.poll() is None
+
+    def execute(self, script_dict):
+        try:
+            pickle.dump(script_dict, self.proc.stdin)
+            self.proc.stdin.flush()
+            resp = pickle.load(self.proc.stdout)
+        except Exception as ex:
+            raise sol_ex.UserdataExecutionFailed(
+                sol_detail=f"userdata worker terminated: {ex}")
+        if 'error' in resp:
+            raise sol_ex.UserdataExecutionFailed(sol_detail=resp['error'])
+        return resp['result']
+
+    def stop(self):
+        try:
+            # NOTE: the worker exits when stdin is closed.
+            self.proc.stdin.close()
+            self.proc.wait(timeout=5)
+        except Exception:
+            self.proc.kill()
+            self.proc.wait()
+        self.proc.stdout.close()
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+        if self.csar_dir is not None:
+            _set_writable(self.csar_dir, True)
+            shutil.rmtree(self.csar_dir, ignore_errors=True)
+
+
+_WRITE_BITS = stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH
+
+
+def _set_writable(path, writable):
+    # NOTE: only the write permission of the owner is given back, which
+    # is enough to remove the directory.
+    for root, dirs, files in os.walk(path):
+        for name in [root] + [os.path.join(root, f) for f in files]:
+            if os.path.islink(name):
+                continue
+            mode = stat.S_IMODE(os.stat(name).st_mode)
+            if writable:
+                os.chmod(name, mode | stat.S_IWUSR)
+            else:
+                os.chmod(name, mode & ~_WRITE_BITS)
+
+
+class UserDataWorkerPool(object):
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.idle = {}
+        self.spare = None
+        self.stats = {
+            'executed': 0,
+            'failed': 0,
+            'warm': 0,
+            'latency_sum': 0.0,
+            'latency_max': 0.0,
+        }
+        # latency per LCM operation (ex. 'INSTANTIATE')
+        self.op_stats = {}
+
+    @staticmethod
+    def _get_key(vnfd, userdata_path):
+        path = os.path.join(vnfd.csar_dir, userdata_path)
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            mtime = None
+        return (vnfd.csar_dir, userdata_path, mtime)
+
+    def _pop_expired(self):
+        # NOTE: called with the lock held.
+        expired = []
+        limit = time.monotonic() - CONF.v2_vnfm.userdata_worker_idle_timeout
+        for key in list(self.idle):
+            workers = self.idle[key]
+            expired += [w for w in workers if w.last_used < limit]
+            workers[:] = [w for w in workers if w.last_used >= limit]
+            if not workers:
+                del self.idle[key]
+        return expired
+
+    def _acquire(self, key):
+        worker = None
+        warm = False
+        with self.lock:
+            stale = self._pop_expired()
+            workers = self.idle.get(key, [])
+            while workers:
+                candidate = workers.pop()
+                if candidate.alive():
+                    worker = candidate
+                    warm = True
+                    break
+                stale.append(candidate)
+            if worker is None:
+                worker, self.spare = self.spare, None
+            need_spare = self.spare is None
+        for w in stale:
+            w.stop()
+        if worker is None or not worker.alive():
+            if worker is not None:
+                worker.stop()
+            worker = UserDataWorker()
+        if need_spare:
+            self._start_spare()
+        return worker, warm
+
+    def _start_spare(self):
+        # NOTE: the process is started without holding the lock not to
+        # block the other operations. if another thread has started a
+        # spare in the meantime, the one started here is not needed.
+        spare = UserDataWorker()
+        with self.lock:
+            if self.spare is None:
+                self.spare, spare = spare, None
+        if spare is not None:
+            spare.stop()
+
+    def _release(self, key, worker):
+        worker.last_used = time.monotonic()
+        with self.lock:
+            self.idle.setdefault(key, []).append(worker)
+            stale = self._pop_expired()
+            num_idle = sum(len(workers) for workers in self.idle.values())
+            while num_idle > CONF.v2_vnfm.userdata_worker_pool_size:
+                oldest_key = min(self.idle,
+                                 key=lambda k: self.idle[k][0].last_used)
+                stale.append(self.idle[oldest_key].pop(0))
+                if not self.idle[oldest_key]:
+                    del self.idle[oldest_key]
+                num_idle -= 1
+        for w in stale:
+            w.stop()
+
+    def _execute_in_worker(self, vnfd, script_dict):
+        userdata_path = (script_dict['request']['additionalParams']
+                         ['lcm-operation-user-data'])
+        key = self._get_key(vnfd, userdata_path)
+        worker, warm = self._acquire(key)
+        try:
+            worker.bind(vnfd)
+            script_dict['tmp_csar_dir'] = worker.csar_dir
+            result = worker.execute(script_dict)
+        except Exception:
+            worker.stop()
+            raise
+        self._release(key, worker)
+        return result, warm
+
+    def _execute_in_new_process(self, vnfd, script_dict):
+        tmp_csar_dir = vnfd.make_tmp_csar_dir()
+        script_dict['tmp_csar_dir'] = tmp_csar_dir
+        out = subprocess.run([sys.executable, USERDATA_MAIN],
+            input=pickle.dumps(script_dict),
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+
+        vnfd.remove_tmp_csar_dir(tmp_csar_dir)
+
+        if out.returncode != 0:
+            raise sol_ex.UserdataExecutionFailed(sol_detail=str(out.stderr))
+
+        return pickle.loads(out.stdout)
+
+    def execute(self, vnfd, script_dict):
+        """Execute the userdata class specified in script_dict.
+
+        script_dict is the same as the input of userdata_main.py.
+        'tmp_csar_dir' of it is set by this method.
+        """
+        start = time.monotonic()
+        warm = False
+        success = False
+        try:
+            if CONF.v2_vnfm.userdata_worker_pool_size > 0:
+                result, warm = self._execute_in_worker(vnfd, script_dict)
+            else:
+                result = self._execute_in_new_process(vnfd, script_dict)
+            success = True
+        except sol_ex.UserdataExecutionFailed as ex:
+            LOG.debug("execute userdata class %s failed: %s",
+                      script_dict['grant_request']['operation'],
+                      ex.detail)
+            raise
+        finally:
+            self._record(script_dict, success, warm,
+                         time.monotonic() - start)
+        return result
+
+    def _record(self, script_dict, success, warm, latency):
+        operation = script_dict['grant_request']['operation']
+        with self.lock:
+            if success:
+                self.stats['executed'] += 1
+            else:
+                self.stats['failed'] += 1
+            if warm:
+                self.stats['warm'] += 1
+            self.stats['latency_sum'] += latency
+            self.stats['latency_max'] = max(self.stats['latency_max'],
+                                            latency)
+            op_stats = self.op_stats.setdefault(
+                operation, {'count': 0, 'latency_sum': 0.0,
+                            'latency_max': 0.0})
+            op_stats['count'] += 1
+            op_stats['latency_sum'] += latency
+            op_stats['latency_max'] = max(op_stats['latency_max'], latency)
+        LOG.info("userdata %(op)s of vnf instance %(inst)s took %(time).3f "
+                 "sec (warm worker: %(warm)s).",
+                 {'op': operation,
+                  'inst': script_dict['vnf_instance']['id'],
+                  'time': latency, 'warm': warm})
+
+    def get_stats(self):
+        with self.lock:
+            stats = dict(self.stats)
+            stats['idle_workers'] = sum(
+                len(workers) for workers in self.idle.values())
+            stats['operations'] = {
+                operation: dict(op_stats,
+                                latency_avg=(op_stats['latency_sum'] /
+                                             op_stats['count']))
+                for operation, op_stats in self.op_stats.items()}
+        count = stats['executed'] + stats['failed']
+        stats['latency_avg'] = stats['latency_sum'] / count if count else 0.0
+        return stats
+
+    def stop(self):
+        with self.lock:
+            workers = [w for ws in self.idle.values() for w in ws]
+            if self.spare is not None:
+                workers.append(self.spare)
+            self.idle = {}
+            self.spare = None
+        for worker in workers:
+            worker.stop()
+
+
+POOL = UserDataWorkerPool()
+
+stats.register('v2_userdata_worker_pool', POOL.get_stats)
@@ -214,147 +214,156 @@ class ContainerUpdateMgmtDriver(kubernetes.Kubernetes):
                                       'ConfigMap/Secret is inconsistent '
                                       'with the previous one.')
         # Initialize k8s client api
-        acm = kubernetes_utils.AuthContextManager(vim_connection_info)
-        k8s_api_client = acm.init_k8s_api_client()
-
-        # Get the namespace of this CNF
-        namespace = inst_vnf_info['metadata']['namespace']
-
-        # Get old_k8s_objs
-        target_k8s_files = inst_vnf_info['metadata'][
-            'lcm-kubernetes-def-files']
-        old_vnfd = vnfd_utils.Vnfd(uuidutils.generate_uuid())
-        old_vnfd.init_from_csar_dir(self.old_csar_dir)
-        old_k8s_objs, _ = self._setup_k8s_reses(
-            old_vnfd, target_k8s_files, k8s_api_client, namespace,
-            vnf_instance['id'])
-        # Get new_k8s_objs
-        target_k8s_files = new_inst_vnf_info['metadata'][
-            'lcm-kubernetes-def-files']
-        new_vnfd = vnfd_utils.Vnfd(self.req['vnfdId'])
-        new_vnfd.init_from_csar_dir(self.new_csar_dir)
-        new_k8s_objs, _ = self._setup_k8s_reses(
-            new_vnfd, target_k8s_files, k8s_api_client, namespace,
-            vnf_instance['id'])
-        # Initialize k8s_pod_objs and k8s_config_objs
-        k8s_pod_objs = []
-        k8s_config_objs = []
-        vdu_image_changed_info = {}
-
-        for old_k8s_obj in old_k8s_objs:
-            old_k8s_obj_kind = old_k8s_obj.kind
-            old_k8s_obj_name = old_k8s_obj.name
-            if old_k8s_obj_kind in ('Pod', 'Deployment',
-                                    'ReplicaSet', 'DaemonSet'):
-                image_modify_flag = False
-                config_modify_flag = False
-                for new_k8s_obj in new_k8s_objs:
-                    # If the old and new k8s_obj have the same kind and name
-                    new_k8s_obj_kind = new_k8s_obj.kind
-                    new_k8s_obj_name = new_k8s_obj.name
-                    if old_k8s_obj_kind == new_k8s_obj_kind and (
-                            old_k8s_obj_name == new_k8s_obj_name):
-                        # Call the read API
-                        old_k8s_resource_info = old_k8s_obj.read()
-                        # Assign old_k8s_resource_info to old_k8s_obj['object']
-                        old_k8s_obj.body = old_k8s_resource_info
-
-                        # if config of Pod/Deployment/ReplicaSet/DaemonSet
-                        # is to be updated then set config_modify_flag True
-                        config_modify_flag = self._is_config_updated(
-                            old_k8s_resource_info, modify_config_names)
-                        if old_k8s_obj_kind in ('Deployment', 'ReplicaSet',
-                                                'DaemonSet'):
-                            old_containers = (old_k8s_obj.body.spec
-                                              .template.spec.containers)
-                            new_containers = (
-                                new_k8s_obj.body['spec'][
-                                    'template']['spec']['containers'])
-                        elif old_k8s_obj_kind == 'Pod':
-                            old_containers = (old_k8s_obj.body
-                                              .spec.containers)
-                            new_containers = (
-                                new_k8s_obj.body['spec']['containers'])
-                        # Replace the old image with the new image
-                        image_modify_flag = self._modify_container_img(
-                            old_containers, new_containers)
-                        if image_modify_flag:
-                            vdu_image_changed_info[new_k8s_obj_name] = {
-                                old_container.name: old_container.image
-                                for old_container in old_containers}
-                        break
-                # Append only old_k8s_obj whose image or config would
-                # be updated to k8s_pod_objs
-                if image_modify_flag or config_modify_flag:
-                    k8s_pod_objs.append(old_k8s_obj)
-            elif old_k8s_obj_kind in ['ConfigMap', 'Secret']:
-                for new_k8s_obj in new_k8s_objs:
-                    # If the old and new k8s_obj have the same kind and name
-                    new_k8s_obj_kind = new_k8s_obj.kind
-                    new_k8s_obj_name = new_k8s_obj.name
-                    if old_k8s_obj_kind == new_k8s_obj_kind and (
-                            old_k8s_obj_name == new_k8s_obj_name):
-                        # Append new_k8s_obj to k8s_config_objs
-                        k8s_config_objs.append(new_k8s_obj)
-                        break
-        for k8s_config_obj in k8s_config_objs:
-            # Call the replace API
-            k8s_config_obj.replace()
-
-        pods = kubernetes_utils.list_namespaced_pods(
-            k8s_api_client, namespace=namespace)
-        old_pods_names = set()
-        for k8s_pod_obj in k8s_pod_objs:
-            # Call the replace API
-            k8s_pod_obj.replace()
-            for pod in pods:
-                # TODO(YiFeng): The function of `is_match_pod_naming` is
-                # called too frequently, resulting in reduced performance.
-                # In the future, during instantiate processing, the label of
-                # `vnfInstanceId: xxxxx` will be added to the specified
-                # resource of CNF, and then the parameter `label_selector`
-                # will be added when calling `list_namespaced_pods` above to
-                # filter to get the pods belonging to the CNF.
-                match_result = self.is_match_pod_naming(
-                    k8s_pod_obj.kind,
-                    k8s_pod_obj.name,
-                    pod.metadata.name)
-                if match_result:
-                    # delete pod of modified replicaset
-                    # After using the replace_namespaced_replicaset API of k8s,
-                    # the new configuration cannot be applied to the pod
-                    # created by the replicaset, so you need to delete the pod
-                    # first, and then the replicaset will automatically rebuild
-                    # the pod to make the new configuration take effect.
-                    if k8s_pod_obj.kind == 'ReplicaSet':
-                        k8s_pod_obj.delete_pod(pod.metadata.name)
-                    old_pods_names.add(pod.metadata.name)
-                    pods.remove(pod)
-
-        # _replace_wait_k8s
-        self._wait_k8s_reses_updated(
-            k8s_pod_objs, k8s_api_client, namespace, old_pods_names)
-
-        # update DB
-        # update vdu_reses
-        updated_vdu = [vnfc_res_info['vduId'] for vnfc_res_info in
-                       new_inst_vnf_info['vnfcResourceInfo'] if
-                       vnfc_res_info['id'] in old_pods_names]
-        for vdu, vdu_res in new_inst_vnf_info['metadata']['vdu_reses'].items():
-            k8s_ojb_name = vdu_res.get('metadata', {}).get('name')
-            if (vdu in updated_vdu and k8s_ojb_name
-                    in list(vdu_image_changed_info.keys())):
-                if vdu_res['kind'] == 'Pod':
-                    self._update_vdu_res_image_info(
-                        vdu_res['spec']['containers'],
-                        vdu_image_changed_info[k8s_ojb_name])
-                else:
-                    self._update_vdu_res_image_info(
-                        vdu_res['spec']['template']['spec']['containers'],
-                        vdu_image_changed_info[k8s_ojb_name])
-
-        vnf_instance['instantiatedVnfInfo'] = new_inst_vnf_info
-        self._update_vnfc_info(vnf_instance, k8s_api_client)
+        # NOTE: the api client may be taken from the cache. it is
+        # released when leaving the with block.
+        with kubernetes_utils.AuthContextManager(
+                vim_connection_info) as acm:
+            k8s_api_client = acm.init_k8s_api_client()
+
+            # Get the namespace of this CNF
+            namespace = inst_vnf_info['metadata']['namespace']
+
+            # Get old_k8s_objs
+            target_k8s_files = inst_vnf_info['metadata'][
+                'lcm-kubernetes-def-files']
+            old_vnfd = vnfd_utils.Vnfd(uuidutils.generate_uuid())
+            old_vnfd.init_from_csar_dir(self.old_csar_dir)
+            old_k8s_objs, _ = self._setup_k8s_reses(
+                old_vnfd, target_k8s_files, k8s_api_client, namespace,
+                vnf_instance['id'])
+            # Get new_k8s_objs
+            target_k8s_files = new_inst_vnf_info['metadata'][
+                'lcm-kubernetes-def-files']
+            new_vnfd = vnfd_utils.Vnfd(self.req['vnfdId'])
+            new_vnfd.init_from_csar_dir(self.new_csar_dir)
+            new_k8s_objs, _ = self._setup_k8s_reses(
+                new_vnfd, target_k8s_files, k8s_api_client, namespace,
+                vnf_instance['id'])
+            # Initialize k8s_pod_objs and k8s_config_objs
+            k8s_pod_objs = []
+            k8s_config_objs = []
+            vdu_image_changed_info = {}
+
+            for old_k8s_obj in old_k8s_objs:
+                old_k8s_obj_kind = old_k8s_obj.kind
+                old_k8s_obj_name = old_k8s_obj.name
+                if old_k8s_obj_kind in ('Pod', 'Deployment',
+                                        'ReplicaSet', 'DaemonSet'):
+                    image_modify_flag = False
+                    config_modify_flag = False
+                    for new_k8s_obj in new_k8s_objs:
+                        # If the old and new k8s_obj have the same kind
+                        # and name
+                        new_k8s_obj_kind = new_k8s_obj.kind
+                        new_k8s_obj_name = new_k8s_obj.name
+                        if old_k8s_obj_kind == new_k8s_obj_kind and (
+                                old_k8s_obj_name == new_k8s_obj_name):
+                            # Call the read API
+                            old_k8s_resource_info = old_k8s_obj.read()
+                            # Assign old_k8s_resource_info to
+                            # old_k8s_obj['object']
+                            old_k8s_obj.body = old_k8s_resource_info
+
+                            # if config of Pod/Deployment/ReplicaSet/DaemonSet
+                            # is to be updated then set config_modify_flag True
+                            config_modify_flag = self._is_config_updated(
+                                old_k8s_resource_info, modify_config_names)
+                            if old_k8s_obj_kind in ('Deployment', 'ReplicaSet',
+                                                    'DaemonSet'):
+                                old_containers = (old_k8s_obj.body.spec
+                                                  .template.spec.containers)
+                                new_containers = (
+                                    new_k8s_obj.body['spec'][
+                                        'template']['spec']['containers'])
+                            elif old_k8s_obj_kind == 'Pod':
+                                old_containers = (old_k8s_obj.body
+                                                  .spec.containers)
+                                new_containers = (
+                                    new_k8s_obj.body['spec']['containers'])
+                            # Replace the old image with the new image
+                            image_modify_flag = self._modify_container_img(
+                                old_containers, new_containers)
+                            if image_modify_flag:
+                                vdu_image_changed_info[new_k8s_obj_name] = {
+                                    old_container.name: old_container.image
+                                    for old_container in old_containers}
+                            break
+                    # Append only old_k8s_obj whose image or config would
+                    # be updated to k8s_pod_objs
+                    if image_modify_flag or config_modify_flag:
+                        k8s_pod_objs.append(old_k8s_obj)
+                elif old_k8s_obj_kind in ['ConfigMap', 'Secret']:
+                    for new_k8s_obj in new_k8s_objs:
+                        # If the old and new k8s_obj have the same kind
+                        # and name
+                        new_k8s_obj_kind = new_k8s_obj.kind
+                        new_k8s_obj_name = new_k8s_obj.name
+                        if old_k8s_obj_kind == new_k8s_obj_kind and (
+                                old_k8s_obj_name == new_k8s_obj_name):
+                            # Append new_k8s_obj to k8s_config_objs
+                            k8s_config_objs.append(new_k8s_obj)
+                            break
+            for k8s_config_obj in k8s_config_objs:
+                # Call the replace API
+                k8s_config_obj.replace()
+
+            pods = kubernetes_utils.list_namespaced_pods(
+                k8s_api_client, namespace=namespace)
+            old_pods_names = set()
+            for k8s_pod_obj in k8s_pod_objs:
+                # Call the replace API
+                k8s_pod_obj.replace()
+                for pod in pods:
+                    # TODO(YiFeng): The function of `is_match_pod_naming`
+                    # is called too frequently, resulting in reduced
+                    # performance. In the future, during instantiate
+                    # processing, the label of `vnfInstanceId: xxxxx` will
+                    # be added to the specified resource of CNF, and then
+                    # the parameter `label_selector` will be added when
+                    # calling `list_namespaced_pods` above to filter to get
+                    # the pods belonging to the CNF.
+                    match_result = self.is_match_pod_naming(
+                        k8s_pod_obj.kind,
+                        k8s_pod_obj.name,
+                        pod.metadata.name)
+                    if match_result:
+                        # delete pod of modified replicaset
+                        # After using the replace_namespaced_replicaset API
+                        # of k8s, the new configuration cannot be applied to
+                        # the pod created by the replicaset, so you need to
+                        # delete the pod first, and then the replicaset will
+                        # automatically rebuild the pod to make the new
+                        # configuration take effect.
+                        if k8s_pod_obj.kind == 'ReplicaSet':
+                            k8s_pod_obj.delete_pod(pod.metadata.name)
+                        old_pods_names.add(pod.metadata.name)
+                        pods.remove(pod)
+
+            # _replace_wait_k8s
+            self._wait_k8s_reses_updated(
+                k8s_pod_objs, k8s_api_client, namespace, old_pods_names)
+
+            # update DB
+            # update vdu_reses
+            updated_vdu = [vnfc_res_info['vduId'] for vnfc_res_info in
+                           new_inst_vnf_info['vnfcResourceInfo'] if
+                           vnfc_res_info['id'] in old_pods_names]
+            vdu_reses = new_inst_vnf_info['metadata']['vdu_reses']
+            for vdu, vdu_res in vdu_reses.items():
+                k8s_ojb_name = vdu_res.get('metadata', {}).get('name')
+                if (vdu in updated_vdu and k8s_ojb_name
+                        in list(vdu_image_changed_info.keys())):
+                    if vdu_res['kind'] == 'Pod':
+                        self._update_vdu_res_image_info(
+                            vdu_res['spec']['containers'],
+                            vdu_image_changed_info[k8s_ojb_name])
+                    else:
+                        self._update_vdu_res_image_info(
+                            vdu_res['spec']['template']['spec']['containers'],
+                            vdu_image_changed_info[k8s_ojb_name])
+
+            vnf_instance['instantiatedVnfInfo'] = new_inst_vnf_info
+            self._update_vnfc_info(vnf_instance, k8s_api_client)
         output = {'vnf_instance': vnf_instance}
         return output
 
@@ -27,6 +27,7 @@ from tacker.sol_refactored.common import fm_alarm_utils as alarm_utils
 from tacker.sol_refactored.common import fm_subscription_utils as fm_utils
 from tacker.sol_refactored.common import http_client
 from tacker.sol_refactored.common import lcm_op_occ_utils as lcmocc_utils
+from tacker.sol_refactored.common import lcm_profiler
 from tacker.sol_refactored.common import pm_job_utils
 from tacker.sol_refactored.common import subscription_utils as subsc_utils
 from tacker.sol_refactored.common import vnfd_utils
@@ -125,6 +126,7 @@ class NfvoClient(object):
         LOG.debug("grant response: %s", grant_res.to_dict())
         return grant_res
 
+    @lcm_profiler.measure('get_vnfd')
     @coordinate.lock_resources('{vnfd_id}', blocking=True)
     def get_vnfd(self, context, vnfd_id, all_contents=False):
         if self.is_local:
@@ -159,7 +161,7 @@ class NfvoClient(object):
             raise ex
 
     def _delete_csar_cache(self, context, vnfd_id):
-        insts = objects.VnfInstanceV2.get_by_filter(context,
+        insts = objects.VnfInstanceV2.get_by_filter(context, attrs=['id'],
                                                     vnfdId=vnfd_id)
 
         # NOTE: assume this method called after delete VnfInstance
@@ -205,6 +207,7 @@ class NfvoClient(object):
         if not self.is_local:
             self._delete_csar_cache(context, inst.vnfdId)
 
+    @lcm_profiler.measure('notification')
     def send_lcmocc_notification(self, context, lcmocc, inst, endpoint):
         subscs = subsc_utils.get_lcmocc_subscs(context, lcmocc, inst)
         for subsc in subscs:
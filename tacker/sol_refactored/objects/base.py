@@ -25,8 +25,11 @@ from oslo_serialization import jsonutils
 from oslo_utils import versionutils
 from oslo_versionedobjects import base as ovoo_base
 from oslo_versionedobjects import exception as ovoo_exc
+import sqlalchemy as sa
+from sqlalchemy import orm
 
 from tacker.db import api as db_api
+from tacker.sol_refactored.common import config
 from tacker.sol_refactored.common import exceptions as sol_ex
 from tacker.sol_refactored.db.sqlalchemy import models
 from tacker.sol_refactored import objects
@@ -35,6 +38,12 @@ from tacker.sol_refactored.objects import fields as obj_fields
 
 LOG = logging.getLogger(__name__)
 
+CONF = config.CONF
+
+# NOTE: the number of rows fetched from DB at once by get_dict_all with
+# stream=True.
+_STREAM_BATCH_SIZE = 100
+
 
 def get_attrname(name):
     """Return the mangled name of the attribute's underlying storage."""
@@ -77,6 +86,55 @@ def get_model_field(name):
     return name
 
 
+def _make_lazy_decrypt_property(cls, name, decrypt):
+    # NOTE: The credentials in a field listed in _lazy_decrypt_fields of a
+    # TackerPersistentObject are not decrypted when the object is loaded
+    # from DB but when the field is read first, since most of the loaded
+    # objects (ex. all subscriptions to find the matched ones) do not use
+    # them. The property made by oslo.versionedobjects is wrapped for it.
+    # 'decrypt' decrypts the field value in place.
+    prop = getattr(cls, name)
+
+    def getter(self):
+        value = prop.fget(self)
+        if name in self._decrypt_pending:
+            self._decrypt_pending.discard(name)
+            if value is not None:
+                decrypt(value)
+        return value
+
+    def setter(self, value):
+        self._decrypt_pending.discard(name)
+        prop.fset(self, value)
+
+    setattr(cls, name, property(getter, setter, prop.fdel))
+
+
+def _make_lazy_load_property(cls, name):
+    # NOTE: The JSON columns of the object fields (i.e. ObjectField,
+    # ListOfObjectsField and DictOfObjectsField) of a TackerPersistentObject
+    # are not converted to objects when the object is loaded from DB but
+    # when the field is read first, since many of the loaded objects use a
+    # few simple fields only (ex. id and instantiationState of
+    # VnfInstanceV2). The JSON string is kept as the field value until then.
+    prop = getattr(cls, name)
+
+    def getter(self):
+        value = prop.fget(self)
+        if name in self._load_pending:
+            self._load_pending.discard(name)
+            prop.fset(self, self._load_field(self.fields[name], value))
+            self._changed_fields.discard(name)
+            value = prop.fget(self)
+        return value
+
+    def setter(self, value):
+        self._load_pending.discard(name)
+        prop.fset(self, value)
+
+    setattr(cls, name, property(getter, setter, prop.fdel))
+
+
 class TackerObjectRegistry(ovoo_base.VersionedObjectRegistry):
     notification_classes = []
     _registry = None
@@ -94,6 +152,16 @@ class TackerObjectRegistry(ovoo_base.VersionedObjectRegistry):
         self._obj_classes = TackerObjectRegistry._registry._obj_classes
         return self
 
+    def _register_class(self, cls):
+        super(TackerObjectRegistry, self)._register_class(cls)
+        if issubclass(cls, TackerPersistentObject):
+            for name, field in cls.fields.items():
+                if isinstance(field, _OBJECT_FIELD_TYPES):
+                    _make_lazy_load_property(cls, name)
+        for name, decrypt in getattr(cls, '_lazy_decrypt_fields',
+                                     {}).items():
+            _make_lazy_decrypt_property(cls, name, decrypt)
+
     def registration_hook(self, cls, index):
         # NOTE: This is called when an object is registered,
         # and is responsible for maintaining tacker.objects.$OBJECT
@@ -319,12 +387,63 @@ class TackerObjectSerializer(messaging.NoOpSerializer):
         return entity
 
 
+_OBJECT_FIELD_TYPES = (obj_fields.ObjectField,
+                       obj_fields.ListOfObjectsField,
+                       obj_fields.DictOfObjectsField)
+
+
+def _db_value(value):
+    # NOTE: make a value of a DB column comparable with the value loaded
+    # from DB. datetime is compared as tz unaware UTC since DateTime
+    # column does not keep timezone. dict and list (i.e. JSON column) are
+    # compared by their serialized form so that the loaded values are not
+    # affected by in-place modification of the object.
+    if isinstance(value, datetime.datetime) and value.tzinfo:
+        return value.replace(tzinfo=None) - value.utcoffset()
+    if isinstance(value, (dict, list)):
+        return jsonutils.dumps(value, sort_keys=True)
+    return value
+
+
 class TackerPersistentObject(TackerObject):
     """Class for objects supposed to be to DB."""
 
+    # NOTE: {field name: function to decrypt the field value in place}.
+    # See _make_lazy_decrypt_property().
+    _lazy_decrypt_fields = {}
+
     def __init__(self, context=None, **kwargs):
+        self._decrypt_pending = set()
+        self._load_pending = set()
         super(TackerPersistentObject, self).__init__(context, **kwargs)
         self._db_obj = None
+        # NOTE: values of the DB columns when the object was loaded from
+        # (or saved to) DB. It is used to update only the columns changed.
+        self._db_values = None
+
+    def obj_decrypt_pending(self, name):
+        """Return True if the field loaded from DB is not decrypted yet."""
+        return name in self._decrypt_pending
+
+    def obj_load_pending(self, name):
+        """Return True if the field loaded from DB is not converted yet."""
+        return name in self._load_pending
+
+    def obj_what_changed(self):
+        # NOTE: same as the original except that the fields not converted
+        # yet are skipped, which are not changed obviously. The original
+        # reads all object fields (i.e. converts them) to check changes of
+        # their children.
+        changes = set([field for field in self._changed_fields
+                       if field in self.fields])
+        for field in self.fields:
+            if (field not in self._load_pending and
+                    self.obj_attr_is_set(field) and
+                    isinstance(getattr(self, field),
+                               ovoo_base.VersionedObject) and
+                    getattr(self, field).obj_what_changed()):
+                changes.add(field)
+        return changes
 
     # By default, it's assumed that there is a model class corresponding to one
     # TackerPersistentObject, which has the same named fields.
@@ -332,26 +451,90 @@ class TackerPersistentObject(TackerObject):
         clsname = self.__class__.__name__
         return getattr(models, clsname)
 
+    @staticmethod
+    def _get_version_column(model_cls):
+        # NOTE: A model class can have an integer column 'version' for
+        # optimistic concurrency control. It is incremented by every
+        # update of the row.
+        return 'version' if hasattr(model_cls, 'version') else None
+
+    def _set_db_values(self, db_obj, values):
+        self._db_values = {name: _db_value(value)
+                           for name, value in values.items()}
+        version_column = self._get_version_column(type(db_obj))
+        if version_column:
+            self._db_values[version_column] = db_obj.get(version_column)
+
     @db_api.context_manager.writer
     def _save(self, context, merge=False):
         if not self.obj_get_changes():
             return
         model_cls = self._get_model_cls()
+        values = self.to_db_obj()
+        if merge and self._db_values is not None:
+            self._update_changed(context, model_cls, values)
+            self.obj_reset_changes()
+            return
+
         inst = model_cls()
-        inst.update(self.to_db_obj())
+        inst.update(values)
         # note: The same workaround is present in oslo.db ModelBase.save()
         #       implementation.
         with context.session.begin(nested=True):
             if merge:
-                context.session.merge(inst, load=True)
+                db_obj = context.session.merge(inst, load=True)
             else:
                 context.session.add(inst)
+                db_obj = inst
             context.session.commit()
         # 'flush' must have succeeded because we are here.
         if self._db_obj is None:
             self._db_obj = inst
+        self._set_db_values(db_obj, values)
         self.obj_reset_changes()
 
+    def _update_changed(self, context, model_cls, values):
+        # NOTE: Only the columns whose values differ from the ones loaded
+        # from DB are updated by a single UPDATE statement. Note that
+        # values are compared instead of using obj_get_changes() since
+        # obj_get_changes() does not detect in-place modifications of
+        # list and dict fields.
+        changes = {name: value for name, value in values.items()
+                   if _db_value(value) != self._db_values.get(name)}
+        if not changes:
+            return
+
+        query = context.session.query(model_cls).filter(
+            model_cls.id == self.id)
+        version_column = self._get_version_column(model_cls)
+        if version_column:
+            column = getattr(model_cls, version_column)
+            version = self._db_values.get(version_column)
+            if CONF.v2_vnfm.db_optimistic_locking and version is not None:
+                query = query.filter(column == version)
+                changes[version_column] = version + 1
+            else:
+                version = None
+                changes[version_column] = column + 1
+
+        with context.session.begin(nested=True):
+            count = query.update(changes, synchronize_session=False)
+            context.session.commit()
+        if count == 0:
+            if version_column and CONF.v2_vnfm.db_optimistic_locking:
+                raise sol_ex.DbUpdateConflict(obj_name=self.obj_name(),
+                                              obj_id=self.id)
+            # NOTE: the row was deleted. create it as session.merge does.
+            self._db_values = None
+            self._save(context, merge=True)
+            return
+
+        for name, value in changes.items():
+            self._db_values[name] = _db_value(value)
+        if version_column and version is None:
+            # NOTE: the version is unknown since it was incremented in DB.
+            self._db_values[version_column] = None
+
     @db_api.context_manager.writer
     def delete(self, context):
         if self._db_obj is None:
@@ -377,6 +560,17 @@ class TackerPersistentObject(TackerObject):
             return None
         return cls.from_db_obj(result)
 
+    @classmethod
+    @db_api.context_manager.reader
+    def get_by_ids(cls, context, ids):
+        model_cls = getattr(models, cls.__name__)
+        if not ids:
+            return []
+        query = context.session.query(model_cls).filter(
+            model_cls.id.in_(ids))
+        result = query.all()
+        return [cls.from_db_obj(item) for item in result]
+
     @classmethod
     @db_api.context_manager.reader
     def get_all(cls, context, marker=None):
@@ -393,15 +587,27 @@ class TackerPersistentObject(TackerObject):
 
     @classmethod
     @db_api.context_manager.reader
-    def get_by_filter(cls, context, *args, **kwargs):
+    def get_by_filter(cls, context, *args, attrs=None, **kwargs):
+        """Get the objects which match kwargs.
+
+        If attrs (a list of field names) is specified, only the columns of
+        them are loaded from DB and the other fields are not set to the
+        objects.
+        """
         model_cls = getattr(models, cls.__name__)
         query = context.session.query(model_cls).filter_by(**kwargs)
+        if attrs is not None:
+            columns = [get_model_field(attr) for attr in attrs]
+            version_column = cls._get_version_column(model_cls)
+            if version_column:
+                columns.append(version_column)
+            query = query.options(orm.load_only(
+                *[getattr(model_cls, column) for column in columns]))
         result = query.all()
         return [cls.from_db_obj(item) for item in result]
 
     @classmethod
-    @db_api.context_manager.reader
-    def get_dict_all(cls, context, attrs, filters, limit):
+    def _dict_query(cls, context, attrs, filters, limit):
         model_cls = getattr(models, cls.__name__)
         args = []
         for attr in attrs:
@@ -429,12 +635,19 @@ class TackerPersistentObject(TackerObject):
                     args.append(column.not_in(val))
             query = query.filter(*args)
         if limit is not None:
-            query = query.limit(limit)
-        result = query.all()
-        ret = [item._asdict() for item in result]
+            # NOTE: the order is necessary for paging by the marker (i.e.
+            # 'gt' id).
+            query = query.order_by(model_cls.id).limit(limit)
+        return query
+
+    @classmethod
+    def _dict_converter(cls, attrs):
+        model_cls = getattr(models, cls.__name__)
         json_attrs = [attr for attr in attrs
             if str(getattr(model_cls, get_model_field(attr)).type) == 'JSON']
-        for item in ret:
+
+        def _convert(row):
+            item = row._asdict()
             for attr in attrs:
                 attr_ = get_model_field(attr)
                 val = item[attr_]
@@ -449,39 +662,82 @@ class TackerPersistentObject(TackerObject):
                     # NOTE: It is str normally but there is a case it is
                     # already dict.
                     item[attr] = jsonutils.loads(val)
-        return ret
+            return item
+
+        return _convert
+
+    @classmethod
+    def get_dict_all(cls, context, attrs, filters, limit, stream=False):
+        """Get the values of attrs of the objects as dicts.
+
+        If stream is True, an iterator is returned instead of a list. The
+        rows are fetched from DB by batches while it is consumed, so that
+        all of them are not loaded in memory at once. Note that the read
+        transaction is kept until the iterator is exhausted or closed.
+        """
+        if stream:
+            return cls._iter_dict_all(context, attrs, filters, limit)
+        return cls._get_dict_all(context, attrs, filters, limit)
+
+    @classmethod
+    @db_api.context_manager.reader
+    def _get_dict_all(cls, context, attrs, filters, limit):
+        query = cls._dict_query(context, attrs, filters, limit)
+        convert = cls._dict_converter(attrs)
+        return [convert(item) for item in query.all()]
+
+    @classmethod
+    def _iter_dict_all(cls, context, attrs, filters, limit):
+        convert = cls._dict_converter(attrs)
+        with db_api.context_manager.reader.using(context):
+            query = cls._dict_query(context, attrs, filters, limit)
+            for item in query.yield_per(_STREAM_BATCH_SIZE):
+                yield convert(item)
+
+    @classmethod
+    def _load_field(cls, field, value):
+        # convert the JSON string of an object field in DB to the objects.
+        child_cls = cls.obj_class_from_name(field.objname, None)
+        if isinstance(field, obj_fields.ObjectField):
+            return child_cls.from_json(value)
+        value_loaded = jsonutils.loads(value)
+        if isinstance(field, obj_fields.ListOfObjectsField):
+            return [child_cls.from_dict(thing) for thing in value_loaded]
+        # DictOfObjectsField
+        return {key: child_cls.from_dict(thing)
+                for key, thing in value_loaded.items()}
 
     @classmethod
     def from_db_obj(cls, db_obj):
         inst = cls()
-        for name, field in cls.fields.items():
-            name_ = get_model_field(name)
-            value = db_obj.get(name_, None)
+        # NOTE: the columns not loaded (i.e. not selected by attrs of
+        # get_by_filter) are not set to the object.
+        state = sa.inspect(db_obj, raiseerr=False)
+        unloaded = state.unloaded if state is not None else set()
+        names = [name for name in cls.fields
+                 if get_model_field(name) not in unloaded]
+        for name in names:
+            field = cls.fields[name]
+            value = db_obj.get(get_model_field(name), None)
             if value is None:
                 continue
-            if isinstance(field, obj_fields.ObjectField):
-                child_cls = cls.obj_class_from_name(field.objname, None)
-                setattr(inst, name, child_cls.from_json(value))
-            elif isinstance(field, obj_fields.ListOfObjectsField):
-                child_cls = cls.obj_class_from_name(field.objname, None)
-                list_of_objects = []
-                value_loaded = jsonutils.loads(value)
-                for thing in value_loaded:
-                    list_of_objects.append(child_cls.from_dict(thing))
-                setattr(inst, name, list_of_objects)
-            elif isinstance(field, obj_fields.DictOfObjectsField):
-                child_cls = cls.obj_class_from_name(field.objname, None)
-                dict_of_objects = {}
-                value_loaded = jsonutils.loads(value)
-                for key, thing in value_loaded.items():
-                    dict_of_objects[key] = child_cls.from_dict(thing)
-                setattr(inst, name, dict_of_objects)
+            if isinstance(field, _OBJECT_FIELD_TYPES):
+                # NOTE: converted when it is read first.
+                # see _make_lazy_load_property.
+                setattr(inst, get_attrname(name), value)
+                inst._load_pending.add(name)
             elif isinstance(field, obj_fields.DateTimeField):
                 setattr(inst, name, value)
             else:
                 setattr(inst, name, field.from_primitive(inst, name, value))
         inst._db_obj = db_obj
+        inst._set_db_values(db_obj, {
+            get_model_field(name): db_obj.get(get_model_field(name))
+            for name in names})
         inst.obj_reset_changes()
+        if CONF.use_credential_encryption:
+            inst._decrypt_pending = {name for name in cls._lazy_decrypt_fields
+                                     if inst.obj_attr_is_set(name)}
         return inst
 
     def to_db_obj(self):
@@ -490,6 +746,11 @@ class TackerPersistentObject(TackerObject):
             name_ = get_model_field(name)
             if not self.obj_attr_is_set(name):
                 continue
+            if self.obj_decrypt_pending(name) or self.obj_load_pending(name):
+                # NOTE: the field is not read since it was loaded from DB.
+                # the (encrypted) value in DB is kept as it is.
+                obj[name_] = self._db_obj.get(name_)
+                continue
             if getattr(self, name) is None:
                 obj[name_] = None
                 continue
@@ -49,18 +49,10 @@ class LccnSubscriptionV2(base.TackerPersistentObject,
             'LccnSubscriptionV2_Links', nullable=False),
     }
 
-    @classmethod
-    def from_db_obj(cls, db_obj):
-        lccn_subsc = super().from_db_obj(db_obj)
-        if not CONF.use_credential_encryption:
-            # If use_credential_encryption in the config is False,
-            # credential information is not encrypted.
-            return lccn_subsc
-
-        if lccn_subsc.obj_attr_is_set('authentication'):
-            auth = lccn_subsc.authentication
-            crypt_utils.decrypt_subsc_auth_v2(auth)
-        return lccn_subsc
+    # NOTE: credentials are decrypted when the field is read first.
+    _lazy_decrypt_fields = {
+        'authentication': crypt_utils.decrypt_subsc_auth_v2,
+    }
 
     def to_db_obj(self):
         obj = super().to_db_obj()
@@ -70,7 +62,7 @@ class LccnSubscriptionV2(base.TackerPersistentObject,
             return obj
 
         auth_db_obj = obj.get('authentication', None)
-        if auth_db_obj:
+        if auth_db_obj and not self.obj_decrypt_pending('authentication'):
             auth = jsonutils.loads(auth_db_obj)
             crypt_utils.encrypt_subsc_auth_v2(auth)
             obj['authentication'] = jsonutils.dumps(auth)
@@ -0,0 +1,130 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from oslo_db import exception as db_exc
+
+from tacker.db import api as db_api
+from tacker.sol_refactored.db.sqlalchemy import models
+from tacker.sol_refactored.objects import base
+from tacker.sol_refactored.objects import fields
+
+
+# NOTE: LcmOpProfileV2 is not included in the SOL specification.
+# It is a proprietary implementation of Tacker. A row is created for
+# each execution (start, retry or rollback) of a VnfLcmOpOccV2 and holds
+# the duration of each phase of the execution.
+@base.TackerObjectRegistry.register
+class LcmOpProfileV2(base.TackerPersistentObject,
+                     base.TackerObjectDictCompat):
+
+    # Version 1.0: Initial version
+    VERSION = '1.0'
+
+    fields = {
+        'id': fields.StringField(nullable=False),
+        'lcmOpOccId': fields.StringField(nullable=False),
+        'vnfInstanceId': fields.StringField(nullable=False),
+        'operation': fields.StringField(nullable=False),
+        # 'START', 'RETRY' or 'ROLLBACK'
+        'action': fields.StringField(nullable=False),
+        'operationState': fields.StringField(nullable=False),
+        'startTime': fields.DateTimeField(nullable=False),
+        # in seconds
+        'duration': fields.FloatField(nullable=False),
+        'phases': fields.ListOfObjectsField(
+            'LcmOpProfileV2_Phases', nullable=False),
+    }
+
+    @classmethod
+    @db_api.context_manager.writer
+    def delete_profiles(cls, context, start_before):
+        """Delete profiles which started before start_before.
+
+        Return the number of deleted profiles.
+        """
+        model_cls = models.LcmOpProfileV2
+        return context.session.query(model_cls).filter(
+            model_cls.startTime < start_before).delete(
+                synchronize_session=False)
+
+
+@base.TackerObjectRegistry.register
+class LcmOpProfileV2_Phases(base.TackerObject, base.TackerObjectDictCompat):
+
+    # Version 1.0: Initial version
+    VERSION = '1.0'
+
+    fields = {
+        # nested phases are joined by '.'. ex. 'process.heat.wait'
+        'name': fields.StringField(nullable=False),
+        # offset from startTime in seconds
+        'start': fields.FloatField(nullable=False),
+        'duration': fields.FloatField(nullable=False),
+    }
+
+
+# NOTE: LcmOpMetricV2 is not included in the SOL specification.
+# It is a proprietary implementation of Tacker. A row holds the number
+# and the sum of the durations of the executions of an operation (or a
+# phase of them) which fall in a bucket of the histogram. The rows are
+# only incremented and are not deleted with the expired profiles, so the
+# histograms never decrease.
+@base.TackerObjectRegistry.register
+class LcmOpMetricV2(base.TackerPersistentObject,
+                    base.TackerObjectDictCompat):
+
+    # Version 1.0: Initial version
+    VERSION = '1.0'
+
+    fields = {
+        'operation': fields.StringField(nullable=False),
+        # name of the phase. '' for the whole execution.
+        'phase': fields.StringField(nullable=False),
+        # upper bound of the bucket. ex. '0.1', '+Inf'
+        'le': fields.StringField(nullable=False),
+        'count': fields.IntegerField(nullable=False),
+        # in seconds
+        'sum': fields.FloatField(nullable=False),
+    }
+
+    @classmethod
+    def add_observations(cls, context, observations):
+        """Add observations to the buckets.
+
+        observations is a dict {(operation, phase, le): (count, sum)}.
+        """
+        try:
+            cls._add_observations(context, observations)
+        except db_exc.DBDuplicateEntry:
+            # NOTE: a bucket was inserted by another process at the same
+            # time. It is updated when retried.
+            cls._add_observations(context, observations)
+
+    @classmethod
+    @db_api.context_manager.writer
+    def _add_observations(cls, context, observations):
+        model_cls = models.LcmOpMetricV2
+        # NOTE: the rows are updated in a fixed order to avoid deadlocks.
+        for key, (count, value) in sorted(observations.items()):
+            operation, phase, le = key
+            num = context.session.query(model_cls).filter_by(
+                operation=operation, phase=phase, le=le).update(
+                    {'count': model_cls.count + count,
+                     'sum': model_cls.sum + value},
+                    synchronize_session=False)
+            if num == 0:
+                context.session.add(model_cls(
+                    operation=operation, phase=phase, le=le,
+                    count=count, sum=value))
@@ -13,6 +13,12 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import datetime
+
+import sqlalchemy as sa
+
+from tacker.db import api as db_api
+from tacker.sol_refactored.db.sqlalchemy import models
 from tacker.sol_refactored.objects import base
 from tacker.sol_refactored.objects import fields
 
@@ -63,3 +69,114 @@ class VnfPmReportV2_Entries_PerformanceValues(base.TackerObject,
         'value': fields.StringField(nullable=False),
         'context': fields.KeyValuePairsField(nullable=True),
     }
+
+
+def _utc(value):
+    # NOTE: DateTime column does not keep timezone. values are stored
+    # as UTC.
+    return value.replace(tzinfo=datetime.timezone.utc)
+
+
+# NOTE: PerformanceReportEntryV2 is not included in the SOL specification.
+# It is a proprietary implementation of Tacker. A row is created for
+# each performanceValue of PerformanceReportV2 and rows are never
+# updated. It is used to look up the latest report of a metric and the
+# reports of PM jobs by the indexes without loading the entries of
+# every PerformanceReportV2.
+@base.TackerObjectRegistry.register
+class PerformanceReportEntryV2(base.TackerPersistentObject,
+                               base.TackerObjectDictCompat):
+
+    # Version 1.0: Initial version
+    VERSION = '1.0'
+
+    fields = {
+        'id': fields.StringField(nullable=False),
+        'reportId': fields.StringField(nullable=False),
+        'jobId': fields.StringField(nullable=False),
+        'objectInstanceId': fields.StringField(nullable=False),
+        'subObjectInstanceId': fields.StringField(nullable=True),
+        'performanceMetric': fields.StringField(nullable=False),
+        'timeStamp': fields.DateTimeField(nullable=False),
+        'readyTime': fields.DateTimeField(nullable=False),
+    }
+
+    @classmethod
+    @db_api.context_manager.reader
+    def get_latest_time_stamps(cls, context, job_ids, object_instance_ids):
+        """Return the timeStamps of the latest performance values.
+
+        The return value is a dict whose key is a tuple of jobId,
+        objectInstanceId, subObjectInstanceId and performanceMetric and
+        value is the latest timeStamp of them. It is answered by one
+        query using PerformanceReportEntryV2_latest_idx.
+        """
+        model_cls = models.PerformanceReportEntryV2
+        if not job_ids or not object_instance_ids:
+            return {}
+        query = context.session.query(
+            model_cls.jobId, model_cls.objectInstanceId,
+            model_cls.subObjectInstanceId, model_cls.performanceMetric,
+            sa.func.max(model_cls.timeStamp)).filter(
+                model_cls.jobId.in_(job_ids),
+                model_cls.objectInstanceId.in_(object_instance_ids)).group_by(
+                    model_cls.jobId, model_cls.objectInstanceId,
+                    model_cls.subObjectInstanceId,
+                    model_cls.performanceMetric)
+        return {(job_id, object_instance_id, sub_id, metric): _utc(latest)
+                for (job_id, object_instance_id, sub_id, metric, latest)
+                in query.all()}
+
+    @classmethod
+    @db_api.context_manager.reader
+    def get_reports(cls, context, job_ids):
+        """Return reports of PM jobs.
+
+        The return value is a dict whose key is a PM job id and value is
+        a list of tuples of report id and readyTime ordered by readyTime.
+        """
+        model_cls = models.PerformanceReportEntryV2
+        query = context.session.query(
+            model_cls.jobId, model_cls.reportId,
+            model_cls.readyTime).filter(
+                model_cls.jobId.in_(job_ids)).distinct().order_by(
+                    model_cls.readyTime, model_cls.reportId)
+        reports = {job_id: [] for job_id in job_ids}
+        for item in query.all():
+            reports[item.jobId].append((item.reportId,
+                                        _utc(item.readyTime)))
+        return reports
+
+    @classmethod
+    @db_api.context_manager.writer
+    def delete_reports(cls, context, job_id, ready_before=None):
+        """Delete reports of a PM job and their entries.
+
+        If ready_before is specified, only the reports whose readyTime
+        is older than it are deleted. Otherwise all reports of the PM job,
+        including ones created before PerformanceReportEntryV2 was
+        introduced, are deleted. Return the number of deleted reports.
+        """
+        model_cls = models.PerformanceReportEntryV2
+        report_model_cls = models.PerformanceReportV2
+        if ready_before is None:
+            num = context.session.query(report_model_cls).filter(
+                report_model_cls.jobId == job_id).delete(
+                    synchronize_session=False)
+            context.session.query(model_cls).filter(
+                model_cls.jobId == job_id).delete(synchronize_session=False)
+            return num
+
+        query = context.session.query(model_cls.reportId).filter(
+            model_cls.jobId == job_id,
+            model_cls.readyTime < ready_before).distinct()
+        report_ids = [item.reportId for item in query.all()]
+        if not report_ids:
+            return 0
+        context.session.query(report_model_cls).filter(
+            report_model_cls.id.in_(report_ids)).delete(
+                synchronize_session=False)
+        context.session.query(model_cls).filter(
+            model_cls.reportId.in_(report_ids)).delete(
+                synchronize_session=False)
+        return len(report_ids)
@@ -52,22 +52,11 @@ class ThresholdV2(base.TackerPersistentObject, base.TackerObjectDictCompat):
         'metadata': fields.KeyValuePairsField(nullable=True),
     }
 
-    @classmethod
-    def from_db_obj(cls, db_obj):
-        threshold = super().from_db_obj(db_obj)
-        if not CONF.use_credential_encryption:
-            # If use_credential_encryption in the config is False,
-            # credential information is not encrypted.
-            return threshold
-
-        if threshold.obj_attr_is_set('authentication'):
-            auth = threshold.authentication
-            crypt_utils.decrypt_subsc_auth_v2(auth)
-
-        if threshold.obj_attr_is_set('metadata'):
-            metadata = threshold.metadata
-            crypt_utils.decrypt_monitoring_v2(metadata)
-        return threshold
+    # NOTE: credentials are decrypted when the field is read first.
+    _lazy_decrypt_fields = {
+        'authentication': crypt_utils.decrypt_subsc_auth_v2,
+        'metadata': crypt_utils.decrypt_monitoring_v2,
+    }
 
     def to_db_obj(self):
         obj = super().to_db_obj()
@@ -77,13 +66,13 @@ class ThresholdV2(base.TackerPersistentObject, base.TackerObjectDictCompat):
             return obj
 
         auth_db_obj = obj.get('authentication', None)
-        if auth_db_obj:
+        if auth_db_obj and not self.obj_decrypt_pending('authentication'):
             auth = jsonutils.loads(auth_db_obj)
             crypt_utils.encrypt_subsc_auth_v2(auth)
             obj['authentication'] = jsonutils.dumps(auth)
 
         metadata = obj.get('metadata__', None)
-        if metadata:
+        if metadata and not self.obj_decrypt_pending('metadata'):
             metadata = copy.deepcopy(metadata)
             crypt_utils.encrypt_monitoring_v2(metadata)
             obj['metadata__'] = metadata
@@ -58,21 +58,10 @@ class VnfInstanceV2(base.TackerPersistentObject,
         '_links': fields.ObjectField('VnfInstanceV2_Links', nullable=False),
     }
 
-    @classmethod
-    def from_db_obj(cls, db_obj):
-        inst = super().from_db_obj(db_obj)
-        if not CONF.use_credential_encryption:
-            # If use_credential_encryption in the config is False,
-            # credential information is not encrypted.
-            return inst
-
-        try:
-            vim_infos_exist = inst.obj_attr_is_set('vimConnectionInfo')
-        except AttributeError:
-            vim_infos_exist = False
-        if vim_infos_exist:
-            crypt_utils.decrypt_vim_infos_v2(inst.vimConnectionInfo)
-        return inst
+    # NOTE: credentials are decrypted when the field is read first.
+    _lazy_decrypt_fields = {
+        'vimConnectionInfo': crypt_utils.decrypt_vim_infos_v2,
+    }
 
     def to_db_obj(self):
         obj = super().to_db_obj()
@@ -82,7 +71,8 @@ class VnfInstanceV2(base.TackerPersistentObject,
             return obj
 
         vim_infos_db_obj = obj.get('vimConnectionInfo', None)
-        if vim_infos_db_obj:
+        if (vim_infos_db_obj and
+                not self.obj_decrypt_pending('vimConnectionInfo')):
             vim_infos = jsonutils.loads(vim_infos_db_obj)
             crypt_utils.encrypt_vim_infos_v2(vim_infos)
             obj['vimConnectionInfo'] = jsonutils.dumps(vim_infos)
@@ -20,6 +20,7 @@ from unittest import mock
 
 from tacker.common import crypt_utils
 from tacker.common import exceptions
+from tacker.common import stats
 from tacker.sol_refactored.db.sqlalchemy import models
 from tacker.sol_refactored.objects.common import crypt_key
 from tacker.tests import base
@@ -134,3 +135,31 @@ class TestCryptUtils(base.BaseTestCase):
         mock_os_remove.return_value = None
         self.assertRaises(exceptions.FailedToGetCryptKey,
                           crypt_utils.CryptUtil)
+
+    def test_encrypt_decrypt(self):
+        # NOTE: CryptUtil is a singleton. an instance is made here without
+        # loading a key from DB.
+        cu = object.__new__(crypt_utils.CryptUtil)
+        cu.tacker_key = self.tacker_key
+        old_stats = crypt_utils.get_stats()
+
+        with mock.patch.object(crypt_utils.fernet, 'Fernet',
+                               wraps=crypt_utils.fernet.Fernet) as mock_fernet:
+            enc1 = cu.encrypt('secret1')
+            enc2 = cu.encrypt('secret2')
+            self.assertEqual('secret1', cu.decrypt(enc1))
+            self.assertEqual('secret2', cu.decrypt(enc2))
+            # Fernet object is reused.
+            self.assertEqual(1, mock_fernet.call_count)
+
+            # made again if the key is changed.
+            cu.tacker_key = self.master_key
+            self.assertEqual('secret1', cu.decrypt(cu.encrypt('secret1')))
+            self.assertEqual(2, mock_fernet.call_count)
+
+        new_stats = crypt_utils.get_stats()
+        self.assertEqual(3, new_stats['encrypt'] - old_stats['encrypt'])
+        self.assertEqual(3, new_stats['decrypt'] - old_stats['decrypt'])
+        # reported by tacker-conductor.
+        self.assertEqual(new_stats,
+                         stats.get_all()['credential_encryption'])
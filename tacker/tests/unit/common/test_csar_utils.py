@@ -12,6 +12,7 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import hashlib
 import os
 import shutil
 import tempfile
@@ -483,3 +484,65 @@ class TestCSARUtils(testtools.TestCase):
         status = os.stat(extract_file_path)
         permission = oct(status.st_mode)[-3:]
         self.assertEqual('755', permission)
+
+    def _make_artifacts_csar(self, artifacts):
+        dir_location = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, dir_location)
+        zip_file_path = os.path.join(dir_location, 'artifacts.zip')
+        with zipfile.ZipFile(zip_file_path, 'w') as zip:
+            for path, content in artifacts.items():
+                zip.writestr(path, content)
+        zfile = zipfile.ZipFile(zip_file_path)
+        self.addCleanup(zfile.close)
+        return mock.Mock(path=zip_file_path, zfile=zfile)
+
+    def _manifest(self, artifacts):
+        return b'\n\n'.join(
+            b'Source: %s\nAlgorithm: SHA-256\nHash: %s' % (
+                path.encode(), hash_code.encode())
+            for path, hash_code in artifacts)
+
+    def test_convert_artifacts_streaming(self):
+        # larger than HASH_CHUNK_SIZE
+        large = os.urandom(csar_utils.HASH_CHUNK_SIZE * 2 + 1)
+        small = b'#!/bin/bash\necho hello\n'
+        csar = self._make_artifacts_csar({'Scripts/large.bin': large,
+                                          'Scripts/small.sh': small})
+        manifest = self._manifest([
+            ('Scripts/large.bin', hashlib.sha256(large).hexdigest()),
+            ('Scripts/small.sh', hashlib.sha256(small).hexdigest())])
+
+        with mock.patch.object(zipfile.ZipFile, 'read') as mock_read:
+            vnf_artifacts = csar_utils._convert_artifacts([], manifest, csar)
+
+        # artifacts are not read into memory at once.
+        mock_read.assert_not_called()
+        self.assertEqual(['Scripts/large.bin', 'Scripts/small.sh'],
+                         [a['Source'] for a in vnf_artifacts])
+
+    def test_convert_artifacts_invalid_hash_order(self):
+        csar = self._make_artifacts_csar({'Scripts/a.sh': b'a',
+                                          'Scripts/b.sh': b'b',
+                                          'Scripts/c.sh': b'c'})
+        manifest = self._manifest([
+            ('Scripts/a.sh', hashlib.sha256(b'a').hexdigest()),
+            ('Scripts/b.sh', 'invalid-b'),
+            ('Scripts/c.sh', 'invalid-c')])
+
+        exc = self.assertRaises(exceptions.InvalidCSAR,
+                                csar_utils._convert_artifacts, [],
+                                manifest, csar)
+
+        # the error of the first invalid artifact is raised.
+        self.assertIn('"Scripts/b.sh"', str(exc))
+        self.assertIn('invalid-b', str(exc))
+
+    def test_convert_artifacts_invalid_source(self):
+        csar = self._make_artifacts_csar({'Scripts/a.sh': b'a'})
+        manifest = self._manifest([('Scripts/not_exist.sh', 'hash')])
+
+        exc = self.assertRaises(exceptions.InvalidCSAR,
+                                csar_utils._convert_artifacts, [],
+                                manifest, csar)
+
+        self.assertIn('Scripts/not_exist.sh', str(exc))
@@ -0,0 +1,53 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from unittest import mock
+
+from tacker.common import stats
+from tacker.tests import base
+
+
+class TestStats(base.BaseTestCase):
+
+    def setUp(self):
+        super(TestStats, self).setUp()
+        patcher = mock.patch.dict(stats._sources, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_get_all(self):
+        stats.register('source-b', lambda: {'hits': 1})
+        stats.register('source-a', lambda: {'misses': 2})
+
+        def _error():
+            raise Exception('error')
+        stats.register('source-c', _error)
+
+        result = stats.get_all()
+        self.assertEqual(['source-a', 'source-b'], list(result))
+        self.assertEqual({'hits': 1}, result['source-b'])
+        self.assertEqual({'misses': 2}, result['source-a'])
+
+    @mock.patch.object(stats, 'LOG')
+    def test_report(self, mock_log):
+        stats.register('source-a', lambda: {'hits': 1})
+        # source not in use yet.
+        stats.register('source-b', lambda: None)
+
+        stats.report()
+
+        mock_log.info.assert_called_once_with(
+            "Statistics of %(name)s: %(stats)s",
+            {'name': 'source-a', 'stats': {'hits': 1}})
@@ -12,6 +12,7 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+from oslo_serialization import jsonutils
 import testtools
 
 from tacker.common import utils
@@ -184,3 +185,53 @@ class TestJsonMergePatch(testtools.TestCase):
         }
         actual_dict = utils.json_merge_patch(target, patch)
         self.assertEqual(expected_dict, actual_dict)
+
+
+class TestJsonListChunks(testtools.TestCase):
+    def test_json_list_chunks(self):
+        items = [{"id": str(i), "value": "x" * i} for i in range(10)]
+
+        chunks = list(utils.json_list_chunks(iter(items), chunk_size=20))
+
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(jsonutils.dump_as_bytes(items), b''.join(chunks))
+
+    def test_json_list_chunks_empty(self):
+        self.assertEqual([b'[]'], list(utils.json_list_chunks(iter([]))))
+
+    def test_json_list_chunks_lazy(self):
+        consumed = []
+
+        def _items():
+            for i in range(3):
+                consumed.append(i)
+                yield i
+
+        chunks = utils.json_list_chunks(_items(), chunk_size=1)
+        self.assertEqual(b'[0', next(chunks))
+        self.assertEqual([0], consumed)
+        self.assertEqual(b'[0, 1, 2]', b'[0' + b''.join(chunks))
+
+
+class TestPrefetchFirst(testtools.TestCase):
+    def test_prefetch_first(self):
+        consumed = []
+
+        def _items():
+            for i in range(3):
+                consumed.append(i)
+                yield i
+
+        items = utils.prefetch_first(_items())
+        self.assertEqual([0], consumed)
+        self.assertEqual([0, 1, 2], list(items))
+
+    def test_prefetch_first_empty(self):
+        self.assertEqual([], list(utils.prefetch_first(iter([]))))
+
+    def test_prefetch_first_error(self):
+        def _items():
+            raise ValueError('error')
+            yield
+
+        self.assertRaises(ValueError, utils.prefetch_first, _items())
@@ -41,6 +41,7 @@ from tacker.common import driver_manager
 from tacker.common import exceptions
 from tacker.common.rpc import BackingOffClient
 from tacker.conductor import conductor_server
+from tacker.conductor import notification_delivery
 import tacker.conf
 from tacker import context
 from tacker import context as t_context
@@ -49,6 +50,7 @@ from tacker.glance_store import store as glance_store
 from tacker import objects
 from tacker.objects import fields
 from tacker.plugins.common import constants
+from tacker.sol_refactored.infra_drivers.openstack import userdata_pool
 from tacker.tests import constants as test_constants
 from tacker.tests.unit import base as unit_base
 from tacker.tests.unit.conductor import fakes
@@ -3251,6 +3253,7 @@ class TestConductor(SqlTestCase, unit_base.FixturedTestCase):
         self.assertEqual(result, 0)
         mock_subscriptions_get.assert_called()
 
+        self.assertTrue(notification_delivery.ENGINE.join(timeout=10))
         history = self.requests_mock.request_history
         req_count = nfvo_client._count_mock_history(
             history, "https://localhost")
@@ -3282,6 +3285,7 @@ class TestConductor(SqlTestCase, unit_base.FixturedTestCase):
         self.assertEqual(result, 0)
         mock_subscriptions_get.assert_called()
 
+        self.assertTrue(notification_delivery.ENGINE.join(timeout=10))
         history = self.requests_mock.request_history
         req_count = nfvo_client._count_mock_history(
             history, "https://localhost")
@@ -3316,6 +3320,7 @@ class TestConductor(SqlTestCase, unit_base.FixturedTestCase):
         self.assertEqual(result, 0)
         mock_subscriptions_get.assert_called()
 
+        self.assertTrue(notification_delivery.ENGINE.join(timeout=10))
         history = self.requests_mock.request_history
         req_count = nfvo_client._count_mock_history(
             history, "https://localhost")
@@ -3367,6 +3372,7 @@ class TestConductor(SqlTestCase, unit_base.FixturedTestCase):
         self.assertEqual(result, 0)
         mock_subscriptions_get.assert_called()
 
+        self.assertTrue(notification_delivery.ENGINE.join(timeout=10))
         history = self.requests_mock.request_history
         req_count = nfvo_client._count_mock_history(
             history, "https://localhost", 'https://oauth2')
@@ -3399,6 +3405,7 @@ class TestConductor(SqlTestCase, unit_base.FixturedTestCase):
         self.assertEqual(result, 0)
         mock_subscriptions_get.assert_called()
 
+        self.assertTrue(notification_delivery.ENGINE.join(timeout=10))
         history = self.requests_mock.request_history
         req_count = nfvo_client._count_mock_history(
             history, "https://localhost")
@@ -3427,6 +3434,7 @@ class TestConductor(SqlTestCase, unit_base.FixturedTestCase):
         self.assertEqual(result, 0)
         mock_subscriptions_get.assert_called()
 
+        self.assertTrue(notification_delivery.ENGINE.join(timeout=10))
         history = self.requests_mock.request_history
         req_count = nfvo_client._count_mock_history(
             history, "https://localhost")
@@ -3474,6 +3482,11 @@ class TestConductor(SqlTestCase, unit_base.FixturedTestCase):
 
         # return value when timeout for POST method is 0
         self.assertEqual(result, 0)
+        self.assertTrue(notification_delivery.ENGINE.join(timeout=10))
+        history = self.requests_mock.request_history
+        req_count = nfvo_client._count_mock_history(
+            history, "https://localhost")
+        self.assertEqual(3, req_count)
 
     def test_get_notification(self):
         cfg.CONF.set_override('test_callback_uri', True,
@@ -4280,3 +4293,39 @@ class TestConductor(SqlTestCase, unit_base.FixturedTestCase):
     def test_sync_db(self):
         self.conductor._sync_db()
         self.vnflcm_driver.sync_db.assert_called_once()
+
+    @mock.patch.object(coordination.COORDINATOR, 'stop')
+    @mock.patch.object(coordination.COORDINATOR, 'start')
+    @mock.patch.object(conductor_server.loopingcall,
+                       'FixedIntervalLoopingCall')
+    def test_start_stop_stats_reporter(self, mock_loop, mock_coord_start,
+                                       mock_coord_stop):
+        cfg.CONF.set_override('stats_report_interval', 60)
+        self.addCleanup(cfg.CONF.clear_override, 'stats_report_interval')
+
+        self.conductor.start()
+        mock_loop.return_value.start.assert_called_once_with(
+            interval=60, initial_delay=60)
+
+        self.conductor.stop()
+        mock_loop.return_value.stop.assert_called_once()
+
+    @mock.patch.object(coordination.COORDINATOR, 'stop')
+    @mock.patch.object(coordination.COORDINATOR, 'start')
+    @mock.patch.object(conductor_server.loopingcall,
+                       'FixedIntervalLoopingCall')
+    def test_start_stop_stats_reporter_disabled(
+            self, mock_loop, mock_coord_start, mock_coord_stop):
+        cfg.CONF.set_override('stats_report_interval', 0)
+        self.addCleanup(cfg.CONF.clear_override, 'stats_report_interval')
+
+        self.conductor.start()
+        self.conductor.stop()
+        self.assertNotIn(mock.call(conductor_server.stats.report),
+                         mock_loop.call_args_list)
+
+    @mock.patch.object(coordination.COORDINATOR, 'stop')
+    @mock.patch.object(userdata_pool.POOL, 'stop')
+    def test_stop_userdata_pool(self, mock_pool_stop, mock_coord_stop):
+        self.conductor.stop()
+        mock_pool_stop.assert_called_once()
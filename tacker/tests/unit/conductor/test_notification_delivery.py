@@ -0,0 +1,182 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import threading
+from unittest import mock
+
+import requests
+
+from tacker import auth
+from tacker.common import stats
+from tacker.conductor import notification_delivery
+from tacker.tests.unit import base
+
+
+class TestNotificationDeliveryEngine(base.TestCase):
+
+    def setUp(self):
+        super(TestNotificationDeliveryEngine, self).setUp()
+        self.config_fixture.config(group='vnf_lcm', retry_wait=0,
+                                   retry_num=3)
+        self.engine = notification_delivery.NotificationDeliveryEngine()
+        self.posted = []
+        self.responses = {}
+        self.client = mock.Mock()
+        self.client.post.side_effect = self._post
+        mock.patch.object(auth.auth_manager, 'get_auth_client',
+                          return_value=self.client).start()
+        self.addCleanup(mock.patch.stopall)
+
+    def _post(self, url, data=None, **kwargs):
+        self.posted.append((url, data))
+        response = self.responses.get(url, 204)
+        if callable(response):
+            return response()
+        if isinstance(response, Exception):
+            raise response
+        return mock.Mock(status_code=response)
+
+    def test_submit(self):
+        prepare = mock.Mock()
+        self.engine.submit('sub-1', 'http://cb1', 'notif-1', 'body-1',
+                           prepare=prepare)
+        self.engine.submit('sub-1', 'http://cb1', 'notif-2', 'body-2',
+                           prepare=prepare)
+
+        self.assertTrue(self.engine.join(timeout=10))
+        # in order of submission.
+        self.assertEqual([('http://cb1', 'body-1'), ('http://cb1', 'body-2')],
+                         self.posted)
+        self.assertEqual(2, prepare.call_count)
+        stats = self.engine.get_stats()['sub-1']
+        self.assertEqual(2, stats['delivered'])
+        self.assertEqual(0, stats['queued'])
+        self.assertFalse(stats['circuit_open'])
+        self.assertGreaterEqual(stats['latency_max'], stats['latency_avg'])
+
+    def test_submit_retry(self):
+        self.responses['http://cb1'] = 500
+
+        self.engine.submit('sub-1', 'http://cb1', 'notif-1', 'body-1')
+
+        self.assertTrue(self.engine.join(timeout=10))
+        self.assertEqual(3, len(self.posted))
+        self.assertEqual(1, self.engine.get_stats()['sub-1']['failed'])
+
+    def test_submit_error_not_retried(self):
+        self.responses['http://cb1'] = requests.ConnectionError()
+
+        self.engine.submit('sub-1', 'http://cb1', 'notif-1', 'body-1')
+
+        self.assertTrue(self.engine.join(timeout=10))
+        self.assertEqual(1, len(self.posted))
+        self.assertEqual(1, self.engine.get_stats()['sub-1']['failed'])
+
+    def test_slow_subscriber_not_blocking(self):
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        def _slow():
+            release.wait(10)
+            return mock.Mock(status_code=204)
+        self.responses['http://slow'] = _slow
+
+        self.engine.submit('sub-slow', 'http://slow', 'notif-1', 'body')
+        self.engine.submit('sub-1', 'http://cb1', 'notif-1', 'body')
+
+        # sub-1 is delivered while sub-slow is still being sent.
+        self.assertFalse(self.engine.join(timeout=1))
+        self.assertEqual(1, self.engine.get_stats()['sub-1']['delivered'])
+        self.assertEqual(1, self.engine.get_stats()['sub-slow']['queued'])
+        release.set()
+        self.assertTrue(self.engine.join(timeout=10))
+
+    def test_retry_not_blocking(self):
+        self.config_fixture.config(group='vnf_lcm', retry_wait=60,
+                                   notification_workers=1)
+        self.responses['http://dead'] = 500
+
+        self.engine.submit('sub-dead', 'http://dead', 'notif-1', 'body')
+        self.engine.submit('sub-1', 'http://cb1', 'notif-1', 'body')
+
+        # the only worker is not occupied by the retry wait of sub-dead.
+        self.assertFalse(self.engine.join(timeout=1))
+        self.assertEqual(1, self.engine.get_stats()['sub-1']['delivered'])
+        self.assertEqual(1, self.posted.count(('http://dead', 'body')))
+
+    def test_circuit_breaker(self):
+        self.config_fixture.config(group='vnf_lcm', retry_num=1,
+                                   notification_circuit_failures=2)
+        self.responses['http://dead'] = 500
+
+        for i in range(4):
+            self.engine.submit('sub-dead', 'http://dead', f'notif-{i}',
+                               'body')
+        self.assertTrue(self.engine.join(timeout=10))
+
+        # the 3rd and 4th are dropped without being sent.
+        self.assertEqual(2, len(self.posted))
+        stats = self.engine.get_stats()['sub-dead']
+        self.assertEqual(2, stats['failed'])
+        self.assertEqual(2, stats['dropped'])
+        self.assertTrue(stats['circuit_open'])
+
+        # half-open after notification_circuit_open_time.
+        self.engine.subscribers['sub-dead'].open_until = 0
+        self.responses['http://dead'] = 204
+        self.engine.submit('sub-dead', 'http://dead', 'notif-5', 'body')
+        self.assertTrue(self.engine.join(timeout=10))
+        stats = self.engine.get_stats()['sub-dead']
+        self.assertEqual(1, stats['delivered'])
+        self.assertFalse(stats['circuit_open'])
+
+    def test_circuit_breaker_disabled(self):
+        self.config_fixture.config(group='vnf_lcm', retry_num=1)
+        self.responses['http://dead'] = 500
+
+        for i in range(10):
+            self.engine.submit('sub-dead', 'http://dead', f'notif-{i}',
+                               'body')
+        self.assertTrue(self.engine.join(timeout=10))
+
+        # nothing is dropped by default.
+        self.assertEqual(10, len(self.posted))
+        stats = self.engine.get_stats()['sub-dead']
+        self.assertEqual(10, stats['failed'])
+        self.assertEqual(0, stats['dropped'])
+        self.assertFalse(stats['circuit_open'])
+
+    def test_get_stats_reported(self):
+        self.assertIsNone(self.engine.get_stats())
+        self.assertIn('v1_notification_delivery', stats.get_all())
+
+    def test_queue_full(self):
+        self.config_fixture.config(group='vnf_lcm',
+                                   notification_queue_size=1)
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        def _slow():
+            release.wait(10)
+            return mock.Mock(status_code=204)
+        self.responses['http://slow'] = _slow
+
+        self.engine.submit('sub-slow', 'http://slow', 'notif-1', 'body')
+        self.engine.submit('sub-slow', 'http://slow', 'notif-2', 'body')
+
+        self.assertEqual(1, self.engine.get_stats()['sub-slow']['dropped'])
+        release.set()
+        self.assertTrue(self.engine.join(timeout=10))
+        self.assertEqual(1, self.engine.get_stats()['sub-slow']['delivered'])
@@ -26,6 +26,7 @@ from tacker.keymgr import API as KEYMGR_API
 from tacker.nfvo import nfvo_plugin
 from tacker.tests.unit.db import base as db_base
 from tacker.tests.unit.db import utils
+from tacker.vnfm import vim_client
 
 SECRET_PASSWORD = '***'
 
@@ -345,10 +346,13 @@ class TestNfvoPlugin(db_base.SqlTestCase):
         vim_obj = self.nfvo_plugin._get_vim(self.context, vim_id)
         self._mock_driver_manager()
         self.nfvo_plugin = nfvo_plugin.NfvoPlugin()
-        self.nfvo_plugin.delete_vim(self.context, vim_id)
+        with mock.patch.object(vim_client,
+                               'clear_vim_auth_cache') as mock_clear:
+            self.nfvo_plugin.delete_vim(self.context, vim_id)
         self._driver_manager.invoke.assert_called_once_with(
             vim_type, 'deregister_vim',
             vim_obj=vim_obj)
+        mock_clear.assert_called_once_with(vim_id)
 
     def test_update_vim(self):
         vim_dict = {'vim': {'id': '6261579e-d6f3-49ad-8bc3-a9cb974778ff',
@@ -362,14 +366,17 @@ class TestNfvoPlugin(db_base.SqlTestCase):
         self.context.tenant_id = 'ad7ebc56538745a08ef7c5e97f8bd437'
         self._mock_driver_manager()
         self.nfvo_plugin = nfvo_plugin.NfvoPlugin()
-        res = self.nfvo_plugin.update_vim(self.context, vim_dict['vim']['id'],
-                                          vim_dict)
+        with mock.patch.object(vim_client,
+                               'clear_vim_auth_cache') as mock_clear:
+            res = self.nfvo_plugin.update_vim(
+                self.context, vim_dict['vim']['id'], vim_dict)
         vim_obj = self.nfvo_plugin._get_vim(
             self.context, vim_dict['vim']['id'])
         vim_obj['updated_at'] = None
         self._driver_manager.invoke.assert_called_with(
             vim_type, 'register_vim',
             vim_obj=vim_obj)
+        mock_clear.assert_called_once_with(vim_dict['vim']['id'])
         self.assertIsNotNone(res)
         self.assertIn('id', res)
         self.assertIn('placement_attr', res)
@@ -13,7 +13,9 @@
 from unittest import mock
 
 import ddt
+from oslo_serialization import jsonutils
 
+from tacker.common import exceptions
 from tacker import context
 from tacker import objects
 from tacker.tests.unit.db.base import SqlTestCase
@@ -365,3 +367,107 @@ class TestVnfLcmSubScriptions(SqlTestCase):
         result = subscription_obj.vnf_lcm_subscriptions_get(self.context,
                 None)
         self.assertIn("tenant_id", result)
+
+
+class TestVnfLcmSubscriptionFilterValues(SqlTestCase):
+
+    def setUp(self):
+        super(TestVnfLcmSubscriptionFilterValues, self).setUp()
+        self.context = context.get_admin_context()
+
+    def _create_subscription(self, subscription_id, filter,
+                             callback_uri='http://localhost/callback'):
+        subscription_obj = (
+            objects.vnf_lcm_subscriptions.LccnSubscriptionRequest(
+                context=self.context, id=subscription_id,
+                callback_uri=callback_uri,
+                tenant_id=uuidsentinel.tenant_id))
+        subscription_obj.create(filter)
+        return subscription_obj
+
+    def _get_ids(self, notification_type, operation_type=None):
+        result = objects.vnf_lcm_subscriptions._vnf_lcm_subscriptions_get(
+            self.context, notification_type, operation_type)
+        return sorted(line.id for line in result)
+
+    def test_vnf_lcm_subscriptions_get(self):
+        self._create_subscription(uuidsentinel.subsc_all, {})
+        self._create_subscription(
+            uuidsentinel.subsc_lcm,
+            {"notificationTypes": ["VnfLcmOperationOccurrenceNotification"],
+             "operationTypes": ["INSTANTIATE", "TERMINATE"]})
+        self._create_subscription(
+            uuidsentinel.subsc_creation,
+            {"notificationTypes": ["VnfIdentifierCreationNotification"]})
+        self._create_subscription(
+            uuidsentinel.subsc_deleted,
+            {"notificationTypes": ["VnfIdentifierCreationNotification"]},
+            callback_uri='http://localhost/deleted')
+        objects.vnf_lcm_subscriptions._destroy_vnf_lcm_subscription(
+            self.context, uuidsentinel.subsc_deleted)
+
+        self.assertEqual(
+            sorted([uuidsentinel.subsc_all, uuidsentinel.subsc_lcm]),
+            self._get_ids('VnfLcmOperationOccurrenceNotification',
+                          'INSTANTIATE'))
+        self.assertEqual(
+            [uuidsentinel.subsc_all],
+            self._get_ids('VnfLcmOperationOccurrenceNotification', 'HEAL'))
+        self.assertEqual(
+            [uuidsentinel.subsc_all],
+            self._get_ids('VnfLcmOperationOccurrenceNotification'))
+        self.assertEqual(
+            sorted([uuidsentinel.subsc_all, uuidsentinel.subsc_creation]),
+            self._get_ids('VnfIdentifierCreationNotification'))
+
+        result = objects.vnf_lcm_subscriptions._vnf_lcm_subscriptions_get(
+            self.context, 'VnfIdentifierCreationNotification')
+        line = [line for line in result
+                if line.id == uuidsentinel.subsc_creation][0]
+        self.assertEqual('http://localhost/callback', line.callback_uri)
+        self.assertEqual(uuidsentinel.tenant_id, line.tenant_id)
+        self.assertEqual(
+            {"notificationTypes": ["VnfIdentifierCreationNotification"]},
+            jsonutils.loads(line.filter))
+
+    def test_create_duplicated(self):
+        filter = {
+            "notificationTypes": ["VnfLcmOperationOccurrenceNotification"],
+            "operationTypes": ["INSTANTIATE", "TERMINATE"],
+            "operationStates": ["COMPLETED"],
+            "vnfInstanceSubscriptionFilter": {
+                "vnfdIds": [uuidsentinel.vnfd_id1, uuidsentinel.vnfd_id2],
+                "vnfInstanceNames": ["vnf1"]}}
+        self._create_subscription(uuidsentinel.subsc1, filter)
+
+        # the same filter
+        self.assertRaises(exceptions.SeeOther, self._create_subscription,
+                          uuidsentinel.subsc2, filter)
+        # a part of the existing filter
+        self.assertRaises(
+            exceptions.SeeOther, self._create_subscription,
+            uuidsentinel.subsc3,
+            dict(filter, operationTypes=["TERMINATE"],
+                 vnfInstanceSubscriptionFilter={
+                     "vnfdIds": [uuidsentinel.vnfd_id2],
+                     "vnfInstanceNames": ["vnf1"]}))
+
+        # not duplicated
+        for i, new_filter in enumerate([
+                dict(filter, operationTypes=["HEAL"]),
+                dict(filter, operationStates=[]),
+                dict(filter, vnfInstanceSubscriptionFilter={
+                    "vnfdIds": [uuidsentinel.vnfd_id3],
+                    "vnfInstanceNames": ["vnf1"]}),
+                dict(filter, vnfInstanceSubscriptionFilter={
+                    "vnfdIds": [uuidsentinel.vnfd_id1],
+                    "vnfInstanceNames": ["vnf2"]})]):
+            self._create_subscription(f'{uuidsentinel.subsc4[:-1]}{i}',
+                                      new_filter)
+        self._create_subscription(uuidsentinel.subsc5, filter,
+                                  callback_uri='http://localhost/other')
+
+        # no filter
+        self._create_subscription(uuidsentinel.subsc6, {})
+        self.assertRaises(exceptions.SeeOther, self._create_subscription,
+                          uuidsentinel.subsc7, {})
@@ -187,6 +187,46 @@ class TestVnfPackage(SqlTestCase):
             self.context, filters=filters)
         self.assertEqual(1, len(vnfpkgm_list))
 
+    def _create_onboarded_vnf_package(self, vnf_provider):
+        vnfpkgm = self._create_vnf_package()
+        vnfd_data = fakes.get_vnf_package_vnfd_data(
+            vnfpkgm.id, uuidutils.generate_uuid())
+        vnfd_data['vnf_provider'] = vnf_provider
+        objects.VnfPackageVnfd(context=self.context, **vnfd_data).create()
+        vnfpkgm.onboarding_state = 'ONBOARDED'
+        vnfpkgm.save()
+        return vnfpkgm
+
+    def test_get_by_marker_filter_vendors(self):
+        vnfpkgm_a = self._create_onboarded_vnf_package('provider_A')
+        vnfpkgm_b = self._create_onboarded_vnf_package('provider_B')
+        vnfpkgm_empty = self._create_onboarded_vnf_package('')
+
+        self.assertEqual(
+            {'provider_A', 'provider_B', ''},
+            set(objects.VnfPackagesList.get_vnf_providers(self.context)))
+
+        def _get_ids(vendors, limit=None, marker_obj=None):
+            result = objects.VnfPackagesList.get_by_marker_filter(
+                self.context, limit, marker_obj, vendors=vendors)
+            return [vnfpkgm.id for vnfpkgm in result]
+
+        self.assertEqual([self.vnf_package.id], _get_ids(['*']))
+        self.assertEqual([vnfpkgm_a.id], _get_ids(['provider_A']))
+        self.assertEqual([vnfpkgm_empty.id], _get_ids([None]))
+        self.assertEqual([], _get_ids([]))
+        expected = sorted([self.vnf_package.id, vnfpkgm_a.id,
+                           vnfpkgm_b.id])
+        self.assertEqual(expected,
+                         _get_ids(['*', 'provider_A', 'provider_B']))
+        # paging is applied to the packages of the vendors.
+        self.assertEqual(expected[:2],
+                         _get_ids(['*', 'provider_A', 'provider_B'], 2))
+        marker_obj = objects.VnfPackage.get_by_id(self.context, expected[1])
+        self.assertEqual(expected[2:],
+                         _get_ids(['*', 'provider_A', 'provider_B'], 2,
+                                  marker_obj))
+
     def test_obj_make_compatible(self):
         data = {'id': self.vnf_package.id}
         vnf_package_obj = objects.VnfPackage(context=self.context, **data)
@@ -15,6 +15,7 @@
 
 from unittest import mock
 
+from tacker.api.validation import validators
 from tacker import context
 from tacker.sol_refactored.api import api_version
 from tacker.sol_refactored.api import validator
@@ -81,3 +82,32 @@ class TestValidator(base.BaseTestCase):
                 ng_ver, supported_versions)
             self.assertRaises(sol_ex.SolValidationError,
                 self._test_method, request=self.request, body=body)
+
+    def test_get_validator_shared(self):
+        schema_validator = validator.get_validator(test_schema_v200)
+
+        self.assertIsInstance(schema_validator, validator.SolSchemaValidator)
+        self.assertIs(schema_validator,
+                      validator.get_validator(test_schema_v200))
+        self.assertIsNot(schema_validator,
+                         validator.get_validator(test_schema_v210))
+        # a schema with the same contents is another schema.
+        self.assertIsNot(schema_validator,
+                         validator.get_validator(dict(test_schema_v200)))
+        # v1 validator of the same schema is not the v2 one.
+        self.assertNotIsInstance(
+            validators.get_schema_validator(test_schema_v200),
+            validator.SolSchemaValidator)
+
+    @mock.patch.object(validator, 'SolSchemaValidator')
+    def test_validator_not_created_per_request(self, mock_validator):
+        @validator.schema_nover(test_schema_v200)
+        def _test_method(request, body):
+            return True
+
+        self.assertEqual(1, mock_validator.call_count)
+        for _ in range(3):
+            _test_method(request=self.request, body={})
+
+        self.assertEqual(1, mock_validator.call_count)
+        self.assertEqual(3, mock_validator.return_value.validate.call_count)
@@ -15,6 +15,7 @@
 
 import ddt
 from oslo_config import cfg
+from oslo_serialization import jsonutils
 from unittest import mock
 
 from tacker import context
@@ -34,6 +35,49 @@ class TestWsgi(base.TestCase):
         self.assertRaises(sol_ex.ResponseTooBig,
             response.serialize, 'application/json')
 
+    def test_response_no_limit(self):
+        self.config_fixture.config(group='v2_vnfm', max_content_length=0)
+        body = {"key": "value0123456789"}
+        response = sol_wsgi.SolResponse(200, body).serialize(
+            'application/json')
+        self.assertEqual(body, response.json)
+
+    def test_response_iterator(self):
+        self.config_fixture.config(group='v2_vnfm', response_chunk_size=10)
+        body = [{"id": f"id-{i}"} for i in range(5)]
+        response = sol_wsgi.SolResponse(200, iter(body)).serialize(
+            'application/json')
+        self.assertEqual(200, response.status_int)
+        self.assertEqual(body, response.json)
+
+        # too big
+        self.config_fixture.config(group='v2_vnfm', max_content_length=20)
+        response = sol_wsgi.SolResponse(200, iter(body))
+        self.assertRaises(sol_ex.ResponseTooBig,
+            response.serialize, 'application/json')
+
+    def test_response_iterator_no_limit(self):
+        self.config_fixture.config(group='v2_vnfm', max_content_length=0,
+                                   response_chunk_size=10)
+        body = [{"id": f"id-{i}"} for i in range(5)]
+        response = sol_wsgi.SolResponse(200, iter(body)).serialize(
+            'application/json')
+        chunks = list(response.app_iter)
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(body, jsonutils.loads(b''.join(chunks)))
+
+    def test_response_iterator_error(self):
+        self.config_fixture.config(group='v2_vnfm', max_content_length=0)
+
+        def _body():
+            raise ValueError('error')
+            yield
+
+        # raised before the response is started.
+        response = sol_wsgi.SolResponse(200, _body())
+        self.assertRaises(ValueError,
+            response.serialize, 'application/json')
+
     def test_unknown_error_response(self):
         err_msg = "Test error"
         status = 500
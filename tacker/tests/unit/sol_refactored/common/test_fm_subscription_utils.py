@@ -35,6 +35,7 @@ class TestFmSubscriptionUtils(base.BaseTestCase):
         super(TestFmSubscriptionUtils, self).setUp()
         objects.register_all()
         self.context = context.get_admin_context()
+        subsc_utils._subsc_index.clear()
 
     @mock.patch.object(objects.base.TackerPersistentObject, 'get_by_id')
     def test_get_subsc(self, mock_subsc):
@@ -139,8 +140,9 @@ class TestFmSubscriptionUtils(base.BaseTestCase):
         result_ids = [sub.id for sub in result]
         self.assertEqual(expected_ids, result_ids)
 
+    @mock.patch.object(objects.base.TackerPersistentObject, 'get_dict_all')
     @mock.patch.object(objects.base.TackerPersistentObject, 'get_all')
-    def test_get_alarm_subscs(self, mock_subscs):
+    def test_get_alarm_subscs(self, mock_subscs, mock_subsc_ids):
         inst = objects.VnfInstanceV2(
             id='dummy-vnfInstanceId-1', vnfdId='dummy-vnfdId-1',
             vnfProvider='dummy-vnfProvider-1',
@@ -150,12 +152,57 @@ class TestFmSubscriptionUtils(base.BaseTestCase):
         alarm = objects.AlarmV1.from_dict(fakes_for_fm.alarm_example)
         mock_subscs.return_value = [objects.FmSubscriptionV1.from_dict(
             fakes_for_fm.fm_subsc_example)]
-        result = subsc_utils.get_alarm_subscs(context, alarm, inst)
+        mock_subsc_ids.return_value = [
+            {'id': fakes_for_fm.fm_subsc_example['id']}]
+        result = subsc_utils.get_alarm_subscs(self.context, alarm, inst)
         self.assertEqual(fakes_for_fm.fm_subsc_example['id'], result[0].id)
 
         alarm_clear = copy.deepcopy(fakes_for_fm.alarm_example)
         del alarm_clear['alarmClearedTime']
         alarm = objects.AlarmV1.from_dict(alarm_clear)
-        result = subsc_utils.get_alarm_subscs(context, alarm, inst)
+        result = subsc_utils.get_alarm_subscs(self.context, alarm, inst)
 
         self.assertEqual(fakes_for_fm.fm_subsc_example['id'], result[0].id)
+
+    @mock.patch.object(objects.base.TackerPersistentObject, 'get_dict_all')
+    @mock.patch.object(objects.base.TackerPersistentObject, 'get_all')
+    def test_get_matched_subscs_indexed(self, mock_subscs, mock_subsc_ids):
+        inst = objects.VnfInstanceV2(id='test-instance', vnfProvider='company')
+        notif_type = 'AlarmNotification'
+        new_alarm_example = copy.deepcopy(fakes_for_fm.alarm_example)
+        new_alarm_example['perceivedSeverity'] = 'CRITICAL'
+        new_alarm_example['eventType'] = 'COMMUNICATIONS_ALARM'
+        alarm = objects.AlarmV1.from_dict(new_alarm_example)
+
+        subscs_no_filter = objects.FmSubscriptionV1(id='subsc-1')
+        subscs_all_match = objects.FmSubscriptionV1(
+            id='subsc-2', filter=objects.FmNotificationsFilterV1(
+                faultyResourceTypes=['COMPUTE'],
+                perceivedSeverities=['CRITICAL'],
+                eventTypes=['COMMUNICATIONS_ALARM'],
+                probableCauses=['The server cannot be connected.']))
+        subscs_per_sev_mismatch = objects.FmSubscriptionV1(
+            id='subsc-3', filter=objects.FmNotificationsFilterV1(
+                faultyResourceTypes=['COMPUTE'],
+                perceivedSeverities=['MAJOR'],
+                eventTypes=['COMMUNICATIONS_ALARM'],
+                probableCauses=['The server cannot be connected.']))
+        subscs_probable_cause_mismatch = objects.FmSubscriptionV1(
+            id='subsc-4', filter=objects.FmNotificationsFilterV1(
+                faultyResourceTypes=['COMPUTE'],
+                perceivedSeverities=['CRITICAL'],
+                eventTypes=['COMMUNICATIONS_ALARM'],
+                probableCauses=['The server is invalid.']))
+        mock_subscs.return_value = [
+            subscs_no_filter, subscs_all_match, subscs_per_sev_mismatch,
+            subscs_probable_cause_mismatch]
+        mock_subsc_ids.return_value = [
+            {'id': subsc.id} for subsc in mock_subscs.return_value]
+
+        # first call loads the index and second call uses loaded index.
+        for _ in range(2):
+            result = subsc_utils.get_matched_subscs(
+                self.context, inst, notif_type, alarm)
+            self.assertEqual(['subsc-1', 'subsc-2'],
+                             [sub.id for sub in result])
+        mock_subscs.assert_called_once()
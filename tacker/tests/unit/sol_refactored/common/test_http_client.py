@@ -0,0 +1,134 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import threading
+import time
+from unittest import mock
+
+from requests_mock.contrib import fixture as requests_mock_fixture
+
+from tacker.sol_refactored.common import http_client
+from tacker.tests import base
+
+
+TOKEN_ENDPOINT = 'http://127.0.0.1/token'
+ENDPOINT = 'http://127.0.0.1:9890'
+
+
+class TestOAuth2TokenCache(base.BaseTestCase):
+
+    def setUp(self):
+        super(TestOAuth2TokenCache, self).setUp()
+        self.requests_mock = self.useFixture(requests_mock_fixture.Fixture())
+        http_client.OAUTH2_TOKEN_CACHE.clear()
+        self.addCleanup(http_client.OAUTH2_TOKEN_CACHE.clear)
+
+    def _token_responses(self, expires_in=3600):
+        return [{'json': {'access_token': f'token-{i}',
+                          'token_type': 'Bearer',
+                          'expires_in': expires_in},
+                 'status_code': 200}
+                for i in range(10)]
+
+    def _client(self, client_id='client-1'):
+        auth_handle = http_client.OAuth2AuthHandle(
+            ENDPOINT, TOKEN_ENDPOINT, client_id, 'password')
+        return http_client.HttpClient(auth_handle)
+
+    def _auth_headers(self, path):
+        return [req.headers.get('Authorization')
+                for req in self.requests_mock.request_history
+                if req.path == path]
+
+    def test_token_cached(self):
+        token_mock = self.requests_mock.post(
+            TOKEN_ENDPOINT, self._token_responses())
+        self.requests_mock.get(f'{ENDPOINT}/test', status_code=200,
+                               json={})
+
+        for _ in range(3):
+            self._client().do_request(f'{ENDPOINT}/test', "GET")
+        # other client_id uses other token.
+        self._client('client-2').do_request(f'{ENDPOINT}/test', "GET")
+
+        self.assertEqual(2, token_mock.call_count)
+        self.assertEqual(['Bearer token-0'] * 3 + ['Bearer token-1'],
+                         self._auth_headers('/test'))
+
+    def test_token_expired(self):
+        token_mock = self.requests_mock.post(
+            TOKEN_ENDPOINT,
+            self._token_responses(http_client.OAUTH2_TOKEN_REFRESH_MARGIN))
+        self.requests_mock.get(f'{ENDPOINT}/test', status_code=200,
+                               json={})
+
+        self._client().do_request(f'{ENDPOINT}/test', "GET")
+        self._client().do_request(f'{ENDPOINT}/test', "GET")
+
+        # expires_in is not longer than the margin. not used again.
+        self.assertEqual(2, token_mock.call_count)
+
+    def test_token_invalidated_by_401(self):
+        token_mock = self.requests_mock.post(
+            TOKEN_ENDPOINT, self._token_responses())
+        self.requests_mock.get(f'{ENDPOINT}/test', [
+            {'status_code': 200, 'json': {}},
+            {'status_code': 401, 'json': {}},
+            {'status_code': 200, 'json': {}}])
+
+        self._client().do_request(f'{ENDPOINT}/test', "GET")
+        resp, _ = self._client().do_request(f'{ENDPOINT}/test', "GET")
+
+        self.assertEqual(200, resp.status_code)
+        self.assertEqual(2, token_mock.call_count)
+        self.assertEqual(['Bearer token-0', 'Bearer token-0',
+                          'Bearer token-1'],
+                         self._auth_headers('/test'))
+
+    def test_get_single_flight(self):
+        cache = http_client.OAuth2TokenCache()
+        fetch = mock.Mock()
+
+        def _fetch():
+            time.sleep(0.2)
+            return {'access_token': 'token', 'expires_in': 3600}
+        fetch.side_effect = _fetch
+
+        results = []
+
+        def _get():
+            results.append(cache.get('key', fetch))
+
+        ths = [threading.Thread(target=_get) for _ in range(5)]
+        for th in ths:
+            th.start()
+        for th in ths:
+            th.join()
+
+        self.assertEqual(['token'] * 5, results)
+        fetch.assert_called_once()
+
+    def test_get_not_cached(self):
+        cache = http_client.OAuth2TokenCache()
+        fetch = mock.Mock(return_value={'access_token': 'token'})
+
+        # no expires_in
+        self.assertEqual('token', cache.get('key', fetch))
+        self.assertEqual('token', cache.get('key', fetch))
+        self.assertEqual(2, fetch.call_count)
+
+        # failed
+        fetch = mock.Mock(return_value=None)
+        self.assertIsNone(cache.get('key', fetch))
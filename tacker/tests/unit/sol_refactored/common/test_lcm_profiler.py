@@ -0,0 +1,201 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import datetime
+from unittest import mock
+
+from oslo_db import exception as db_exc
+from oslo_utils import uuidutils
+
+from tacker import context
+from tacker.sol_refactored.common import lcm_profiler
+from tacker.sol_refactored import objects
+from tacker.sol_refactored.objects.v2 import fields
+from tacker.tests.unit.db import base as db_base
+
+
+class _FakeConductor(object):
+
+    @lcm_profiler.profile_lcm_op('START')
+    def start(self, context, lcmocc, error=False):
+        with lcm_profiler.phase('grant'):
+            pass
+        self.process()
+        lcmocc.operationState = fields.LcmOperationStateType.COMPLETED
+        if error:
+            raise ValueError('error')
+
+    @lcm_profiler.measure('process')
+    def process(self):
+        with lcm_profiler.phase('heat_wait'):
+            pass
+
+
+class TestLcmProfiler(db_base.SqlTestCase):
+
+    def setUp(self):
+        # NOTE: register objects (i.e. load DB models) before DB tables
+        # are created in SqlTestCase.setUp.
+        objects.register_all()
+        super(TestLcmProfiler, self).setUp()
+        self.context = context.get_admin_context()
+        self.conductor = _FakeConductor()
+
+    def _lcmocc(self, operation=fields.LcmOperationType.SCALE):
+        return objects.VnfLcmOpOccV2(
+            id=uuidutils.generate_uuid(),
+            vnfInstanceId=uuidutils.generate_uuid(),
+            operation=operation,
+            operationState=fields.LcmOperationStateType.STARTING)
+
+    def test_phase_without_profile(self):
+        # nothing is recorded and no error.
+        with lcm_profiler.phase('grant'):
+            pass
+        self.conductor.process()
+        self.assertEqual([], objects.LcmOpProfileV2.get_all(self.context))
+
+    def test_profile_lcm_op(self):
+        lcmocc = self._lcmocc()
+        self.conductor.start(self.context, lcmocc)
+
+        profiles = lcm_profiler.get_profiles(self.context, lcmocc.id)
+        self.assertEqual(1, len(profiles))
+        profile = profiles[0]
+        self.assertEqual(lcmocc.vnfInstanceId, profile.vnfInstanceId)
+        self.assertEqual('SCALE', profile.operation)
+        self.assertEqual('START', profile.action)
+        self.assertEqual('COMPLETED', profile.operationState)
+        # ordered by start.
+        self.assertEqual(['grant', 'process', 'process.heat_wait'],
+                         [phase.name for phase in profile.phases])
+        for phase in profile.phases:
+            self.assertLessEqual(phase.start + phase.duration,
+                                 profile.duration)
+
+    def test_profile_lcm_op_error(self):
+        lcmocc = self._lcmocc()
+        self.assertRaises(ValueError, self.conductor.start,
+                          self.context, lcmocc, error=True)
+
+        # stored even if an error occurred.
+        profiles = lcm_profiler.get_profiles(self.context, lcmocc.id)
+        self.assertEqual(1, len(profiles))
+
+    def test_profile_lcm_op_disabled(self):
+        self.config_fixture.config(group='v2_vnfm', lcm_op_profile=False)
+        lcmocc = self._lcmocc()
+        self.conductor.start(self.context, lcmocc)
+
+        self.assertEqual([], lcm_profiler.get_profiles(self.context,
+                                                       lcmocc.id))
+
+    def test_profile_lcm_op_store_error(self):
+        lcmocc = self._lcmocc()
+
+        with mock.patch.object(objects.LcmOpProfileV2, 'create',
+                               side_effect=Exception('error')):
+            # the operation is not affected.
+            self.conductor.start(self.context, lcmocc)
+        self.assertEqual('COMPLETED', lcmocc.operationState)
+
+    def test_retention_period(self):
+        self.config_fixture.config(group='v2_vnfm',
+                                   lcm_op_profile_retention_period=3600)
+        old_lcmocc = self._lcmocc()
+        self.conductor.start(self.context, old_lcmocc)
+        old_profile = lcm_profiler.get_profiles(self.context,
+                                                old_lcmocc.id)[0]
+        old_profile.startTime -= datetime.timedelta(seconds=3601)
+        old_profile.update(self.context)
+
+        lcmocc = self._lcmocc()
+        self.conductor.start(self.context, lcmocc)
+
+        self.assertEqual([], lcm_profiler.get_profiles(self.context,
+                                                       old_lcmocc.id))
+        self.assertEqual(1, len(lcm_profiler.get_profiles(self.context,
+                                                          lcmocc.id)))
+        # the metrics are not decreased.
+        self.assertIn('tacker_lcm_op_duration_seconds_count'
+                      '{operation="SCALE"} 2',
+                      lcm_profiler.get_metrics(self.context).splitlines())
+
+    def test_get_metrics(self):
+        for duration in (0.05, 3, 100):
+            lcm_profiler._store_metrics(
+                self.context, 'SCALE', duration,
+                [objects.LcmOpProfileV2_Phases(
+                    name='process', start=0.0, duration=duration / 2)])
+
+        metrics = lcm_profiler.get_metrics(self.context).splitlines()
+
+        self.assertIn('# TYPE tacker_lcm_op_duration_seconds histogram',
+                      metrics)
+        self.assertIn('tacker_lcm_op_duration_seconds_bucket'
+                      '{operation="SCALE",le="0.1"} 1', metrics)
+        self.assertIn('tacker_lcm_op_duration_seconds_bucket'
+                      '{operation="SCALE",le="5"} 2', metrics)
+        self.assertIn('tacker_lcm_op_duration_seconds_bucket'
+                      '{operation="SCALE",le="+Inf"} 3', metrics)
+        self.assertIn('tacker_lcm_op_duration_seconds_sum'
+                      '{operation="SCALE"} 103.05', metrics)
+        self.assertIn('tacker_lcm_op_duration_seconds_count'
+                      '{operation="SCALE"} 3', metrics)
+        self.assertIn('tacker_lcm_op_phase_duration_seconds_bucket'
+                      '{operation="SCALE",phase="process",le="60"} 3',
+                      metrics)
+
+    def test_store_metrics(self):
+        lcm_profiler._store_metrics(
+            self.context, 'SCALE', 4,
+            [objects.LcmOpProfileV2_Phases(name='process.heat_wait',
+                                           start=0.0, duration=1),
+             objects.LcmOpProfileV2_Phases(name='process.heat_wait',
+                                           start=2.0, duration=1)])
+        lcm_profiler._store_metrics(self.context, 'SCALE', 4000, [])
+
+        metrics = objects.LcmOpMetricV2.get_dict_all(
+            self.context, ['operation', 'phase', 'le', 'count', 'sum'],
+            None, None)
+        self.assertEqual(
+            [{'operation': 'SCALE', 'phase': '', 'le': '+Inf',
+              'count': 1, 'sum': 4000.0},
+             {'operation': 'SCALE', 'phase': '', 'le': '5',
+              'count': 1, 'sum': 4.0},
+             {'operation': 'SCALE', 'phase': 'process.heat_wait',
+              'le': '1', 'count': 2, 'sum': 2.0}],
+            sorted(metrics, key=lambda m: (m['phase'], m['le'])))
+
+    def test_add_observations_retry(self):
+        observations = {('SCALE', '', '5'): (1, 3.0)}
+        orig = objects.LcmOpMetricV2._add_observations
+
+        def _add_observations(context, observations):
+            if mock_add.call_count == 1:
+                # the bucket inserted by another process.
+                orig(context, observations)
+                raise db_exc.DBDuplicateEntry()
+            orig(context, observations)
+
+        with mock.patch.object(objects.LcmOpMetricV2, '_add_observations',
+                               side_effect=_add_observations) as mock_add:
+            objects.LcmOpMetricV2.add_observations(self.context,
+                                                   observations)
+
+        self.assertEqual(2, mock_add.call_count)
+        metrics = objects.LcmOpMetricV2.get_dict_all(
+            self.context, ['count', 'sum'], None, None)
+        self.assertEqual([{'count': 2, 'sum': 6.0}], metrics)
@@ -0,0 +1,67 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import threading
+
+from tacker.sol_refactored.common import notification_dispatcher
+from tacker.tests import base
+
+
+class TestNotificationDispatcher(base.BaseTestCase):
+
+    def test_submit(self):
+        dispatcher = notification_dispatcher.NotificationDispatcher(3, 10)
+        results = []
+
+        def _func(value, fail=False):
+            if fail:
+                raise Exception('unit test')
+            results.append(value)
+
+        for i in range(20):
+            dispatcher.submit(_func, i)
+        dispatcher.submit(_func, 20, fail=True)
+        dispatcher.join()
+
+        self.assertEqual(list(range(20)), sorted(results))
+        self.assertEqual(3, len(dispatcher.workers))
+        stats = dispatcher.get_stats()
+        self.assertEqual(20, stats['delivered'])
+        self.assertEqual(1, stats['failed'])
+        self.assertEqual(0, stats['queue_depth'])
+
+    def test_submit_backpressure(self):
+        dispatcher = notification_dispatcher.NotificationDispatcher(1, 1)
+        event = threading.Event()
+
+        dispatcher.submit(event.wait)
+        # the worker is blocked by the first one and the second one
+        # fills the queue.
+        dispatcher.submit(lambda: None)
+
+        submitted = threading.Event()
+
+        def _submit():
+            dispatcher.submit(lambda: None)
+            submitted.set()
+
+        th = threading.Thread(target=_submit, daemon=True)
+        th.start()
+        self.assertFalse(submitted.wait(0.5))
+
+        event.set()
+        self.assertTrue(submitted.wait(5))
+        dispatcher.join()
+        self.assertEqual(3, dispatcher.get_stats()['delivered'])
@@ -13,7 +13,9 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-from oslo_utils import uuidutils
+import datetime
+from oslo_config import cfg
+from oslo_utils import timeutils
 from unittest import mock
 
 from tacker import context
@@ -21,6 +23,7 @@ from tacker.sol_refactored.api import api_version
 from tacker.sol_refactored.common import exceptions as sol_ex
 from tacker.sol_refactored.common import pm_job_utils
 from tacker.sol_refactored import objects
+from tacker.sol_refactored.objects.v2 import pm_report
 from tacker.tests import base
 
 
@@ -32,43 +35,85 @@ class TestPmJobUtils(base.BaseTestCase):
         self.context = context.get_admin_context()
         self.context.api_version = api_version.APIVersion('2.1.0')
 
-    @mock.patch.object(objects.base.TackerPersistentObject, 'get_by_id')
-    def test_update_report(self, mock_pm):
-        _PmJobCriteriaV2 = objects.VnfPmJobCriteriaV2(
-            performanceMetric=['VCpuUsageMeanVnf.VNF'],
-            performanceMetricGroup=['VirtualisedComputeResource'],
-            collectionPeriod=10,
-            reportingPeriod=11,
-            reportingBoundary='2000-05-23',
-        )
-        _SubscriptionAuthentication = objects.SubscriptionAuthentication(
-            authType=['BASIC'],
-            paramsBasic=objects.SubscriptionAuthentication_ParamsBasic(
-                username='test_name',
-                password='test_pwd'
-            )
-        )
-        mock_pm.return_value = objects.PmJobV2(
-            id='pm_job_1',
-            objectType='VNF',
-            objectInstanceIds=['id_1'],
-            subObjectInstanceIds=['sub_id_1', 'sub_id_2'],
-            criteria=_PmJobCriteriaV2,
-            callbackUri='callbackuri',
-            authentication=_SubscriptionAuthentication
-        )
-        report = objects.PerformanceReportV2(
-            id=uuidutils.generate_uuid(),
-            jobId='pm_job_1',
-        )
-
-        result = pm_job_utils.update_report(self.context, 'pm_job_1',
-                                            report, '2008-01-03 08:04:34',
-                                            'endpoint')
-        href = result.reports[0].href
-        self.assertEqual('pm_job_1', result.id)
+    def test_make_report_entries(self):
+        report = objects.PerformanceReportV2.from_dict({
+            'id': 'report_1',
+            'jobId': 'pm_job_1',
+            'entries': [{
+                'objectType': 'Vnf',
+                'objectInstanceId': 'id_1',
+                'performanceMetric': 'VCpuUsageMeanVnf.id_1',
+                'performanceValues': [{
+                    'timeStamp': '2022-06-22T10:22:45.678+09:00',
+                    'value': '12.3'
+                }, {
+                    'timeStamp': '2022-06-22T01:23:15.678Z',
+                    'value': '45.6'
+                }]
+            }, {
+                'objectType': 'Vnf',
+                'objectInstanceId': 'id_1',
+                'subObjectInstanceId': 'sub_id_1',
+                'performanceMetric': 'VCpuUsageMeanVnf.id_1',
+                'performanceValues': [{
+                    'timeStamp': '2022-06-22T01:23:15.678Z',
+                    'value': '45.6'
+                }]
+            }]
+        })
+        ready_time = report.entries[0].performanceValues[0].timeStamp
+
+        result = pm_job_utils.make_report_entries(report, ready_time)
+
+        self.assertEqual(3, len(result))
+        self.assertEqual(['report_1'] * 3,
+                         [entry.reportId for entry in result])
+        self.assertEqual([None, None, 'sub_id_1'],
+                         [entry.subObjectInstanceId for entry in result])
+        # timeStamp is normalized to UTC.
+        self.assertEqual('2022-06-22T01:22:45.678000+00:00',
+                         result[0].timeStamp.isoformat())
+        self.assertEqual(result[0].timeStamp, result[2].readyTime)
+
+    @mock.patch.object(pm_report.PerformanceReportEntryV2, 'get_reports')
+    def test_set_pm_job_reports(self, mock_get_reports):
+        ready_time = datetime.datetime(2022, 6, 22, 1, 23, 15,
+                                       tzinfo=datetime.timezone.utc)
+        mock_get_reports.return_value = {
+            'pm_job_1': [('report_1', ready_time)],
+            'pm_job_2': []
+        }
+        # reports saved in PmJobV2 by the former version
+        pm_job_1 = objects.PmJobV2(id='pm_job_1', reports=[
+            objects.VnfPmJobV2_Reports(href='old_href',
+                                       readyTime=ready_time)])
+        pm_job_2 = objects.PmJobV2(id='pm_job_2')
+
+        pm_job_utils.set_pm_job_reports(self.context, [pm_job_1, pm_job_2],
+                                        'endpoint')
+
+        mock_get_reports.assert_called_once_with(
+            self.context, ['pm_job_1', 'pm_job_2'])
         self.assertEqual(
-            f'endpoint/vnfpm/v2/pm_jobs/pm_job_1/reports/{report.id}', href)
+            ['old_href',
+             'endpoint/vnfpm/v2/pm_jobs/pm_job_1/reports/report_1'],
+            [report.href for report in pm_job_1.reports])
+        self.assertEqual([], pm_job_2.reports)
+
+    @mock.patch.object(pm_report.PerformanceReportEntryV2, 'delete_reports')
+    def test_delete_expired_reports(self, mock_delete):
+        # disabled by default
+        pm_job_utils.delete_expired_reports(self.context, 'pm_job_1')
+        mock_delete.assert_not_called()
+
+        cfg.CONF.set_override('vnfpm_report_retention_period', 3600,
+                              group='v2_vnfm')
+        now = datetime.datetime(2022, 6, 22, 1, 0, 0)
+        with mock.patch.object(timeutils, 'utcnow', return_value=now):
+            pm_job_utils.delete_expired_reports(self.context, 'pm_job_1')
+        mock_delete.assert_called_once_with(
+            self.context, 'pm_job_1',
+            ready_before=datetime.datetime(2022, 6, 22, 0, 0, 0))
 
     @mock.patch.object(objects.base.TackerPersistentObject, 'get_all')
     def test_get_pm_job_all(self, mock_pm):
@@ -18,6 +18,7 @@ import datetime
 import freezegun
 import paramiko
 import sys
+import threading
 import webob
 
 from tacker.common import utils
@@ -95,12 +96,13 @@ _body_pm_alert7 = copy.deepcopy(_body_pm_alert1)
 _body_pm_alert7['labels']['job_id'] = 'pm_job_id2'
 _body_pm_alert7['labels']['object_instance_id'] = 'obj_instance_id2'
 
+_pm_threshold_id = '64e46b0e-887a-4691-8d2b-aa3d7b157e2c'
 _body_pm_threshold_alert1 = {
     'status': 'firing',
     'labels': {
         'receiver_type': 'tacker',
         'function_type': 'vnfpm_threshold',
-        'threshold_id': '64e46b0e-887a-4691-8d2b-aa3d7b157e2c',
+        'threshold_id': _pm_threshold_id,
         'metric': 'VCpuUsageMeanVnf.'
                   '25b9b9d0-2461-4109-866e-a7767375415b',
         'object_instance_id': '25b9b9d0-2461-4109-866e-a7767375415b'
@@ -266,73 +268,6 @@ _pm_threshold2 = copy.deepcopy(_pm_threshold)
 _pm_threshold2['objectType'] = 'VnfIntCp'
 _pm_threshold2['criteria']['performanceMetric'] = 'ByteIncomingVnfIntCp'
 
-_pm_report = {
-    'id': 'report_id',
-    'jobId': 'pm_job_id',
-    'entries': [{
-        # objectType, InstanceId, Metric match the test
-        # condition.
-        'objectType': 'Vnf',
-        'objectInstanceId':
-            '25b9b9d0-2461-4109-866e-a7767375415b',
-        'performanceMetric':
-            'VCpuUsageMeanVnf.'
-            '25b9b9d0-2461-4109-866e-a7767375415b',
-        'performanceValues': [{
-            # current_time - 60sec
-            'timeStamp': '2022-06-22T01:22:45.678Z',
-            'value': 12.3
-        }, {
-            # current_time - 30sec
-            'timeStamp': '2022-06-22T01:23:15.678Z',
-            'value': 45.6
-        }]
-    }, {
-        # objectType, InstanceId, Metric do
-        # not match the test condition.
-        'objectType': 'Vnf',
-        'objectInstanceId':
-            '25b9b9d0-2461-4109-866e-a7767375415b',
-        'subObjectInstanceId':
-            'ebd40865-e3d9-4ac6-b7f0-0a8d2791d07f',
-        'performanceMetric':
-            'VCpuUsageMeanVnf.'
-            '25b9b9d0-2461-4109-866e-a7767375415b',
-        'performanceValues': [{
-            # current_time - 30sec
-            'timeStamp': '2022-06-22T01:23:15.678Z',
-            'value': 45.6
-        }]
-    }, {
-        # objectType, InstanceId, Metric do
-        # not match the test condition.
-        'objectType': 'Vnf',
-        'objectInstanceId':
-            '25b9b9d0-2461-4109-866e-a7767375415b',
-        'performanceMetric':
-            'VMemoryUsageMeanVnf.'
-            '25b9b9d0-2461-4109-866e-a7767375415b',
-        'performanceValues': [{
-            # current_time - 5sec
-            'timeStamp': '2022-06-22T01:23:40.678Z',
-            'value': 78.9
-        }]
-    }, {
-        # objectType, InstanceId, Metric do
-        # not match the test condition.
-        'objectType': 'Vnf',
-        'objectInstanceId':
-            'test_id',
-        'performanceMetric':
-            'VCpuUsageMeanVnf.test_id',
-        'performanceValues': [{
-            # current_time + 5sec
-            'timeStamp': '2022-06-22T01:23:50.678Z',
-            'value': 0.1
-        }]
-    }]
-}
-
 _pm_threshold_state = {
     'thresholdId': 'threshold_id',
     'subObjectInstanceId': 'sub_id_1',
@@ -341,10 +276,14 @@ _pm_threshold_state = {
     'crossingDirection': 'UP'
 }
 
-_pm_report2 = {
-    'id': 'report_id',
-    'jobId': 'pm_job_id',
-    'entries': []
+# the latest timeStamp of the reports which match the test condition.
+# (current_time - 30sec)
+_latest_report_time = datetime.datetime.fromisoformat(
+    '2022-06-22T01:23:15.678+00:00')
+_latest_report_times = {
+    (_pm_job_id1, '25b9b9d0-2461-4109-866e-a7767375415b', None,
+     'VCpuUsageMeanVnf.25b9b9d0-2461-4109-866e-a7767375415b'): (
+        _latest_report_time)
 }
 
 _inst_base = {
@@ -431,6 +370,21 @@ class _ParamikoTest():
     def put(self, a1, a2):
         pass
 
+    def putfo(self, a1, a2):
+        pass
+
+    def open_session(self):
+        return self
+
+    def makefile_stderr(self):
+        return self
+
+    def is_active(self):
+        return True
+
+    def close(self):
+        pass
+
     def __enter__(self):
         return self
 
@@ -445,6 +399,8 @@ class TestPrometheusPluginPm(base.TestCase):
         self.context = context.get_admin_context()
         self.request = mock.Mock()
         self.request.context = self.context
+        self.config_fixture.config(
+            group='prometheus_plugin', reload_coalesce_window=0)
         prometheus_plugin.PrometheusPluginPm._instance = None
 
     def tearDown(self):
@@ -471,14 +427,14 @@ class TestPrometheusPluginPm(base.TestCase):
             prometheus_plugin.PrometheusPluginPm)
         self.assertIsInstance(pp._instance, mon_base.MonitoringPluginStub)
 
-    @mock.patch.object(pm_job_utils, 'get_pm_report')
-    @mock.patch.object(pm_job_utils, 'get_pm_job')
+    @mock.patch.object(pm_job_utils, 'get_latest_report_times')
+    @mock.patch.object(pm_job_utils, 'get_pm_jobs')
     def test_pm(self, mock_pm_job, mock_pm_report):
         self.config_fixture.config(
             group='prometheus_plugin', performance_management=True)
-        mock_pm_job.return_value = objects.PmJobV2.from_dict(_pm_job)
-        mock_pm_report.return_value = [objects.PerformanceReportV2.from_dict(
-            _pm_report)]
+        mock_pm_job.return_value = {
+            _pm_job_id1: objects.PmJobV2.from_dict(_pm_job)}
+        mock_pm_report.return_value = _latest_report_times
         pp = mon_base.MonitoringPlugin.get_instance(
             prometheus_plugin.PrometheusPluginPm)
 
@@ -490,14 +446,14 @@ class TestPrometheusPluginPm(base.TestCase):
                 result[_pm_job_id1][0]['objectInstanceId'],
                 '25b9b9d0-2461-4109-866e-a7767375415b')
 
-    @mock.patch.object(pm_job_utils, 'get_pm_report')
-    @mock.patch.object(pm_job_utils, 'get_pm_job')
+    @mock.patch.object(pm_job_utils, 'get_latest_report_times')
+    @mock.patch.object(pm_job_utils, 'get_pm_jobs')
     def test_pm_metrics(self, mock_pm_job, mock_pm_report):
         self.config_fixture.config(
             group='prometheus_plugin', performance_management=True)
-        mock_pm_job.return_value = objects.PmJobV2.from_dict(_pm_job)
-        mock_pm_report.return_value = [objects.PerformanceReportV2.from_dict(
-            _pm_report)]
+        mock_pm_job.return_value = {
+            _pm_job_id1: objects.PmJobV2.from_dict(_pm_job)}
+        mock_pm_report.return_value = _latest_report_times
         pp = mon_base.MonitoringPlugin.get_instance(
             prometheus_plugin.PrometheusPluginPm)
         unload_uuidsentinel()
@@ -507,14 +463,14 @@ class TestPrometheusPluginPm(base.TestCase):
             self.assertEqual(result[_pm_job_id1][0]["performanceMetric"],
                              'ByteIncomingVnfIntCp')
 
-    @mock.patch.object(pm_job_utils, 'get_pm_report')
-    @mock.patch.object(pm_job_utils, 'get_pm_job')
+    @mock.patch.object(pm_job_utils, 'get_latest_report_times')
+    @mock.patch.object(pm_job_utils, 'get_pm_jobs')
     def test_pm_report(self, mock_pm_job, mock_pm_report):
         self.config_fixture.config(
             group='prometheus_plugin', performance_management=True)
-        mock_pm_job.return_value = objects.PmJobV2.from_dict(_pm_job)
-        mock_pm_report.return_value = [objects.PerformanceReportV2.from_dict(
-            _pm_report2)]
+        mock_pm_job.return_value = {
+            _pm_job_id1: objects.PmJobV2.from_dict(_pm_job)}
+        mock_pm_report.return_value = {}
         pp = mon_base.MonitoringPlugin.get_instance(
             prometheus_plugin.PrometheusPluginPm)
         unload_uuidsentinel()
@@ -524,7 +480,7 @@ class TestPrometheusPluginPm(base.TestCase):
             self.assertEqual(
                 result[_pm_job_id1][0]['objectInstanceId'],
                 '25b9b9d0-2461-4109-866e-a7767375415b')
-        mock_pm_report.return_value = None
+        mock_pm_report.return_value = {}
         unload_uuidsentinel()
         with freezegun.freeze_time(datetime_test):
             result = pp._alert(self.request, body=_body_pm1)
@@ -533,14 +489,14 @@ class TestPrometheusPluginPm(base.TestCase):
                 result[_pm_job_id1][0]['objectInstanceId'],
                 '25b9b9d0-2461-4109-866e-a7767375415b')
 
-    @mock.patch.object(pm_job_utils, 'get_pm_report')
-    @mock.patch.object(pm_job_utils, 'get_pm_job')
+    @mock.patch.object(pm_job_utils, 'get_latest_report_times')
+    @mock.patch.object(pm_job_utils, 'get_pm_jobs')
     def test_pm_datetime(self, mock_pm_job, mock_pm_report):
         self.config_fixture.config(
             group='prometheus_plugin', performance_management=True)
-        mock_pm_job.return_value = objects.PmJobV2.from_dict(_pm_job)
-        mock_pm_report.return_value = [objects.PerformanceReportV2.from_dict(
-            _pm_report)]
+        mock_pm_job.return_value = {
+            _pm_job_id1: objects.PmJobV2.from_dict(_pm_job)}
+        mock_pm_report.return_value = _latest_report_times
         pp = mon_base.MonitoringPlugin.get_instance(
             prometheus_plugin.PrometheusPluginPm)
         unload_uuidsentinel()
@@ -557,14 +513,14 @@ class TestPrometheusPluginPm(base.TestCase):
             result = pp._alert(self.request, body=_body_pm1)
             self.assertTrue(len(result) == 0)
 
-    @mock.patch.object(pm_job_utils, 'get_pm_report')
-    @mock.patch.object(pm_job_utils, 'get_pm_job')
+    @mock.patch.object(pm_job_utils, 'get_latest_report_times')
+    @mock.patch.object(pm_job_utils, 'get_pm_jobs')
     def test_pm_set_callback(self, mock_pm_job, mock_pm_report):
         self.config_fixture.config(
             group='prometheus_plugin', performance_management=True)
-        mock_pm_job.return_value = objects.PmJobV2.from_dict(_pm_job)
-        mock_pm_report.return_value = [objects.PerformanceReportV2.from_dict(
-            _pm_report)]
+        mock_pm_job.return_value = {
+            _pm_job_id1: objects.PmJobV2.from_dict(_pm_job)}
+        mock_pm_report.return_value = _latest_report_times
         pp = mon_base.MonitoringPlugin.get_instance(
             prometheus_plugin.PrometheusPluginPm)
         pp.set_callback(None)
@@ -576,17 +532,16 @@ class TestPrometheusPluginPm(base.TestCase):
                 result[_pm_job_id1][0]['objectInstanceId'],
                 '25b9b9d0-2461-4109-866e-a7767375415b')
 
-    @mock.patch.object(pm_job_utils, 'get_pm_report')
-    @mock.patch.object(pm_job_utils, 'get_pm_job')
+    @mock.patch.object(pm_job_utils, 'get_latest_report_times')
+    @mock.patch.object(pm_job_utils, 'get_pm_jobs')
     def test_pm_multi_job_alerts(self, mock_pm_job, mock_pm_report):
         self.config_fixture.config(
             group='prometheus_plugin', performance_management=True)
         return_pm_job1 = objects.PmJobV2.from_dict(_pm_job)
         return_pm_job2 = objects.PmJobV2.from_dict(_pm_job3)
-        mock_pm_job.side_effect = [return_pm_job1, return_pm_job1,
-            return_pm_job2]
-        mock_pm_report.return_value = [objects.PerformanceReportV2.from_dict(
-            _pm_report)]
+        mock_pm_job.return_value = {_pm_job_id1: return_pm_job1,
+                                    'pm_job_id2': return_pm_job2}
+        mock_pm_report.return_value = _latest_report_times
         pp = mon_base.MonitoringPlugin.get_instance(
             prometheus_plugin.PrometheusPluginPm)
 
@@ -601,6 +556,54 @@ class TestPrometheusPluginPm(base.TestCase):
             self.assertEqual(result['pm_job_id2'][0]['objectInstanceId'],
                 'obj_instance_id2')
 
+    @mock.patch.object(pm_job_utils, 'get_latest_report_times')
+    @mock.patch.object(pm_job_utils, 'get_pm_jobs')
+    def test_pm_alert_storm(self, mock_pm_job, mock_pm_report):
+        # 500 alerts of 20 PM jobs are handled by one lookup of PM jobs
+        # and one lookup of the latest report times.
+        self.config_fixture.config(
+            group='prometheus_plugin', performance_management=True)
+        pm_jobs = {}
+        alerts = []
+        for i in range(20):
+            pm_job = copy.deepcopy(_pm_job3)
+            pm_job['id'] = f'pm_job_{i}'
+            pm_job['objectInstanceIds'] = [f'obj_instance_{i}']
+            pm_jobs[pm_job['id']] = objects.PmJobV2.from_dict(pm_job)
+            for j in range(25):
+                alert = copy.deepcopy(_body_pm_alert1)
+                alert['labels']['job_id'] = pm_job['id']
+                alert['labels']['object_instance_id'] = f'obj_instance_{i}'
+                alerts.append(alert)
+        body = copy.deepcopy(_body_base)
+        body['alerts'] = alerts
+        mock_pm_job.return_value = pm_jobs
+        mock_pm_report.return_value = {}
+        pp = mon_base.MonitoringPlugin.get_instance(
+            prometheus_plugin.PrometheusPluginPm)
+
+        unload_uuidsentinel()
+        with freezegun.freeze_time(datetime_test):
+            result = pp._alert(self.request, body=body)
+        self.assertEqual(20, len(result))
+        self.assertEqual(500, sum(len(entries)
+                                  for entries in result.values()))
+        mock_pm_job.assert_called_once_with(self.context, set(pm_jobs))
+        self.assertEqual(1, mock_pm_report.call_count)
+
+    @mock.patch.object(pm_job_utils, 'get_latest_report_times')
+    @mock.patch.object(pm_job_utils, 'get_pm_jobs')
+    def test_pm_job_not_exist(self, mock_pm_job, mock_pm_report):
+        self.config_fixture.config(
+            group='prometheus_plugin', performance_management=True)
+        mock_pm_job.return_value = {}
+        mock_pm_report.return_value = {}
+        pp = mon_base.MonitoringPlugin.get_instance(
+            prometheus_plugin.PrometheusPluginPm)
+
+        self.assertRaises(sol_ex.PMJobNotExist, pp._alert, self.request,
+                          body=_body_pm1)
+
     def test_pm_error_access_info(self):
         self.config_fixture.config(
             group='prometheus_plugin', performance_management=True)
@@ -646,17 +649,14 @@ class TestPrometheusPluginPm(base.TestCase):
             exp=sol_ex.PrometheusPluginError())
         pp.delete_job(context=self.context, pm_job=job)
 
-    @mock.patch.object(paramiko, 'SSHClient')
     @mock.patch.object(http_client.HttpClient, 'do_request')
     @mock.patch.object(paramiko.SFTPClient, 'from_transport')
     @mock.patch.object(paramiko, 'Transport')
     @mock.patch.object(inst_utils, 'get_inst')
     def test_create_job(
-            self, mock_inst, mock_paramiko, mock_sftp, mock_do_request,
-            mock_sshclient):
+            self, mock_inst, mock_paramiko, mock_sftp, mock_do_request):
         mock_paramiko.return_value = _ParamikoTest()
         mock_sftp.return_value = _ParamikoTest()
-        mock_sshclient.return_value = _ParamikoTest()
         resp = webob.Response()
         resp.status_code = 202
         mock_do_request.return_value = resp, {}
@@ -853,18 +853,15 @@ class TestPrometheusPluginPm(base.TestCase):
             pp.create_job, context=self.context, pm_job=job
         )
 
-    @mock.patch.object(paramiko, 'SSHClient')
     @mock.patch.object(http_client.HttpClient, 'do_request')
     @mock.patch.object(paramiko.SFTPClient, 'from_transport')
     @mock.patch.object(paramiko, 'Transport')
     @mock.patch.object(inst_utils, 'get_inst')
     def test_create_job_uploading_error(
-            self, mock_inst, mock_paramiko, mock_sftp, mock_do_request,
-            mock_sshclient):
-        mock_paramiko.return_value = _ParamikoTest()
+            self, mock_inst, mock_paramiko, mock_sftp, mock_do_request):
         mock_sftp.return_value = _ParamikoTest()
         exp = ValueError("test_create_job_error2")
-        mock_sshclient.return_value = _ParamikoTest(
+        mock_paramiko.return_value = _ParamikoTest(
             exp=exp, recv_exit_status_value=1)
         resp = webob.Response()
         resp.status_code = 202
@@ -884,24 +881,22 @@ class TestPrometheusPluginPm(base.TestCase):
             pp.create_job, context=self.context, pm_job=job)
         exp = sol_ex.PrometheusPluginError("test_create_job_error2")
         mock_paramiko.return_value = _ParamikoTest(exp=exp)
-        mock_sshclient.return_value = _ParamikoTest(
+        mock_paramiko.return_value = _ParamikoTest(
             exp=exp, recv_exit_status_value=1)
         self.assertRaises(
             sol_ex.PrometheusPluginError,
             pp.create_job, context=self.context, pm_job=job)
 
     @mock.patch.object(utils, 'find_config_file')
-    @mock.patch.object(paramiko, 'SSHClient')
     @mock.patch.object(http_client.HttpClient, 'do_request')
     @mock.patch.object(paramiko.SFTPClient, 'from_transport')
     @mock.patch.object(paramiko, 'Transport')
     @mock.patch.object(inst_utils, 'get_inst')
     def test_promql_config_file_missing(
             self, mock_inst, mock_paramiko, mock_sftp, mock_do_request,
-            mock_sshclient, mock_utils):
-        mock_paramiko.return_value = _ParamikoTest()
+            mock_utils):
         mock_sftp.return_value = _ParamikoTest()
-        mock_sshclient.return_value = _ParamikoTest(recv_exit_status_value=1)
+        mock_paramiko.return_value = _ParamikoTest(recv_exit_status_value=1)
         resp = webob.Response()
         resp.status_code = 202
         mock_do_request.return_value = resp, {}
@@ -929,17 +924,14 @@ class TestPrometheusPluginPm(base.TestCase):
             pp.make_rule, "TypeError", "id", "id", "id", "metric", "exp"
         )
 
-    @mock.patch.object(paramiko, 'SSHClient')
     @mock.patch.object(http_client.HttpClient, 'do_request')
     @mock.patch.object(paramiko.SFTPClient, 'from_transport')
     @mock.patch.object(paramiko, 'Transport')
     @mock.patch.object(inst_utils, 'get_inst')
     def test_promql(
-            self, mock_inst, mock_paramiko, mock_sftp, mock_do_request,
-            mock_sshclient):
-        mock_paramiko.return_value = _ParamikoTest()
+            self, mock_inst, mock_paramiko, mock_sftp, mock_do_request):
         mock_sftp.return_value = _ParamikoTest()
-        mock_sshclient.return_value = _ParamikoTest(recv_exit_status_value=1)
+        mock_paramiko.return_value = _ParamikoTest(recv_exit_status_value=1)
         resp = webob.Response()
         resp.status_code = 202
         mock_do_request.return_value = resp, {}
@@ -958,6 +950,148 @@ class TestPrometheusPluginPm(base.TestCase):
             pp.create_job, context=self.context, pm_job=job
         )
 
+    @mock.patch.object(paramiko, 'Transport')
+    def test_ssh_connection_pool(self, mock_paramiko):
+        self.config_fixture.config(
+            group='prometheus_plugin', ssh_pool_size=1)
+        mock_paramiko.side_effect = lambda sock: _ParamikoTest()
+        pool = prometheus_plugin.SshConnectionPool()
+        self.addCleanup(pool.close)
+
+        with pool.connection('host', 22, 'user', 'pass') as conn1:
+            with pool.connection('host', 22, 'user', 'pass') as conn2:
+                self.assertIsNot(conn1, conn2)
+        self.assertEqual(2, mock_paramiko.call_count)
+        # reused. the other one is closed since the pool size is 1.
+        with pool.connection('host', 22, 'user', 'pass') as conn3:
+            self.assertIs(conn2, conn3)
+        self.assertEqual(2, mock_paramiko.call_count)
+        # another host
+        with pool.connection('host2', 22, 'user', 'pass'):
+            pass
+        self.assertEqual(3, mock_paramiko.call_count)
+
+        # not reused after an error
+        def _error():
+            with pool.connection('host', 22, 'user', 'pass'):
+                raise paramiko.SSHException('error')
+        self.assertRaises(paramiko.SSHException, _error)
+        with pool.connection('host', 22, 'user', 'pass') as conn4:
+            self.assertIsNot(conn3, conn4)
+        self.assertEqual(4, mock_paramiko.call_count)
+
+        # not reused after idle timeout
+        self.config_fixture.config(
+            group='prometheus_plugin', ssh_idle_timeout=1)
+        with mock.patch.object(prometheus_plugin.time, 'monotonic',
+                               side_effect=[0, 0, 10, 10]):
+            with pool.connection('host', 22, 'user', 'pass'):
+                pass
+            with pool.connection('host', 22, 'user', 'pass'):
+                pass
+        self.assertEqual(5, mock_paramiko.call_count)
+
+    @mock.patch.object(paramiko, 'Transport')
+    def test_ssh_connection_pool_reaper(self, mock_paramiko):
+        self.config_fixture.config(
+            group='prometheus_plugin', ssh_idle_timeout=1)
+        mock_paramiko.side_effect = lambda sock: mock.Mock(
+            wraps=_ParamikoTest())
+        pool = prometheus_plugin.SshConnectionPool()
+        self.addCleanup(pool.close)
+
+        with pool.connection('host', 22, 'user', 'pass') as conn:
+            pass
+        self.assertIsNotNone(pool.reaper)
+        conn.close.assert_not_called()
+
+        # closed after ssh_idle_timeout without another request.
+        pool.reaper.join(10)
+        conn.close.assert_called_once_with()
+        self.assertEqual({}, pool.idle)
+        self.assertIsNone(pool.reaper)
+
+    @mock.patch.object(paramiko, 'Transport')
+    def test_ssh_connection_pool_close(self, mock_paramiko):
+        mock_paramiko.side_effect = lambda sock: mock.Mock(
+            wraps=_ParamikoTest())
+        pool = prometheus_plugin.SshConnectionPool()
+
+        with pool.connection('host', 22, 'user', 'pass') as conn:
+            pass
+        pool.close()
+        conn.close.assert_called_once_with()
+        self.assertEqual({}, pool.idle)
+        self.assertIsNone(pool.reaper)
+
+    def test_reload_coalescer(self):
+        self.config_fixture.config(
+            group='prometheus_plugin', reload_coalesce_window=0.5)
+        reload_func = mock.Mock()
+        coalescer = prometheus_plugin.ReloadCoalescer(reload_func)
+
+        threads = [threading.Thread(target=coalescer.reload,
+                                    args=(self.context, uri))
+                   for uri in ['uri1', 'uri1', 'uri1', 'uri2']]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(2, reload_func.call_count)
+        self.assertEqual(
+            ['uri1', 'uri2'],
+            sorted(call[0][1] for call in reload_func.call_args_list))
+
+        # error is raised to all requests
+        reload_func.reset_mock()
+        reload_func.side_effect = sol_ex.PrometheusPluginError('error')
+        errors = []
+
+        def _reload():
+            try:
+                coalescer.reload(self.context, 'uri1')
+            except sol_ex.PrometheusPluginError as ex:
+                errors.append(ex)
+        threads = [threading.Thread(target=_reload) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(1, reload_func.call_count)
+        self.assertEqual(3, len(errors))
+
+    @mock.patch.object(prometheus_plugin.PrometheusPluginPm, '_delete_rule')
+    @mock.patch.object(prometheus_plugin.PrometheusPluginPm,
+                       'reload_prom_server')
+    @mock.patch.object(prometheus_plugin.PrometheusPluginPm, '_upload_rule')
+    def test_upload_rules_parallel(self, mock_upload, mock_reload,
+                                   mock_delete):
+        self.config_fixture.config(
+            group='prometheus_plugin', performance_management=True)
+        pp = mon_base.MonitoringPlugin.get_instance(
+            prometheus_plugin.PrometheusPluginPm)
+        targets = [{'host': f'host{i}', 'port': 22, 'user': 'user',
+                    'password': 'pass', 'path': 'path'} for i in range(3)]
+        reloads = ['uri0', 'uri1']
+
+        # normal
+        pp.upload_rules(self.context, targets, reloads, {}, 'id')
+        self.assertEqual(3, mock_upload.call_count)
+        self.assertEqual(2, mock_reload.call_count)
+        mock_delete.assert_not_called()
+
+        # an upload error cleans up all targets
+        mock_upload.reset_mock()
+        mock_reload.reset_mock()
+        mock_upload.side_effect = [
+            None, paramiko.SSHException('error'), None]
+        mock_delete.side_effect = paramiko.SSHException('error')
+        self.assertRaises(
+            paramiko.SSHException,
+            pp.upload_rules, self.context, targets, reloads, {}, 'id')
+        mock_reload.assert_not_called()
+        self.assertEqual(3, mock_delete.call_count)
+
 
 class TestPrometheusPluginThreshold(base.TestCase):
 
@@ -967,6 +1101,8 @@ class TestPrometheusPluginThreshold(base.TestCase):
         self.context = context.get_admin_context()
         self.request = mock.Mock()
         self.request.context = self.context
+        self.config_fixture.config(
+            group='prometheus_plugin', reload_coalesce_window=0)
         prometheus_plugin.PrometheusPluginThreshold._instance = None
 
     def tearDown(self):
@@ -994,12 +1130,12 @@ class TestPrometheusPluginThreshold(base.TestCase):
         self.assertIsInstance(pp._instance, mon_base.MonitoringPluginStub)
 
     @mock.patch.object(pm_threshold_utils, 'get_pm_threshold_state')
-    @mock.patch.object(pm_threshold_utils, 'get_pm_threshold')
+    @mock.patch.object(pm_threshold_utils, 'get_pm_thresholds')
     def test_pm_threshold(self, mock_pm_threshold, mock_pm_threshold_state):
         self.config_fixture.config(
             group='prometheus_plugin', performance_management=True)
-        mock_pm_threshold.return_value = (
-            objects.ThresholdV2.from_dict(_pm_threshold))
+        mock_pm_threshold.return_value = {
+            _pm_threshold_id: objects.ThresholdV2.from_dict(_pm_threshold)}
         mock_pm_threshold_state.return_value = _pm_threshold_state
 
         pp = mon_base.MonitoringPlugin.get_instance(
@@ -1012,13 +1148,13 @@ class TestPrometheusPluginThreshold(base.TestCase):
             self.assertEqual(result[0]['performanceValue'], 510)
 
     @mock.patch.object(pm_threshold_utils, 'get_pm_threshold_state')
-    @mock.patch.object(pm_threshold_utils, 'get_pm_threshold')
+    @mock.patch.object(pm_threshold_utils, 'get_pm_thresholds')
     def test_pm_threshold_metrics(
             self, mock_pm_threshold, mock_pm_threshold_state):
         self.config_fixture.config(
             group='prometheus_plugin', performance_management=True)
-        mock_pm_threshold.return_value = (
-            objects.ThresholdV2.from_dict(_pm_threshold))
+        mock_pm_threshold.return_value = {
+            _pm_threshold_id: objects.ThresholdV2.from_dict(_pm_threshold)}
         mock_pm_threshold_state.return_value = _pm_threshold_state
 
         pp = mon_base.MonitoringPlugin.get_instance(
@@ -1030,13 +1166,13 @@ class TestPrometheusPluginThreshold(base.TestCase):
             self.assertTrue(len(result) == 0)
 
     @mock.patch.object(pm_threshold_utils, 'get_pm_threshold_state')
-    @mock.patch.object(pm_threshold_utils, 'get_pm_threshold')
+    @mock.patch.object(pm_threshold_utils, 'get_pm_thresholds')
     def test_pm_threshold_with_threshold_state(
             self, mock_pm_threshold, mock_pm_threshold_state):
         self.config_fixture.config(
             group='prometheus_plugin', performance_management=True)
-        mock_pm_threshold.return_value = (
-            objects.ThresholdV2.from_dict(_pm_threshold))
+        mock_pm_threshold.return_value = {
+            _pm_threshold_id: objects.ThresholdV2.from_dict(_pm_threshold)}
         mock_pm_threshold_state.return_value = None
 
         pp = mon_base.MonitoringPlugin.get_instance(
@@ -1049,13 +1185,13 @@ class TestPrometheusPluginThreshold(base.TestCase):
             self.assertEqual(result[0]['performanceValue'], 510)
 
     @mock.patch.object(pm_threshold_utils, 'get_pm_threshold_state')
-    @mock.patch.object(pm_threshold_utils, 'get_pm_threshold')
+    @mock.patch.object(pm_threshold_utils, 'get_pm_thresholds')
     def test_pm_threshold_set_callback(
             self, mock_pm_threshold, mock_pm_threshold_state):
         self.config_fixture.config(
             group='prometheus_plugin', performance_management=True)
-        mock_pm_threshold.return_value = (
-            objects.ThresholdV2.from_dict(_pm_threshold))
+        mock_pm_threshold.return_value = {
+            _pm_threshold_id: objects.ThresholdV2.from_dict(_pm_threshold)}
         mock_pm_threshold_state.return_value = _pm_threshold_state
 
         pp = mon_base.MonitoringPlugin.get_instance(
@@ -1068,6 +1204,38 @@ class TestPrometheusPluginThreshold(base.TestCase):
             self.assertTrue(len(result) > 0)
             self.assertEqual(result[0]['performanceValue'], 510)
 
+    @mock.patch.object(pm_threshold_utils, 'get_pm_thresholds')
+    def test_pm_threshold_alert_storm(self, mock_pm_threshold):
+        self.config_fixture.config(
+            group='prometheus_plugin', performance_management=True)
+        pm_thresholds = {}
+        alerts = []
+        for i in range(10):
+            pm_threshold = copy.deepcopy(_pm_threshold)
+            pm_threshold['id'] = f'threshold_{i}'
+            pm_thresholds[pm_threshold['id']] = (
+                objects.ThresholdV2.from_dict(pm_threshold))
+            for j in range(10):
+                alert = copy.deepcopy(_body_pm_threshold_alert1)
+                alert['labels']['threshold_id'] = pm_threshold['id']
+                alerts.append(alert)
+        # an alert of a threshold which does not exist is skipped.
+        alert = copy.deepcopy(_body_pm_threshold_alert1)
+        alert['labels']['threshold_id'] = 'threshold_not_exist'
+        alerts.append(alert)
+        body = copy.deepcopy(_body_base)
+        body['alerts'] = alerts
+        mock_pm_threshold.return_value = pm_thresholds
+        pp = mon_base.MonitoringPlugin.get_instance(
+            prometheus_plugin.PrometheusPluginThreshold)
+
+        unload_uuidsentinel()
+        with freezegun.freeze_time(datetime_test):
+            result = pp._alert(self.request, body=body)
+        self.assertEqual(100, len(result))
+        mock_pm_threshold.assert_called_once_with(
+            self.context, set(pm_thresholds) | {'threshold_not_exist'})
+
     def test_pm_threshold_error_access_info(self):
         self.config_fixture.config(
             group='prometheus_plugin', performance_management=True)
@@ -1117,17 +1285,15 @@ class TestPrometheusPluginThreshold(base.TestCase):
             exp=sol_ex.PrometheusPluginError())
         pp.delete_threshold(context=self.context, pm_threshold=threshold)
 
-    @mock.patch.object(paramiko, 'SSHClient')
     @mock.patch.object(http_client.HttpClient, 'do_request')
     @mock.patch.object(paramiko.SFTPClient, 'from_transport')
     @mock.patch.object(paramiko, 'Transport')
     @mock.patch.object(inst_utils, 'get_inst')
     def test_create_pm_threshold(
             self, mock_inst, mock_paramiko, mock_sftp,
-            mock_do_request, mock_sshclient):
+            mock_do_request):
         mock_paramiko.return_value = _ParamikoTest()
         mock_sftp.return_value = _ParamikoTest()
-        mock_sshclient.return_value = _ParamikoTest()
         resp = webob.Response()
         resp.status_code = 202
         mock_do_request.return_value = resp, {}
@@ -1325,18 +1491,16 @@ class TestPrometheusPluginThreshold(base.TestCase):
             pp.create_threshold, context=self.context, pm_threshold=threshold
         )
 
-    @mock.patch.object(paramiko, 'SSHClient')
     @mock.patch.object(http_client.HttpClient, 'do_request')
     @mock.patch.object(paramiko.SFTPClient, 'from_transport')
     @mock.patch.object(paramiko, 'Transport')
     @mock.patch.object(inst_utils, 'get_inst')
     def test_create_pm_threshold_error2(
             self, mock_inst, mock_paramiko,
-            mock_sftp, mock_do_request, mock_sshclient):
-        mock_paramiko.return_value = _ParamikoTest()
+            mock_sftp, mock_do_request):
         mock_sftp.return_value = _ParamikoTest()
         exp = ValueError("test_create_pm_threshold_error2")
-        mock_sshclient.return_value = _ParamikoTest(
+        mock_paramiko.return_value = _ParamikoTest(
             exp=exp, recv_exit_status_value=1)
         resp = webob.Response()
         resp.status_code = 202
@@ -1356,24 +1520,22 @@ class TestPrometheusPluginThreshold(base.TestCase):
             pp.create_threshold, context=self.context, pm_threshold=threshold)
         exp = sol_ex.PrometheusPluginError("test_create_pm_threshold_error2")
         mock_paramiko.return_value = _ParamikoTest(exp=exp)
-        mock_sshclient.return_value = _ParamikoTest(
+        mock_paramiko.return_value = _ParamikoTest(
             exp=exp, recv_exit_status_value=1)
         self.assertRaises(
             sol_ex.PrometheusPluginError,
             pp.create_threshold, context=self.context, pm_threshold=threshold)
 
     @mock.patch.object(utils, 'find_config_file')
-    @mock.patch.object(paramiko, 'SSHClient')
     @mock.patch.object(http_client.HttpClient, 'do_request')
     @mock.patch.object(paramiko.SFTPClient, 'from_transport')
     @mock.patch.object(paramiko, 'Transport')
     @mock.patch.object(inst_utils, 'get_inst')
     def test_promql(
             self, mock_inst, mock_paramiko, mock_sftp, mock_do_request,
-            mock_sshclient, mock_utils):
-        mock_paramiko.return_value = _ParamikoTest()
+            mock_utils):
         mock_sftp.return_value = _ParamikoTest()
-        mock_sshclient.return_value = _ParamikoTest(recv_exit_status_value=1)
+        mock_paramiko.return_value = _ParamikoTest(recv_exit_status_value=1)
         resp = webob.Response()
         resp.status_code = 202
         mock_do_request.return_value = resp, {}
@@ -1401,17 +1563,14 @@ class TestPrometheusPluginThreshold(base.TestCase):
             pp.make_rule, "TypeError", "id", "id", "id", "metric", "exp"
         )
 
-    @mock.patch.object(paramiko, 'SSHClient')
     @mock.patch.object(http_client.HttpClient, 'do_request')
     @mock.patch.object(paramiko.SFTPClient, 'from_transport')
     @mock.patch.object(paramiko, 'Transport')
     @mock.patch.object(inst_utils, 'get_inst')
     def test_promql2(
-            self, mock_inst, mock_paramiko, mock_sftp, mock_do_request,
-            mock_sshclient):
-        mock_paramiko.return_value = _ParamikoTest()
+            self, mock_inst, mock_paramiko, mock_sftp, mock_do_request):
         mock_sftp.return_value = _ParamikoTest()
-        mock_sshclient.return_value = _ParamikoTest(recv_exit_status_value=1)
+        mock_paramiko.return_value = _ParamikoTest(recv_exit_status_value=1)
         resp = webob.Response()
         resp.status_code = 202
         mock_do_request.return_value = resp, {}
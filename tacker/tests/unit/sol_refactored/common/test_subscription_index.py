@@ -0,0 +1,172 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from unittest import mock
+
+from tacker import context
+from tacker.sol_refactored.common import subscription_index
+from tacker.sol_refactored import objects
+from tacker.sol_refactored.objects import base as objects_base
+from tacker.tests import base
+
+
+def _subsc(subsc_id, **kwargs):
+    subsc = objects.LccnSubscriptionV2(id=subsc_id)
+    if kwargs:
+        subsc.filter = objects.LifecycleChangeNotificationsFilterV2(**kwargs)
+    return subsc
+
+
+def _inst_filter(**kwargs):
+    return objects.VnfInstanceSubscriptionFilter(**kwargs)
+
+
+class TestSubscriptionIndex(base.BaseTestCase):
+
+    def setUp(self):
+        super(TestSubscriptionIndex, self).setUp()
+        objects.register_all()
+        self.context = context.get_admin_context()
+        self.index = subscription_index.SubscriptionIndex(
+            'LccnSubscriptionV2',
+            subscription_index.INST_FILTER_KEYS + [
+                ('notificationType', subscription_index.filter_key(
+                    'notificationTypes')),
+                ('operationType', subscription_index.filter_key(
+                    'operationTypes')),
+            ]
+        )
+        self.inst = objects.VnfInstanceV2(
+            id='inst-1', vnfdId='vnfd-1', vnfProvider='company',
+            vnfProductName='product')
+
+    def _match_ids(self, conditions):
+        return [subsc.id
+                for subsc in self.index.match(self.context, conditions)]
+
+    @mock.patch.object(objects_base.TackerPersistentObject, 'get_dict_all')
+    @mock.patch.object(objects_base.TackerPersistentObject, 'get_all')
+    def test_match(self, mock_get_all, mock_get_dict_all):
+        product_other = objects._VnfProductsFromProviders_VnfProducts(
+            vnfProductName='other')
+        mock_get_all.return_value = [
+            _subsc('subsc-1'),
+            _subsc('subsc-2', notificationTypes=[
+                'VnfLcmOperationOccurrenceNotification']),
+            _subsc('subsc-3', notificationTypes=[
+                'VnfIdentifierCreationNotification']),
+            _subsc('subsc-4', operationTypes=['SCALE', 'HEAL']),
+            _subsc('subsc-5', vnfInstanceSubscriptionFilter=_inst_filter(
+                vnfdIds=['vnfd-1'])),
+            _subsc('subsc-6', vnfInstanceSubscriptionFilter=_inst_filter(
+                vnfdIds=['vnfd-2'])),
+            _subsc('subsc-7', vnfInstanceSubscriptionFilter=_inst_filter(
+                vnfInstanceIds=['inst-2'])),
+            _subsc('subsc-8', vnfInstanceSubscriptionFilter=_inst_filter(
+                vnfProductsFromProviders=[
+                    objects._VnfProductsFromProviders(
+                        vnfProvider='company')])),
+            _subsc('subsc-9', vnfInstanceSubscriptionFilter=_inst_filter(
+                vnfProductsFromProviders=[
+                    objects._VnfProductsFromProviders(
+                        vnfProvider='company',
+                        vnfProducts=[product_other])])),
+        ]
+
+        conditions = subscription_index.inst_conditions(self.inst)
+        conditions['notificationType'] = [
+            'VnfLcmOperationOccurrenceNotification']
+        conditions['operationType'] = ['SCALE']
+        self.assertEqual(['subsc-1', 'subsc-2', 'subsc-4', 'subsc-5',
+                          'subsc-8'],
+                         self._match_ids(conditions))
+
+        # operationType is not checked if it is not specified.
+        del conditions['operationType']
+        conditions['notificationType'] = [
+            'VnfIdentifierCreationNotification']
+        self.assertEqual(['subsc-1', 'subsc-3', 'subsc-4', 'subsc-5',
+                          'subsc-8'],
+                         self._match_ids(conditions))
+        mock_get_all.assert_called_once()
+        mock_get_dict_all.assert_not_called()
+
+    @mock.patch.object(subscription_index.time, 'monotonic')
+    @mock.patch.object(objects_base.TackerPersistentObject, 'get_by_id')
+    @mock.patch.object(objects_base.TackerPersistentObject, 'get_dict_all')
+    @mock.patch.object(objects_base.TackerPersistentObject, 'get_all')
+    def test_sync(self, mock_get_all, mock_get_dict_all, mock_get_by_id,
+                  mock_monotonic):
+        mock_monotonic.return_value = 1000.0
+        mock_get_all.return_value = [_subsc('subsc-1'), _subsc('subsc-2')]
+        self.assertEqual(['subsc-1', 'subsc-2'], self._match_ids({}))
+
+        # subsc-1 was deleted and subsc-3 was created by other process.
+        mock_get_dict_all.return_value = [{'id': 'subsc-2'},
+                                          {'id': 'subsc-3'}]
+        mock_get_by_id.return_value = _subsc(
+            'subsc-3', operationTypes=['HEAL'])
+
+        # DB is not read until the resync interval elapses.
+        mock_monotonic.return_value = 1059.0
+        self.assertEqual(['subsc-1', 'subsc-2'], self._match_ids({}))
+        mock_get_dict_all.assert_not_called()
+
+        mock_monotonic.return_value = 1060.0
+        self.assertEqual(['subsc-2', 'subsc-3'],
+                         self._match_ids({'operationType': ['HEAL']}))
+        self.assertEqual(['subsc-2'],
+                         self._match_ids({'operationType': ['SCALE']}))
+        mock_get_all.assert_called_once()
+        mock_get_dict_all.assert_called_once()
+        mock_get_by_id.assert_called_once_with(self.context, 'subsc-3')
+
+    @mock.patch.object(objects_base.TackerPersistentObject, 'get_by_id')
+    @mock.patch.object(objects_base.TackerPersistentObject, 'get_dict_all')
+    @mock.patch.object(objects_base.TackerPersistentObject, 'get_all')
+    def test_reload(self, mock_get_all, mock_get_dict_all, mock_get_by_id):
+        # not loaded yet. nothing to do.
+        mock_get_by_id.return_value = _subsc('subsc-1')
+        self.index.reload(self.context, 'subsc-1')
+        self.assertFalse(self.index.loaded)
+
+        mock_get_all.return_value = [_subsc('subsc-1')]
+        self.assertEqual(['subsc-1'], self._match_ids({}))
+
+        # subsc-2 was created by other process.
+        mock_get_by_id.return_value = _subsc('subsc-2')
+        self.index.reload(self.context, 'subsc-2')
+        self.assertEqual(['subsc-1', 'subsc-2'], self._match_ids({}))
+
+        # subsc-1 was deleted by other process.
+        mock_get_by_id.return_value = None
+        self.index.reload(self.context, 'subsc-1')
+        self.assertEqual(['subsc-2'], self._match_ids({}))
+        mock_get_dict_all.assert_not_called()
+
+    @mock.patch.object(objects_base.TackerPersistentObject, 'get_dict_all')
+    @mock.patch.object(objects_base.TackerPersistentObject, 'get_all')
+    def test_add_remove(self, mock_get_all, mock_get_dict_all):
+        mock_get_all.return_value = [
+            _subsc('subsc-1', operationTypes=['HEAL'])]
+        self.assertEqual(['subsc-1'],
+                         self._match_ids({'operationType': ['HEAL']}))
+
+        subsc_2 = _subsc('subsc-2', operationTypes=['HEAL'])
+        self.index.add(subsc_2)
+        self.index.remove('subsc-1')
+        self.assertEqual(['subsc-2'],
+                         self._match_ids({'operationType': ['HEAL']}))
+        mock_get_dict_all.assert_not_called()
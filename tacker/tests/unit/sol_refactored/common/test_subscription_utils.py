@@ -42,6 +42,8 @@ class TestSubscriptionUtils(base.BaseTestCase):
         objects.register_all()
         self.context = context.get_admin_context()
         self.context.api_version = api_version.APIVersion('2.0.0')
+        subsc_utils._subsc_index.clear()
+        subsc_utils._notif_clients.clear()
 
     @mock.patch.object(objects.base.TackerPersistentObject, 'get_by_id')
     def test_get_subsc(self, mock_subsc):
@@ -361,6 +363,7 @@ class TestSubscriptionUtils(base.BaseTestCase):
 
         # execute oauth2 mtls
         subsc_utils.send_notification(subsc_oauth2_mtls, notif_data_no_auth)
+        subsc_utils._get_dispatcher().join()
         mock_resp.assert_called_once()
 
     @mock.patch('tacker.sol_refactored.common.subscription_utils.LOG')
@@ -378,6 +381,7 @@ class TestSubscriptionUtils(base.BaseTestCase):
 
         # execute no_auth
         subsc_utils.send_notification(subsc_no_auth, notif_data_no_auth)
+        subsc_utils._get_dispatcher().join()
         expected_message = "send_notification failed: unit test"
         mock_log.exception.assert_called_with(expected_message)
 
@@ -403,6 +407,7 @@ class TestSubscriptionUtils(base.BaseTestCase):
             subsc_basic_auth, alarm, 'http://127.0.0.1:9890')
 
         subsc_utils.send_notification(subsc_basic_auth, notif_data)
+        subsc_utils._get_dispatcher().join()
         mock_resp.assert_called_once()
 
     @mock.patch.object(http_client.HttpClient, 'do_request')
@@ -431,8 +436,56 @@ class TestSubscriptionUtils(base.BaseTestCase):
         mock_resp.return_value = (resp_no_auth, None)
         subsc_utils.send_notification(
             pm_job, notif_data, subsc_utils.NOTIFY_TYPE_PM)
+        subsc_utils._get_dispatcher().join()
         mock_resp.assert_called_once()
 
+    @mock.patch.object(http_client.NoAuthHandle, 'get_session')
+    def test_send_notification_reuse_client(self, mock_session):
+        resp_no_auth = requests.Response()
+        resp_no_auth.status_code = 204
+        mock_session.return_value.request.return_value = resp_no_auth
+        subsc_1 = objects.LccnSubscriptionV2(
+            id='sub-1', verbosity='SHORT',
+            callbackUri='http://127.0.0.1/callback')
+        subsc_2 = objects.LccnSubscriptionV2(
+            id='sub-2', verbosity='SHORT',
+            callbackUri='http://127.0.0.2/callback')
+        notif_data = objects.VnfLcmOperationOccurrenceNotificationV2(
+            id=uuidutils.generate_uuid()
+        )
+
+        for _ in range(3):
+            subsc_utils.send_notification(subsc_1, notif_data)
+            subsc_utils.send_notification(subsc_2, notif_data)
+        subsc_utils._get_dispatcher().join()
+
+        # session is created per callbackUri and reused.
+        self.assertEqual(2, mock_session.call_count)
+        self.assertEqual(6, mock_session.return_value.request.call_count)
+        self.assertEqual(2, len(subsc_utils._notif_clients))
+        stats = subsc_utils.get_notification_stats()
+        self.assertEqual(0, stats['queue_depth'])
+
+    def test_get_dispatcher(self):
+        self.addCleanup(setattr, subsc_utils, '_dispatcher',
+                        subsc_utils._dispatcher)
+        subsc_utils._dispatcher = None
+        CONF.set_override('notification_workers', 3, group='v2_vnfm')
+        CONF.set_override('notification_queue_size', 5, group='v2_vnfm')
+        self.addCleanup(CONF.clear_override, 'notification_workers',
+                        group='v2_vnfm')
+        self.addCleanup(CONF.clear_override, 'notification_queue_size',
+                        group='v2_vnfm')
+
+        # not created until a notification is sent.
+        self.assertIsNone(subsc_utils.get_notification_stats())
+
+        dispatcher = subsc_utils._get_dispatcher()
+        self.assertEqual(3, dispatcher.num_workers)
+        self.assertEqual(5, dispatcher.queue.maxsize)
+        self.assertIs(dispatcher, subsc_utils._get_dispatcher())
+        self.assertEqual(0, subsc_utils.get_notification_stats()['workers'])
+
     @mock.patch.object(http_client.HttpClient, 'do_request')
     def test_test_notification(self, mock_resp):
         subsc_no_auth = objects.LccnSubscriptionV2(
@@ -15,7 +15,9 @@
 import os
 import shutil
 import tempfile
+from unittest import mock
 
+from oslo_config import cfg
 from oslo_log import log as logging
 from oslo_utils import uuidutils
 import yaml
@@ -297,3 +299,91 @@ class TestVnfd(base.BaseTestCase):
         expected_result = ['Scripts/install.sh',
                            'Files/kubernetes/deployment.yaml']
         self.assertEqual(expected_result, result)
+
+
+class TestVnfdCache(base.BaseTestCase):
+
+    def setUp(self):
+        super(TestVnfdCache, self).setUp()
+        self.cache = vnfd_utils.VnfdCache()
+        mock.patch.object(vnfd_utils, '_vnfd_cache', self.cache).start()
+        self.addCleanup(mock.patch.stopall)
+        self.csar_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.csar_dir)
+        shutil.copytree(
+            utils.test_sample("unit/sol_refactored/samples", "sample1"),
+            self.csar_dir, dirs_exist_ok=True)
+
+    def _get_vnfd(self, vnfd_id=SAMPLE_VNFD_ID):
+        vnfd = vnfd_utils.Vnfd(vnfd_id)
+        vnfd.init_from_csar_dir(self.csar_dir)
+        return vnfd
+
+    @mock.patch.object(yaml, 'safe_load', wraps=yaml.safe_load)
+    def test_cache_hit(self, mock_load):
+        vnfd_1 = self._get_vnfd()
+        num_loads = mock_load.call_count
+        vdu_nodes = vnfd_1.get_vdu_nodes(SAMPLE_FLAVOUR_ID)
+
+        vnfd_2 = self._get_vnfd()
+
+        self.assertEqual(num_loads, mock_load.call_count)
+        self.assertEqual(vnfd_1.definitions, vnfd_2.definitions)
+        self.assertEqual(vdu_nodes, vnfd_2.get_vdu_nodes(SAMPLE_FLAVOUR_ID))
+        # the contents are not shared.
+        self.assertIsNot(vnfd_1.definitions, vnfd_2.definitions)
+        vnfd_2.definitions.clear()
+        self.assertEqual(vdu_nodes,
+                         self._get_vnfd().get_vdu_nodes(SAMPLE_FLAVOUR_ID))
+        stats = vnfd_utils.get_vnfd_cache_stats()
+        self.assertEqual(2, stats['hits'])
+        self.assertEqual(1, stats['misses'])
+        self.assertEqual(1, stats['entries'])
+
+    def test_cache_modified(self):
+        vnfd_1 = self._get_vnfd()
+
+        path = os.path.join(self.csar_dir, 'Definitions',
+                            'ut_sample1_df_simple.yaml')
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1000))
+        vnfd_2 = self._get_vnfd()
+
+        self.assertIsNot(vnfd_1.definitions, vnfd_2.definitions)
+        self.assertEqual(vnfd_1.definitions, vnfd_2.definitions)
+        self.assertEqual(2, vnfd_utils.get_vnfd_cache_stats()['misses'])
+
+    def test_cache_evicted(self):
+        cfg.CONF.set_override('vnfd_cache_size', 1, group='v2_vnfm')
+
+        self._get_vnfd('vnfd-1')
+        self._get_vnfd('vnfd-2')
+        self._get_vnfd('vnfd-1')
+
+        stats = vnfd_utils.get_vnfd_cache_stats()
+        self.assertEqual(0, stats['hits'])
+        self.assertEqual(3, stats['misses'])
+        self.assertEqual(2, stats['evictions'])
+        self.assertEqual(1, stats['entries'])
+
+    def test_cache_disabled(self):
+        cfg.CONF.set_override('vnfd_cache_size', 0, group='v2_vnfm')
+
+        vnfd_1 = self._get_vnfd()
+        vnfd_2 = self._get_vnfd()
+
+        self.assertIsNot(vnfd_1.definitions, vnfd_2.definitions)
+        stats = vnfd_utils.get_vnfd_cache_stats()
+        self.assertEqual(0, stats['misses'])
+        self.assertEqual(0, stats['entries'])
+
+    def test_get_vdu_cps_not_shared(self):
+        vnfd = self._get_vnfd()
+
+        cps = vnfd.get_vdu_cps(SAMPLE_FLAVOUR_ID, 'VDU1')
+        cps.append('dummy')
+
+        self.assertNotIn('dummy',
+                         self._get_vnfd().get_vdu_cps(SAMPLE_FLAVOUR_ID,
+                                                      'VDU1'))
+        self.assertEqual([], vnfd.get_vdu_cps(SAMPLE_FLAVOUR_ID, 'VDU0'))
@@ -20,11 +20,16 @@ from kubernetes import client
 from oslo_log import log as logging
 from oslo_utils import timeutils
 from oslo_utils import uuidutils
+from tooz import coordination as tooz_coordination
 from tooz.drivers import file
 
+from tacker.common import coordination
 from tacker import context
 from tacker.sol_refactored.common import exceptions as sol_ex
+from tacker.sol_refactored.common import fm_subscription_utils \
+    as fm_subsc_utils
 from tacker.sol_refactored.common import lcm_op_occ_utils as lcmocc_utils
+from tacker.sol_refactored.common import subscription_utils as subsc_utils
 from tacker.sol_refactored.conductor import conductor_v2
 from tacker.sol_refactored.conductor import vnflcm_driver_v2
 from tacker.sol_refactored.nfvo import nfvo_client
@@ -750,18 +755,23 @@ class TestConductorV2(db_base.SqlTestCase):
     def test_sync_db_exception(
             self, mock_get_by_filters, mock_list_namespaced_pod,
             mock_check_pod_information):
-        vnf_instance_obj = fakes.fake_vnf_instance()
-        vnf_instance_obj.id = CNF_SAMPLE_VNFD_ID
-        vnfc_rsc_info_obj1, vnfc_info_obj1 = fakes.fake_vnfc_resource_info(
-            vdu_id='VDU1', rsc_kind='Pod')
-        vnf_instance_obj.instantiatedVnfInfo.vnfcResourceInfo = [
-            vnfc_rsc_info_obj1
-        ]
-        vim_connection_object = fakes.fake_vim_connection_info()
-        vnf_instance_obj.vimConnectionInfo['vim1'] = vim_connection_object
-
-        mock_get_by_filters.return_value = [
-            vnf_instance_obj, vnf_instance_obj]
+        # NOTE: distinct instances are used since the instances are
+        # synchronized concurrently and the copies of the same instance
+        # would race on its lock.
+        vnf_instance_objs = []
+        for _ in range(2):
+            vnf_instance_obj = fakes.fake_vnf_instance()
+            vnfc_rsc_info_obj1, vnfc_info_obj1 = (
+                fakes.fake_vnfc_resource_info(vdu_id='VDU1', rsc_kind='Pod'))
+            vnf_instance_obj.instantiatedVnfInfo.vnfcResourceInfo = [
+                vnfc_rsc_info_obj1
+            ]
+            vim_connection_object = fakes.fake_vim_connection_info()
+            vnf_instance_obj.vimConnectionInfo['vim1'] = (
+                vim_connection_object)
+            vnf_instance_objs.append(vnf_instance_obj)
+
+        mock_get_by_filters.return_value = vnf_instance_objs
         mock_list_namespaced_pod.return_value = client.V1PodList(
             items=[fakes.get_fake_pod_info(kind='Pod')])
         mock_check_pod_information.return_value = True
@@ -770,9 +780,11 @@ class TestConductorV2(db_base.SqlTestCase):
         with self.assertLogs(logger=log_name, level=logging.DEBUG) as cm:
             self.conductor._sync_db()
 
-        msg = (f'ERROR:{log_name}:Failed to synchronize database vnf: '
-               f'{vnf_instance_obj.id} Error: ')
-        self.assertIn(f'{msg}', cm.output[1])
+        output = '\n'.join(cm.output)
+        for vnf_instance_obj in vnf_instance_objs:
+            msg = (f'ERROR:{log_name}:Failed to synchronize database vnf: '
+                   f'{vnf_instance_obj.id} Error: ')
+            self.assertIn(msg, output)
 
     @mock.patch.object(file.FileLock, 'acquire')
     @mock.patch.object(kubernetes_driver.Kubernetes,
@@ -809,3 +821,118 @@ class TestConductorV2(db_base.SqlTestCase):
                f'so skip this DB synchronization. '
                f'vnf: {vnf_instance_obj.id}.')
         self.assertIn(f'{msg}', cm.output)
+
+    def _sync_db_insts(self, vim_ids):
+        insts = []
+        for vim_id in vim_ids:
+            inst = fakes.fake_vnf_instance()
+            inst.id = uuidutils.generate_uuid()
+            vim_info = fakes.fake_vim_connection_info()
+            vim_info.vimId = vim_id
+            inst.vimConnectionInfo = {'vim1': vim_info}
+            insts.append(inst)
+        return insts
+
+    def test_group_insts_by_vim(self):
+        self.config_fixture.config(db_synchronization_workers_per_vim=2)
+        insts = self._sync_db_insts(['vim-a'] * 5 + ['vim-b'])
+
+        groups = self.conductor._group_insts_by_vim(insts)
+
+        # vim-a: 2 groups of 3 and 2 instances, vim-b: 1 group.
+        self.assertEqual([insts[0:5:2], insts[1:5:2], [insts[5]]], groups)
+
+    @mock.patch.object(conductor_v2.ConductorV2, '_sync_db_inst')
+    @mock.patch.object(objects.base.TackerPersistentObject, "get_by_filter")
+    def test_sync_db_concurrent(self, mock_get_by_filter, mock_sync_inst):
+        self.config_fixture.config(db_synchronization_workers=3,
+                                   db_synchronization_workers_per_vim=2)
+        insts = self._sync_db_insts(['vim-a'] * 4 + ['vim-b'] * 4)
+        mock_get_by_filter.return_value = insts
+
+        log_name = "tacker.sol_refactored.conductor.conductor_v2"
+        with self.assertLogs(logger=log_name, level=logging.DEBUG) as cm:
+            self.conductor._sync_db()
+
+        self.assertEqual(sorted(inst.id for inst in insts),
+                         sorted(call.args[1].id
+                                for call in mock_sync_inst.call_args_list))
+        # contexts are not shared among threads.
+        self.assertEqual(4, len({id(call.args[0])
+                                 for call in mock_sync_inst.call_args_list}))
+        msg = (f'INFO:{log_name}:DB synchronization pass finished: '
+               '8 vnf instances in ')
+        self.assertTrue(any(out.startswith(msg) for out in cm.output))
+        for inst in insts:
+            msg = (f'DEBUG:{log_name}:DB synchronization of vnf {inst.id} '
+                   'took ')
+            self.assertTrue(any(out.startswith(msg) for out in cm.output))
+
+    @mock.patch.object(coordination.COORDINATOR, 'start')
+    @mock.patch.object(conductor_v2.ConductorV2, '_get_own_instances')
+    @mock.patch.object(conductor_v2.ConductorV2, '_sync_db_inst')
+    @mock.patch.object(objects.base.TackerPersistentObject, "get_by_filter")
+    def test_sync_db_sharding(self, mock_get_by_filter, mock_sync_inst,
+                              mock_get_own_insts, mock_coord_start):
+        insts = self._sync_db_insts(['vim-a'] * 2)
+        mock_get_by_filter.return_value = insts
+        mock_get_own_insts.return_value = insts[:1]
+
+        # coordination is not used without sharding.
+        self.conductor._sync_db()
+        mock_coord_start.assert_not_called()
+        mock_get_own_insts.assert_not_called()
+        self.assertEqual(2, mock_sync_inst.call_count)
+
+        mock_sync_inst.reset_mock()
+        self.config_fixture.config(db_synchronization_sharding=True)
+        self.conductor._sync_db()
+        mock_coord_start.assert_called_once()
+        mock_get_own_insts.assert_called_once_with(insts)
+        mock_sync_inst.assert_called_once()
+
+    @mock.patch.object(coordination.COORDINATOR, 'coordinator')
+    def test_get_own_instances(self, mock_coordinator):
+        insts = self._sync_db_insts(['vim-a'] * 20)
+        member_id = coordination.COORDINATOR.member_id
+        mock_coordinator.create_group.return_value.get.side_effect = (
+            tooz_coordination.GroupAlreadyExist(conductor_v2.DB_SYNC_GROUP))
+        mock_coordinator.get_members.return_value.get.return_value = {
+            member_id, b'tacker-other-conductor'}
+
+        own_insts = self.conductor._get_own_instances(insts)
+
+        mock_coordinator.join_group.assert_called_once_with(
+            conductor_v2.DB_SYNC_GROUP)
+        self.assertLess(0, len(own_insts))
+        self.assertGreater(len(insts), len(own_insts))
+
+        # the other conductor gets the rest of instances.
+        with mock.patch.object(coordination.COORDINATOR, 'agent_id',
+                               'other-conductor'):
+            other_insts = self.conductor._get_own_instances(insts)
+        self.assertEqual(sorted(inst.id for inst in insts),
+                         sorted(inst.id for inst in own_insts + other_insts))
+
+        # all instances are assigned to the only member.
+        mock_coordinator.get_members.return_value.get.return_value = {
+            member_id}
+        self.assertEqual(insts, self.conductor._get_own_instances(insts))
+
+    @mock.patch.object(coordination.COORDINATOR, 'coordinator')
+    def test_get_own_instances_not_supported(self, mock_coordinator):
+        insts = self._sync_db_insts(['vim-a'] * 3)
+        mock_coordinator.create_group.side_effect = NotImplementedError
+
+        self.assertEqual(insts, self.conductor._get_own_instances(insts))
+
+    @mock.patch.object(fm_subsc_utils, 'reload_subsc_index')
+    @mock.patch.object(subsc_utils, 'reload_subsc_index')
+    def test_reload_subsc_index(self, mock_lccn_reload, mock_fm_reload):
+        self.conductor.reload_subsc_index(
+            self.context, 'LccnSubscriptionV2', 'subsc-1')
+        mock_lccn_reload.assert_called_once_with(self.context, 'subsc-1')
+
+        self.conductor.reload_subsc_index(
+            self.context, 'FmSubscriptionV1', 'subsc-2')
+        mock_fm_reload.assert_called_once_with(self.context, 'subsc-2')
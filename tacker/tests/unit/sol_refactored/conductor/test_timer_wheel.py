@@ -0,0 +1,122 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import threading
+import time
+from unittest import mock
+
+from tacker.common import stats
+from tacker.sol_refactored.conductor import timer_wheel
+from tacker.tests.unit import base
+
+
+class TestTimerWheel(base.TestCase):
+
+    def test_schedule(self):
+        wheel = timer_wheel.TimerWheel(tick=0.01)
+        fired = threading.Event()
+        result = []
+
+        def _expired(arg):
+            result.append((arg, time.monotonic()))
+            fired.set()
+
+        start = time.monotonic()
+        wheel.schedule(0.1, _expired, 'arg')
+        self.assertEqual(1, wheel.get_stats()['pending'])
+
+        self.assertTrue(fired.wait(10))
+        self.assertEqual('arg', result[0][0])
+        self.assertGreaterEqual(result[0][1] - start, 0.1)
+        stats = wheel.get_stats()
+        self.assertEqual(0, stats['pending'])
+        self.assertEqual(1, stats['expired'])
+        self.assertGreaterEqual(stats['expiry_lag_max'],
+                                stats['expiry_lag_last'])
+
+    def test_cancel(self):
+        wheel = timer_wheel.TimerWheel(tick=0.01)
+        fired = threading.Event()
+        callback = mock.Mock()
+
+        handle = wheel.schedule(0.05, callback)
+        handle.cancel()
+        # cancel again is ignored.
+        handle.cancel()
+        wheel.schedule(0.1, fired.set)
+
+        self.assertTrue(fired.wait(10))
+        callback.assert_not_called()
+        self.assertEqual(0, wheel.get_stats()['pending'])
+
+    def test_many_timers_one_thread(self):
+        wheel = timer_wheel.TimerWheel(tick=0.01, max_workers=2)
+        done = threading.Semaphore(0)
+        num_threads = threading.active_count()
+
+        for i in range(1000):
+            wheel.schedule(0.05 + (i % 10) * 0.01, done.release)
+        # a scheduler thread only. the workers are started on demand.
+        self.assertLessEqual(threading.active_count(), num_threads + 3)
+
+        for _ in range(1000):
+            self.assertTrue(done.acquire(timeout=10))
+        self.assertEqual(1000, wheel.get_stats()['expired'])
+
+    def test_callback_error(self):
+        wheel = timer_wheel.TimerWheel(tick=0.01)
+        fired = threading.Event()
+
+        wheel.schedule(0.01, mock.Mock(side_effect=Exception('error')))
+        wheel.schedule(0.05, fired.set)
+
+        self.assertTrue(fired.wait(10))
+
+    @mock.patch.object(timer_wheel, 'WHEEL_SLOTS', 4)
+    @mock.patch.object(timer_wheel, 'WHEEL_LEVELS', 3)
+    def test_cascade(self):
+        # the wheels cover 64 ticks. beyond that is placed again later.
+        wheel = timer_wheel.TimerWheel(tick=1)
+        wheel.current_tick = 5
+        handles = []
+        for expire_tick in range(6, 206):
+            handle = timer_wheel.TimerHandle(wheel, None, expire_tick,
+                                             None, ())
+            wheel._place(handle)
+            handles.append(handle)
+        wheel.pending = len(handles)
+        handles[10].cancel()
+
+        for tick in range(6, 206):
+            expired = wheel._advance()
+            expected = ([] if tick == 16 else [tick])
+            self.assertEqual(expected,
+                             [handle.expire_tick for handle in expired])
+        self.assertEqual(0, wheel.pending)
+
+    def test_get_timer_wheel_stats(self):
+        self.addCleanup(setattr, timer_wheel, '_timer_wheel',
+                        timer_wheel._timer_wheel)
+        timer_wheel._timer_wheel = None
+
+        # not created just to report it.
+        self.assertIsNone(stats.get_all()['v2_timer_wheel'])
+        self.assertIsNone(timer_wheel._timer_wheel)
+
+        wheel = timer_wheel.TimerWheel(tick=0.01)
+        timer_wheel._timer_wheel = wheel
+        wheel.schedule(10, mock.Mock()).cancel()
+        self.assertEqual(wheel.get_stats(),
+                         stats.get_all()['v2_timer_wheel'])
@@ -34,13 +34,12 @@ class TestVnfPmDriverV2(base.BaseTestCase):
         self.context = context.get_admin_context()
 
     @mock.patch.object(NfvoClient, 'send_pm_job_notification')
-    @mock.patch.object(pm_job_utils, 'update_report')
-    @mock.patch.object(objects.base.TackerPersistentObject, 'update')
+    @mock.patch.object(pm_job_utils, 'delete_expired_reports')
+    @mock.patch.object(pm_job_utils, 'get_pm_job')
     @mock.patch.object(objects.base.TackerPersistentObject, 'create')
-    def test_store_job_info(self, mock_create, mock_update, mock_update_report,
-                            mock_send):
+    def test_store_job_info(self, mock_create, mock_get_pm_job,
+                            mock_delete_expired, mock_send):
         mock_create.return_value = None
-        mock_update.return_value = None
         pm_job1 = objects.PmJobV2(
             id='pm_job_id1',
             objectTtype='VNF',
@@ -65,7 +64,7 @@ class TestVnfPmDriverV2(base.BaseTestCase):
             ),
             callbackUri='http://127.0.0.1/callback2'
         )
-        mock_update_report.side_effect = [pm_job1, pm_job2]
+        mock_get_pm_job.side_effect = [pm_job1, pm_job2]
         mock_send.return_value = None
         report1 = {
             'id': 'fake_id1',
@@ -74,6 +73,7 @@ class TestVnfPmDriverV2(base.BaseTestCase):
                 'objectType': 'VNF',
                 'objectInstanceId': 'instance_id1',
                 'subObjectInstanceId': 'subObjectInstanceId1',
+                'performanceMetric': 'VCpuUsageMeanVnf.instance_id1',
                 'performanceValues': [{
                     'timeStamp': '2022-06-21T23:47:36.453Z',
                     'value': '99.0'
@@ -87,6 +87,7 @@ class TestVnfPmDriverV2(base.BaseTestCase):
                 'objectType': 'VNF',
                 'objectInstanceId': 'instance_id2',
                 'subObjectInstanceId': 'subObjectInstanceId2',
+                'performanceMetric': 'VCpuUsageMeanVnf.instance_id2',
                 'performanceValues': [{
                     'timeStamp': '2022-06-21T23:47:36.453Z',
                     'value': '99.0'
@@ -95,9 +96,10 @@ class TestVnfPmDriverV2(base.BaseTestCase):
         }
         reports = [report1, report2]
         VnfPmDriverV2().store_job_info(context=self.context, reports=reports)
-        call1 = mock.call(mock.ANY, 'pm_job_id1', mock.ANY, mock.ANY, mock.ANY)
-        call2 = mock.call(mock.ANY, 'pm_job_id2', mock.ANY, mock.ANY, mock.ANY)
-        mock_update_report.assert_has_calls([call1, call2])
+        call1 = mock.call(mock.ANY, 'pm_job_id1')
+        call2 = mock.call(mock.ANY, 'pm_job_id2')
+        mock_get_pm_job.assert_has_calls([call1, call2])
+        mock_delete_expired.assert_has_calls([call1, call2])
         call1 = mock.call(mock.ANY, pm_job1, mock.ANY, mock.ANY)
         call2 = mock.call(mock.ANY, pm_job2, mock.ANY, mock.ANY)
         mock_send.assert_has_calls([call1, call2])
@@ -146,34 +148,18 @@ class TestVnfPmDriverV2(base.BaseTestCase):
                 "objectType": "VNF",
                 "objectInstanceId": "instance_id_1",
                 "subObjectInstanceId": "subObjectInstanceId_1",
+                "performanceMetric": "VCpuUsageMeanVnf.instance_id_1",
                 'performanceValues': [{
                     'timeStamp': "2022-06-21T23:47:36.453Z",
                     'value': "99.0"
+                }, {
+                    'timeStamp': "2022-06-21T23:48:36.453Z",
+                    'value': "98.0"
                 }]
             }]
         }
         result = VnfPmDriverV2()._store_report(context=self.context,
                                                report=report)
         self.assertEqual('fake_job_id', result.jobId)
-
-    @mock.patch.object(objects.base.TackerPersistentObject, 'update')
-    @mock.patch.object(pm_job_utils, 'update_report')
-    def test_update_job_reports(self, mock_update_report, mock_update):
-        pm_job = objects.PmJobV2(
-            id='pm_job_1',
-            objectTtype='VNF',
-            authentication=objects.SubscriptionAuthentication(
-                authType=["BASIC"],
-                paramsBasic=objects.SubscriptionAuthentication_ParamsBasic(
-                    userName='test',
-                    password='test'
-                ),
-            ),
-            callbackUri='http://127.0.0.1/callback'
-        )
-        mock_update_report.return_value = pm_job
-        mock_update.return_value = None
-        result = VnfPmDriverV2()._update_job_reports(
-            context=self.context, job_id='pm_job_1', report='report',
-            timestamp='timestamp', endpoint='endpoint')
-        self.assertEqual('pm_job_1', result.id)
+        # the report and an entry per performance value are created.
+        self.assertEqual(3, mock_create.call_count)
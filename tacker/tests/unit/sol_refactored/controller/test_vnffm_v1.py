@@ -25,6 +25,7 @@ from tacker.sol_refactored.common import fm_alarm_utils as alarm_utils
 from tacker.sol_refactored.common import fm_subscription_utils\
     as fm_subsc_utils
 from tacker.sol_refactored.common import subscription_utils as subsc_utils
+from tacker.sol_refactored.conductor import conductor_rpc_v2
 from tacker.sol_refactored.controller import vnffm_v1
 from tacker.sol_refactored import objects
 from tacker.tests import base
@@ -119,9 +120,11 @@ class TestVnffmV1(base.BaseTestCase):
         self.assertRaises(sol_ex.AckStateInvalid, self.controller.update,
                           request=self.request, id=SAMPLE_ALARM_ID, body=body)
 
+    @mock.patch.object(conductor_rpc_v2.VnfLcmRpcApiV2,
+                       'reload_subsc_index')
     @mock.patch.object(objects.base.TackerPersistentObject, 'create')
     @mock.patch.object(subsc_utils, 'test_notification')
-    def test_subscription_create(self, mock_test, mock_create):
+    def test_subscription_create(self, mock_test, mock_create, mock_reload):
         sample_cert = utils.test_sample(
             "unit/sol_refactored/samples/sample_cert",
             "notification_client_cert.pem")
@@ -278,11 +281,17 @@ class TestVnffmV1(base.BaseTestCase):
             request=self.request, id=SAMPLE_SUBSC_ID)
         self.assertEqual(200, result.status)
 
+    @mock.patch.object(conductor_rpc_v2.VnfLcmRpcApiV2,
+                       'reload_subsc_index')
     @mock.patch.object(fm_subsc_utils, 'get_subsc')
     @mock.patch.object(objects.base.TackerPersistentObject, 'delete')
-    def test_subscription_delete(self, mock_delete, mock_subsc):
+    def test_subscription_delete(self, mock_delete, mock_subsc,
+                                 mock_reload):
         mock_subsc.return_value = objects.FmSubscriptionV1.from_dict(
             fakes_for_fm.fm_subsc_example)
         result = self.controller.subscription_delete(
             request=self.request, id=SAMPLE_SUBSC_ID)
         self.assertEqual(204, result.status)
+        mock_reload.assert_called_once_with(
+            self.context, 'FmSubscriptionV1',
+            fakes_for_fm.fm_subsc_example['id'])
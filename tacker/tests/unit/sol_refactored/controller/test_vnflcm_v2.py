@@ -13,6 +13,7 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 import copy
+import datetime
 import ddt
 from http import client as http_client
 import requests
@@ -30,6 +31,7 @@ from tacker.sol_refactored.api.policies.vnflcm_v2 import POLICY_NAME
 from tacker.sol_refactored.common import config
 from tacker.sol_refactored.common import exceptions as sol_ex
 from tacker.sol_refactored.common import lcm_op_occ_utils as lcmocc_utils
+from tacker.sol_refactored.common import lcm_profiler
 from tacker.sol_refactored.common import subscription_utils as subsc_utils
 from tacker.sol_refactored.common import vim_utils
 from tacker.sol_refactored.common import vnf_instance_utils as inst_utils
@@ -1272,8 +1274,10 @@ class TestVnflcmV2(db_base.SqlTestCase):
         self.assertEqual("paramsOauth2ClientCert must be specified.",
                          ex.detail)
 
+    @mock.patch.object(conductor_rpc_v2.VnfLcmRpcApiV2,
+                       'reload_subsc_index')
     @mock.patch.object(subsc_utils, 'test_notification')
-    def test_subscription_create_201(self, mock_test):
+    def test_subscription_create_201(self, mock_test, mock_reload):
         sample_cert = utils.test_sample(
             "unit/sol_refactored/samples/sample_cert",
             "notification_client_cert.pem")
@@ -1393,12 +1397,16 @@ class TestVnflcmV2(db_base.SqlTestCase):
             request=self.request, id='subsc-1')
         self.assertEqual(200, result.status)
 
+    @mock.patch.object(conductor_rpc_v2.VnfLcmRpcApiV2,
+                       'reload_subsc_index')
     @mock.patch.object(subsc_utils, 'get_subsc')
-    def test_subscription_delete(self, mock_subsc):
+    def test_subscription_delete(self, mock_subsc, mock_reload):
         mock_subsc.return_value = objects.LccnSubscriptionV2(id='subsc-1')
         result = self.controller.subscription_delete(
             request=self.request, id='subsc-1')
         self.assertEqual(204, result.status)
+        mock_reload.assert_called_once_with(
+            self.context, 'LccnSubscriptionV2', 'subsc-1')
 
     def test_lcm_op_occ_list(self):
         request = requests.Request()
@@ -1581,6 +1589,55 @@ class TestVnflcmV2(db_base.SqlTestCase):
             request=self.request,
             id=lcmocc_id)
 
+    def _create_lcm_op_profile(self, lcmocc_id, action, start_time):
+        objects.LcmOpProfileV2(
+            id=uuidutils.generate_uuid(),
+            lcmOpOccId=lcmocc_id,
+            vnfInstanceId='inst-1',
+            operation='SCALE',
+            action=action,
+            operationState='COMPLETED',
+            startTime=start_time,
+            duration=10.0,
+            phases=[objects.LcmOpProfileV2_Phases(
+                name='process', start=1.0, duration=8.0)]
+        ).create(self.context)
+
+    def test_lcm_op_occ_profile(self):
+        _, lcmocc_id = self._create_inst_and_lcmocc(
+            'INSTANTIATED', fields.LcmOperationStateType.COMPLETED)
+        now = timeutils.utcnow()
+        self._create_lcm_op_profile(lcmocc_id, 'RETRY', now)
+        self._create_lcm_op_profile(lcmocc_id, 'START',
+                                    now - datetime.timedelta(seconds=60))
+        self._create_lcm_op_profile('lcmocc-other', 'START', now)
+
+        result = self.controller.lcm_op_occ_profile(
+            request=self.request, id=lcmocc_id)
+        self.assertEqual(200, result.status)
+        self.assertEqual(['START', 'RETRY'],
+                         [item['action'] for item in result.body])
+        self.assertEqual([{'name': 'process', 'start': 1.0,
+                           'duration': 8.0}], result.body[0]['phases'])
+
+        self.assertRaises(
+            sol_ex.VnfLcmOpOccNotFound, self.controller.lcm_op_occ_profile,
+            request=self.request, id='lcmocc-not-exist')
+
+    def test_lcm_op_profile_metrics(self):
+        lcm_profiler._store_metrics(
+            self.context, 'SCALE', 10.0,
+            [objects.LcmOpProfileV2_Phases(name='process', start=1.0,
+                                           duration=8.0)])
+
+        result = self.controller.lcm_op_profile_metrics(request=self.request)
+        self.assertEqual(200, result.status)
+        self.assertEqual('text/plain', result.headers['content_type'])
+        self.assertIn(b'tacker_lcm_op_phase_duration_seconds_count'
+                      b'{operation="SCALE",phase="process"} 1', result.body)
+        self.assertIsNone(
+            self.controller.supported_api_versions('lcm_op_profile_metrics'))
+
     def _prepare_db_for_fail(self):
         inst, lcmocc = self._set_inst_and_lcmocc('NOT_INSTANTIATED',
             fields.LcmOperationStateType.FAILED_TEMP)
@@ -2505,13 +2562,52 @@ class TestVnflcmV2EnhancedPolicy(TestVnflcmV2):
     def test_index_enhanced_policy(self, vnf_instance_list,
             rules, roles, expected_vnf_inst_ids):
         self._overwrite_policy(rules)
-        self.controller._inst_view.get_dict_all = mock.Mock(
-            return_value=vnf_instance_list)
         request = self._fake_request(roles)
         request.GET = {}
 
-        result = self.controller.index(request)
+        with mock.patch.object(objects.VnfInstanceV2, 'get_dict_all',
+                               return_value=vnf_instance_list):
+            result = self.controller.index(request)
         self.assertEqual(200, result.status)
         result = result.body
         self.assertEqual(
             expected_vnf_inst_ids, [inst.get('id') for inst in result])
+
+    def test_index_enhanced_policy_paging(self):
+        self.controller._inst_view.page_size = 2
+        inst_ids = sorted(uuidutils.generate_uuid() for _ in range(7))
+        vendors = ['provider_B', 'provider_A', 'provider_B', 'provider_B',
+                   'provider_A', 'provider_B', 'provider_A']
+        for inst_id, vendor in zip(inst_ids, vendors):
+            inst, _ = self._set_inst_and_lcmocc(
+                'NOT_INSTANTIATED', fields.LcmOperationStateType.COMPLETED,
+                vnf_inst_updates={'id': inst_id, 'vnfProvider': vendor})
+            inst.create(self.context)
+        self._overwrite_policy(
+            {POLICY_NAME.format('index'): "vendor:%(vendor)s"})
+        url = 'http://127.0.0.1:9890/vnflcm/v2/vnf_instances'
+
+        # first page
+        request = self._fake_request(['VENDOR_provider_A'])
+        request.GET = {}
+        request.url = url
+        with mock.patch.object(policy, 'authorize',
+                               wraps=policy.authorize) as mock_authorize:
+            result = self.controller.index(request)
+        self.assertEqual(200, result.status)
+        self.assertEqual([inst_ids[1], inst_ids[4]],
+                         [inst['id'] for inst in result.body])
+        self.assertEqual(
+            f'<{url}?nextpage_opaque_marker={inst_ids[4]}>;rel="next"',
+            result.headers['link'])
+        # the rules are evaluated once per distinct target.
+        self.assertEqual(2, mock_authorize.call_count)
+
+        # second page
+        request.GET = {'nextpage_opaque_marker': inst_ids[4]}
+        request.url = f'{url}?nextpage_opaque_marker={inst_ids[4]}'
+        result = self.controller.index(request)
+        self.assertEqual(200, result.status)
+        self.assertEqual([inst_ids[6]],
+                         [inst['id'] for inst in result.body])
+        self.assertNotIn('link', result.headers)
@@ -168,6 +168,48 @@ class TestEnhanceAttributeSelector(base.BaseTestCase):
                          'ccc': {'bar': 5}})
 
 
+class TestEnhanceViewBuilder(base.BaseTestCase):
+
+    def _builder(self, page_size):
+        builder = vnflcm_view.InstanceViewBuilder('endpoint', page_size)
+        builder.obj_cls = mock.Mock()
+        return builder
+
+    def test_get_dict_all_stream(self):
+        values = [{'id': f'inst-{i}', 'vnfdId': 'vnfd',
+                   'instantiationState': 'NOT_INSTANTIATED'}
+                  for i in range(3)]
+        attrs = {'id', 'vnfdId', 'instantiationState'}
+        selector = vnflcm_view.EnhanceAttributeSelector(attrs, attrs, set())
+
+        # no paging. values are read and returned lazily.
+        builder = self._builder(0)
+        builder.obj_cls.get_dict_all.return_value = iter(values)
+        pager = vnflcm_view.Pager(None, 'url', 0)
+        filters = builder.parse_filter('(eq,vnfdId,vnfd)')
+        insts = builder.get_dict_all(mock.Mock(), filters, selector, pager)
+        builder.obj_cls.get_dict_all.assert_called_once_with(
+            mock.ANY, attrs, [('eq', 'vnfdId', 'vnfd')], None,
+            stream=True)
+        result = builder.detail_dict_list(insts, filters, selector, pager)
+        self.assertNotIsInstance(result, list)
+        self.assertEqual(['inst-0', 'inst-1', 'inst-2'],
+                         [inst['id'] for inst in result])
+        self.assertIsNone(pager.next_marker)
+
+        # paging
+        builder = self._builder(2)
+        builder.obj_cls.get_dict_all.return_value = values
+        pager = vnflcm_view.Pager(None, 'url', 2)
+        insts = builder.get_dict_all(mock.Mock(), [], selector, pager)
+        builder.obj_cls.get_dict_all.assert_called_once_with(
+            mock.ANY, attrs, [], 3, stream=False)
+        result = builder.detail_dict_list(insts, [], selector, pager)
+        self.assertEqual(['inst-0', 'inst-1'],
+                         [inst['id'] for inst in result])
+        self.assertEqual('inst-1', pager.next_marker)
+
+
 class TestBaseViewBuilder(base.BaseTestCase):
 
     def test_parse_filter(self):
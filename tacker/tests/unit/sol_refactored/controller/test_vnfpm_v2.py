@@ -30,6 +30,7 @@ from tacker.sol_refactored.controller import vnfpm_v2
 from tacker.sol_refactored.controller import vnfpm_view
 from tacker.sol_refactored.controller.vnfpm_view import PmJobViewBuilder
 from tacker.sol_refactored import objects
+from tacker.sol_refactored.objects.v2 import pm_report
 from tacker.tests import base
 
 CONF = config.CONF
@@ -286,6 +287,7 @@ class TestVnfpmV2(base.BaseTestCase):
         result = self.controller.create(request=self.request, body=body)
         self.assertEqual(201, result.status)
 
+    @mock.patch.object(pm_job_utils, 'set_pm_job_reports')
     @mock.patch.object(Pager, 'get_link')
     @mock.patch.object(BaseViewBuilder, 'detail_list')
     @mock.patch.object(objects.base.TackerPersistentObject, 'get_all')
@@ -296,7 +298,8 @@ class TestVnfpmV2(base.BaseTestCase):
                    mock_parse_pager,
                    mock_pm,
                    mock_detail_list,
-                   mock_get_link):
+                   mock_get_link,
+                   mock_set_reports):
         mock_parse_selector.return_value = 'selector'
         mock_parse_filter.return_value = 'filter'
 
@@ -317,8 +320,9 @@ class TestVnfpmV2(base.BaseTestCase):
         result = self.controller.index(self.request)
         self.assertEqual(200, result.status)
 
+    @mock.patch.object(pm_job_utils, 'set_pm_job_reports')
     @mock.patch.object(objects.base.TackerPersistentObject, 'get_by_id')
-    def test_show(self, mock_pm):
+    def test_show(self, mock_pm, mock_set_reports):
         mock_pm.return_value = objects.PmJobV2(
             id='pm_job_1',
             objectInstanceIds=["id_1"],
@@ -367,15 +371,13 @@ class TestVnfpmV2(base.BaseTestCase):
                                         body=body)
         self.assertEqual({}, result.body)
 
-    @mock.patch.object(objects.base.TackerPersistentObject, 'get_by_filter')
+    @mock.patch.object(pm_report.PerformanceReportEntryV2, 'delete_reports')
     @mock.patch.object(objects.base.TackerPersistentObject, 'get_by_id')
-    def test_delete(self, mock_pm, mock_report):
+    def test_delete(self, mock_pm, mock_delete_reports):
         mock_pm.return_value = objects.PmJobV2(id='pm_job_1')
-        mock_report.return_value = [objects.PerformanceReportV2(
-            id='report_id',
-            jobId='pm_job_1')]
         result = self.controller.delete(self.request, 'pm_job_1')
         self.assertEqual(204, result.status)
+        mock_delete_reports.assert_called_once_with(mock.ANY, 'pm_job_1')
 
     @mock.patch.object(PmJobViewBuilder, 'report_detail')
     @mock.patch.object(pm_job_utils, 'get_pm_report')
@@ -0,0 +1,145 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import os
+from unittest import mock
+
+from tacker.sol_refactored.common import oidc_utils
+from tacker.sol_refactored.infra_drivers.kubernetes import kubernetes_utils
+from tacker.sol_refactored import objects
+from tacker.tests.unit import base
+
+
+_ca_cert = ("-----BEGIN CERTIFICATE----- MIIC -----END CERTIFICATE-----")
+
+
+def _vim_info(vim_id='vim-1', endpoint='https://127.0.0.1:6443',
+              token='token-1', **access_info):
+    access_info.setdefault('bearer_token', token)
+    return objects.VimConnectionInfo.from_dict({
+        'vimId': vim_id,
+        'vimType': 'kubernetes',
+        'interfaceInfo': {'endpoint': endpoint, 'ssl_ca_cert': _ca_cert},
+        'accessInfo': access_info
+    })
+
+
+class TestAuthContextManager(base.TestCase):
+
+    def setUp(self):
+        super(TestAuthContextManager, self).setUp()
+        objects.register_all()
+        self.cache = kubernetes_utils.K8sApiClientCache()
+        mock.patch.object(kubernetes_utils, '_api_client_cache',
+                          self.cache).start()
+        self.addCleanup(mock.patch.stopall)
+        self.addCleanup(self.cache.clear)
+
+    def _get_api_client(self, vim_info):
+        with kubernetes_utils.AuthContextManager(vim_info) as acm:
+            api_client = acm.init_k8s_api_client()
+            ca_cert_file = acm.ca_cert_file
+            self.assertTrue(os.path.exists(ca_cert_file))
+        return api_client, ca_cert_file
+
+    def test_init_k8s_api_client_cached(self):
+        api_client_1, ca_cert_file = self._get_api_client(_vim_info())
+        api_client_2, _ = self._get_api_client(_vim_info())
+
+        self.assertIs(api_client_1, api_client_2)
+        # the ca cert file is kept for the following operations.
+        self.assertTrue(os.path.exists(ca_cert_file))
+        self.assertEqual('https://127.0.0.1:6443',
+                         api_client_1.configuration.host)
+        self.assertEqual('token-1',
+                         api_client_1.configuration.api_key['authorization'])
+        self.assertEqual(ca_cert_file,
+                         api_client_1.configuration.ssl_ca_cert)
+
+    def test_init_k8s_api_client_per_connection(self):
+        api_client_1, _ = self._get_api_client(_vim_info())
+        api_client_2, _ = self._get_api_client(
+            _vim_info(vim_id='vim-2', endpoint='https://127.0.0.2:6443'))
+
+        self.assertIsNot(api_client_1, api_client_2)
+        self.assertEqual(2, len(self.cache.entries))
+
+    def test_init_k8s_api_client_vim_changed(self):
+        api_client_1, ca_cert_file = self._get_api_client(_vim_info())
+        api_client_2, _ = self._get_api_client(_vim_info(token='token-2'))
+
+        # the entry of the old vimConnectionInfo is invalidated.
+        self.assertIsNot(api_client_1, api_client_2)
+        self.assertEqual(1, len(self.cache.entries))
+        self.assertFalse(os.path.exists(ca_cert_file))
+        self.assertEqual('token-2',
+                         api_client_2.configuration.api_key['authorization'])
+
+    def test_init_k8s_api_client_vim_changed_in_use(self):
+        with kubernetes_utils.AuthContextManager(_vim_info()) as acm:
+            acm.init_k8s_api_client()
+            ca_cert_file = acm.ca_cert_file
+            self._get_api_client(_vim_info(token='token-2'))
+            # not removed while in use.
+            self.assertTrue(os.path.exists(ca_cert_file))
+        self.assertFalse(os.path.exists(ca_cert_file))
+        self.assertEqual(1, len(self.cache.entries))
+
+    def test_init_k8s_api_client_idle_timeout(self):
+        _, ca_cert_file = self._get_api_client(_vim_info())
+        self.assertEqual(1, len(self.cache.entries))
+
+        self.config_fixture.config(group='v2_vnfm',
+            kubernetes_api_client_idle_timeout=1)
+        entry = list(self.cache.entries.values())[0]
+        entry.last_used -= 2
+        self._get_api_client(
+            _vim_info(vim_id='vim-2', endpoint='https://127.0.0.2:6443'))
+
+        self.assertEqual(1, len(self.cache.entries))
+        self.assertFalse(os.path.exists(ca_cert_file))
+
+    @mock.patch.object(oidc_utils, 'get_id_token_with_password_grant')
+    def test_init_k8s_api_client_oidc(self, mock_get_token):
+        mock_get_token.side_effect = ['id-token-1', 'id-token-2']
+        vim_info = _vim_info(bearer_token=None,
+                             oidc_token_url='https://oidc/token',
+                             username='user', password='pass',
+                             client_id='tacker')
+
+        api_client_1, ca_cert_file = self._get_api_client(vim_info)
+        self.assertEqual('Bearer id-token-1',
+                         api_client_1.configuration.get_api_key_with_prefix(
+                             'authorization'))
+        api_client_2, _ = self._get_api_client(vim_info)
+
+        # a token is obtained for each operation.
+        self.assertIs(api_client_1, api_client_2)
+        self.assertEqual('Bearer id-token-2',
+                         api_client_2.configuration.get_api_key_with_prefix(
+                             'authorization'))
+        self.assertEqual(ca_cert_file,
+                         mock_get_token.call_args[1]['ssl_ca_cert'])
+
+    def test_init_k8s_api_client_no_cache(self):
+        self.config_fixture.config(group='v2_vnfm',
+            kubernetes_api_client_idle_timeout=0)
+
+        api_client_1, ca_cert_file = self._get_api_client(_vim_info())
+        api_client_2, _ = self._get_api_client(_vim_info())
+
+        self.assertIsNot(api_client_1, api_client_2)
+        self.assertFalse(os.path.exists(ca_cert_file))
+        self.assertEqual({}, self.cache.entries)
@@ -0,0 +1,166 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import contextlib
+import threading
+import time
+from unittest import mock
+
+from kubernetes import client
+from kubernetes import watch
+
+from tacker.sol_refactored.common import exceptions as sol_ex
+from tacker.sol_refactored.infra_drivers.kubernetes import kubernetes_common
+from tacker.sol_refactored.infra_drivers.kubernetes import kubernetes_watch
+from tacker.tests.unit import base
+
+
+def _pod_event(resource_version):
+    return {'type': 'MODIFIED',
+            'object': mock.Mock(metadata=mock.Mock(
+                resource_version=resource_version))}
+
+
+class TestPodWatcher(base.TestCase):
+
+    def setUp(self):
+        super(TestPodWatcher, self).setUp()
+        self.k8s_api_client = mock.Mock()
+
+    def _wait_for(self, cond):
+        for _ in range(50):
+            if cond():
+                return
+            time.sleep(0.1)
+        self.fail('condition not satisfied')
+
+    @mock.patch.object(watch.Watch, 'stream')
+    @mock.patch.object(client.CoreV1Api, 'list_namespaced_pod')
+    def test_watch_pods(self, mock_list, mock_stream):
+        mock_list.return_value = mock.Mock(
+            metadata=mock.Mock(resource_version='1'))
+        go = threading.Event()
+
+        def _stream(*args, **kwargs):
+            go.wait()
+            yield _pod_event('2')
+            go.clear()
+            go.wait()
+        mock_stream.side_effect = _stream
+
+        targets = {(self.k8s_api_client, 'default')}
+        with kubernetes_watch.watch_pods(targets) as (event, is_active):
+            self._wait_for(is_active)
+            event.clear()
+            go.set()
+            self.assertTrue(event.wait(5))
+
+            # shared by the waits of the same namespace.
+            with kubernetes_watch.watch_pods(targets) as (event_2, _):
+                self.assertEqual(1, len(kubernetes_watch._watchers))
+            self.assertEqual(1, len(kubernetes_watch._watchers))
+            go.set()
+
+        self.assertEqual({}, kubernetes_watch._watchers)
+        self.assertEqual('1', mock_stream.call_args_list[0][1][
+            'resource_version'])
+
+    @mock.patch.object(kubernetes_watch, 'WATCH_RETRY_INTERVAL_MIN', 0.01)
+    @mock.patch.object(client.CoreV1Api, 'list_namespaced_pod')
+    def test_watch_pods_failed(self, mock_list):
+        slept = threading.Event()
+
+        def _list(*args, **kwargs):
+            if mock_list.call_count > 1:
+                slept.set()
+            raise client.ApiException(status=403)
+        mock_list.side_effect = _list
+
+        targets = {(self.k8s_api_client, 'default')}
+        with kubernetes_watch.watch_pods(targets) as (event, is_active):
+            self.assertTrue(slept.wait(5))
+            self.assertFalse(is_active())
+            self.assertTrue(event.is_set())
+
+    def test_watch_pods_no_targets(self):
+        with kubernetes_watch.watch_pods(set()) as (_, is_active):
+            self.assertFalse(is_active())
+
+
+class TestCheckStatus(base.TestCase):
+
+    def setUp(self):
+        super(TestCheckStatus, self).setUp()
+        self.driver = kubernetes_common.KubernetesCommon()
+        self.event = mock.Mock()
+        self.active = False
+
+        @contextlib.contextmanager
+        def _watch_pods(targets):
+            yield self.event, lambda: self.active
+        mock.patch.object(kubernetes_watch, 'watch_pods',
+                          _watch_pods).start()
+        self.addCleanup(mock.patch.stopall)
+
+    @mock.patch.object(kubernetes_common, 'POLL_INTERVAL_MIN', 0.01)
+    def test_check_status_polling_backoff(self):
+        check_func = mock.Mock(side_effect=[False, False, False, True])
+
+        self.driver._check_status(check_func, [], 'arg')
+
+        check_func.assert_called_with('arg')
+        self.assertEqual(4, check_func.call_count)
+        self.assertEqual([mock.call(0.01), mock.call(0.02),
+                          mock.call(0.04)],
+                         self.event.wait.call_args_list)
+
+    @mock.patch.object(kubernetes_common, 'POLL_INTERVAL_MIN', 0)
+    def test_check_status_watch(self):
+        self.active = True
+        check_func = mock.Mock(side_effect=[False, True])
+
+        self.driver._check_status(check_func, [])
+
+        self.assertEqual(2, check_func.call_count)
+        # woken up by the event. CHECK_INTERVAL is the upper limit.
+        self.event.wait.assert_called_once_with(
+            kubernetes_common.CHECK_INTERVAL)
+
+    def test_check_status_timeout(self):
+        self.config_fixture.config(group='v2_vnfm',
+                                   kubernetes_vim_rsc_wait_timeout=0)
+        check_func = mock.Mock(return_value=False)
+
+        self.assertRaises(sol_ex.K8sOperaitionTimeout,
+                          self.driver._check_status, check_func, [])
+        check_func.assert_called_once_with()
+
+    def test_get_watch_targets(self):
+        k8s_api_client = mock.Mock()
+        deployment = mock.Mock(
+            spec=kubernetes_common.kubernetes_resource.Deployment,
+            k8s_api_client=k8s_api_client, namespace='default')
+        namespace = mock.Mock(
+            spec=kubernetes_common.kubernetes_resource.Namespace,
+            k8s_api_client=k8s_api_client, namespace=None)
+
+        self.assertEqual({(k8s_api_client, 'default')},
+                         self.driver._get_watch_targets(
+                             [deployment, namespace]))
+
+        self.config_fixture.config(group='v2_vnfm',
+                                   kubernetes_vim_rsc_watch=False)
+        self.assertEqual(set(),
+                         self.driver._get_watch_targets([deployment]))
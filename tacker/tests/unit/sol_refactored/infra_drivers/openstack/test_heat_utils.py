@@ -0,0 +1,272 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from unittest import mock
+
+import requests
+
+from tacker.common import stats
+from tacker.sol_refactored.common import http_client
+from tacker.sol_refactored.infra_drivers.openstack import heat_utils
+from tacker.sol_refactored import objects
+from tacker.tests.unit import base
+
+
+STACK_NAME = "vnf-test/6c1b1b9c-3c8c-4b5b-9c3b-0f4b3b7b6b2e"
+NESTED_STACK_NAME = "vnf-test-VDU1-abcdefghijkl/8f7c6b8e-7d5e-4a1c-b52a"
+
+_vim_connection_info_example = {
+    "vimId": "vim_id_1",
+    "vimType": "ETSINFV.OPENSTACK_KEYSTONE.V_3",
+    "interfaceInfo": {
+        "endpoint": "http://localhost/identity/v3"
+    },
+    "accessInfo": {
+        "username": "nfv_user",
+        "region": "RegionOne",
+        "password": "devstack",
+        "project": "nfv",
+        "projectDomain": "Default",
+        "userDomain": "Default"
+    }
+}
+
+
+def _stack_link(stack_name):
+    return {
+        "href": f"http://127.0.0.1/heat-api/v1/project/stacks/{stack_name}",
+        "rel": "stack"
+    }
+
+
+def _res(name, res_type, physical_id, stack_name=STACK_NAME, parent=None):
+    res = {
+        "resource_name": name,
+        "resource_type": res_type,
+        "physical_resource_id": physical_id,
+        "links": [_stack_link(stack_name)]
+    }
+    if parent:
+        res["parent_resource"] = parent
+    return res
+
+
+def _event(event_id, name, stack_name=STACK_NAME):
+    return {
+        "id": event_id,
+        "resource_name": name,
+        "links": [_stack_link(stack_name)]
+    }
+
+
+_heat_reses = [
+    _res("VDU1", "VDU1.yaml", "nested_id"),
+    _res("VDU1", "OS::Nova::Server", "server1",
+         stack_name=NESTED_STACK_NAME, parent="VDU1"),
+    _res("VDU1_CP1", "OS::Neutron::Port", "port1",
+         stack_name=NESTED_STACK_NAME, parent="VDU1"),
+    _res("VDU2", "OS::Nova::Server", "server2"),
+    _res("VDU2_CP1", "OS::Neutron::Port", "port2"),
+]
+
+
+class TestHeatUtils(base.TestCase):
+
+    def setUp(self):
+        super(TestHeatUtils, self).setUp()
+        objects.register_all()
+        vim_info = objects.VimConnectionInfo.from_dict(
+            _vim_connection_info_example)
+        self.heat_client = heat_utils.HeatClient(vim_info)
+        cache_patcher = mock.patch.object(
+            heat_utils, '_heat_resource_cache', heat_utils.HeatResourceCache())
+        cache_patcher.start()
+        self.addCleanup(cache_patcher.stop)
+
+    def test_inventory(self):
+        inventory = heat_utils.HeatResourceInventory(_heat_reses)
+
+        self.assertEqual(_heat_reses, inventory)
+        self.assertEqual(
+            ["server1", "server2"],
+            [res["physical_resource_id"]
+             for res in heat_utils.get_server_reses(inventory)])
+        self.assertEqual(
+            ["server1", "port1", "server2", "port2"],
+            [res["physical_resource_id"]
+             for res in heat_utils.get_reses_by_types(
+                 inventory, ["OS::Nova::Server", "OS::Neutron::Port"])])
+        self.assertEqual([], heat_utils.get_storage_reses(inventory))
+        self.assertEqual(
+            ["server1", "port1"],
+            [res["physical_resource_id"]
+             for res in inventory.get_children("VDU1")])
+        self.assertEqual(
+            ["nested_id", "server2", "port2"],
+            [res["physical_resource_id"]
+             for res in inventory.get_children(None)])
+
+        # the same results as the plain list
+        for res in _heat_reses:
+            self.assertEqual(
+                heat_utils.get_parent_resource(res, _heat_reses),
+                heat_utils.get_parent_resource(res, inventory))
+        self.assertIs(inventory, heat_utils.make_inventory(inventory))
+
+    @mock.patch.object(heat_utils.HeatClient, 'get_resource_info')
+    @mock.patch.object(heat_utils.HeatClient, 'get_events_after')
+    @mock.patch.object(heat_utils.HeatClient, 'list_resources')
+    @mock.patch.object(heat_utils.HeatClient, 'get_latest_event_id')
+    def test_get_resources_cache(self, mock_latest, mock_list, mock_events,
+                                 mock_res_info):
+        mock_latest.return_value = "event1"
+        mock_list.return_value = list(_heat_reses)
+
+        # miss
+        result = self.heat_client.get_resources(STACK_NAME)
+        self.assertIsInstance(result, heat_utils.HeatResourceInventory)
+        self.assertEqual(_heat_reses, result)
+        self.assertEqual(1, mock_list.call_count)
+
+        # hit
+        result = self.heat_client.get_resources(STACK_NAME)
+        self.assertEqual(_heat_reses, result)
+        self.assertEqual(1, mock_list.call_count)
+        mock_events.assert_not_called()
+
+        # incremental update
+        # - VDU1 server is replaced
+        # - VDU2_CP1 is deleted
+        # - VDU3 is added
+        mock_latest.return_value = "event2"
+        mock_events.return_value = [
+            _event("e1", "vnf-test"),
+            _event("e2", "VDU1", stack_name=NESTED_STACK_NAME),
+            _event("e3", "VDU2_CP1"),
+            _event("e4", "VDU3"),
+            _event("e5", "VDU1", stack_name=NESTED_STACK_NAME),
+            _event("e6", "vnf-test"),
+        ]
+        new_server1 = _res("VDU1", "OS::Nova::Server", "server1-new",
+                           stack_name=NESTED_STACK_NAME, parent="VDU1")
+        new_server3 = _res("VDU3", "OS::Nova::Server", "server3")
+
+        def _res_info(stack_id, resource_name):
+            return {
+                (NESTED_STACK_NAME, "VDU1"): new_server1,
+                (STACK_NAME, "VDU3"): new_server3,
+            }.get((stack_id, resource_name))
+        mock_res_info.side_effect = _res_info
+
+        result = self.heat_client.get_resources(STACK_NAME)
+        self.assertEqual(1, mock_list.call_count)
+        mock_events.assert_called_once_with(STACK_NAME, "event1", 101)
+        self.assertEqual(3, mock_res_info.call_count)
+        self.assertEqual(
+            ["nested_id", "server1-new", "port1", "server2", "server3"],
+            [res["physical_resource_id"] for res in result])
+        self.assertEqual(
+            ["server1-new", "server2", "server3"],
+            [res["physical_resource_id"]
+             for res in heat_utils.get_server_reses(result)])
+
+        # too many events
+        self.config_fixture.config(
+            group='v2_vnfm', heat_resource_cache_max_events=2)
+        mock_latest.return_value = "event3"
+        result = self.heat_client.get_resources(STACK_NAME)
+        self.assertEqual(2, mock_list.call_count)
+        self.assertEqual(_heat_reses, result)
+
+        # marker is not found
+        mock_latest.return_value = "event4"
+        mock_events.return_value = None
+        self.heat_client.get_resources(STACK_NAME)
+        self.assertEqual(3, mock_list.call_count)
+
+        # stack not found
+        mock_latest.return_value = None
+        self.heat_client.get_resources(STACK_NAME)
+        self.assertEqual(4, mock_list.call_count)
+        self.assertEqual(0, heat_utils.get_heat_resource_cache_stats()[
+            'entries'])
+
+        cache_stats = heat_utils.get_heat_resource_cache_stats()
+        self.assertEqual(1, cache_stats['hits'])
+        self.assertEqual(1, cache_stats['incremental_updates'])
+        self.assertEqual(4, cache_stats['misses'])
+        # reported by tacker-conductor.
+        self.assertEqual(cache_stats,
+                         stats.get_all()['v2_heat_resource_cache'])
+
+    @mock.patch.object(heat_utils.HeatClient, 'list_resources')
+    @mock.patch.object(heat_utils.HeatClient, 'get_latest_event_id')
+    def test_get_resources_cache_disabled(self, mock_latest, mock_list):
+        self.config_fixture.config(
+            group='v2_vnfm', heat_resource_cache_size=0)
+        mock_list.return_value = list(_heat_reses)
+
+        self.heat_client.get_resources(STACK_NAME)
+        result = self.heat_client.get_resources(STACK_NAME)
+
+        self.assertEqual(_heat_reses, result)
+        self.assertEqual(2, mock_list.call_count)
+        mock_latest.assert_not_called()
+
+    @mock.patch.object(heat_utils.HeatClient, 'list_resources')
+    @mock.patch.object(heat_utils.HeatClient, 'get_latest_event_id')
+    def test_get_resources_cache_eviction(self, mock_latest, mock_list):
+        self.config_fixture.config(
+            group='v2_vnfm', heat_resource_cache_size=1)
+        mock_latest.return_value = "event1"
+        mock_list.return_value = list(_heat_reses)
+
+        self.heat_client.get_resources(STACK_NAME)
+        self.heat_client.get_resources("vnf-test2/stack_id")
+        self.heat_client.get_resources(STACK_NAME)
+
+        self.assertEqual(3, mock_list.call_count)
+        cache_stats = heat_utils.get_heat_resource_cache_stats()
+        self.assertEqual(2, cache_stats['evictions'])
+        self.assertEqual(1, cache_stats['entries'])
+
+    @mock.patch.object(http_client.HttpClient, 'do_request')
+    def test_get_events(self, mock_do_request):
+        resp = requests.Response()
+        resp.status_code = 200
+        mock_do_request.return_value = (
+            resp, {"events": [_event("event1", "VDU1")]})
+
+        self.assertEqual(
+            "event1", self.heat_client.get_latest_event_id(STACK_NAME))
+        mock_do_request.assert_called_with(
+            f"stacks/{STACK_NAME}/events?nested_depth=2&sort_dir=desc"
+            "&limit=1", "GET", expected_status=[200, 404])
+
+        self.assertEqual(
+            [_event("event1", "VDU1")],
+            self.heat_client.get_events_after(STACK_NAME, "event0", 10))
+        mock_do_request.assert_called_with(
+            f"stacks/{STACK_NAME}/events?nested_depth=2&sort_dir=asc"
+            "&marker=event0&limit=10", "GET",
+            expected_status=[200, 400, 404])
+
+        mock_do_request.return_value = (resp, {"events": []})
+        self.assertIsNone(self.heat_client.get_latest_event_id(STACK_NAME))
+
+        resp.status_code = 404
+        self.assertIsNone(self.heat_client.get_latest_event_id(STACK_NAME))
+        self.assertIsNone(
+            self.heat_client.get_events_after(STACK_NAME, "event0", 10))
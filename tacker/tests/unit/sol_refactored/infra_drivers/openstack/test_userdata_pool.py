@@ -0,0 +1,198 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import os
+import shutil
+import stat
+import tempfile
+import textwrap
+from unittest import mock
+
+from oslo_config import cfg
+
+from tacker.sol_refactored.common import exceptions as sol_ex
+from tacker.sol_refactored.infra_drivers.openstack import userdata_pool
+from tacker.tests import base
+
+
+_userdata = textwrap.dedent('''
+    import os
+
+    COUNT = 0
+
+
+    class MyUserData(object):
+
+        @staticmethod
+        def instantiate(req, inst, grant_req, grant, tmp_csar_dir):
+            global COUNT
+            COUNT += 1
+            # outputs of userdata class do not break the response.
+            print('instantiate called')
+            return {'pid': os.getpid(), 'count': COUNT,
+                    'csar_dir': tmp_csar_dir}
+
+        @staticmethod
+        def heal(req, inst, grant_req, grant, tmp_csar_dir):
+            print('heal called')
+            raise Exception('heal failed')
+''')
+
+
+class TestUserDataWorkerPool(base.BaseTestCase):
+
+    def setUp(self):
+        super(TestUserDataWorkerPool, self).setUp()
+        self.pool = userdata_pool.UserDataWorkerPool()
+        self.addCleanup(self.pool.stop)
+
+    def _make_vnfd(self):
+        csar_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, csar_dir)
+        os.mkdir(os.path.join(csar_dir, 'UserData'))
+        with open(os.path.join(csar_dir, 'UserData', 'my_userdata.py'),
+                  'w') as f:
+            f.write(_userdata)
+
+        def _make_tmp_csar_dir():
+            tmp_dir = tempfile.mkdtemp()
+            os.rmdir(tmp_dir)
+            shutil.copytree(csar_dir, tmp_dir)
+            return tmp_dir
+
+        vnfd = mock.Mock(csar_dir=csar_dir)
+        vnfd.make_tmp_csar_dir.side_effect = _make_tmp_csar_dir
+        vnfd.remove_tmp_csar_dir.side_effect = shutil.rmtree
+        return vnfd
+
+    def _script_dict(self, operation='INSTANTIATE'):
+        return {
+            'request': {
+                'additionalParams': {
+                    'lcm-operation-user-data': './UserData/my_userdata.py',
+                    'lcm-operation-user-data-class': 'MyUserData'
+                }
+            },
+            'vnf_instance': {'id': 'inst-1'},
+            'grant_request': {'operation': operation},
+            'grant_response': {},
+            'is_rollback': False
+        }
+
+    def test_execute_warm(self):
+        vnfd = self._make_vnfd()
+
+        result_1 = self.pool.execute(vnfd, self._script_dict())
+        result_2 = self.pool.execute(vnfd, self._script_dict())
+
+        # the same worker is used and the module is kept imported.
+        self.assertEqual(result_1['pid'], result_2['pid'])
+        self.assertEqual(1, result_1['count'])
+        self.assertEqual(2, result_2['count'])
+        # the package is copied once per worker and the copy is
+        # read-only.
+        self.assertNotEqual(vnfd.csar_dir, result_1['csar_dir'])
+        self.assertEqual(result_1['csar_dir'], result_2['csar_dir'])
+        vnfd.make_tmp_csar_dir.assert_called_once()
+        for path in [result_1['csar_dir'],
+                     os.path.join(result_1['csar_dir'], 'UserData',
+                                  'my_userdata.py')]:
+            self.assertFalse(os.stat(path).st_mode & stat.S_IWUSR)
+
+        stats = self.pool.get_stats()
+        self.assertEqual(2, stats['executed'])
+        self.assertEqual(1, stats['warm'])
+        self.assertEqual(1, stats['idle_workers'])
+        self.assertEqual(2, stats['operations']['INSTANTIATE']['count'])
+
+        # the copy is removed when the worker is stopped.
+        self.pool.stop()
+        self.assertFalse(os.path.exists(result_1['csar_dir']))
+
+    def test_execute_per_package(self):
+        vnfd_1 = self._make_vnfd()
+        vnfd_2 = self._make_vnfd()
+
+        result_1 = self.pool.execute(vnfd_1, self._script_dict())
+        result_2 = self.pool.execute(vnfd_2, self._script_dict())
+
+        self.assertNotEqual(result_1['pid'], result_2['pid'])
+        self.assertEqual(1, result_2['count'])
+        self.assertEqual(2, self.pool.get_stats()['idle_workers'])
+
+    def test_execute_failed(self):
+        vnfd = self._make_vnfd()
+
+        ex = self.assertRaises(sol_ex.UserdataExecutionFailed,
+                               self.pool.execute, vnfd,
+                               self._script_dict('HEAL'))
+
+        self.assertIn('heal called', ex.detail)
+        self.assertIn('heal failed', ex.detail)
+        # the worker is discarded.
+        stats = self.pool.get_stats()
+        self.assertEqual(1, stats['failed'])
+        self.assertEqual(0, stats['idle_workers'])
+        self.assertEqual(1, stats['operations']['HEAL']['count'])
+
+    def test_execute_pool_size_exceeded(self):
+        cfg.CONF.set_override('userdata_worker_pool_size', 1,
+                              group='v2_vnfm')
+        vnfd_1 = self._make_vnfd()
+        vnfd_2 = self._make_vnfd()
+
+        self.pool.execute(vnfd_1, self._script_dict())
+        result = self.pool.execute(vnfd_2, self._script_dict())
+
+        self.assertEqual(1, self.pool.get_stats()['idle_workers'])
+        # the worker of vnfd_1 was stopped.
+        self.assertEqual([(vnfd_2.csar_dir, './UserData/my_userdata.py')],
+                         [key[:2] for key in self.pool.idle])
+        self.assertEqual(result['pid'],
+                         self.pool.idle[list(self.pool.idle)[0]][0]
+                         .proc.pid)
+
+    def test_execute_no_pool(self):
+        cfg.CONF.set_override('userdata_worker_pool_size', 0,
+                              group='v2_vnfm')
+        vnfd = self._make_vnfd()
+
+        result_1 = self.pool.execute(vnfd, self._script_dict())
+        result_2 = self.pool.execute(vnfd, self._script_dict())
+
+        self.assertNotEqual(result_1['pid'], result_2['pid'])
+        self.assertEqual(1, result_2['count'])
+        self.assertNotEqual(vnfd.csar_dir, result_1['csar_dir'])
+        self.assertEqual(2, vnfd.make_tmp_csar_dir.call_count)
+        self.assertEqual(0, self.pool.get_stats()['idle_workers'])
+
+        self.assertRaises(sol_ex.UserdataExecutionFailed,
+                          self.pool.execute, vnfd,
+                          self._script_dict('HEAL'))
+
+    @mock.patch.object(userdata_pool, 'UserDataWorker')
+    def test_acquire_spawn_without_lock(self, mock_worker):
+        def _new_worker():
+            # worker processes are started without holding the lock.
+            self.assertFalse(self.pool.lock.locked())
+            return mock.Mock()
+        mock_worker.side_effect = _new_worker
+
+        worker, warm = self.pool._acquire(('csar', 'userdata', 0))
+
+        self.assertFalse(warm)
+        self.assertIsNotNone(self.pool.spare)
+        self.assertIsNot(worker, self.pool.spare)
+        self.assertEqual(2, mock_worker.call_count)
@@ -23,6 +23,7 @@ from oslo_config import cfg
 
 from tacker.common import exceptions
 from tacker.sol_refactored.common import vnfd_utils
+from tacker.sol_refactored.infra_drivers.kubernetes import kubernetes_utils
 from tacker.sol_refactored.mgmt_drivers import (
     container_update_mgmt_v2 as mgmt_driver)
 from tacker.tests.unit import base
@@ -643,6 +644,9 @@ class TestContainerUpdate(base.TestCase):
     def setUp(self):
         super(TestContainerUpdate, self).setUp()
         cfg.CONF.v2_vnfm.kubernetes_vim_rsc_wait_timeout = 0
+        # NOTE: k8s API is mocked. pods are not watched.
+        self.config_fixture.config(group='v2_vnfm',
+                                   kubernetes_vim_rsc_watch=False)
         sample_dir = utils.test_sample("functional/sol_kubernetes_v2")
         self.old_vnfd = vnfd_utils.Vnfd(SAMPLE_OLD_VNFD_ID)
         self.old_vnfd.init_from_csar_dir(os.path.join(
@@ -825,6 +829,11 @@ class TestContainerUpdate(base.TestCase):
             ])
         ]
         output = self.cntr_update_mgmt.modify_information_end()['vnf_instance']
+        # the cached api client is released.
+        self.addCleanup(kubernetes_utils._api_client_cache.clear)
+        self.assertLess(0, len(kubernetes_utils._api_client_cache.entries))
+        for entry in kubernetes_utils._api_client_cache.entries.values():
+            self.assertEqual(0, entry.users)
         for vnfc_res_info in output['instantiatedVnfInfo']['vnfcResourceInfo']:
             if vnfc_res_info['vduId'] in ['VDU1', 'VDU2', 'VDU5']:
                 vnfc_id_before = [
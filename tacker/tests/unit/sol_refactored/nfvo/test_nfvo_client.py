@@ -303,6 +303,7 @@ class TestNfvoClient(base.BaseTestCase):
         CONF.vnf_package.vnf_package_csar_path = (
             '/opt/stack/data/tacker/vnfpackage/')
         self.context.api_version = api_version.APIVersion('2.0.0')
+        subsc_utils._subsc_index.clear()
         self.nfvo_client = nfvo_client.NfvoClient()
         self.nfvo_client.endpoint = 'http://127.0.0.1:9990'
         auth_handle = http_client.OAuth2AuthHandle(
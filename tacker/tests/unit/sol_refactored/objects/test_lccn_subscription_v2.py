@@ -71,6 +71,59 @@ class TestLccnSubscriptionObject(tests_base.BaseTestCase):
             dict_of_auth["paramsOauth2ClientCredentials"]["clientPassword"],
             _decrypted_data)
 
+    @mock.patch.object(crypt_utils, 'encrypt')
+    @mock.patch.object(crypt_utils, 'decrypt')
+    def test_from_db_obj_lazy_decrypt(self, mock_decrypt, mock_encrypt):
+        cfg.CONF.set_override('use_credential_encryption', True)
+
+        mock_decrypt.return_value = _decrypted_data
+        mock_encrypt.return_value = _encrypted_data
+        auth = jsonutils.dumps({
+            "paramsBasic": {
+                "userName": "test_user",
+                "password": _encrypted_data
+            }
+        })
+        lccn_subsc = {
+            "id": "test_id",
+            "filter": None,
+            "callbackUri": "test_uri",
+            "authentication": auth,
+            "verbosity": "FULL",
+            "_links": _link
+        }
+        obj = objects.LccnSubscriptionV2.from_db_obj(lccn_subsc)
+
+        # not decrypted until authentication is read
+        self.assertEqual("test_uri", obj.callbackUri)
+        self.assertTrue(obj.obj_decrypt_pending('authentication'))
+        mock_decrypt.assert_not_called()
+
+        # the encrypted value in DB is kept
+        self.assertEqual(auth, obj.to_db_obj()["authentication"])
+        mock_decrypt.assert_not_called()
+        mock_encrypt.assert_not_called()
+
+        self.assertEqual(_decrypted_data,
+                         obj.authentication.paramsBasic.password)
+        self.assertFalse(obj.obj_decrypt_pending('authentication'))
+        self.assertEqual(_decrypted_data,
+                         obj.authentication.paramsBasic.password)
+        mock_decrypt.assert_called_once_with(_encrypted_data)
+
+        # encrypted again after decrypted
+        dict_auth = jsonutils.loads(obj.to_db_obj()["authentication"])
+        self.assertEqual(_encrypted_data, dict_auth["paramsBasic"]["password"])
+        mock_encrypt.assert_called_once_with(_decrypted_data)
+
+        # not decrypted if authentication is replaced before read
+        obj = objects.LccnSubscriptionV2.from_db_obj(lccn_subsc)
+        obj.authentication = objects.SubscriptionAuthentication(
+            authType=['BASIC'])
+        self.assertFalse(obj.obj_decrypt_pending('authentication'))
+        self.assertEqual(['BASIC'], obj.authentication.authType)
+        mock_decrypt.assert_called_once_with(_encrypted_data)
+
     def test_from_db_obj_no_encrypt(self):
         cfg.CONF.set_override('use_credential_encryption', False)
 
@@ -0,0 +1,295 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from oslo_utils import uuidutils
+import sqlalchemy as sa
+
+from tacker import context
+from tacker.db import api as db_api
+from tacker.sol_refactored.common import exceptions as sol_ex
+from tacker.sol_refactored.db.sqlalchemy import models
+from tacker.sol_refactored import objects
+from tacker.tests.unit.db import base as db_base
+
+
+class TestTackerPersistentObjectSave(db_base.SqlTestCase):
+
+    def setUp(self):
+        # NOTE: register objects (i.e. load DB models) before DB tables
+        # are created in SqlTestCase.setUp.
+        objects.register_all()
+        super(TestTackerPersistentObjectSave, self).setUp()
+        self.context = context.get_admin_context()
+        self.statements = []
+
+        def _before_cursor_execute(conn, cursor, statement, parameters,
+                                   context, executemany):
+            self.statements.append((statement, parameters))
+
+        engine = db_api.get_engine()
+        sa.event.listen(engine, 'before_cursor_execute',
+                        _before_cursor_execute)
+        self.addCleanup(sa.event.remove, engine, 'before_cursor_execute',
+                        _before_cursor_execute)
+
+    def _create_inst(self):
+        inst = objects.VnfInstanceV2(
+            id=uuidutils.generate_uuid(),
+            vnfdId=uuidutils.generate_uuid(),
+            vnfProvider='provider',
+            vnfProductName='product',
+            vnfSoftwareVersion='1.0',
+            vnfdVersion='1.0',
+            instantiationState='NOT_INSTANTIATED',
+            metadata={'key': 'value'}
+        )
+        inst.create(self.context)
+        return objects.VnfInstanceV2.get_by_id(self.context, inst.id)
+
+    def _updates(self):
+        return [(statement, parameters)
+                for statement, parameters in self.statements
+                if statement.startswith('UPDATE')]
+
+    def _get_version(self, inst_id):
+        db_obj = self.context.session.query(models.VnfInstanceV2).filter(
+            models.VnfInstanceV2.id == inst_id).one()
+        return db_obj.version
+
+    def test_update_changed_columns_only(self):
+        inst = self._create_inst()
+        self.statements.clear()
+
+        inst.vnfInstanceName = 'new name'
+        inst.update(self.context)
+
+        updates = self._updates()
+        self.assertEqual(1, len(updates))
+        statement, _ = updates[0]
+        self.assertIn('vnfInstanceName', statement)
+        self.assertIn('version', statement)
+        self.assertNotIn('vnfdId', statement)
+        self.assertNotIn('metadata', statement)
+        # no SELECT before UPDATE as session.merge does.
+        self.assertFalse([s for s, _ in self.statements
+                          if s.startswith('SELECT')])
+
+        result = objects.VnfInstanceV2.get_by_id(self.context, inst.id)
+        self.assertEqual('new name', result.vnfInstanceName)
+        self.assertEqual({'key': 'value'}, result.metadata)
+        self.assertEqual(1, self._get_version(inst.id))
+
+    def test_update_in_place_modification(self):
+        inst = self._create_inst()
+        self.statements.clear()
+
+        # NOTE: obj_get_changes() does not detect it.
+        inst.metadata['key'] = 'new value'
+        inst.vnfInstanceName = 'new name'
+        inst.update(self.context)
+
+        statement, _ = self._updates()[0]
+        self.assertIn('metadata', statement)
+        result = objects.VnfInstanceV2.get_by_id(self.context, inst.id)
+        self.assertEqual({'key': 'new value'}, result.metadata)
+
+    def test_update_no_change(self):
+        inst = self._create_inst()
+        self.statements.clear()
+
+        # set the same value
+        inst.vnfInstanceName = None
+        inst.update(self.context)
+
+        self.assertEqual([], self._updates())
+        self.assertEqual(0, self._get_version(inst.id))
+
+    def test_update_twice(self):
+        inst = self._create_inst()
+
+        inst.vnfInstanceName = 'name 1'
+        inst.update(self.context)
+        inst.vnfInstanceName = 'name 2'
+        inst.update(self.context)
+
+        result = objects.VnfInstanceV2.get_by_id(self.context, inst.id)
+        self.assertEqual('name 2', result.vnfInstanceName)
+        self.assertEqual(2, self._get_version(inst.id))
+
+    def test_update_conflict(self):
+        self.config_fixture.config(group='v2_vnfm',
+                                   db_optimistic_locking=True)
+        inst = self._create_inst()
+        other = objects.VnfInstanceV2.get_by_id(self.context, inst.id)
+
+        other.vnfInstanceName = 'other'
+        other.update(self.context)
+
+        inst.vnfInstanceName = 'mine'
+        self.assertRaises(sol_ex.DbUpdateConflict,
+                          inst.update, self.context)
+        result = objects.VnfInstanceV2.get_by_id(self.context, inst.id)
+        self.assertEqual('other', result.vnfInstanceName)
+
+    def test_update_no_locking(self):
+        inst = self._create_inst()
+        other = objects.VnfInstanceV2.get_by_id(self.context, inst.id)
+
+        other.vnfInstanceDescription = 'other'
+        other.update(self.context)
+
+        inst.vnfInstanceName = 'mine'
+        inst.update(self.context)
+
+        # the columns not changed by inst are kept.
+        result = objects.VnfInstanceV2.get_by_id(self.context, inst.id)
+        self.assertEqual('mine', result.vnfInstanceName)
+        self.assertEqual('other', result.vnfInstanceDescription)
+        self.assertEqual(2, self._get_version(inst.id))
+
+    def test_update_deleted(self):
+        inst = self._create_inst()
+        objects.VnfInstanceV2.get_by_id(self.context, inst.id).delete(
+            self.context)
+
+        inst.vnfInstanceName = 'new name'
+        inst.update(self.context)
+
+        # re-created as session.merge does.
+        result = objects.VnfInstanceV2.get_by_id(self.context, inst.id)
+        self.assertEqual('new name', result.vnfInstanceName)
+        self.assertEqual({'key': 'value'}, result.metadata)
+
+    def test_update_not_loaded(self):
+        # an object not loaded from DB is saved by session.merge.
+        inst = self._create_inst()
+        new_inst = objects.VnfInstanceV2.from_dict(inst.to_dict())
+
+        new_inst.vnfInstanceName = 'new name'
+        new_inst.update(self.context)
+
+        result = objects.VnfInstanceV2.get_by_id(self.context, inst.id)
+        self.assertEqual('new name', result.vnfInstanceName)
+
+    def test_get_by_ids(self):
+        inst_1 = self._create_inst()
+        inst_2 = self._create_inst()
+        self._create_inst()
+
+        self.statements.clear()
+        result = objects.VnfInstanceV2.get_by_ids(
+            self.context, [inst_1.id, inst_2.id, 'not-exist'])
+
+        self.assertEqual({inst_1.id, inst_2.id}, {inst.id for inst in result})
+        self.assertEqual(1, len([stmt for stmt, _ in self.statements
+                                 if stmt.startswith('SELECT')]))
+        self.assertEqual([], objects.VnfInstanceV2.get_by_ids(self.context,
+                                                              []))
+
+    def test_get_dict_all_stream(self):
+        insts = sorted((self._create_inst() for _ in range(3)),
+                       key=lambda inst: inst.id)
+        attrs = ['id', 'metadata', 'vnfInstanceDescription']
+
+        expected = objects.VnfInstanceV2.get_dict_all(
+            self.context, attrs, [], 10)
+        self.assertEqual([{'id': inst.id, 'metadata': {'key': 'value'}}
+                          for inst in insts], expected)
+
+        self.statements.clear()
+        result = objects.VnfInstanceV2.get_dict_all(
+            self.context, attrs, [], 10, stream=True)
+        # nothing is read until it is consumed.
+        self.assertEqual([], self.statements)
+        self.assertEqual(expected, list(result))
+
+        result = objects.VnfInstanceV2.get_dict_all(
+            self.context, attrs, [('gt', 'id', insts[0].id)], None,
+            stream=True)
+        self.assertEqual(expected[1:],
+                         sorted(result, key=lambda item: item['id']))
+
+    def _create_instantiated_inst(self):
+        inst = objects.VnfInstanceV2(
+            id=uuidutils.generate_uuid(),
+            vnfdId=uuidutils.generate_uuid(),
+            vnfProvider='provider',
+            vnfProductName='product',
+            vnfSoftwareVersion='1.0',
+            vnfdVersion='1.0',
+            instantiationState='INSTANTIATED',
+            instantiatedVnfInfo=objects.VnfInstanceV2_InstantiatedVnfInfo(
+                flavourId='simple',
+                vnfState='STARTED',
+                extCpInfo=[]
+            )
+        )
+        inst.create(self.context)
+        return inst
+
+    def test_lazy_load(self):
+        created = self._create_instantiated_inst()
+        inst = objects.VnfInstanceV2.get_by_id(self.context, created.id)
+
+        # not converted until it is read.
+        self.assertTrue(inst.obj_attr_is_set('instantiatedVnfInfo'))
+        self.assertTrue(inst.obj_load_pending('instantiatedVnfInfo'))
+        self.assertEqual(set(), inst.obj_what_changed())
+        self.assertTrue(inst.obj_load_pending('instantiatedVnfInfo'))
+
+        # the JSON in DB is kept as it is.
+        self.statements.clear()
+        inst.vnfInstanceName = 'new name'
+        inst.update(self.context)
+        statement, _ = self._updates()[0]
+        self.assertNotIn('instantiatedVnfInfo', statement)
+        self.assertTrue(inst.obj_load_pending('instantiatedVnfInfo'))
+
+        self.assertEqual('STARTED', inst.instantiatedVnfInfo.vnfState)
+        self.assertFalse(inst.obj_load_pending('instantiatedVnfInfo'))
+        self.assertEqual(created.instantiatedVnfInfo.to_dict(),
+                         inst.to_dict()['instantiatedVnfInfo'])
+
+        # changes of the child object are saved after it is read.
+        inst.instantiatedVnfInfo.vnfState = 'STOPPED'
+        inst.update(self.context)
+        result = objects.VnfInstanceV2.get_by_id(self.context, inst.id)
+        self.assertEqual('STOPPED', result.instantiatedVnfInfo.vnfState)
+        self.assertEqual('new name', result.vnfInstanceName)
+
+    def test_get_by_filter_attrs(self):
+        created = self._create_instantiated_inst()
+        self._create_inst()
+
+        self.statements.clear()
+        result = objects.VnfInstanceV2.get_by_filter(
+            self.context, attrs=['id', 'instantiationState'],
+            instantiationState='INSTANTIATED')
+
+        self.assertEqual([created.id], [inst.id for inst in result])
+        inst = result[0]
+        self.assertEqual('INSTANTIATED', inst.instantiationState)
+        self.assertFalse(inst.obj_attr_is_set('vnfdId'))
+        self.assertFalse(inst.obj_attr_is_set('instantiatedVnfInfo'))
+        statement, _ = self.statements[0]
+        self.assertNotIn('instantiatedVnfInfo', statement)
+        self.assertNotIn('vnfdId', statement.split('WHERE')[0])
+
+        # the loaded columns only are compared to update.
+        inst.vnfInstanceName = 'new name'
+        inst.update(self.context)
+        result = objects.VnfInstanceV2.get_by_id(self.context, inst.id)
+        self.assertEqual('new name', result.vnfInstanceName)
+        self.assertEqual('STARTED', result.instantiatedVnfInfo.vnfState)
@@ -0,0 +1,122 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import datetime
+
+from tacker import context
+from tacker.sol_refactored.common import pm_job_utils
+from tacker.sol_refactored import objects
+from tacker.tests.unit.db import base as db_base
+
+
+_inst_id = '25b9b9d0-2461-4109-866e-a7767375415b'
+_sub_id = 'ebd40865-e3d9-4ac6-b7f0-0a8d2791d07f'
+_metric = f'VCpuUsageMeanVnf.{_inst_id}'
+
+
+def _time(minute):
+    return datetime.datetime(2022, 6, 22, 1, minute,
+                             tzinfo=datetime.timezone.utc)
+
+
+class TestPerformanceReportEntryV2(db_base.SqlTestCase):
+
+    def setUp(self):
+        # NOTE: register objects (i.e. load DB models) before DB tables
+        # are created in SqlTestCase.setUp.
+        objects.register_all()
+        super(TestPerformanceReportEntryV2, self).setUp()
+        self.context = context.get_admin_context()
+
+    def _create_report(self, report_id, job_id, values,
+                       sub_id=None, metric=_metric):
+        entry = {
+            'objectType': 'Vnf',
+            'objectInstanceId': _inst_id,
+            'performanceMetric': metric,
+            'performanceValues': [{'timeStamp': value.isoformat(),
+                                   'value': '1.0'}
+                                  for value in values]
+        }
+        if sub_id:
+            entry['subObjectInstanceId'] = sub_id
+        report = objects.PerformanceReportV2.from_dict({
+            'id': report_id, 'jobId': job_id, 'entries': [entry]})
+        report.create(self.context)
+        for entry in pm_job_utils.make_report_entries(report, values[0]):
+            entry.create(self.context)
+
+    def test_get_latest_time_stamps(self):
+        self._create_report('report-1', 'job-1', [_time(1), _time(2)])
+        self._create_report('report-2', 'job-1', [_time(3)], sub_id=_sub_id)
+        self._create_report('report-3', 'job-1', [_time(4)],
+                            metric='other')
+        self._create_report('report-4', 'job-2', [_time(5)])
+        self._create_report('report-5', 'job-3', [_time(6)])
+
+        latest = objects.PerformanceReportEntryV2.get_latest_time_stamps(
+            self.context, ['job-1', 'job-2'], [_inst_id])
+
+        self.assertEqual({
+            ('job-1', _inst_id, None, _metric): _time(2),
+            ('job-1', _inst_id, _sub_id, _metric): _time(3),
+            ('job-1', _inst_id, None, 'other'): _time(4),
+            ('job-2', _inst_id, None, _metric): _time(5)}, latest)
+        # an entry without subObjectInstanceId matches any of them.
+        self.assertEqual(_time(3), pm_job_utils.find_latest_report_time(
+            latest, 'job-1', _inst_id, _sub_id, _metric))
+        self.assertEqual(_time(2), pm_job_utils.find_latest_report_time(
+            latest, 'job-1', _inst_id, 'other', _metric))
+        self.assertIsNone(pm_job_utils.find_latest_report_time(
+            latest, 'job-3', _inst_id, None, _metric))
+        self.assertEqual({}, objects.PerformanceReportEntryV2.
+                         get_latest_time_stamps(self.context, [], [_inst_id]))
+
+    def test_get_reports(self):
+        self._create_report('report-2', 'job-1', [_time(3), _time(4)])
+        self._create_report('report-1', 'job-1', [_time(1)])
+        self._create_report('report-3', 'job-2', [_time(2)])
+
+        result = objects.PerformanceReportEntryV2.get_reports(
+            self.context, ['job-1', 'job-2', 'job-3'])
+
+        self.assertEqual({
+            'job-1': [('report-1', _time(1)), ('report-2', _time(3))],
+            'job-2': [('report-3', _time(2))],
+            'job-3': []}, result)
+
+    def test_delete_reports(self):
+        self._create_report('report-1', 'job-1', [_time(1)])
+        self._create_report('report-2', 'job-1', [_time(3)])
+        self._create_report('report-3', 'job-2', [_time(1)])
+        # a report created by the former version has no entries.
+        objects.PerformanceReportV2(
+            id='report-4', jobId='job-1', entries=[]).create(self.context)
+
+        entry_cls = objects.PerformanceReportEntryV2
+        self.assertEqual(1, entry_cls.delete_reports(
+            self.context, 'job-1', ready_before=_time(2)))
+        self.assertEqual(['report-2', 'report-4'], sorted(
+            report.id for report in objects.PerformanceReportV2.get_by_filter(
+                self.context, jobId='job-1')))
+        self.assertEqual({'job-1': [('report-2', _time(3))]},
+                         entry_cls.get_reports(self.context, ['job-1']))
+
+        self.assertEqual(2, entry_cls.delete_reports(self.context, 'job-1'))
+        self.assertEqual([], objects.PerformanceReportV2.get_by_filter(
+            self.context, jobId='job-1'))
+        self.assertEqual({'job-1': [], 'job-2': [('report-3', _time(1))]},
+                         entry_cls.get_reports(
+                             self.context, ['job-1', 'job-2']))
@@ -3946,6 +3946,8 @@ class TestController(base.TestCase):
             jsonutils.loads(jsonutils.dump_as_bytes(expected_result)),
             resp.json)
 
+    @mock.patch.object(objects.vnf_lcm_op_occs.VnfLcmOpOccList,
+                       "iter_by_marker_filter")
     @mock.patch.object(objects.vnf_lcm_op_occs.VnfLcmOpOccList,
                        "get_by_marker_filter")
     @mock.patch.object(objects.vnf_lcm_op_occs.VnfLcmOpOcc, "get_by_id")
@@ -3966,7 +3968,8 @@ class TestController(base.TestCase):
     )
     def test_op_occ_list_paging(self, values,
             mock_marker_obj,
-            mock_op_occ_list):
+            mock_op_occ_list,
+            mock_op_occ_iter):
         ids = ['11111111-1111-1111-1111-111111111111',
                '22222222-2222-2222-2222-222222222222',
                '33333333-3333-3333-3333-333333333333',
@@ -3999,6 +4002,7 @@ class TestController(base.TestCase):
                 fakes.return_vnf_lcm_opoccs_obj(
                     **{'id': ids[target_index[index]],
                     'operation': values['result_names'][index]}))
+        mock_op_occ_iter.return_value = iter(mock_op_occ_list.return_value)
 
         complex_attributes = [
             'error',
@@ -4034,6 +4038,25 @@ class TestController(base.TestCase):
             resp.json)
         if expected_result_link is not None:
             self.assertEqual(expected_result_link, resp.headers['Link'])
+        if values['params'].get('all_records') == 'yes':
+            mock_op_occ_iter.assert_called_once_with(
+                mock.ANY, mock_marker_obj.return_value, filters=None,
+                read_deleted='no')
+            mock_op_occ_list.assert_not_called()
+
+    @mock.patch.object(objects.vnf_lcm_op_occs.VnfLcmOpOccList,
+                       "iter_by_marker_filter")
+    def test_op_occ_list_all_records_db_error(self, mock_op_occ_iter):
+        def _iter():
+            raise exceptions.DBAccessError(cause='error')
+            yield
+        mock_op_occ_iter.return_value = _iter()
+        req = fake_request.HTTPRequest.blank(
+            '/vnflcm/v1/vnf_lcm_op_occs?all_records=yes')
+
+        # an error response instead of a truncated 200 response.
+        resp = self.controller.list_lcm_op_occs(req)
+        self.assertEqual(500, resp.status_code)
 
     @mock.patch.object(objects.VnfLcmOpOccList, "get_by_marker_filter")
     @ddt.data(
@@ -1961,6 +1961,53 @@ class TestOpenStack(base.FixturedTestCase):
                            instance_id + '&show_nested=True')
         self.requests_mock.register_uri('GET', url, response_list)
 
+    def test_get_stack_resources(self):
+        # root - child1 - grandchild1
+        #      - child2
+        tree = {
+            'root': ['child1', 'child2'],
+            'child1': ['grandchild1'],
+            'child2': [],
+            'grandchild1': [],
+        }
+        parents = {child: parent for parent, children in tree.items()
+                   for child in children}
+
+        def _stack(stack_id, parent):
+            # NOTE: 'parent' is not allowed for the argument of Mock.
+            stack = mock.Mock(id=stack_id)
+            stack.parent = parent
+            return stack
+
+        def _stacks_list(filters):
+            owner_id = filters['owner_id']
+            # a stack whose parent is not the owner is ignored.
+            return ([_stack(child, owner_id) for child in tree[owner_id]] +
+                    [_stack('other', None)])
+
+        def _resources_list(stack_id):
+            res = mock.Mock(resource_type='OS::Nova::Server',
+                            physical_resource_id=f'{stack_id}_server')
+            res.resource_name = 'VDU1'
+            return [res]
+
+        heatclient = mock.Mock()
+        heatclient.stacks.list.side_effect = _stacks_list
+        heatclient.resources.list.side_effect = _resources_list
+
+        result = self.openstack._get_stack_resources('root', heatclient)
+
+        self.assertEqual(['root', 'child1', 'grandchild1', 'child2'],
+                         list(result))
+        for stack_id, stack_resources in result.items():
+            self.assertEqual(
+                {'VDU1': {'resource_type': 'OS::Nova::Server',
+                          'physical_resource_id': f'{stack_id}_server'},
+                 'child_stack': stack_id in parents},
+                stack_resources)
+        self.assertEqual(4, heatclient.stacks.list.call_count)
+        self.assertEqual(4, heatclient.resources.list.call_count)
+
     def test_post_vnf_instantiation(self):
         v_s_resource_info = fd_utils.get_virtual_storage_resource_info(
             desc_id="storage1", set_resource_id=False)
@@ -10,12 +10,15 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import copy
 from sqlalchemy.orm import exc as orm_exc
 from unittest import mock
 
+from cryptography import fernet
 from oslo_config import cfg
 from requests_mock.contrib import fixture as rm_fixture
 
+from tacker.common import stats
 from tacker.extensions import nfvo
 from tacker.keymgr import API as KEYMGR_API
 from tacker import manager
@@ -85,6 +88,10 @@ class TestVIMClient(base.TestCase):
         self.vimclient = vim_client.VimClient()
         self.service_plugins = mock.Mock()
         self.nfvo_plugin = mock.Mock()
+        cache_patcher = mock.patch.object(
+            vim_client, '_vim_auth_cache', vim_client._VimAuthCache())
+        cache_patcher.start()
+        self.addCleanup(cache_patcher.stop)
 
     def _mock_external_token_api(self):
         def mock_token_resp(request, context):
@@ -308,3 +315,93 @@ class TestVIMClient(base.TestCase):
             self.vimclient.get_vim(None,
                                    vim_id=self.vim_info['id'],
                                    region_name='TestRegionOne')
+
+    def _encrypted_vim_info(self, vim_key, **auth):
+        f = fernet.Fernet(vim_key)
+        auth_cred = {'username': 'test', 'key_type': 'fernet_key'}
+        for key, value in auth.items():
+            auth_cred[key] = f.encrypt(value.encode('utf-8')).decode('utf-8')
+        return {'id': 'aaaa', 'type': 'openstack', 'tenant_id': 'test',
+                'auth_url': 'http://127.0.0.1/identity/v3',
+                'auth_cred': auth_cred}
+
+    @mock.patch.object(vim_client.VimClient, '_find_vim_key')
+    def test_build_vim_auth_one_key_fetch(self, mock_find_vim_key):
+        vim_key = fernet.Fernet.generate_key()
+        mock_find_vim_key.return_value = vim_key
+        vim_info = self._encrypted_vim_info(
+            vim_key, password='pass', client_secret='secret',
+            ssl_ca_cert='cert')
+
+        vim_auth = self.vimclient._build_vim_auth(vim_info)
+
+        self.assertEqual({'username': 'test', 'password': 'pass',
+                          'client_secret': 'secret', 'ssl_ca_cert': 'cert',
+                          'auth_url': 'http://127.0.0.1/identity/v3'},
+                         vim_auth)
+        mock_find_vim_key.assert_called_once_with('aaaa')
+
+    @mock.patch.object(vim_client.VimClient, '_find_vim_key')
+    def test_build_vim_auth_cache(self, mock_find_vim_key):
+        vim_key = fernet.Fernet.generate_key()
+        mock_find_vim_key.return_value = vim_key
+        vim_info = self._encrypted_vim_info(vim_key, password='pass')
+
+        # miss and hit
+        vim_auth = self.vimclient._build_vim_auth(copy.deepcopy(vim_info))
+        vim_auth['password'] = 'modified'
+        vim_auth = self.vimclient._build_vim_auth(copy.deepcopy(vim_info))
+        self.assertEqual('pass', vim_auth['password'])
+        self.assertEqual(1, mock_find_vim_key.call_count)
+
+        # the credentials are updated with a new key
+        new_key = fernet.Fernet.generate_key()
+        mock_find_vim_key.return_value = new_key
+        new_vim_info = self._encrypted_vim_info(new_key, password='new')
+        vim_auth = self.vimclient._build_vim_auth(new_vim_info)
+        self.assertEqual('new', vim_auth['password'])
+        self.assertEqual(2, mock_find_vim_key.call_count)
+
+        # cleared
+        vim_client.clear_vim_auth_cache('aaaa')
+        new_vim_info = self._encrypted_vim_info(new_key, password='new')
+        self.vimclient._build_vim_auth(new_vim_info)
+        self.assertEqual(3, mock_find_vim_key.call_count)
+
+        cache_stats = vim_client.get_vim_auth_cache_stats()
+        self.assertEqual(1, cache_stats['hits'])
+        self.assertEqual(3, cache_stats['misses'])
+        self.assertEqual(3, cache_stats['key_fetches'])
+        self.assertEqual(1, cache_stats['entries'])
+        # reported by tacker-conductor.
+        self.assertEqual(cache_stats, stats.get_all()['v1_vim_auth_cache'])
+
+    @mock.patch.object(vim_client.time, 'monotonic')
+    @mock.patch.object(vim_client.VimClient, '_find_vim_key')
+    def test_build_vim_auth_cache_expired(self, mock_find_vim_key,
+                                          mock_monotonic):
+        vim_key = fernet.Fernet.generate_key()
+        mock_find_vim_key.return_value = vim_key
+        vim_info = self._encrypted_vim_info(vim_key, password='pass')
+        mock_monotonic.return_value = 1000
+
+        self.vimclient._build_vim_auth(copy.deepcopy(vim_info))
+        mock_monotonic.return_value = 1000 + 299
+        self.vimclient._build_vim_auth(copy.deepcopy(vim_info))
+        self.assertEqual(1, mock_find_vim_key.call_count)
+
+        mock_monotonic.return_value = 1000 + 300
+        self.vimclient._build_vim_auth(copy.deepcopy(vim_info))
+        self.assertEqual(2, mock_find_vim_key.call_count)
+
+    @mock.patch.object(vim_client.VimClient, '_find_vim_key')
+    def test_build_vim_auth_cache_disabled(self, mock_find_vim_key):
+        self.config_fixture.config(group='vim_keys', auth_cache_ttl=0)
+        vim_key = fernet.Fernet.generate_key()
+        mock_find_vim_key.return_value = vim_key
+        vim_info = self._encrypted_vim_info(vim_key, password='pass')
+
+        self.vimclient._build_vim_auth(copy.deepcopy(vim_info))
+        self.vimclient._build_vim_auth(copy.deepcopy(vim_info))
+
+        self.assertEqual(2, mock_find_vim_key.call_count)
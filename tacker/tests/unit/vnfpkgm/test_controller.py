@@ -1434,6 +1434,9 @@ class TestControllerEnhancedPolicy(TestController):
         super(TestControllerEnhancedPolicy, self).setUp()
         cfg.CONF.set_override(
             "enhanced_tacker_policy", True, group='oslo_policy')
+        mock.patch.object(VnfPackagesList, "get_vnf_providers",
+                          return_value=[]).start()
+        self.addCleanup(mock.patch.stopall)
 
     @mock.patch.object(csar_utils, 'load_csar_data')
     @mock.patch.object(glance_store, 'load_csar')
@@ -1775,3 +1778,30 @@ class TestControllerEnhancedPolicy(TestController):
         self.assertEqual(http_client.OK, resp.status_code)
         self.assertEqual(
             [pkg_a_2.id], [pkg.get('id') for pkg in resp.json])
+
+    @mock.patch.object(VnfPackagesList, "get_vnf_providers")
+    @mock.patch.object(VnfPackagesList, "get_by_marker_filter")
+    def test_index_enhanced_policy_vendors(self, mock_pkg_list,
+                                           mock_get_vnf_providers):
+        cfg.CONF.set_override('vnf_package_num', 1, group='vnf_package')
+        mock_get_vnf_providers.return_value = ['provider_A', 'provider_B']
+        mock_pkg_list.return_value = []
+        rules = {
+            vnf_package_policies.VNFPKGM % 'index': "vendor:%(vendor)s"}
+        policy.set_rules(oslo_policy.Rules.from_dict(rules), overwrite=True)
+        ctx = context.Context('fake', 'fake', roles=['VENDOR_provider_A'])
+        req = fake_request.HTTPRequest.blank('/vnf_packages')
+        req.headers['Content-Type'] = 'application/json'
+        req.method = 'GET'
+
+        with mock.patch.object(policy, 'authorize',
+                               wraps=policy.authorize) as mock_authorize:
+            resp = req.get_response(
+                fakes.wsgi_app_v1(fake_auth_context=ctx))
+        self.assertEqual(http_client.OK, resp.status_code)
+        # the packages are narrowed down by the authorized vendors and
+        # paged in DB. the rules are evaluated once per distinct vendor.
+        mock_pkg_list.assert_called_once_with(
+            mock.ANY, 1, None, filters=mock.ANY, read_deleted='no',
+            vendors=['provider_A', '*'])
+        self.assertEqual(4, mock_authorize.call_count)
@@ -74,6 +74,11 @@ OPTS = [
                default=10,
                help=_("Wait time (in seconds) between consecutive stack"
                       " create/delete retries")),
+    cfg.IntOpt('nested_stack_workers',
+               default=8,
+               min=1,
+               help=_("Number of nested stacks whose child stacks and"
+                      " resources are got from heat concurrently")),
 ]
 
 CONF.register_opts(OPTS, group='openstack_vim')
@@ -1304,30 +1309,52 @@ class OpenStack(abstract_driver.VnfAbstractDriver,
                 ext_mng_vl_info)
 
     def _get_stack_resources(self, stack_id, heatclient):
-        def _stack_ids(stack_id):
+        # NOTE: the nested stacks are got level by level, and the stacks
+        # of a level are got concurrently by at most nested_stack_workers
+        # green threads. resource_details is made in the depth-first order
+        # of the stacks as before.
+        def _get_stack(id):
             filters = {
-                "owner_id": stack_id,
+                "owner_id": id,
                 "show_nested": True
             }
-            yield stack_id
-            for stack in heatclient.stacks.list(**{"filters": filters}):
-                if stack.parent and stack.parent == stack_id:
-                    for x in _stack_ids(stack.id):
-                        yield x
-
-        resource_details = {}
-        for id in _stack_ids(stack_id):
+            child_ids = [stack.id
+                for stack in heatclient.stacks.list(**{"filters": filters})
+                if stack.parent and stack.parent == id]
             resources = {}
-            child_stack = False if id == stack_id else True
             for stack_resource in heatclient.resources.list(id):
                 resource_data = {"resource_type":
                     stack_resource.resource_type,
                     "physical_resource_id":
                     stack_resource.physical_resource_id}
                 resources[stack_resource.resource_name] = resource_data
+            return child_ids, resources
+
+        pool = eventlet.GreenPool(CONF.openstack_vim.nested_stack_workers)
+        stacks = {}
+        seen = {stack_id}
+        level = [stack_id]
+        while level:
+            next_level = []
+            for id, result in zip(level, pool.imap(_get_stack, level)):
+                stacks[id] = result
+                for child_id in result[0]:
+                    if child_id not in seen:
+                        seen.add(child_id)
+                        next_level.append(child_id)
+            level = next_level
+
+        resource_details = {}
+
+        def _add_stack(id):
+            child_ids, resources = stacks[id]
             resource_details[id] = resources
-            resource_details[id].update({'child_stack': child_stack})
+            resource_details[id].update({'child_stack': id != stack_id})
+            for child_id in child_ids:
+                if child_id not in resource_details:
+                    _add_stack(child_id)
 
+        _add_stack(stack_id)
         return resource_details
 
     def _get_vnfc_resources_from_heal_request(self, inst_vnf_info,
@@ -13,12 +13,17 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import copy
 import os
+import threading
+import time
 
 from cryptography import fernet
 from oslo_config import cfg
 from oslo_log import log as logging
 
+from tacker._i18n import _
+from tacker.common import stats
 from tacker.common import utils
 from tacker import context as t_context
 from tacker.extensions import nfvo
@@ -29,6 +34,116 @@ from tacker.plugins.common import constants
 LOG = logging.getLogger(__name__)
 CONF = cfg.CONF
 
+OPTS = [
+    cfg.IntOpt('auth_cache_ttl', default=300, min=0,
+               help=_('Number of seconds to keep the decrypted VIM '
+                      'credentials in memory. The cache is disabled '
+                      'if 0.')),
+]
+cfg.CONF.register_opts(OPTS, 'vim_keys')
+
+
+def config_opts():
+    return [('vim_keys', OPTS)]
+
+
+class _VimAuthCache(object):
+    """Cache of the decrypted VIM auth per vim_id
+
+    An entry is valid until its TTL expires and while the auth_cred
+    stored in DB is the same as the one it was built from. Since the
+    credentials are encrypted again with a new key whenever a VIM is
+    updated, the comparison also detects the update by other processes.
+    Concurrent misses of the same VIM are coalesced into one build, so
+    that the key is fetched once.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._build_locks = {}
+        self._stats = {'hits': 0, 'misses': 0, 'key_fetches': 0,
+                       'invalidations': 0}
+
+    def _lookup(self, vim_id, source):
+        entry = self._entries.get(vim_id)
+        if entry is None:
+            return None
+        entry_source, expire_at, vim_auth = entry
+        if entry_source != source or expire_at <= time.monotonic():
+            self._entries.pop(vim_id, None)
+            return None
+        self._stats['hits'] += 1
+        return copy.deepcopy(vim_auth)
+
+    def get(self, vim_info, build):
+        ttl = CONF.vim_keys.auth_cache_ttl
+        if ttl <= 0:
+            return build(vim_info)
+
+        vim_id = vim_info['id']
+        source = (vim_info.get('auth_url'),
+                  copy.deepcopy(vim_info['auth_cred']))
+        with self._lock:
+            vim_auth = self._lookup(vim_id, source)
+            if vim_auth is not None:
+                return vim_auth
+            build_lock = self._build_locks.setdefault(vim_id,
+                                                      threading.Lock())
+
+        with build_lock:
+            # NOTE: other thread may have built it while waiting the lock.
+            with self._lock:
+                vim_auth = self._lookup(vim_id, source)
+                if vim_auth is not None:
+                    return vim_auth
+                self._stats['misses'] += 1
+
+            vim_auth = build(vim_info)
+            with self._lock:
+                self._entries[vim_id] = (source, time.monotonic() + ttl,
+                                         copy.deepcopy(vim_auth))
+            return vim_auth
+
+    def count_key_fetch(self):
+        with self._lock:
+            self._stats['key_fetches'] += 1
+
+    def clear(self, vim_id=None):
+        with self._lock:
+            if vim_id is None:
+                self._entries.clear()
+                self._build_locks.clear()
+            else:
+                self._entries.pop(vim_id, None)
+                self._build_locks.pop(vim_id, None)
+            self._stats['invalidations'] += 1
+
+    def get_stats(self):
+        with self._lock:
+            result = dict(self._stats)
+            result['entries'] = len(self._entries)
+            return result
+
+
+_vim_auth_cache = _VimAuthCache()
+
+
+def clear_vim_auth_cache(vim_id=None):
+    """Drop the decrypted credentials of a VIM (all VIMs if None)
+
+    It must be called when the credentials or the key of a VIM are
+    changed or deleted.
+    """
+    _vim_auth_cache.clear(vim_id)
+
+
+def get_vim_auth_cache_stats():
+    return _vim_auth_cache.get_stats()
+
+
+stats.register('v1_vim_auth_cache', get_vim_auth_cache_stats)
+
 
 class VimClient(object):
     def get_vim(self, context, vim_id=None, region_name=None):
@@ -74,32 +189,34 @@ class VimClient(object):
 
     def _build_vim_auth(self, vim_info):
         LOG.debug('VIM id is %s', vim_info['id'])
+        return _vim_auth_cache.get(vim_info, self._make_vim_auth)
+
+    def _make_vim_auth(self, vim_info):
         vim_auth = vim_info['auth_cred']
+        vim_key = None
+
+        def _decode(secret_value):
+            # NOTE: all credentials of a VIM are encrypted with the same
+            # key. fetch it once for them.
+            nonlocal vim_key
+            if vim_key is None:
+                vim_key = self._get_vim_key(vim_info['id'], vim_auth)
+            return self._decode_vim_auth(vim_info['id'], vim_auth,
+                                         secret_value, vim_key=vim_key)
 
         # decode password
         if ('password' in vim_auth) and (vim_auth['password'] is not None):
-            vim_auth['password'] = self._decode_vim_auth(vim_info['id'],
-                                                         vim_auth,
-                                                         vim_auth['password'])
+            vim_auth['password'] = _decode(vim_auth['password'])
         # decode bearer_token
         if 'bearer_token' in vim_auth:
-            vim_auth['bearer_token'] = self.\
-                _decode_vim_auth(vim_info['id'],
-                                 vim_auth,
-                                 vim_auth['bearer_token'])
+            vim_auth['bearer_token'] = _decode(vim_auth['bearer_token'])
         # decode ssl_ca_cert
         if utils.none_from_string(vim_auth.get('ssl_ca_cert')) is not None:
-            vim_auth['ssl_ca_cert'] = self.\
-                _decode_vim_auth(vim_info['id'],
-                                 vim_auth,
-                                 vim_auth['ssl_ca_cert'])
+            vim_auth['ssl_ca_cert'] = _decode(vim_auth['ssl_ca_cert'])
 
         # decode client_secret
         if 'client_secret' in vim_auth and vim_auth['client_secret']:
-            vim_auth['client_secret'] = self._decode_vim_auth(
-                vim_info['id'],
-                vim_auth,
-                vim_auth['client_secret'])
+            vim_auth['client_secret'] = _decode(vim_auth['client_secret'])
 
         vim_auth['auth_url'] = vim_info['auth_url']
 
@@ -111,13 +228,9 @@ class VimClient(object):
                 vim_auth.pop(attr, None)
         return vim_auth
 
-    def _decode_vim_auth(self, vim_id, auth, secret_value):
-        """Decode Vim credentials
-
-        Decrypt VIM cred, get fernet Key from local_file_system or
-        barbican.
-        """
-        cred = secret_value.encode('utf-8')
+    def _get_vim_key(self, vim_id, auth):
+        """Get fernet key of Vim from local_file_system or barbican"""
+        _vim_auth_cache.count_key_fetch()
         if auth.get('key_type') == 'barbican_key':
             secret_uuid = auth['secret_uuid']
             if CONF.ext_oauth2_auth.use_ext_oauth2_auth:
@@ -126,9 +239,18 @@ class VimClient(object):
                 keymgr_api = KEYMGR_API(CONF.keystone_authtoken.auth_url)
             k_context = t_context.generate_tacker_service_context()
             secret_obj = keymgr_api.get(k_context, secret_uuid)
-            vim_key = secret_obj.payload
-        else:
-            vim_key = self._find_vim_key(vim_id)
+            return secret_obj.payload
+        return self._find_vim_key(vim_id)
+
+    def _decode_vim_auth(self, vim_id, auth, secret_value, vim_key=None):
+        """Decode Vim credentials
+
+        Decrypt VIM cred, get fernet Key from local_file_system or
+        barbican if vim_key is not given.
+        """
+        cred = secret_value.encode('utf-8')
+        if vim_key is None:
+            vim_key = self._get_vim_key(vim_id, auth)
 
         f = fernet.Fernet(vim_key)
         if not f:
@@ -0,0 +1,136 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Micro benchmark of TackerPersistentObject.update().
+
+It compares the update by session.merge (i.e. the whole row is read
+before it is written) with the update of changed columns only. Bytes of
+the statements sent to DB, bytes of the rows read from DB and latency
+per update are reported.
+
+Usage: python tools/benchmarks/db_save.py [--count N] [--vnfcs N]
+"""
+
+import argparse
+import time
+
+from oslo_config import cfg
+from oslo_db import options as db_options
+from oslo_utils import uuidutils
+import sqlalchemy as sa
+
+from tacker.common import config  # noqa: F401
+from tacker import context as t_context
+from tacker.db import api as db_api
+from tacker.db import model_base
+from tacker.sol_refactored.db.sqlalchemy import models
+from tacker.sol_refactored import objects
+from tacker.sol_refactored.objects import base as objects_base
+
+
+def _make_inst(num_vnfcs):
+    vnfcs = [{'id': uuidutils.generate_uuid(),
+              'vduId': 'VDU1',
+              'computeResource': {
+                  'resourceId': uuidutils.generate_uuid(),
+                  'vimLevelResourceType': 'OS::Nova::Server'},
+              'metadata': {'creation_time': '2026-01-01T00:00:00Z',
+                           'stack_id': uuidutils.generate_uuid()}}
+             for _ in range(num_vnfcs)]
+    return objects.VnfInstanceV2.from_dict({
+        'id': uuidutils.generate_uuid(),
+        'vnfdId': uuidutils.generate_uuid(),
+        'vnfProvider': 'provider',
+        'vnfProductName': 'product',
+        'vnfSoftwareVersion': '1.0',
+        'vnfdVersion': '1.0',
+        'instantiationState': 'INSTANTIATED',
+        'instantiatedVnfInfo': {'flavourId': 'simple',
+                                'vnfState': 'STARTED',
+                                'vnfcResourceInfo': vnfcs},
+    })
+
+
+def _merge_update(self, context):
+    # NOTE: the implementation of _save(merge=True) before the change.
+    @db_api.context_manager.writer
+    def _save(context):
+        inst = self._get_model_cls()()
+        inst.update(self.to_db_obj())
+        with context.session.begin(nested=True):
+            context.session.merge(inst, load=True)
+            context.session.commit()
+    _save(context)
+    self.obj_reset_changes()
+
+
+def _run(context, insts, update):
+    start = time.perf_counter()
+    for inst in insts:
+        inst.vnfInstanceName = uuidutils.generate_uuid()
+        update(inst, context)
+    return (time.perf_counter() - start) / len(insts)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--count', type=int, default=200)
+    parser.add_argument('--vnfcs', type=int, default=50)
+    args = parser.parse_args()
+
+    cfg.CONF([], project='tacker')
+    db_options.set_defaults(cfg.CONF, connection='sqlite://')
+    objects.register_all()
+    engine = db_api.get_engine()
+    model_base.BASE.metadata.create_all(engine)
+
+    stats = {'bytes': 0, 'read_bytes': 0, 'statements': 0}
+
+    def _before_cursor_execute(conn, cursor, statement, parameters,
+                               context, executemany):
+        stats['statements'] += 1
+        stats['bytes'] += len(statement) + sum(
+            len(str(param)) for param in parameters or ())
+
+    def _load(target, context):
+        stats['read_bytes'] += sum(
+            len(str(target.get(column.key)))
+            for column in sa.inspect(target).mapper.column_attrs)
+
+    sa.event.listen(engine, 'before_cursor_execute', _before_cursor_execute)
+    sa.event.listen(models.VnfInstanceV2, 'load', _load)
+
+    context = t_context.get_admin_context()
+    ids = []
+    for _ in range(args.count):
+        inst = _make_inst(args.vnfcs)
+        inst.create(context)
+        ids.append(inst.id)
+
+    for name, update in (('merge', _merge_update),
+                         ('changed-only',
+                          objects_base.TackerPersistentObject.update)):
+        insts = [objects.VnfInstanceV2.get_by_id(context, inst_id)
+                 for inst_id in ids]
+        stats.update(bytes=0, read_bytes=0, statements=0)
+        latency = _run(context, insts, update)
+        print(f'{name:>12}: {latency * 1000:.3f} ms/update, '
+              f'{stats["bytes"] / len(insts):.0f} bytes sent/update, '
+              f'{stats["read_bytes"] / len(insts):.0f} bytes read/update, '
+              f'{stats["statements"] / len(insts):.1f} statements/update')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,145 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Micro benchmark of loading VnfInstanceV2 from DB.
+
+It compares the latency and the memory of the objects retained after
+get_by_filter() loads the instantiated VNF instances and their id and
+instantiationState are read, which is the typical use of the loaded
+instances, in the following modes.
+
+- eager: all object fields are read as well, i.e. the same conversion
+  as from_db_obj() before the object fields are converted lazily.
+- lazy: the object fields are kept as JSON strings.
+- projection: only id and instantiationState are loaded from DB by
+  attrs of get_by_filter().
+
+Usage: python tools/benchmarks/lazy_object_load.py [--count N] [--vnfcs N]
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from oslo_config import cfg
+from oslo_db import options as db_options
+from oslo_utils import uuidutils
+
+from tacker.common import config  # noqa: F401
+from tacker import context as t_context
+from tacker.db import api as db_api
+from tacker.db import model_base
+from tacker.sol_refactored.db.sqlalchemy import models
+from tacker.sol_refactored import objects
+from tacker.sol_refactored.objects import base as objects_base
+
+ATTRS = ['id', 'instantiationState']
+
+
+def _make_inst(num_vnfcs):
+    vnfcs = [{'id': uuidutils.generate_uuid(),
+              'vduId': 'VDU1',
+              'computeResource': {
+                  'resourceId': uuidutils.generate_uuid(),
+                  'vimLevelResourceType': 'OS::Nova::Server'},
+              'metadata': {'creation_time': '2026-01-01T00:00:00Z',
+                           'stack_id': uuidutils.generate_uuid()}}
+             for _ in range(num_vnfcs)]
+    return objects.VnfInstanceV2.from_dict({
+        'id': uuidutils.generate_uuid(),
+        'vnfdId': uuidutils.generate_uuid(),
+        'vnfProvider': 'provider',
+        'vnfProductName': 'product',
+        'vnfSoftwareVersion': '1.0',
+        'vnfdVersion': '1.0',
+        'instantiationState': 'INSTANTIATED',
+        'instantiatedVnfInfo': {'flavourId': 'simple',
+                                'vnfState': 'STARTED',
+                                'vnfcResourceInfo': vnfcs},
+    })
+
+
+@db_api.context_manager.writer
+def _populate(context, count, num_vnfcs):
+    context.session.execute(
+        models.VnfInstanceV2.__table__.insert(),
+        [_make_inst(num_vnfcs).to_db_obj() for _ in range(count)])
+
+
+def _eager(context):
+    insts = objects.VnfInstanceV2.get_by_filter(
+        context, instantiationState='INSTANTIATED')
+    for inst in insts:
+        for name, field in inst.fields.items():
+            if (isinstance(field, objects_base._OBJECT_FIELD_TYPES) and
+                    inst.obj_attr_is_set(name)):
+                getattr(inst, name)
+    return insts
+
+
+def _lazy(context):
+    return objects.VnfInstanceV2.get_by_filter(
+        context, instantiationState='INSTANTIATED')
+
+
+def _projection(context):
+    return objects.VnfInstanceV2.get_by_filter(
+        context, attrs=ATTRS, instantiationState='INSTANTIATED')
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--count', type=int, default=10000)
+    parser.add_argument('--vnfcs', type=int, default=10)
+    args = parser.parse_args()
+
+    cfg.CONF([], project='tacker')
+    db_options.set_defaults(cfg.CONF, connection='sqlite://')
+    objects.register_all()
+    engine = db_api.get_engine()
+    model_base.BASE.metadata.create_all(engine)
+
+    context = t_context.get_admin_context()
+    _populate(context, args.count, args.vnfcs)
+
+    results = []
+    for name, load in (('eager', _eager), ('lazy', _lazy),
+                       ('projection', _projection)):
+        gc.collect()
+        start = time.perf_counter()
+        insts = load(context)
+        states = [(inst.id, inst.instantiationState) for inst in insts]
+        elapsed = time.perf_counter() - start
+        results.append(sorted(states))
+        del insts
+
+        # NOTE: measured separately since tracemalloc slows down.
+        gc.collect()
+        tracemalloc.start()
+        insts = load(context)
+        gc.collect()
+        retained = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        print(f'{name:>10}: {elapsed * 1000:.0f} ms, '
+              f'{retained / 2 ** 20:.1f} MiB retained, '
+              f'{len(insts)} instances')
+        del insts
+
+    assert results[0] == results[1] == results[2]
+
+
+if __name__ == '__main__':
+    main()
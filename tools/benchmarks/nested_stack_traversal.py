@@ -0,0 +1,143 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Micro benchmark of OpenStack._get_stack_resources() of the v1 driver.
+
+It compares the depth-first traversal of the nested stacks one by one
+with the concurrent traversal level by level against a fake heat client,
+which returns a tree of ResourceGroup like nested stacks after a delay
+per request. The results of both are checked to be the same.
+
+Usage: python tools/benchmarks/nested_stack_traversal.py
+           [--groups N] [--members N] [--latency SEC] [--workers N]
+"""
+
+import argparse
+import time
+
+import eventlet
+from oslo_config import cfg
+
+from tacker.vnfm.infra_drivers.openstack import openstack
+
+
+class _Obj(object):
+
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+
+class FakeHeatClient(object):
+    """Fake of heatclient which has stacks.list and resources.list."""
+
+    def __init__(self, tree, latency):
+        self.tree = tree
+        self.latency = latency
+        self.requests = 0
+        self.stacks = _Obj(list=self._stacks_list)
+        self.resources = _Obj(list=self._resources_list)
+
+    def _request(self):
+        self.requests += 1
+        # NOTE: green sleep as the network I/O of heatclient.
+        eventlet.sleep(self.latency)
+
+    def _stacks_list(self, filters):
+        self._request()
+        owner_id = filters['owner_id']
+        return [_Obj(id=child, parent=owner_id)
+                for child in self.tree[owner_id]]
+
+    def _resources_list(self, stack_id):
+        self._request()
+        return [_Obj(resource_name=f'{name}-{stack_id}',
+                     resource_type=res_type,
+                     physical_resource_id=f'{stack_id}-{name}')
+                for name, res_type in (('VDU1', 'OS::Nova::Server'),
+                                       ('CP1', 'OS::Neutron::Port'))]
+
+
+def _make_tree(groups, members):
+    tree = {'root': []}
+    for i in range(groups):
+        group = f'group{i}'
+        tree['root'].append(group)
+        tree[group] = []
+        for j in range(members):
+            member = f'{group}-member{j}'
+            tree[group].append(member)
+            tree[member] = []
+    return tree
+
+
+def _sequential(stack_id, heatclient):
+    # NOTE: the implementation of _get_stack_resources before the change.
+    def _stack_ids(stack_id):
+        filters = {
+            "owner_id": stack_id,
+            "show_nested": True
+        }
+        yield stack_id
+        for stack in heatclient.stacks.list(**{"filters": filters}):
+            if stack.parent and stack.parent == stack_id:
+                for x in _stack_ids(stack.id):
+                    yield x
+
+    resource_details = {}
+    for id in _stack_ids(stack_id):
+        resources = {}
+        child_stack = False if id == stack_id else True
+        for stack_resource in heatclient.resources.list(id):
+            resource_data = {"resource_type":
+                stack_resource.resource_type,
+                "physical_resource_id":
+                stack_resource.physical_resource_id}
+            resources[stack_resource.resource_name] = resource_data
+        resource_details[id] = resources
+        resource_details[id].update({'child_stack': child_stack})
+
+    return resource_details
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--groups', type=int, default=4)
+    parser.add_argument('--members', type=int, default=10)
+    parser.add_argument('--latency', type=float, default=0.02)
+    parser.add_argument('--workers', type=int, default=8)
+    args = parser.parse_args()
+
+    cfg.CONF([], project='tacker')
+    cfg.CONF.set_override('nested_stack_workers', args.workers,
+                          group='openstack_vim')
+    tree = _make_tree(args.groups, args.members)
+    driver = openstack.OpenStack()
+
+    results = []
+    for name, func in (('sequential', _sequential),
+                       ('concurrent', driver._get_stack_resources)):
+        client = FakeHeatClient(tree, args.latency)
+        start = time.perf_counter()
+        results.append(func('root', client))
+        elapsed = time.perf_counter() - start
+        print(f'{name:>10}: {elapsed * 1000:.1f} ms, '
+              f'{client.requests} requests, {len(tree)} stacks')
+
+    assert results[0] == results[1]
+    assert list(results[0]) == list(results[1])
+
+
+if __name__ == '__main__':
+    main()
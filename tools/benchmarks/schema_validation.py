@@ -0,0 +1,134 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Micro benchmark of the validation of API request bodies.
+
+It compares the validation by a validator created for each request (i.e.
+the validator class is extended and a FormatChecker is created every
+time) with the validation by the shared validator of the registry.
+Latency per request is reported for each endpoint.
+
+Usage: python tools/benchmarks/schema_validation.py [--count N]
+"""
+
+import argparse
+import time
+
+import jsonschema
+
+from tacker.api.schemas import vnf_lcm
+from tacker.api.validation import validators
+from tacker.sol_refactored.api.schemas import prometheus_plugin_schemas
+from tacker.sol_refactored.api.schemas import vnflcm_v2
+
+
+_VNFD_ID = 'b1bb0ce7-ebca-4fa7-95ed-4840d70a1177'
+
+_alert = {
+    'status': 'firing',
+    'labels': {'receiver_type': 'tacker', 'function_type': 'vnfpm',
+               'job_id': 'job-1', 'metric': 'VCpuUsageMeanVnf.' + _VNFD_ID,
+               'object_instance_id': _VNFD_ID},
+    'annotations': {'value': 99},
+    'startsAt': '2026-01-01T00:00:00Z',
+    'fingerprint': '5ef77f1f8a3ecb8d'
+}
+
+_instantiate_v2 = {
+    'flavourId': 'simple',
+    'instantiationLevelId': 'instantiation_level_1',
+    'extVirtualLinks': [{
+        'id': 'ext_vl_id_net1',
+        'resourceId': _VNFD_ID,
+        'extCps': [{
+            'cpdId': 'VDU1_CP1',
+            'cpConfig': {
+                'VDU1_CP1_1': {
+                    'cpProtocolData': [{
+                        'layerProtocol': 'IP_OVER_ETHERNET',
+                        'ipOverEthernet': {
+                            'ipAddresses': [{'type': 'IPV4',
+                                             'numDynamicAddresses': 1}]
+                        }
+                    }]
+                }
+            }
+        }]
+    }],
+    'vimConnectionInfo': {
+        'vim1': {'vimId': _VNFD_ID,
+                 'vimType': 'ETSINFV.OPENSTACK_KEYSTONE.V_3'}
+    },
+    'additionalParams': {'lcm-operation-user-data': './UserData/u.py',
+                         'lcm-operation-user-data-class': 'UserData'}
+}
+
+ENDPOINTS = [
+    ('v1 instantiate', vnf_lcm.instantiate,
+     {'flavourId': 'simple', 'instantiationLevelId': 'instantiation_level_1',
+      'additionalParams': {'key': 'value'}}),
+    ('v2 create', vnflcm_v2.CreateVnfRequest_V200,
+     {'vnfdId': _VNFD_ID, 'vnfInstanceName': 'vnf',
+      'metadata': {'key': 'value'}}),
+    ('v2 instantiate', vnflcm_v2.InstantiateVnfRequest_V200,
+     _instantiate_v2),
+    ('v2 subscription', vnflcm_v2.LccnSubscriptionRequest_V200,
+     {'callbackUri': 'http://127.0.0.1/notification',
+      'filter': {'vnfInstanceSubscriptionFilter': {'vnfdIds': [_VNFD_ID]},
+                 'notificationTypes': [
+                     'VnfLcmOperationOccurrenceNotification'],
+                 'operationStates': ['COMPLETED']}}),
+    ('prometheus alert (10 alerts)', prometheus_plugin_schemas.AlertMessage,
+     {'alerts': [_alert] * 10}),
+]
+
+
+def _validate_per_request(schema, body):
+    validator_cls = jsonschema.validators.extend(jsonschema.Draft7Validator,
+                                                 validators={})
+    validator = validator_cls(schema,
+                              format_checker=validators.FormatChecker())
+    validator.validate(body)
+
+
+def _validate_shared(schema, body):
+    validators.get_schema_validator(schema).validate(body)
+
+
+def _measure(func, schema, body, count):
+    func(schema, body)
+    start = time.perf_counter()
+    for _ in range(count):
+        func(schema, body)
+    return (time.perf_counter() - start) / count * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--count', type=int, default=2000)
+    args = parser.parse_args()
+
+    print('%-30s %14s %14s %8s' % ('endpoint', 'per-request', 'shared',
+                                   'speedup'))
+    for name, schema, body in ENDPOINTS:
+        per_request = _measure(_validate_per_request, schema, body,
+                               args.count)
+        shared = _measure(_validate_shared, schema, body, args.count)
+        print('%-30s %11.1f us %11.1f us %7.1fx' % (
+            name, per_request, shared, per_request / shared))
+
+
+if __name__ == '__main__':
+    main()
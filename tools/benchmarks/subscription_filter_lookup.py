@@ -0,0 +1,195 @@
+# Copyright (C) 2026 Nippon Telegraph and Telephone Corporation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Micro benchmark of the lookup of the v1 LCM subscriptions.
+
+It compares the lookup of the subscriptions to notify by JSON_CONTAINS
+against vnf_lcm_filters, i.e. a full scan of the filters, with the lookup
+by the index of vnf_lcm_filter_values. JSON_CONTAINS is registered to
+sqlite as a python function to run the former. The latency of the
+duplicate check of a new subscription is reported too. Both lookups are
+checked to return the same subscriptions.
+
+Usage: python tools/benchmarks/subscription_filter_lookup.py
+           [--subscriptions N] [--count N]
+"""
+
+import argparse
+import random
+import time
+
+from oslo_config import cfg
+from oslo_db import options as db_options
+from oslo_serialization import jsonutils
+from oslo_utils import uuidutils
+import sqlalchemy as sa
+
+from tacker.common import config  # noqa: F401
+from tacker import context as t_context
+from tacker.db import api as db_api
+from tacker.db.db_sqlalchemy import models
+from tacker.db import model_base
+from tacker.objects import vnf_lcm_subscriptions
+
+NOTIFICATION_TYPES = ['VnfLcmOperationOccurrenceNotification',
+                      'VnfIdentifierCreationNotification',
+                      'VnfIdentifierDeletionNotification']
+OPERATION_TYPES = ['INSTANTIATE', 'SCALE', 'SCALE_TO_LEVEL',
+                   'CHANGE_FLAVOUR', 'TERMINATE', 'HEAL', 'OPERATE',
+                   'CHANGE_EXT_CONN', 'MODIFY_INFO', 'CHANGE_VNFPKG']
+OPERATION_STATES = ['STARTING', 'PROCESSING', 'COMPLETED', 'FAILED_TEMP',
+                    'FAILED', 'ROLLING_BACK', 'ROLLED_BACK']
+
+
+def _json_contains(target, candidate):
+    if target is None:
+        return 0
+    if isinstance(target, bytes):
+        target = target.decode()
+    target = jsonutils.loads(target)
+    return int(all(value in target for value in jsonutils.loads(candidate)))
+
+
+def _legacy_get(context, notification_type, operation_type):
+    # NOTE: the statement of _vnf_lcm_subscriptions_get before the change.
+    stmt = (
+        "select"
+        " t1.id,t1.callback_uri,t1.authentication,"
+        " t1.tenant_id, t2.filter "
+        " from "
+        " vnf_lcm_subscriptions t1, "
+        " (select distinct subscription_uuid,filter from vnf_lcm_filters "
+        " where "
+        " (notification_types_len = 0 "
+        " or JSON_CONTAINS(notification_types, '[\"" +
+        notification_type + "\"]')) "
+        " and "
+        " (operation_types_len = 0 or JSON_CONTAINS(operation_types, '[\"" +
+        operation_type + "\"]')) "
+        " order by "
+        "         notification_types_len desc,"
+        "         operation_types_len desc"
+        ") t2 "
+        " where "
+        " t1.id=t2.subscription_uuid "
+        " and t1.deleted=0")
+
+    @db_api.context_manager.reader
+    def _get(context):
+        return list(context.session.execute(sa.text(stmt)))
+    return _get(context)
+
+
+def _random_list(values, max_len):
+    return random.sample(values, random.randint(0, max_len))
+
+
+def _make_filter(vnfd_ids):
+    return {
+        'notificationTypes': _random_list(NOTIFICATION_TYPES, 1),
+        'operationTypes': _random_list(OPERATION_TYPES, 3),
+        'operationStates': _random_list(OPERATION_STATES, 2),
+        'vnfInstanceSubscriptionFilter': {
+            'vnfdIds': _random_list(vnfd_ids, 2)}}
+
+
+@db_api.context_manager.writer
+def _populate(context, num_subscriptions):
+    vnfd_ids = [uuidutils.generate_uuid() for _ in range(100)]
+    subscriptions = []
+    filters = []
+    filter_values = []
+    for i in range(num_subscriptions):
+        subscription_id = uuidutils.generate_uuid()
+        filter = _make_filter(vnfd_ids)
+        subscriptions.append({
+            'id': subscription_id,
+            'callback_uri': f'http://localhost/callback/{i % 100}',
+            'tenant_id': 'tenant'})
+        # NOTE: the columns below are generated from filter on MySQL.
+        filters.append({
+            'subscription_uuid': subscription_id,
+            'filter': filter,
+            'notification_types':
+                jsonutils.dumps(filter['notificationTypes']).encode(),
+            'notification_types_len': len(filter['notificationTypes']),
+            'operation_types':
+                jsonutils.dumps(filter['operationTypes']).encode(),
+            'operation_types_len': len(filter['operationTypes'])})
+        filter_values.extend(vnf_lcm_subscriptions._make_filter_values(
+            subscription_id, filter))
+
+    context.session.execute(
+        models.VnfLcmSubscriptions.__table__.insert(), subscriptions)
+    context.session.execute(
+        models.VnfLcmFilters.__table__.insert(), filters)
+    context.session.execute(
+        models.VnfLcmFilterValues.__table__.insert(), filter_values)
+    return [filter['filter'] for filter in filters]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--subscriptions', type=int, default=10000)
+    parser.add_argument('--count', type=int, default=50)
+    args = parser.parse_args()
+
+    cfg.CONF([], project='tacker')
+    db_options.set_defaults(cfg.CONF, connection='sqlite://')
+    engine = db_api.get_engine()
+    model_base.BASE.metadata.create_all(engine)
+    # NOTE: the in-memory DB is kept by the connection of this thread.
+    with engine.connect() as conn:
+        conn.connection.dbapi_connection.create_function(
+            'JSON_CONTAINS', 2, _json_contains)
+
+    random.seed(0)
+    context = t_context.get_admin_context()
+    filters = _populate(context, args.subscriptions)
+    queries = [(random.choice(NOTIFICATION_TYPES[:1]),
+                random.choice(OPERATION_TYPES))
+               for _ in range(args.count)]
+
+    results = []
+    for name, get in (
+            ('json_contains', _legacy_get),
+            ('indexed', vnf_lcm_subscriptions._vnf_lcm_subscriptions_get)):
+        start = time.perf_counter()
+        result = [sorted(line.id for line in get(context, *query))
+                  for query in queries]
+        elapsed = (time.perf_counter() - start) / len(queries)
+        results.append(result)
+        print(f'{name:>14}: {elapsed * 1000:.2f} ms/lookup, '
+              f'{sum(map(len, result)) / len(result):.0f} '
+              f'subscriptions/lookup, {args.subscriptions} subscriptions')
+    assert results[0] == results[1]
+
+    start = time.perf_counter()
+    for i in range(args.count):
+        filter = filters[i]
+        found = vnf_lcm_subscriptions._vnf_lcm_subscriptions_id_get(
+            context, f'http://localhost/callback/{i % 100}',
+            notification_type=filter['notificationTypes'],
+            operation_type=filter['operationTypes'],
+            operation_state=filter['operationStates'],
+            vnf_instance_subscription_filter=filter[
+                'vnfInstanceSubscriptionFilter'])
+        assert found
+    elapsed = (time.perf_counter() - start) / args.count
+    print(f'{"duplicate check":>14}: {elapsed * 1000:.2f} ms/check')
+
+
+if __name__ == '__main__':
+    main()